@@ -41,4 +41,6 @@ class Acidity(DerivedAttribute):
             H_max=dynamic.pH_H_max,
             ionic_strength_threshold=dynamic.ionic_strength_threshold,
             rtol=dynamic.pH_rtol,
+            iterations=dynamic.pH_iterations,
+            counters=dynamic.counters,
         )
@@ -28,6 +28,10 @@ class CriticalVolume(DerivedAttribute, TemperatureVariationOptionAttribute):
             self, builder, name="critical volume", dependencies=dependencies
         )
 
+    @staticmethod
+    def backend_methods():
+        return ("critical_volume",)
+
     def recalculate(self):
         temperature = (
             self.initial_temperature
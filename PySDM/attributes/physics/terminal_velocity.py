@@ -25,6 +25,14 @@ class TerminalVelocity(DerivedAttribute):
             builder.particulator
         )
 
+    def backend_methods(self):
+        return tuple(
+            method
+            for approximation in (self.approximation_liquid, self.approximation_ice)
+            if hasattr(approximation, "backend_methods")
+            for method in approximation.backend_methods()
+        )
+
     def recalculate(self):
         self.approximation_liquid(self.data, self.radius.get())
         # TODO #1605 order of functions calls changes result. approximation_liquid will override
@@ -13,5 +13,9 @@ class Volume(DerivedAttribute):
         self.water_mass = builder.get_attribute("water mass")
         super().__init__(builder, name="volume", dependencies=(self.water_mass,))
 
+    @staticmethod
+    def backend_methods():
+        return ("volume_of_water_mass",)
+
     def recalculate(self):
         self.particulator.backend.volume_of_water_mass(self.data, self.water_mass.get())
@@ -68,8 +68,8 @@ else:
     ThrustRTC.ENABLE = False
 
     class Random(RandomCommon):  # pylint: disable=too-few-public-methods
-        def __init__(self, size, seed):
-            super().__init__(size, seed)
+        def __init__(self, size, seed, stream=""):
+            super().__init__(size, seed, stream)
             self.generator = np.random.default_rng(seed)
 
         def __call__(self, storage):
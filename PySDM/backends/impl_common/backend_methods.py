@@ -9,9 +9,13 @@ class BackendMethods:
     def __init__(self):
         if not hasattr(self, "formulae"):
             self.formulae = None
-        if not hasattr(self, "formulae_flattened"):
+        if not hasattr(type(self), "formulae_flattened") and not hasattr(
+            self, "formulae_flattened"
+        ):
             self.formulae_flattened = None
         if not hasattr(self, "Storage"):
             self.Storage = None
         if not hasattr(self, "default_jit_flags"):
             self.default_jit_flags = {}
+        if not hasattr(self, "jit_cache"):
+            self.jit_cache = None
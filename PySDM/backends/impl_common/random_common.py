@@ -4,7 +4,12 @@ common base class for random number generation abstraction layer
 
 
 class RandomCommon:  # pylint: disable=too-few-public-methods
-    def __init__(self, size: int, seed: int):
+    def __init__(self, size: int, seed: int, stream: str = ""):
+        """`stream` names the consumer of the random numbers (e.g., a dynamic) and
+        selects an independent sequence in generators supporting it (the default
+        generators ignore it, drawing the same numbers for a given `seed`)"""
         assert isinstance(size, int)
         assert isinstance(seed, int)
+        assert isinstance(stream, str)
         self.size = size
+        self.stream = stream
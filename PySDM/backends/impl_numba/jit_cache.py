@@ -0,0 +1,384 @@
+"""
+persistent on-disk cache of JIT-compiled backend kernels - Numba's own `cache=True`
+ cannot be used for the kernels as they are closures capturing `exec`-generated formulae
+ (see https://github.com/numba/numba/issues/2956) and the pickled closure variables
+ differ between processes; here, the cache index key is instead composed of
+ the selected `PySDM.formulae.Formulae` components, a hash of the constants catalogue
+ and a digest of the kernel code (including any captured values, the referenced
+ globals and callees, and the sources of the non-library modules these are defined in,
+ which covers `numba.extending.overload` implementations); kernels referring to
+ anything that cannot be digested are not cached
+"""
+
+import builtins
+import dis
+import hashlib
+import inspect
+import os
+import pickle
+import sys
+import sysconfig
+import tempfile
+import types
+import warnings
+from collections import namedtuple
+from functools import cached_property, lru_cache
+
+import numba
+import numpy as np
+
+from PySDM import physics
+
+try:
+    from numba.core.caching import (
+        CompileResultCacheImpl,
+        FunctionCache,
+        _CacheLocator,
+        _SourceFileBackedLocatorMixin,
+    )
+except ImportError:  # pragma: no cover
+    CompileResultCacheImpl, FunctionCache, _CacheLocator = (
+        type(name, (), {}) for name in ("_Impl", "_Cache", "_Locator")
+    )
+    _SourceFileBackedLocatorMixin = type("_Mixin", (), {})
+
+JITCacheStats = namedtuple("JITCacheStats", ("hits", "misses"))
+
+TESTED_NUMBA_VERSIONS = ((0, 51), (0, 68))
+
+
+def numba_caching_supported() -> bool:
+    """the cache is built on private `numba.core.caching` classes, hence it is only
+    enabled for the tested range of Numba versions and if these classes have
+    the expected layout (otherwise, `JITCache.enable` returns `False`)"""
+    version = tuple(int(part) for part in numba.__version__.split(".")[:2])
+    if not TESTED_NUMBA_VERSIONS[0] <= version <= TESTED_NUMBA_VERSIONS[1]:
+        return False
+    try:
+        return (
+            tuple(inspect.signature(FunctionCache._index_key).parameters)
+            == ("self", "sig", "codegen")
+            and hasattr(FunctionCache, "_impl_class")
+            and hasattr(CompileResultCacheImpl, "_locator_classes")
+            and all(
+                hasattr(_SourceFileBackedLocatorMixin, method)
+                for method in ("get_source_stamp", "get_disambiguator")
+            )
+            and hasattr(_CacheLocator, "ensure_cache_path")
+        )
+    except (AttributeError, TypeError, ValueError):
+        return False
+
+
+class cached_kernel(  # pylint: disable=invalid-name,too-few-public-methods
+    cached_property
+):
+    """`functools.cached_property` for backend kernels: on first access, the backend
+    threading check is run (see `PySDM.backends.numba.Numba.check_threading`)
+    and the returned Numba dispatcher is handed to the backend's `JITCache` (if set, see
+    `PySDM.backends.numba.Numba`) under the name of the property"""
+
+    def __get__(self, instance, owner=None):
+        if instance is not None and self.attrname not in instance.__dict__:
+            instance.check_threading()
+        kernel = super().__get__(instance, owner)
+        if instance is not None and instance.jit_cache is not None:
+            instance.jit_cache.enable(kernel, name=self.attrname)
+        return kernel
+
+
+def formulae_key(formulae) -> str:
+    """returns a hash of the selected formulae components (incl. their source code),
+    of the constants catalogue, of the fastmath & breakup-handling flags and of
+    the formulae tabulation settings
+    (the random seeds are deliberately not part of the key)"""
+    hasher = hashlib.sha256()
+    for component in sorted(formulae._components):  # pylint: disable=protected-access
+        value = formulae._component_names[component]  # pylint: disable=protected-access
+        hasher.update(f"{component}={value};".encode())
+        choices = getattr(physics, component).__dict__
+        for name in value.split("+"):
+            if name in choices:
+                hasher.update(inspect.getsource(choices[name]).encode())
+    hasher.update(inspect.getsource(physics.trivia).encode())
+    hasher.update(
+        repr(
+            tuple(
+                item
+                for item in formulae.constants._asdict().items()
+                if item[0] != "default_random_seed"
+            )
+        ).encode()
+    )
+    hasher.update(f"{formulae.fastmath};{formulae.handle_all_breakups}".encode())
+    hasher.update(repr(sorted(formulae.tabulate.items())).encode())
+    return hasher.hexdigest()
+
+
+class _UnsupportedClosure(TypeError):
+    pass
+
+
+def _digest(obj, hasher, formulae_flattened, seen):
+    """feeds `hasher` with a process-independent representation of `obj`
+    (raising `_UnsupportedClosure` for values that cannot be represented)"""
+    if obj is formulae_flattened:
+        hasher.update(b"<formulae>")
+    elif obj is None or isinstance(obj, (bool, int, float, str, bytes, np.number)):
+        hasher.update(f"{type(obj).__name__}:{obj!r};".encode())
+    elif isinstance(obj, np.ndarray):
+        hasher.update(f"{obj.dtype}{obj.shape}".encode())
+        hasher.update(np.ascontiguousarray(obj).tobytes())
+    elif isinstance(obj, tuple):
+        hasher.update(f"{type(obj).__name__}{getattr(obj, '_fields', '')}(".encode())
+        for item in obj:
+            _digest(item, hasher, formulae_flattened, seen)
+        hasher.update(b")")
+    elif isinstance(obj, types.CodeType):
+        hasher.update(obj.co_code)
+        hasher.update(repr(obj.co_names).encode())
+        for const in obj.co_consts:
+            _digest(const, hasher, formulae_flattened, seen)
+    elif isinstance(obj, types.FunctionType):
+        _digest_function(obj, hasher, formulae_flattened, seen)
+    elif hasattr(obj, "py_func"):  # Numba dispatcher
+        if id(obj) not in seen:
+            seen.add(id(obj))
+            hasher.update(repr(sorted(obj.targetoptions.items())).encode())
+            _digest_function(obj.py_func, hasher, formulae_flattened, seen)
+    else:
+        raise _UnsupportedClosure(type(obj).__name__)
+
+
+def _digest_function(func, hasher, formulae_flattened, seen):
+    if id(func) in seen:
+        return
+    seen.add(id(func))
+    hasher.update(f"{func.__module__}.{func.__qualname__}".encode())
+    hasher.update(_module_digest(func.__module__).encode())
+    _digest(func.__code__, hasher, formulae_flattened, seen)
+    for cell in func.__closure__ or ():
+        _digest(cell.cell_contents, hasher, formulae_flattened, seen)
+    for name in _global_names(func.__code__):
+        if name in func.__globals__:
+            _digest_global(func.__globals__[name], hasher, formulae_flattened, seen)
+        elif not hasattr(builtins, name):
+            raise _UnsupportedClosure(name)
+
+
+def _global_names(code):
+    """names of globals loaded by `code` and its nested code objects
+    (e.g., of the lambdas returned by `numba.extending.overload` templates)"""
+    names = {
+        instruction.argval
+        for instruction in dis.get_instructions(code)
+        if instruction.opname in ("LOAD_GLOBAL", "LOAD_NAME")
+    }
+    for const in code.co_consts:
+        if isinstance(const, types.CodeType):
+            names |= set(_global_names(const))
+    return sorted(names)
+
+
+_LIBRARY_PATHS = tuple(
+    os.path.abspath(sysconfig.get_paths()[key])
+    for key in ("stdlib", "platstdlib", "purelib", "platlib")
+)
+
+
+def _is_library(module_name) -> bool:
+    """`True` for the standard library and installed packages other than PySDM
+    (identified by name and version), `False` for PySDM and user code (identified
+    by source) as well as for `exec`-generated code"""
+    if module_name is None or module_name.split(".")[0] == "PySDM":
+        return False
+    module = sys.modules.get(module_name, None)
+    if module is None:
+        return False
+    path = getattr(module, "__file__", None)
+    return path is None or os.path.abspath(path).startswith(_LIBRARY_PATHS)
+
+
+def _digest_global(value, hasher, formulae_flattened, seen):
+    """globals are frozen by Numba at compile time, hence the values and
+    the code of the callees (with the sources of the modules they are defined in,
+    which covers `numba.extending.overload` implementations) are hashed"""
+    if isinstance(value, types.ModuleType):
+        hasher.update(f"module:{value.__name__};".encode())
+        hasher.update(_module_digest(value.__name__).encode())
+    elif isinstance(value, np.ufunc):
+        hasher.update(f"ufunc:{value.__name__};".encode())
+    elif isinstance(
+        value, (type, types.FunctionType, types.BuiltinFunctionType)
+    ) and _is_library(getattr(value, "__module__", None)):
+        hasher.update(f"{value.__module__}.{value.__qualname__};".encode())
+        hasher.update(_module_digest(value.__module__).encode())
+    elif isinstance(value, type):
+        if not issubclass(value, tuple):
+            raise _UnsupportedClosure(value.__name__)
+        hasher.update(
+            f"{value.__module__}.{value.__qualname__}"
+            f"{getattr(value, '_fields', '')};".encode()
+        )
+        hasher.update(_module_digest(value.__module__).encode())
+    else:
+        _digest(value, hasher, formulae_flattened, seen)
+
+
+@lru_cache()
+def _module_digest(module_name) -> str:
+    """name and version of library modules, hash of the source of other modules
+    and an empty string for `exec`-generated code (covered by `formulae_key`)"""
+    module = sys.modules.get(module_name, None)
+    if module is None:
+        return ""
+    if _is_library(module_name):
+        root = sys.modules.get(module_name.split(".")[0], module)
+        return f"{module_name}=={getattr(root, '__version__', '')}"
+    try:
+        return hashlib.sha256(inspect.getsource(module).encode()).hexdigest()
+    except (OSError, TypeError) as error:
+        raise _UnsupportedClosure(module_name) from error
+
+
+class _Locator(_SourceFileBackedLocatorMixin, _CacheLocator):
+    cache_dir = None
+
+    def __init__(self, py_func, py_file):
+        # pylint: disable=super-init-not-called
+        self._py_file = py_file
+        self._lineno = py_func.__code__.co_firstlineno
+        self._cache_path = os.path.join(
+            self.cache_dir,
+            hashlib.sha256(os.path.abspath(py_file).encode()).hexdigest()[:16],
+        )
+
+    def get_cache_path(self):
+        return self._cache_path
+
+
+class _FunctionCache(FunctionCache):
+    key = None
+
+    def _index_key(self, sig, codegen):
+        return sig, codegen.magic_tuple(), self.key
+
+
+class JITCache:
+    """attaches an on-disk cache to Numba dispatchers created by the backend,
+    hits and misses are reported through the `stats` property; in addition,
+    signatures of the compiled kernels can be stored in a manifest file (per `tag`,
+    e.g., per set of dynamics) to be used for warming up subsequent runs"""
+
+    def __init__(self, path: str, formulae):
+        self.path = os.path.abspath(path)
+        self.formulae_key = formulae_key(formulae)
+        self.__formulae = formulae
+        self.__dispatchers = {}
+        self.__manifests = {}
+        self.__n_saved_signatures = {}
+        self.__cache_class = None
+        if not numba_caching_supported():
+            warnings.warn(
+                f"JIT cache disabled: Numba {numba.__version__} caching internals"
+                f" differ from those of the tested versions {TESTED_NUMBA_VERSIONS}"
+            )
+            return
+        locator = type("_Locator", (_Locator,), {"cache_dir": self.path})
+        impl = type(
+            "_CacheImpl", (CompileResultCacheImpl,), {"_locator_classes": [locator]}
+        )
+        self.__cache_class = type("_FunctionCache", (_FunctionCache,), {})
+        self.__cache_class._impl_class = impl  # pylint: disable=protected-access
+
+    def enable(self, dispatcher, name=None) -> bool:
+        """enables caching for a not-yet-compiled dispatcher, returns `False`
+        if the dispatcher cannot be cached (e.g., with JIT disabled, with an untested
+        Numba version or if the function, its callees or the globals it refers to
+        cannot be hashed across processes)"""
+        if self.__cache_class is None or not isinstance(
+            dispatcher, numba.core.dispatcher.Dispatcher
+        ):
+            return False
+        if isinstance(dispatcher._cache, _FunctionCache):
+            return True
+        hasher = hashlib.sha256(self.formulae_key.encode())
+        try:
+            _digest(dispatcher, hasher, self.__formulae.flatten, set())
+        except _UnsupportedClosure:
+            return False
+        try:
+            cache = self.__cache_class(dispatcher.py_func)
+        except RuntimeError:  # no locator available, e.g. for exec-generated code
+            return False
+        cache.key = hasher.hexdigest()
+        dispatcher._cache = cache  # pylint: disable=protected-access
+        self.__dispatchers[name or dispatcher.py_func.__qualname__] = dispatcher
+        return True
+
+    @property
+    def stats(self) -> dict:
+        """per-kernel numbers of cache hits and misses (i.e., compilations)"""
+        return {
+            name: JITCacheStats(
+                hits=sum(dispatcher.stats.cache_hits.values()),
+                misses=sum(dispatcher.stats.cache_misses.values()),
+            )
+            for name, dispatcher in self.__dispatchers.items()
+        }
+
+    @property
+    def summary(self) -> JITCacheStats:
+        """total numbers of cache hits and misses"""
+        stats = self.stats.values()
+        return JITCacheStats(
+            hits=sum(stat.hits for stat in stats),
+            misses=sum(stat.misses for stat in stats),
+        )
+
+    @property
+    def kernels(self) -> dict:
+        """cached dispatchers (including the not-yet-compiled ones) indexed by name"""
+        return dict(self.__dispatchers)
+
+    def _manifest_path(self, tag):
+        key = hashlib.sha256(f"{self.formulae_key};{tag}".encode()).hexdigest()
+        return os.path.join(self.path, f"manifest-{key[:16]}.pkl")
+
+    def load_manifest(self, tag: str) -> dict:
+        """returns a dictionary of signature lists indexed by kernel names
+        (empty if no manifest was saved for a given tag)"""
+        if tag not in self.__manifests:
+            try:
+                with open(self._manifest_path(tag), "rb") as file:
+                    self.__manifests[tag] = pickle.load(file)
+            except (OSError, pickle.UnpicklingError, EOFError):
+                self.__manifests[tag] = {}
+        return self.__manifests[tag]
+
+    def save_manifest(self, tag: str):
+        """merges signatures of the so-far compiled kernels into the manifest
+        (the file is rewritten only if new signatures were compiled)"""
+        n_signatures = sum(
+            len(dispatcher.signatures) for dispatcher in self.__dispatchers.values()
+        )
+        if self.__n_saved_signatures.get(tag, None) == n_signatures:
+            return
+        self.__n_saved_signatures[tag] = n_signatures
+        manifest = {
+            name: list(signatures)
+            for name, signatures in self.load_manifest(tag).items()
+        }
+        updated = False
+        for name, dispatcher in self.__dispatchers.items():
+            for signature in dispatcher.signatures:
+                if signature not in manifest.setdefault(name, []):
+                    manifest[name].append(signature)
+                    updated = True
+        if updated:
+            os.makedirs(self.path, exist_ok=True)
+            handle, tmp_path = tempfile.mkstemp(dir=self.path)
+            with os.fdopen(handle, "wb") as file:
+                pickle.dump(manifest, file)
+            os.replace(tmp_path, self._manifest_path(tag))
+            self.__manifests[tag] = manifest
@@ -3,49 +3,142 @@ CPU implementation of backend methods for aqueous chemistry
 """
 
 from collections import namedtuple
+from functools import cached_property
 
 import numba
 import numpy as np
 
 from PySDM.backends.impl_common.backend_methods import BackendMethods
+from PySDM.backends.impl_numba.jit_cache import cached_kernel
 from PySDM.backends.impl_numba import conf
 from PySDM.backends.impl_numba.toms748 import toms748_solve
 from PySDM.dynamics.impl.chemistry_utils import (
     DIFFUSION_CONST,
-    DISSOCIATION_FACTORS,
     GASEOUS_COMPOUNDS,
     MASS_ACCOMMODATION_COEFFICIENTS,
     EquilibriumConsts,
     HenryConsts,
     KineticConsts,
     SpecificGravities,
+    _K,
+    _DF,
+    calc_dissociation_factors,
     k4,
 )
 from PySDM.physics.constants import K_H2O
 
-_MAX_ITER_QUITE_CLOSE = 8
 _MAX_ITER_DEFAULT = 32
 _REALY_CLOSE_THRESHOLD = 1e-6
-_QUITE_CLOSE_THRESHOLD = 1
-_QUITE_CLOSE_MULTIPLIER = 2
+_BRACKET_INITIAL_MULTIPLIER = 1.1
 
-_K = namedtuple("_K", ("NH3", "SO2", "HSO3", "HSO4", "HCO3", "CO2", "HNO3"))
 _conc = namedtuple("_conc", ("N_mIII", "N_V", "C_IV", "S_IV", "S_VI"))
 
 
 class ChemistryMethods(BackendMethods):
-    def __init__(self):
-        BackendMethods.__init__(self)
-        self.HENRY_CONST = HenryConsts(self.formulae)
-        self.KINETIC_CONST = KineticConsts(self.formulae)
-        self.EQUILIBRIUM_CONST = EquilibriumConsts(self.formulae)
-        self.specific_gravities = SpecificGravities(self.formulae.constants)
-
-    def dissolution(  # pylint:disable=too-many-locals
+    # note: the constants below are evaluated on first use only (JIT-compiling formulae)
+    @cached_property
+    def HENRY_CONST(self):  # pylint: disable=invalid-name
+        return HenryConsts(self.formulae)
+
+    @cached_property
+    def KINETIC_CONST(self):  # pylint: disable=invalid-name
+        return KineticConsts(self.formulae)
+
+    @cached_property
+    def EQUILIBRIUM_CONST(self):  # pylint: disable=invalid-name
+        return EquilibriumConsts(self.formulae)
+
+    @cached_property
+    def specific_gravities(self):
+        return SpecificGravities(self.formulae.constants)
+
+    @cached_kernel
+    def _dissolution_body(self):
+        ff = self.formulae_flattened
+
+        @numba.njit(**self.default_jit_flags)
+        def body(  # pylint: disable=too-many-arguments,too-many-locals
+            *,
+            n_threads,
+            n_cell,
+            cell_order,
+            cell_start_arg,
+            idx,
+            do_chemistry_flag,
+            mole_amounts,
+            env_mixing_ratio,
+            henrys_constant,
+            env_T,
+            env_p,
+            env_rho_d,
+            timestep,
+            dv,
+            closed_system,
+            droplet_volume,
+            multiplicity,
+            specific_gravity,
+            alpha,
+            diffusion_const,
+            dissociation_factor,
+        ):
+            Mc = specific_gravity * ff.constants.Md
+            Rc = ff.constants.R_str / Mc
+            n_failed = 0
+            for thread_id in numba.prange(n_threads):  # pylint: disable=not-an-iterable
+                for i in range(thread_id, n_cell, n_threads):
+                    cell_id = cell_order[i]
+                    T = env_T[cell_id]
+                    cinf = (
+                        env_p[cell_id]
+                        / T
+                        / (ff.constants.Rd / env_mixing_ratio[cell_id] + Rc)
+                        / Mc
+                    )
+                    v_avg = np.sqrt(8 * ff.constants.R_str * T / (np.pi * Mc))
+
+                    mole_amount_taken = 0.0
+                    for j in range(
+                        cell_start_arg[cell_id], cell_start_arg[cell_id + 1]
+                    ):
+                        sd_id = idx[j]
+                        if not do_chemistry_flag[sd_id]:
+                            continue
+                        r_w = ff.trivia__radius(droplet_volume[sd_id])
+                        dt_over_scale = timestep / (
+                            4 * r_w / (3 * v_avg * alpha)
+                            + r_w**2 / (3 * diffusion_const)
+                        )
+                        A_old = mole_amounts[sd_id] / droplet_volume[sd_id]
+                        H_eff = henrys_constant[cell_id] * dissociation_factor[sd_id]
+                        A_new = (A_old + dt_over_scale * cinf) / (
+                            1 + dt_over_scale / H_eff / ff.constants.R_str / T
+                        )
+                        new_mole_amount_per_real_droplet = A_new * droplet_volume[sd_id]
+                        if new_mole_amount_per_real_droplet < 0:
+                            n_failed += 1
+
+                        mole_amount_taken += multiplicity[sd_id] * (
+                            new_mole_amount_per_real_droplet - mole_amounts[sd_id]
+                        )
+                        mole_amounts[sd_id] = new_mole_amount_per_real_droplet
+                    delta_mr = (
+                        mole_amount_taken
+                        * specific_gravity
+                        * ff.constants.Md
+                        / (dv[cell_id] * env_rho_d[cell_id])
+                    )
+                    if delta_mr > env_mixing_ratio[cell_id]:
+                        n_failed += 1
+                    if closed_system:
+                        env_mixing_ratio[cell_id] -= delta_mr
+            return n_failed
+
+        return body
+
+    def dissolution(  # pylint: disable=too-many-locals
         self,
         *,
         n_cell,
-        n_threads,
         cell_order,
         cell_start_arg,
         idx,
@@ -62,98 +155,33 @@ class ChemistryMethods(BackendMethods):
         droplet_volume,
         multiplicity,
     ):
-        assert n_cell == 1
-        assert n_threads == 1
-        for i in range(n_cell):
-            cell_id = cell_order[i]
-
-            cell_start = cell_start_arg[cell_id]
-            cell_end = cell_start_arg[cell_id + 1]
-            n_sd_in_cell = cell_end - cell_start
-            if n_sd_in_cell == 0:
-                continue
-
-            super_droplet_ids = numba.typed.List()
-            for sd_id in idx[cell_start:cell_end]:
-                if do_chemistry_flag.data[sd_id]:
-                    super_droplet_ids.append(sd_id)
-
-            if len(super_droplet_ids) == 0:
-                return
-
-            for key, compound in GASEOUS_COMPOUNDS.items():
-                ChemistryMethods.dissolution_body(
-                    super_droplet_ids=super_droplet_ids,
-                    mole_amounts=mole_amounts[key].data,
-                    env_mixing_ratio=env_mixing_ratio[compound][cell_id : cell_id + 1],
-                    henrysConstant=self.HENRY_CONST.HENRY_CONST[compound].at(
-                        env_T[cell_id]
-                    ),
-                    env_p=env_p[cell_id],
-                    env_T=env_T[cell_id],
-                    env_rho_d=env_rho_d[cell_id],
-                    timestep=timestep,
-                    dv=dv,
-                    droplet_volume=droplet_volume.data,
-                    multiplicity=multiplicity.data,
-                    system_type=system_type,
-                    specific_gravity=self.specific_gravities[compound],
-                    alpha=MASS_ACCOMMODATION_COEFFICIENTS[compound],
-                    diffusion_const=DIFFUSION_CONST[compound],
-                    dissociation_factor=dissociation_factors[compound].data,
-                    radius=self.formulae.trivia.radius,
-                    const=self.formulae.constants,
-                )
-
-    @staticmethod
-    @numba.njit(**{**conf.JIT_FLAGS, **{"parallel": False}})
-    def dissolution_body(  # pylint: disable=too-many-locals
-        *,
-        super_droplet_ids,
-        mole_amounts,
-        env_mixing_ratio,
-        henrysConstant,
-        env_p,
-        env_T,
-        env_rho_d,
-        timestep,
-        dv,
-        droplet_volume,
-        multiplicity,
-        system_type,
-        specific_gravity,
-        alpha,
-        diffusion_const,
-        dissociation_factor,
-        radius,
-        const,
-    ):
-        mole_amount_taken = 0
-        for i in super_droplet_ids:
-            Mc = specific_gravity * const.Md
-            Rc = const.R_str / Mc
-            cinf = env_p / env_T / (const.Rd / env_mixing_ratio[0] + Rc) / Mc
-            r_w = radius(volume=droplet_volume[i])
-            v_avg = np.sqrt(8 * const.R_str * env_T / (np.pi * Mc))
-            dt_over_scale = timestep / (
-                4 * r_w / (3 * v_avg * alpha) + r_w**2 / (3 * diffusion_const)
-            )
-            A_old = mole_amounts[i] / droplet_volume[i]
-            H_eff = henrysConstant * dissociation_factor[i]
-            A_new = (A_old + dt_over_scale * cinf) / (
-                1 + dt_over_scale / H_eff / const.R_str / env_T
-            )
-            new_mole_amount_per_real_droplet = A_new * droplet_volume[i]
-            assert new_mole_amount_per_real_droplet >= 0
-
-            mole_amount_taken += multiplicity[i] * (
-                new_mole_amount_per_real_droplet - mole_amounts[i]
+        n_threads = min(numba.get_num_threads(), n_cell)
+        dv = np.broadcast_to(dv, (n_cell,)).astype(float)
+        for key, compound in GASEOUS_COMPOUNDS.items():
+            n_failed = self._dissolution_body(
+                n_threads=n_threads,
+                n_cell=n_cell,
+                cell_order=cell_order,
+                cell_start_arg=cell_start_arg.data,
+                idx=idx.data,
+                do_chemistry_flag=do_chemistry_flag.data,
+                mole_amounts=mole_amounts[key].data,
+                env_mixing_ratio=env_mixing_ratio[compound],
+                henrys_constant=self.HENRY_CONST.HENRY_CONST[compound].at(env_T.data),
+                env_T=env_T.data,
+                env_p=env_p.data,
+                env_rho_d=env_rho_d.data,
+                timestep=timestep,
+                dv=dv,
+                closed_system=system_type == "closed",
+                droplet_volume=droplet_volume.data,
+                multiplicity=multiplicity.data,
+                specific_gravity=self.specific_gravities[compound],
+                alpha=MASS_ACCOMMODATION_COEFFICIENTS[compound],
+                diffusion_const=DIFFUSION_CONST[compound],
+                dissociation_factor=dissociation_factors[compound].data,
             )
-            mole_amounts[i] = new_mole_amount_per_real_droplet
-        delta_mr = mole_amount_taken * specific_gravity * const.Md / (dv * env_rho_d)
-        assert delta_mr <= env_mixing_ratio
-        if system_type == "closed":
-            env_mixing_ratio -= delta_mr
+            assert n_failed == 0
 
     def oxidation(  # pylint: disable=too-many-locals
         self,
@@ -279,30 +307,214 @@ class ChemistryMethods(BackendMethods):
                 moles_H2O2[i], dt_times_volume, dconc_dt_H2O2
             )
 
+    @cached_kernel
+    def _chem_recalculate_drop_data_body(self):
+        ff = self.formulae_flattened
+
+        @numba.njit(**self.default_jit_flags)
+        def body(  # pylint: disable=too-many-locals
+            *, pH, cell_id, K, dissociation_factors
+        ):
+            # arrays within namedtuples in prange loops do not work
+            # https://github.com/numba/numba/issues/5872
+            K_NH3, K_SO2, K_HSO3, K_HSO4 = K.NH3, K.SO2, K.HSO3, K.HSO4
+            K_HCO3, K_CO2, K_HNO3 = K.HCO3, K.CO2, K.HNO3
+            df_HNO3, df_H2O2, df_NH3 = (
+                dissociation_factors.HNO3,
+                dissociation_factors.H2O2,
+                dissociation_factors.NH3,
+            )
+            df_SO2, df_CO2, df_O3 = (
+                dissociation_factors.SO2,
+                dissociation_factors.CO2,
+                dissociation_factors.O3,
+            )
+            for i in numba.prange(len(pH)):  # pylint: disable=not-an-iterable
+                cid = cell_id[i]
+                factors = calc_dissociation_factors(
+                    ff.trivia__pH2H(pH[i]),
+                    _K(
+                        NH3=K_NH3[cid],
+                        SO2=K_SO2[cid],
+                        HSO3=K_HSO3[cid],
+                        HSO4=K_HSO4[cid],
+                        HCO3=K_HCO3[cid],
+                        CO2=K_CO2[cid],
+                        HNO3=K_HNO3[cid],
+                    ),
+                )
+                df_HNO3[i] = factors.HNO3
+                df_H2O2[i] = factors.H2O2
+                df_NH3[i] = factors.NH3
+                df_SO2[i] = factors.SO2
+                df_CO2[i] = factors.CO2
+                df_O3[i] = factors.O3
+
+        return body
+
     def chem_recalculate_drop_data(
         self, dissociation_factors, equilibrium_consts, cell_id, pH
     ):
-        for i in range(len(pH)):
-            H = self.formulae.trivia.pH2H(pH.data[i])
-            for key in DIFFUSION_CONST:
-                dissociation_factors[key].data[i] = DISSOCIATION_FACTORS[key](
-                    H, equilibrium_consts, cell_id.data[i]
-                )
+        self._chem_recalculate_drop_data_body(
+            pH=pH.data,
+            cell_id=cell_id.data,
+            K=_K(
+                NH3=equilibrium_consts["K_NH3"].data,
+                SO2=equilibrium_consts["K_SO2"].data,
+                HSO3=equilibrium_consts["K_HSO3"].data,
+                HSO4=equilibrium_consts["K_HSO4"].data,
+                HCO3=equilibrium_consts["K_HCO3"].data,
+                CO2=equilibrium_consts["K_CO2"].data,
+                HNO3=equilibrium_consts["K_HNO3"].data,
+            ),
+            dissociation_factors=_DF(
+                **{key: dissociation_factors[key].data for key in _DF._fields}
+            ),
+        )
+
+    @cached_kernel
+    def _chem_recalculate_cell_data_body(self):
+        ff = self.formulae_flattened
+
+        @numba.njit(**self.default_jit_flags)
+        def body(
+            *,
+            temperature,
+            equilibrium_consts,
+            equilibrium_params,
+            kinetic_consts,
+            kinetic_params,
+        ):
+            for i in numba.prange(len(temperature)):  # pylint: disable=not-an-iterable
+                # pylint: disable-next=consider-using-enumerate
+                for j in range(len(equilibrium_consts)):
+                    equilibrium_consts[j][i] = ff.trivia__vant_hoff(
+                        equilibrium_params[j, 0],
+                        equilibrium_params[j, 1],
+                        temperature[i],
+                        equilibrium_params[j, 2],
+                    )
+                # pylint: disable-next=consider-using-enumerate
+                for j in range(len(kinetic_consts)):
+                    kinetic_consts[j][i] = ff.trivia__arrhenius(
+                        kinetic_params[j, 0], kinetic_params[j, 1], temperature[i]
+                    )
+
+        return body
 
     def chem_recalculate_cell_data(
         self, equilibrium_consts, kinetic_consts, temperature
     ):
-        for i in range(len(temperature)):
-            for key in equilibrium_consts:
-                equilibrium_consts[key].data[i] = (
-                    self.EQUILIBRIUM_CONST.EQUILIBRIUM_CONST[key].at(
-                        temperature.data[i]
+        eqc = self.EQUILIBRIUM_CONST.EQUILIBRIUM_CONST
+        kc = self.KINETIC_CONST.KINETIC_CONST
+        self._chem_recalculate_cell_data_body(
+            temperature=temperature.data,
+            equilibrium_consts=tuple(
+                value.data for value in equilibrium_consts.values()
+            ),
+            equilibrium_params=np.asarray(
+                [(eqc[key].K, eqc[key].dH, eqc[key].T0) for key in equilibrium_consts]
+            ).reshape(-1, 3),
+            kinetic_consts=tuple(value.data for value in kinetic_consts.values()),
+            kinetic_params=np.asarray(
+                [(kc[key].A, kc[key].Ea) for key in kinetic_consts]
+            ).reshape(-1, 2),
+        )
+
+    @cached_kernel
+    def _equilibrate_H_body(self):
+        ff = self.formulae_flattened
+
+        @numba.njit(**self.default_jit_flags)
+        def body(  # pylint: disable=too-many-locals
+            *,
+            cell_id,
+            conc,
+            K,
+            do_chemistry_flag,
+            pH,
+            iterations,
+            n_solves,
+            n_iterations,
+            n_threads,
+            # params
+            H_min,
+            H_max,
+            ionic_strength_threshold,
+            rtol,
+        ):
+            # arrays within namedtuples in prange loops do not work
+            # https://github.com/numba/numba/issues/5872
+            N_mIII, N_V, C_IV, S_IV, S_VI = (
+                conc.N_mIII,
+                conc.N_V,
+                conc.C_IV,
+                conc.S_IV,
+                conc.S_VI,
+            )
+            K_NH3, K_SO2, K_HSO3, K_HSO4 = K.NH3, K.SO2, K.HSO3, K.HSO4
+            K_HCO3, K_CO2, K_HNO3 = K.HCO3, K.CO2, K.HNO3
+            # per-thread per-cell partial counts summed up after the parallel pass
+            n_sd, n_cell = len(pH), n_solves.shape[0]
+            solves = np.zeros((n_threads, n_cell), dtype=np.int64)
+            solver_iterations = np.zeros_like(solves)
+            n_failed = 0
+            for t in numba.prange(n_threads):  # pylint: disable=not-an-iterable
+                for i in range(t * n_sd // n_threads, (t + 1) * n_sd // n_threads):
+                    cid = cell_id[i]
+                    args = (
+                        _conc(
+                            N_mIII=N_mIII[i],
+                            N_V=N_V[i],
+                            C_IV=C_IV[i],
+                            S_IV=S_IV[i],
+                            S_VI=S_VI[i],
+                        ),
+                        _K(
+                            NH3=K_NH3[cid],
+                            SO2=K_SO2[cid],
+                            HSO3=K_HSO3[cid],
+                            HSO4=K_HSO4[cid],
+                            HCO3=K_HCO3[cid],
+                            CO2=K_CO2[cid],
+                            HNO3=K_HNO3[cid],
+                        ),
                     )
-                )
-            for key in kinetic_consts:
-                kinetic_consts[key].data[i] = self.KINETIC_CONST.KINETIC_CONST[key].at(
-                    temperature.data[i]
-                )
+                    H = min(max(ff.trivia__pH2H(pH[i]), H_min), H_max)
+                    fH = acidity_minfun(H, *args)
+                    if abs(fH) < _REALY_CLOSE_THRESHOLD:
+                        iterations[i] = 0
+                        continue
+                    a, b, fa, fb, n_expansions = bracket_acidity_root(
+                        H, fH, args, H_min, H_max
+                    )
+                    H, iters_taken = toms748_solve(
+                        acidity_minfun,
+                        args,
+                        a,
+                        b,
+                        fa,
+                        fb,
+                        rtol=rtol,
+                        max_iter=_MAX_ITER_DEFAULT,
+                        within_tolerance=ff.trivia__within_tolerance,
+                    )
+                    if iters_taken in (-1, _MAX_ITER_DEFAULT):
+                        n_failed += 1
+                    iterations[i] = n_expansions + iters_taken
+                    solves[t, cid] += 1
+                    solver_iterations[t, cid] += iterations[i]
+                    pH[i] = ff.trivia__H2pH(H)
+                    ionic_strength = calc_ionic_strength(H, *args)
+                    do_chemistry_flag[i] = ionic_strength <= ionic_strength_threshold
+
+            for cid in numba.prange(n_cell):  # pylint: disable=not-an-iterable
+                for t in range(n_threads):
+                    n_solves[cid] += solves[t, cid]
+                    n_iterations[cid] += solver_iterations[t, cid]
+            return n_failed
+
+        return body
 
     def equilibrate_H(
         self,
@@ -316,11 +528,10 @@ class ChemistryMethods(BackendMethods):
         H_max,
         ionic_strength_threshold,
         rtol,
+        iterations,
+        counters,
     ):
-        ChemistryMethods.equilibrate_H_body(
-            within_tolerance=self.formulae.trivia.within_tolerance,
-            pH2H=self.formulae.trivia.pH2H,
-            H2pH=self.formulae.trivia.H2pH,
+        n_failed = self._equilibrate_H_body(
             cell_id=cell_id.data,
             conc=_conc(
                 N_mIII=conc.N_mIII.data,
@@ -341,93 +552,45 @@ class ChemistryMethods(BackendMethods):
             # output
             do_chemistry_flag=do_chemistry_flag.data,
             pH=pH.data,
+            iterations=iterations.data,
+            n_solves=counters["n_pH_solves"].data,
+            n_iterations=counters["n_pH_iterations"].data,
+            n_threads=numba.get_num_threads(),
             # params
             H_min=H_min,
             H_max=H_max,
             ionic_strength_threshold=ionic_strength_threshold,
             rtol=rtol,
         )
+        assert n_failed == 0
 
-    @staticmethod
-    @numba.njit(**{**conf.JIT_FLAGS, **{"parallel": False, "cache": False}})
-    def equilibrate_H_body(  # pylint: disable=too-many-locals
-        *,
-        within_tolerance,
-        pH2H,
-        H2pH,
-        cell_id,
-        conc,
-        K,
-        do_chemistry_flag,
-        pH,
-        # params
-        H_min,
-        H_max,
-        ionic_strength_threshold,
-        rtol,
-    ):
-        for i, pH_i in enumerate(pH):
-            cid = cell_id[i]
-            args = (
-                _conc(
-                    N_mIII=conc.N_mIII[i],
-                    N_V=conc.N_V[i],
-                    C_IV=conc.C_IV[i],
-                    S_IV=conc.S_IV[i],
-                    S_VI=conc.S_VI[i],
-                ),
-                _K(
-                    NH3=K.NH3[cid],
-                    SO2=K.SO2[cid],
-                    HSO3=K.HSO3[cid],
-                    HSO4=K.HSO4[cid],
-                    HCO3=K.HCO3[cid],
-                    CO2=K.CO2[cid],
-                    HNO3=K.HNO3[cid],
-                ),
-            )
-            a = pH2H(pH_i)
+
+@numba.njit(**{**conf.JIT_FLAGS, **{"parallel": False}})
+def bracket_acidity_root(H, fH, args, H_min, H_max):
+    """brackets the root of `acidity_minfun` (which increases with H) starting
+    from a narrow interval around the previous value `H` (with `fH` being the function
+    value at `H`) and widening it geometrically (up to `[H_min, H_max]`) until
+    the function changes sign; returns the bracket, function values at its ends
+    and the number of function evaluations"""
+    multiplier = _BRACKET_INITIAL_MULTIPLIER
+    a, b, fa, fb = H, H, fH, fH
+    n_evaluations = 0
+    while fa * fb > 0:
+        if fH > 0:
+            if a <= H_min:
+                break
+            b, fb = a, fa
+            a = max(a / multiplier, H_min)
             fa = acidity_minfun(a, *args)
-            if abs(fa) < _REALY_CLOSE_THRESHOLD:
-                continue
-            b = np.nan
-            fb = np.nan
-            use_default_range = False
-            if abs(fa) < _QUITE_CLOSE_THRESHOLD:
-                b = a * _QUITE_CLOSE_MULTIPLIER
-                fb = acidity_minfun(b, *args)
-                if fa * fb > 0:
-                    b = a
-                    fb = fa
-                    a = b / _QUITE_CLOSE_MULTIPLIER / _QUITE_CLOSE_MULTIPLIER
-                    fa = acidity_minfun(a, *args)
-                    if fa * fb > 0:
-                        use_default_range = True
-            else:
-                use_default_range = True
-            if use_default_range:
-                a = H_min
-                b = H_max
-                fa = acidity_minfun(a, *args)
-                fb = acidity_minfun(b, *args)
-                max_iter = _MAX_ITER_DEFAULT
-            else:
-                max_iter = _MAX_ITER_QUITE_CLOSE
-            H, _iters_taken = toms748_solve(
-                acidity_minfun,
-                args,
-                a,
-                b,
-                fa,
-                fb,
-                rtol=rtol,
-                max_iter=max_iter,
-                within_tolerance=within_tolerance,
-            )
-            assert _iters_taken != max_iter
-            pH[i] = H2pH(H)
-            ionic_strength = calc_ionic_strength(H, *args)
-            do_chemistry_flag[i] = ionic_strength <= ionic_strength_threshold
+        else:
+            if b >= H_max:
+                break
+            a, fa = b, fb
+            b = min(b * multiplier, H_max)
+            fb = acidity_minfun(b, *args)
+        n_evaluations += 1
+        multiplier *= multiplier
+    return a, b, fa, fb, n_evaluations
 
 
 @numba.njit(**{**conf.JIT_FLAGS, **{"parallel": False}})
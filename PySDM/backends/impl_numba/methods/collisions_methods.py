@@ -2,16 +2,22 @@
 CPU implementation of backend methods for particle collisions
 """
 
-from functools import cached_property
 import numba
 import numpy as np
 
 from PySDM.backends.impl_common.backend_methods import BackendMethods
+from PySDM.backends.impl_numba.jit_cache import cached_kernel
 from PySDM.backends.impl_numba import conf
 from PySDM.backends.impl_numba.atomic_operations import atomic_add
+from PySDM.backends.impl_numba.random import uniform_at
 from PySDM.backends.impl_numba.storage import Storage
 from PySDM.backends.impl_numba.warnings import warn
 
+# pylint: disable=too-many-lines
+
+CELL_CARETAKER_SCHEMES = ("counting_sort", "counting_sort_parallel", "incremental")
+INCREMENTAL_SORT_MAX_MOVED_FRACTION = 0.25
+
 
 @numba.njit(**{**conf.JIT_FLAGS, **{"parallel": False}})
 def pair_indices(i, idx, is_first_in_pair, prob_like):
@@ -243,8 +249,58 @@ def break_up_while(
         warn("overflow", __file__)
 
 
+@numba.njit(**{**conf.JIT_FLAGS, **{"parallel": False}})
+def linear_collection_efficiency_of_pair(
+    params, radius_j, radius_k, unit
+):  # pylint: disable=too-many-locals
+    """collection efficiency for a pair of droplets of radii `radius_j` and `radius_k`
+    using Berry's parameterization (zero for equal radii or where not defined)"""
+    A, B, D1, D2, E1, E2, F1, F2, G1, G2, G3, Mf, Mg = params
+    if radius_j > radius_k:
+        r = radius_j / unit
+        r_s = radius_k / unit
+    else:
+        r = radius_k / unit
+        r_s = radius_j / unit
+    p = r_s / r
+    if p not in (0, 1):
+        G = (G1 / r) ** Mg + G2 + G3 * r
+        Gp = (1 - p) ** G
+        if Gp != 0:
+            D = D1 / r**D2
+            E = E1 / r**E2
+            F = (F1 / r) ** Mf + F2
+            return max(0, A + B * p + D / p**F + E / Gp)
+    return 0
+
+
 class CollisionsMethods(BackendMethods):
-    @cached_property
+    KERNEL_SIGNATURES = {
+        "adaptive_sdm_end": {"_adaptive_sdm_end_body": "F,i,I"},
+        "scale_prob_for_adaptive_sdm_gamma": {
+            "_scale_prob_for_adaptive_sdm_gamma_body": "F,I,i,I,I,F,f,f_range,B,I,F,i"
+        },
+        "collision_coalescence": {"_collision_coalescence_body": "I,I,i,F2,F,I,I,I,B"},
+        "collision_coalescence_breakup": {
+            "_collision_coalescence_breakup_body": (
+                "I,I,i,F2,F,F,F,F,F,I,I,I,I,I,B,i,b,F"
+            )
+        },
+        "compute_gamma": {"_compute_gamma_body": "F,F,I,i,I,I,I,I,B,F"},
+        "normalize": {"_normalize_body": "F,I,i,I,I,I,F,f,F"},
+        "linear_collision_kernel": {"_linear_collision_kernel_body": "F,F,B,I,i,f,f"},
+        "geometric_collision_kernel": {
+            "_geometric_collision_kernel_body": "F,F,F,B,I,i,f"
+        },
+        "parameterized_collision_kernel": {
+            "_parameterized_collision_kernel_body": "berry_params,F,F,F,B,I,i,f"
+        },
+        "long1974_collision_kernel": {
+            "_long1974_collision_kernel_body": "F,F,F,B,I,i,f,f,f"
+        },
+    }
+
+    @cached_kernel
     def _collision_coalescence_breakup_body(self):
         _break_up = break_up_while if self.formulae.handle_all_breakups else break_up
 
@@ -275,11 +331,12 @@ class CollisionsMethods(BackendMethods):
                 j, k, skip_pair = pair_indices(i, idx, is_first_in_pair, gamma)
                 if skip_pair:
                     continue
-                bouncing = rand[i] - (Ec[i] + (1 - Ec[i]) * (Eb[i])) > 0
+                rand_i = uniform_at(rand, i)
+                bouncing = rand_i - (Ec[i] + (1 - Ec[i]) * (Eb[i])) > 0
                 if bouncing:
                     continue
 
-                if rand[i] - Ec[i] < 0:
+                if rand_i - Ec[i] < 0:
                     coalesce(
                         i,
                         j,
@@ -310,7 +367,7 @@ class CollisionsMethods(BackendMethods):
 
         return body
 
-    @cached_property
+    @cached_kernel
     def _adaptive_sdm_end_body(self):
         @numba.njit(**{**self.default_jit_flags, "parallel": False})
         def body(dt_left, n_cell, cell_start):
@@ -327,7 +384,7 @@ class CollisionsMethods(BackendMethods):
     def adaptive_sdm_end(self, dt_left, cell_start):
         return self._adaptive_sdm_end_body(dt_left.data, len(dt_left), cell_start.data)
 
-    @cached_property
+    @cached_kernel
     def _scale_prob_for_adaptive_sdm_gamma_body(self):
         @numba.njit(**self.default_jit_flags)
         def body(
@@ -342,6 +399,7 @@ class CollisionsMethods(BackendMethods):
             is_first_in_pair,
             stats_n_substep,
             stats_dt_min,
+            n_threads,
         ):  # pylint: disable=too-many-locals,too-many-positional-arguments
             """Modified parameters are: `dt_left[cell_id]`, `prob[pair_id]`,
             `stats_n_substep[cell_id]`, `stats_dt_min[cell_id]`;
@@ -351,19 +409,31 @@ class CollisionsMethods(BackendMethods):
             After a full model step is completed, `stats_n_substep[cell_id]` would be 1 if
             no adaptive substepping was needed.
             """
+            n_pair = length // 2
+            thread_num = max(1, min(n_threads, n_pair))
+            dt_optimal_min = np.full((thread_num, len(dt_left)), np.inf)
+            for t in numba.prange(thread_num):  # pylint: disable=not-an-iterable
+                for i in range(
+                    t * n_pair // thread_num,
+                    (t + 1) * n_pair // thread_num if t < thread_num - 1 else n_pair,
+                ):
+                    j, k, skip_pair = pair_indices(i, idx, is_first_in_pair, prob)
+                    if skip_pair:
+                        continue
+                    prop = multiplicity[j] // multiplicity[k]
+                    dt_optimal = dt * prop / prob[i]
+                    cid = cell_id[j]
+                    dt_optimal = max(dt_optimal, dt_range[0])
+                    dt_optimal_min[t, cid] = min(dt_optimal_min[t, cid], dt_optimal)
             dt_todo = np.empty_like(dt_left)
             for cid in numba.prange(len(dt_todo)):  # pylint: disable=not-an-iterable
                 dt_todo[cid] = min(dt_left[cid], dt_range[1])
-            for i in range(length // 2):  # TODO #571
-                j, k, skip_pair = pair_indices(i, idx, is_first_in_pair, prob)
-                if skip_pair:
-                    continue
-                prop = multiplicity[j] // multiplicity[k]
-                dt_optimal = dt * prop / prob[i]
-                cid = cell_id[j]
-                dt_optimal = max(dt_optimal, dt_range[0])
-                dt_todo[cid] = min(dt_todo[cid], dt_optimal)
-                stats_dt_min[cid] = min(stats_dt_min[cid], dt_optimal)
+                for t in range(thread_num):
+                    if dt_optimal_min[t, cid] != np.inf:
+                        dt_todo[cid] = min(dt_todo[cid], dt_optimal_min[t, cid])
+                        stats_dt_min[cid] = min(
+                            stats_dt_min[cid], dt_optimal_min[t, cid]
+                        )
             for i in numba.prange(length // 2):  # pylint: disable=not-an-iterable
                 j, _, skip_pair = pair_indices(i, idx, is_first_in_pair, prob)
                 if skip_pair:
@@ -396,14 +466,15 @@ class CollisionsMethods(BackendMethods):
             multiplicity.data,
             cell_id.data,
             dt_left.data,
-            dt,
-            dt_range,
+            float(dt),
+            tuple(float(limit) for limit in dt_range),
             is_first_in_pair.indicator.data,
             stats_n_substep.data,
             stats_dt_min.data,
+            numba.get_num_threads(),
         )
 
-    @cached_property
+    @cached_kernel
     def _cell_id_body(self):
         # @numba.njit(**conf.JIT_FLAGS)  # note: as of Numba 0.51, np.dot() does not support ints
         def body(cell_id, cell_origin, strides):
@@ -414,7 +485,7 @@ class CollisionsMethods(BackendMethods):
     def cell_id(self, cell_id, cell_origin, strides):
         return self._cell_id_body(cell_id.data, cell_origin.data, strides.data)
 
-    @cached_property
+    @cached_kernel
     def _collision_coalescence_body(self):
         @numba.njit(**self.default_jit_flags)
         def body(
@@ -518,7 +589,7 @@ class CollisionsMethods(BackendMethods):
             particle_mass=particle_mass.data,
         )
 
-    @cached_property
+    @cached_kernel
     def _compute_gamma_body(self):
         @numba.njit(**self.default_jit_flags)
         def body(
@@ -542,7 +613,7 @@ class CollisionsMethods(BackendMethods):
             out may point to the same array as prob
             """
             for i in numba.prange(length // 2):  # pylint: disable=not-an-iterable
-                out[i] = np.ceil(prob[i] - rand[i])
+                out[i] = np.ceil(prob[i] - uniform_at(rand, i))
                 j, k, skip_pair = pair_indices(i, idx, is_first_in_pair, out)
                 if skip_pair:
                     continue
@@ -584,17 +655,23 @@ class CollisionsMethods(BackendMethods):
 
     @staticmethod
     def make_cell_caretaker(idx_shape, idx_dtype, cell_start_len, scheme="default"):
-        class CellCaretaker:  # pylint: disable=too-few-public-methods
+        # pylint: disable-next=too-few-public-methods,too-many-instance-attributes
+        class CellCaretaker:
             def __init__(self, idx_shape, idx_dtype, cell_start_len, scheme):
+                full_sort_scheme = (
+                    "counting_sort_parallel"
+                    if conf.JIT_FLAGS["parallel"]
+                    else "counting_sort"
+                )
                 if scheme == "default":
-                    if conf.JIT_FLAGS["parallel"]:
-                        scheme = "counting_sort_parallel"
-                    else:
-                        scheme = "counting_sort"
+                    scheme = full_sort_scheme
+                assert scheme in CELL_CARETAKER_SCHEMES
                 self.scheme = scheme
-                if scheme in ("counting_sort", "counting_sort_parallel"):
-                    self.tmp_idx = Storage.empty(idx_shape, idx_dtype)
-                if scheme == "counting_sort_parallel":
+                self.full_sort_scheme = (
+                    full_sort_scheme if scheme == "incremental" else scheme
+                )
+                self.tmp_idx = Storage.empty(idx_shape, idx_dtype)
+                if self.full_sort_scheme == "counting_sort_parallel":
                     self.cell_starts = Storage.empty(
                         (
                             numba.config.NUMBA_NUM_THREADS,  # pylint: disable=no-member
@@ -602,10 +679,33 @@ class CollisionsMethods(BackendMethods):
                         ),
                         dtype=int,
                     )
+                if scheme == "incremental":
+                    self.sorted_cell = Storage.from_ndarray(
+                        np.full(idx_shape, -1, dtype=np.int64)
+                    )
+                    self.moved = Storage.empty(idx_shape, dtype=bool)
+                    self.departed = Storage.empty(idx_shape, idx_dtype)
+                    self.arrived = Storage.empty(idx_shape, idx_dtype)
 
             def __call__(self, cell_id, cell_idx, cell_start, idx):
                 length = len(idx)
-                if self.scheme == "counting_sort":
+                if self.scheme == "incremental":
+                    if CollisionsMethods._incremental_sort_by_cell_id_and_update_cell_start(
+                        self.tmp_idx.data,
+                        idx.data,
+                        cell_id.data,
+                        cell_idx.data,
+                        length,
+                        cell_start.data,
+                        self.sorted_cell.data,
+                        self.moved.data,
+                        self.departed.data,
+                        self.arrived.data,
+                        INCREMENTAL_SORT_MAX_MOVED_FRACTION,
+                    ):
+                        idx.data, self.tmp_idx.data = self.tmp_idx.data, idx.data
+                        return
+                if self.full_sort_scheme == "counting_sort":
                     CollisionsMethods._counting_sort_by_cell_id_and_update_cell_start(
                         self.tmp_idx.data,
                         idx.data,
@@ -614,7 +714,7 @@ class CollisionsMethods(BackendMethods):
                         length,
                         cell_start.data,
                     )
-                elif self.scheme == "counting_sort_parallel":
+                elif self.full_sort_scheme == "counting_sort_parallel":
                     CollisionsMethods._parallel_counting_sort_by_cell_id_and_update_cell_start(
                         self.tmp_idx.data,
                         idx.data,
@@ -625,41 +725,62 @@ class CollisionsMethods(BackendMethods):
                         self.cell_starts.data,
                     )
                 idx.data, self.tmp_idx.data = self.tmp_idx.data, idx.data
+                if self.scheme == "incremental":
+                    CollisionsMethods._store_sorted_cell(
+                        self.sorted_cell.data, idx.data, cell_start.data
+                    )
 
         return CellCaretaker(idx_shape, idx_dtype, cell_start_len, scheme)
 
-    @cached_property
+    @cached_kernel
     def _normalize_body(self):
         @numba.njit(**{**self.default_jit_flags, **{"parallel": False}})
-        def body(prob, cell_id, cell_idx, cell_start, norm_factor, timestep, dv):
+        def body(
+            prob, idx, length, cell_id, cell_idx, cell_start, norm_factor, timestep, dv
+        ):
+            # pylint: disable=too-many-positional-arguments
             n_cell = cell_start.shape[0] - 1
-            for i in range(n_cell):
+            for cid in range(n_cell):
+                i = cell_idx[cid]
                 sd_num = cell_start[i + 1] - cell_start[i]
                 if sd_num < 2:
                     norm_factor[i] = 0
                 else:
                     norm_factor[i] = (
-                        timestep / dv * sd_num * (sd_num - 1) / 2 / (sd_num // 2)
+                        timestep / dv[cid] * sd_num * (sd_num - 1) / 2 / (sd_num // 2)
                     )
-            for d in numba.prange(prob.shape[0]):  # pylint: disable=not-an-iterable
-                prob[d] *= norm_factor[cell_idx[cell_id[d]]]
+            # pairs beyond `length` (removed super-droplets) are not normalised
+            for d in numba.prange(length // 2):  # pylint: disable=not-an-iterable
+                # `2d + 1` is within the pair regardless of its offset (see `pair_indices`)
+                prob[d] *= norm_factor[cell_idx[cell_id[idx[2 * d + 1]]]]
 
         return body
 
     def normalize(
-        self, prob, cell_id, cell_idx, cell_start, norm_factor, timestep, dv
+        self,
+        prob,
+        idx,
+        length,
+        cell_id,
+        cell_idx,
+        cell_start,
+        norm_factor,
+        timestep,
+        dv,
     ):  # pylint: disable=too-many-positional-arguments
         return self._normalize_body(
             prob.data,
+            idx.data,
+            length,
             cell_id.data,
             cell_idx.data,
             cell_start.data,
             norm_factor.data,
-            timestep,
-            dv,
+            float(timestep),
+            np.broadcast_to(dv, (len(cell_start) - 1,)).astype(float),
         )
 
-    @cached_property
+    @cached_kernel
     def remove_zero_n_or_flagged(self):
         @numba.njit(**{**self.default_jit_flags, **{"parallel": False}})
         def body(multiplicity, idx, length) -> int:
@@ -736,31 +857,112 @@ class CollisionsMethods(BackendMethods):
 
         cell_start[:] = cell_end_thread[0, :]
 
-    @cached_property
+    @staticmethod
+    @numba.njit(**conf.JIT_FLAGS)
+    # pylint: disable=too-many-arguments,too-many-positional-arguments,too-many-locals,too-many-branches
+    def _incremental_sort_by_cell_id_and_update_cell_start(
+        new_idx,
+        idx,
+        cell_id,
+        cell_idx,
+        length,
+        cell_start,
+        sorted_cell,
+        moved,
+        departed,
+        arrived,
+        max_moved_fraction,
+    ) -> bool:
+        """moves between cell buckets only the super-droplets whose cell changed since
+        the previous sort (`sorted_cell` holding the bucket of each super-droplet);
+        returns False (leaving `idx` and `cell_start` intact) if `idx` is not
+        partitioned into buckets as after the previous sort (e.g., after a global
+        shuffle or removal of super-droplets) or if the fraction of super-droplets
+        that changed cell exceeds `max_moved_fraction`"""
+        n_bucket = len(cell_start) - 1
+        if cell_start[n_bucket] != length:
+            return False
+
+        n_out = np.empty(n_bucket, dtype=np.int64)
+        for c in numba.prange(n_bucket):  # pylint: disable=not-an-iterable
+            n_out[c] = 0
+            for i in range(cell_start[c], cell_start[c + 1]):
+                if sorted_cell[idx[i]] != c:
+                    n_out[c] = -1
+                    break
+                moved[i] = cell_idx[cell_id[idx[i]]] != c
+                if moved[i]:
+                    n_out[c] += 1
+
+        out_start = np.zeros(n_bucket + 1, dtype=np.int64)
+        for c in range(n_bucket):
+            if n_out[c] < 0:
+                return False
+            out_start[c + 1] = out_start[c] + n_out[c]
+        n_moved = out_start[n_bucket]
+        if n_moved > max_moved_fraction * length:
+            return False
+
+        for c in numba.prange(n_bucket):  # pylint: disable=not-an-iterable
+            k = out_start[c]
+            for i in range(cell_start[c], cell_start[c + 1]):
+                if moved[i]:
+                    departed[k] = idx[i]
+                    k += 1
+
+        in_start = np.zeros(n_bucket + 1, dtype=np.int64)
+        for k in range(n_moved):
+            in_start[cell_idx[cell_id[departed[k]]] + 1] += 1
+        for c in range(n_bucket):
+            in_start[c + 1] += in_start[c]
+        in_end = in_start[1:].copy()
+        for k in range(n_moved - 1, -1, -1):
+            c = cell_idx[cell_id[departed[k]]]
+            in_end[c] -= 1
+            arrived[in_end[c]] = departed[k]
+
+        new_start = np.empty(n_bucket + 1, dtype=np.int64)
+        new_start[0] = 0
+        for c in range(n_bucket):
+            new_start[c + 1] = (
+                new_start[c]
+                + cell_start[c + 1]
+                - cell_start[c]
+                - n_out[c]
+                + in_start[c + 1]
+                - in_start[c]
+            )
+
+        for c in numba.prange(n_bucket):  # pylint: disable=not-an-iterable
+            k = new_start[c]
+            for i in range(cell_start[c], cell_start[c + 1]):
+                if not moved[i]:
+                    new_idx[k] = idx[i]
+                    k += 1
+            for i in range(in_start[c], in_start[c + 1]):
+                new_idx[k] = arrived[i]
+                sorted_cell[arrived[i]] = c
+                k += 1
+        cell_start[:] = new_start
+        return True
+
+    @staticmethod
+    @numba.njit(**conf.JIT_FLAGS)
+    def _store_sorted_cell(sorted_cell, idx, cell_start):
+        for c in numba.prange(len(cell_start) - 1):  # pylint: disable=not-an-iterable
+            for i in range(cell_start[c], cell_start[c + 1]):
+                sorted_cell[idx[i]] = c
+
+    @cached_kernel
     def _linear_collection_efficiency_body(self):
         @numba.njit(**self.default_jit_flags)
-        # pylint: disable=too-many-locals
         def body(params, output, radii, is_first_in_pair, idx, length, unit):
-            A, B, D1, D2, E1, E2, F1, F2, G1, G2, G3, Mf, Mg = params
             output[:] = 0
             for i in numba.prange(length - 1):  # pylint: disable=not-an-iterable
                 if is_first_in_pair[i]:
-                    if radii[idx[i]] > radii[idx[i + 1]]:
-                        r = radii[idx[i]] / unit
-                        r_s = radii[idx[i + 1]] / unit
-                    else:
-                        r = radii[idx[i + 1]] / unit
-                        r_s = radii[idx[i]] / unit
-                    p = r_s / r
-                    if p not in (0, 1):
-                        G = (G1 / r) ** Mg + G2 + G3 * r
-                        Gp = (1 - p) ** G
-                        if Gp != 0:
-                            D = D1 / r**D2
-                            E = E1 / r**E2
-                            F = (F1 / r) ** Mf + F2
-                            output[i // 2] = A + B * p + D / p**F + E / Gp
-                            output[i // 2] = max(0, output[i // 2])
+                    output[i // 2] = linear_collection_efficiency_of_pair(
+                        params, radii[idx[i]], radii[idx[i + 1]], unit
+                    )
 
         return body
 
@@ -776,3 +978,142 @@ class CollisionsMethods(BackendMethods):
             len(is_first_in_pair),
             unit,
         )
+
+    @cached_kernel
+    def _geometric_collision_kernel_body(self):
+        PI = self.formulae.constants.PI
+
+        @numba.njit(**self.default_jit_flags)
+        def body(
+            output, radius, fall_velocity, is_first_in_pair, idx, length, efficiency
+        ):  # pylint: disable=too-many-positional-arguments
+            output[:] = 0
+            for i in numba.prange(length - 1):  # pylint: disable=not-an-iterable
+                if is_first_in_pair[i]:
+                    j, k = idx[i], idx[i + 1]
+                    output[i // 2] = (
+                        (radius[j] + radius[k]) ** 2
+                        * (PI * efficiency)
+                        * np.abs(fall_velocity[j] - fall_velocity[k])
+                    )
+
+        return body
+
+    def geometric_collision_kernel(
+        self, *, output, radius, fall_velocity, is_first_in_pair, collection_efficiency
+    ):
+        """fused evaluation of the
+        `PySDM.dynamics.collisions.collision_kernels.geometric.Geometric` kernel"""
+        self._geometric_collision_kernel_body(
+            output.data,
+            radius.data,
+            fall_velocity.data,
+            is_first_in_pair.indicator.data,
+            radius.idx.data,
+            len(is_first_in_pair),
+            float(collection_efficiency),
+        )
+
+    @cached_kernel
+    def _parameterized_collision_kernel_body(self):
+        PI = self.formulae.constants.PI
+
+        @numba.njit(**self.default_jit_flags)
+        def body(
+            params, output, radius, fall_velocity, is_first_in_pair, idx, length, unit
+        ):  # pylint: disable=too-many-positional-arguments
+            output[:] = 0
+            for i in numba.prange(length - 1):  # pylint: disable=not-an-iterable
+                if is_first_in_pair[i]:
+                    j, k = idx[i], idx[i + 1]
+                    efficiency = linear_collection_efficiency_of_pair(
+                        params, radius[j], radius[k], unit
+                    )
+                    output[i // 2] = (
+                        efficiency**2
+                        * PI
+                        * max(radius[j], radius[k]) ** 2
+                        * np.abs(fall_velocity[j] - fall_velocity[k])
+                    )
+
+        return body
+
+    def parameterized_collision_kernel(
+        self, *, params, output, radius, fall_velocity, is_first_in_pair, unit
+    ):
+        """fused evaluation of kernels based on
+        `PySDM.dynamics.collisions.collision_kernels.impl.parameterized.Parameterized`
+        """
+        self._parameterized_collision_kernel_body(
+            params,
+            output.data,
+            radius.data,
+            fall_velocity.data,
+            is_first_in_pair.indicator.data,
+            radius.idx.data,
+            len(is_first_in_pair),
+            float(unit),
+        )
+
+    @cached_kernel
+    def _linear_collision_kernel_body(self):
+        @numba.njit(**self.default_jit_flags)
+        def body(output, volume, is_first_in_pair, idx, length, a, b):
+            output[:] = 0
+            for i in numba.prange(length - 1):  # pylint: disable=not-an-iterable
+                if is_first_in_pair[i]:
+                    output[i // 2] = (volume[idx[i]] + volume[idx[i + 1]]) * b + a
+
+        return body
+
+    def linear_collision_kernel(self, *, output, volume, is_first_in_pair, a, b):
+        """fused evaluation of the
+        `PySDM.dynamics.collisions.collision_kernels.golovin.Golovin` (`a=0`) and
+        `PySDM.dynamics.collisions.collision_kernels.linear.Linear` kernels"""
+        self._linear_collision_kernel_body(
+            output.data,
+            volume.data,
+            is_first_in_pair.indicator.data,
+            volume.idx.data,
+            len(is_first_in_pair),
+            float(a),
+            float(b),
+        )
+
+    @cached_kernel
+    def _long1974_collision_kernel_body(self):
+        @numba.njit(**self.default_jit_flags)
+        def body(
+            output, radius, volume, is_first_in_pair, idx, length, lc, sc, rt
+        ):  # pylint: disable=too-many-positional-arguments
+            output[:] = 0
+            for i in numba.prange(length - 1):  # pylint: disable=not-an-iterable
+                if is_first_in_pair[i]:
+                    j, k = idx[i], idx[i + 1]
+                    v_lg = max(volume[j], volume[k])
+                    v_ratio = min(volume[j], volume[k])
+                    if v_lg != 0:
+                        v_ratio /= v_lg
+                    if max(radius[j], radius[k]) < rt:
+                        output[i // 2] = (v_ratio**2 + 1) * v_lg**2 * sc
+                    else:
+                        output[i // 2] = (v_ratio + 1) * v_lg * lc
+
+        return body
+
+    def long1974_collision_kernel(
+        self, *, output, radius, volume, is_first_in_pair, lin_coeff, sq_coeff, r_thres
+    ):
+        """fused evaluation of the
+        `PySDM.dynamics.collisions.collision_kernels.long1974.Long1974` kernel"""
+        self._long1974_collision_kernel_body(
+            output.data,
+            radius.data,
+            volume.data,
+            is_first_in_pair.indicator.data,
+            radius.idx.data,
+            len(is_first_in_pair),
+            float(lin_coeff),
+            float(sq_coeff),
+            float(r_thres),
+        )
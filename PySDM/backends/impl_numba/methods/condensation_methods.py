@@ -51,6 +51,31 @@ _RelativeTolerances = namedtuple(
 
 
 class CondensationMethods(BackendMethods):
+    KERNEL_SIGNATURES = {
+        "condensation": {
+            "_condensation": (
+                "solver,i,i,I,attributes,cell_data,I,rtols,f,counters,I,F,B"
+            )
+        },
+    }
+
+    @staticmethod
+    def condensation_argument_samples(float_array, int_array, solver):
+        """values typed as the `solver` and the namedtuple arguments of
+        `_condensation` (see `PySDM.backends.numba.Numba.kernel_argument_types`)"""
+        return {
+            "solver": solver,
+            "attributes": _Attributes(
+                **{
+                    **{field: float_array for field in _Attributes._fields},
+                    "multiplicity": int_array,
+                }
+            ),
+            "cell_data": _CellData(*(float_array for _ in _CellData._fields)),
+            "rtols": _RelativeTolerances(x=0.0, thd=0.0),
+            "counters": _Counters(*(int_array for _ in _Counters._fields)),
+        }
+
     # pylint: disable=unused-argument
     @staticmethod
     def condensation(**kwargs):
@@ -74,7 +99,9 @@ class CondensationMethods(BackendMethods):
                 rhod=kwargs["rhod"].data,
                 thd=kwargs["thd"].data,
                 water_vapour_mixing_ratio=kwargs["water_vapour_mixing_ratio"].data,
-                dv_mean=kwargs["dv"],
+                dv_mean=np.broadcast_to(kwargs["dv"], (kwargs["n_cell"],)).astype(
+                    float
+                ),
                 prhod=kwargs["prhod"].data,
                 pthd=kwargs["pthd"].data,
                 predicted_water_vapour_mixing_ratio=(
@@ -84,10 +111,10 @@ class CondensationMethods(BackendMethods):
                 air_dynamic_viscosity=kwargs["air_dynamic_viscosity"].data,
             ),
             rtols=_RelativeTolerances(
-                x=kwargs["rtol_x"],
-                thd=kwargs["rtol_thd"],
+                x=float(kwargs["rtol_x"]),
+                thd=float(kwargs["rtol_thd"]),
             ),
-            timestep=kwargs["timestep"],
+            timestep=float(kwargs["timestep"]),
             counters=_Counters(
                 n_substeps=kwargs["counters"]["n_substeps"].data,
                 n_activating=kwargs["counters"]["n_activating"].data,
@@ -135,6 +162,7 @@ class CondensationMethods(BackendMethods):
                 cell_end = cell_start_arg[cell_id + 1]
                 n_sd_in_cell = cell_end - cell_start
                 if n_sd_in_cell == 0:
+                    success[cell_id] = True
                     continue
 
                 (
@@ -166,7 +194,7 @@ class CondensationMethods(BackendMethods):
                     m_d=(
                         (cell_data.prhod[cell_id] + cell_data.rhod[cell_id])
                         / 2
-                        * cell_data.dv_mean
+                        * cell_data.dv_mean[cell_id]
                     ),
                     air_density=cell_data.air_density[cell_id],
                     air_dynamic_viscosity=cell_data.air_dynamic_viscosity[cell_id],
@@ -590,7 +618,7 @@ class CondensationMethods(BackendMethods):
         RH_rtol,
         max_iters,
     ):
-        return CondensationMethods.make_condensation_solver_impl(
+        solver = CondensationMethods.make_condensation_solver_impl(
             formulae=self.formulae_flattened,
             timestep=timestep,
             dt_range=dt_range,
@@ -600,6 +628,9 @@ class CondensationMethods(BackendMethods):
             RH_rtol=RH_rtol,
             max_iters=max_iters,
         )
+        if self.jit_cache is not None:
+            self.jit_cache.enable(solver, name="condensation_solver")
+        return solver
 
     @staticmethod
     @lru_cache()
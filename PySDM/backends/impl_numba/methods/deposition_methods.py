@@ -2,18 +2,18 @@
 [Howell 1949](https://doi.org/10.1175/1520-0469(1949)006%3C0134:TGOCDI%3E2.0.CO;2)
 """
 
-from functools import cached_property
 import numba
 import numpy as np
 
 from PySDM.backends.impl_common.backend_methods import BackendMethods
+from PySDM.backends.impl_numba.jit_cache import cached_kernel
 
 # TODO #1524
 # pylint: disable=too-many-arguments,too-many-locals,too-many-statements
 
 
 class DepositionMethods(BackendMethods):  # pylint:disable=too-few-public-methods
-    @cached_property
+    @cached_kernel
     def _deposition(self):
         assert self.formulae.particle_shape_and_density.supports_mixed_phase()
 
@@ -3,11 +3,11 @@
 CPU implementation of backend methods for particle displacement (advection and sedimentation)
 """
 
-from functools import cached_property
-
 import numba
+import numpy as np
 
 from PySDM.backends.impl_numba import conf
+from PySDM.backends.impl_numba.jit_cache import cached_kernel
 
 from ...impl_common.backend_methods import BackendMethods
 
@@ -24,6 +24,19 @@ def calculate_displacement_body_common(
 
 
 class DisplacementMethods(BackendMethods):
+    KERNEL_SIGNATURES = {
+        "calculate_displacement": {
+            "calculate_displacement_body_{n_dims}d": "i,scheme,F2,courant,I2,F2,i"
+        },
+        "displace_with_substeps_per_cell": {
+            "_displace_with_substeps_per_cell_body": (
+                "F,I,I2,I,I2,F2,F2,I,I,I,i,F,f,f,i,F,I,I"
+            )
+        },
+        "flag_precipitated": {"_flag_precipitated_body": "I2,F2,F,I,I,i,I,i,F2"},
+        "flag_out_of_column": {"_flag_out_of_column_body": "I2,F2,I,i,I,i"},
+    }
+
     @staticmethod
     @numba.njit(**{**conf.JIT_FLAGS, **{"parallel": False, "cache": False}})
     def calculate_displacement_body_1d(
@@ -142,7 +155,142 @@ class DisplacementMethods(BackendMethods):
         else:
             raise NotImplementedError()
 
-    @cached_property
+    @cached_kernel
+    def _displace_with_substeps_per_cell_body(self):
+        scheme = self.formulae.particle_advection.displacement
+
+        @numba.njit(**self.default_jit_flags)
+        # pylint: disable=too-many-arguments,too-many-locals
+        def body(
+            courant,
+            courant_offsets,
+            courant_strides,
+            grid,
+            cell_origin,
+            position_in_cell,
+            displacement,
+            cell_id,
+            n_substeps,
+            idx,
+            length,
+            fall_velocity,
+            dt,
+            dz,
+            precipitation_counting_level_index,
+            water_mass,
+            multiplicity,
+            healthy,
+        ):
+            n_dims = grid.shape[0]
+            z = n_dims - 1
+            sedimentation = fall_velocity.shape[0] > 0
+            flag = len(idx)
+            rainfall_mass = 0.0
+            for i in numba.prange(length):  # pylint: disable=not-an-iterable
+                droplet = idx[i]
+                n = n_substeps[cell_id[droplet]]
+                for _ in range(n):
+                    for dim in range(n_dims):
+                        # Arakawa-C grid
+                        _l = courant_offsets[dim]
+                        for k in range(n_dims):
+                            _l += cell_origin[k, droplet] * courant_strides[dim, k]
+                        _r = _l + courant_strides[dim, dim]
+                        displacement[dim, droplet] = scheme(
+                            position_in_cell[dim, droplet],
+                            courant[_l] / n,
+                            courant[_r] / n,
+                        )
+                    if sedimentation:
+                        dt_over_dz = dt / n / dz
+                        displacement[z, droplet] *= 1 / dt_over_dz
+                        displacement[z, droplet] -= fall_velocity[droplet]
+                        displacement[z, droplet] *= dt_over_dz
+                    for dim in range(n_dims):
+                        position_in_cell[dim, droplet] += displacement[dim, droplet]
+
+                    position_within_column = (
+                        cell_origin[z, droplet] + position_in_cell[z, droplet]
+                    )
+                    if (
+                        sedimentation
+                        and displacement[z, droplet] < 0
+                        and position_within_column < precipitation_counting_level_index
+                    ):
+                        rainfall_mass += (
+                            abs(water_mass[droplet]) * multiplicity[droplet]
+                        )
+                        idx[i] = flag
+                        healthy[0] = 0
+                        break
+                    if position_within_column < 0 or position_within_column > grid[z]:
+                        break  # left to be flagged as out of column
+
+                    for dim in range(n_dims):
+                        floor_of_position = int(
+                            np.floor(position_in_cell[dim, droplet])
+                        )
+                        cell_origin[dim, droplet] += floor_of_position
+                        position_in_cell[dim, droplet] -= floor_of_position
+                        cell_origin[dim, droplet] %= grid[dim]
+            return rainfall_mass
+
+        return body
+
+    def displace_with_substeps_per_cell(
+        self,
+        *,
+        courant,
+        courant_offsets,
+        courant_strides,
+        grid,
+        cell_origin,
+        position_in_cell,
+        displacement,
+        cell_id,
+        n_substeps,
+        idx,
+        length,
+        fall_velocity,
+        dt,
+        dz,
+        precipitation_counting_level_index,
+        water_mass,
+        multiplicity,
+        healthy,
+    ) -> float:  # pylint: disable=too-many-locals
+        """advances positions of super-droplets by a timestep split into the number of
+        substeps assigned to the cell each super-droplet is in at the beginning of
+        the step (`n_substeps` indexed by cell id); `courant` holds all the Courant-number
+        field components flattened and concatenated (with `courant_offsets` and
+        `courant_strides` locating the components and their faces); sedimentation
+        is included if `fall_velocity` is non-empty, in which case super-droplets
+        falling below the precipitation-counting level in any substep are flagged
+        (as in `flag_precipitated`) and the mass of water they carry is returned;
+        super-droplets leaving the domain are left to be flagged
+        by `flag_out_of_column`"""
+        return self._displace_with_substeps_per_cell_body(
+            courant.data,
+            courant_offsets.data,
+            courant_strides.data,
+            grid.data,
+            cell_origin.data,
+            position_in_cell.data,
+            displacement.data,
+            cell_id.data,
+            n_substeps.data,
+            idx.data,
+            length,
+            fall_velocity.data,
+            float(dt),
+            float(dz),
+            precipitation_counting_level_index,
+            water_mass.data,
+            multiplicity.data,
+            healthy.data,
+        )
+
+    @cached_kernel
     def _flag_precipitated_body(self):
         @numba.njit(**{**self.default_jit_flags, "parallel": False})
         def body(
@@ -176,7 +324,7 @@ class DisplacementMethods(BackendMethods):
 
         return body
 
-    @cached_property
+    @cached_kernel
     def _flag_out_of_column_body(self):
         @numba.njit(**{**self.default_jit_flags, "parallel": False})
         def body(
@@ -2,11 +2,11 @@
 CPU implementation of backend methods supporting fragmentation functions
 """
 
-from functools import cached_property
 import numba
 import numpy as np
 from PySDM.backends.impl_numba import conf
 from PySDM.backends.impl_common.backend_methods import BackendMethods
+from PySDM.backends.impl_numba.jit_cache import cached_kernel
 
 
 @numba.njit(**{**conf.JIT_FLAGS, **{"parallel": False}})
@@ -73,7 +73,7 @@ def ll82_Nr(
 
 
 class FragmentationMethods(BackendMethods):
-    @cached_property
+    @cached_kernel
     def _fragmentation_limiters_body(self):
         @numba.njit(**self.default_jit_flags)
         # pylint: disable=too-many-arguments
@@ -103,7 +103,7 @@ class FragmentationMethods(BackendMethods):
             x_plus_y=x_plus_y.data,
         )
 
-    @cached_property
+    @cached_kernel
     def _slams_fragmentation_body(self):
         @numba.njit(**self.default_jit_flags)
         def body(n_fragment, frag_volume, x_plus_y, probs, rand):
@@ -137,7 +137,7 @@ class FragmentationMethods(BackendMethods):
             x_plus_y=x_plus_y.data,
         )
 
-    @cached_property
+    @cached_kernel
     def _exp_fragmentation_body(self):
         @numba.njit(**self.default_jit_flags)
         # pylint: disable=too-many-arguments
@@ -306,7 +306,7 @@ class FragmentationMethods(BackendMethods):
             nfmax=nfmax,
         )
 
-    @cached_property
+    @cached_kernel
     def _ll82_coalescence_check_body(self):
         @numba.njit(**self.default_jit_flags)
         def body(*, Ec, dl):
@@ -322,7 +322,7 @@ class FragmentationMethods(BackendMethods):
             dl=dl.data,
         )
 
-    @cached_property
+    @cached_kernel
     def _straub_fragmentation_body(self):
         ff = self.formulae_flattened
 
@@ -382,7 +382,7 @@ class FragmentationMethods(BackendMethods):
 
         return body
 
-    @cached_property
+    @cached_kernel
     def _ll82_fragmentation_body(self):  # pylint: disable=too-many-statements
         ff = self.formulae_flattened
 
@@ -479,7 +479,7 @@ class FragmentationMethods(BackendMethods):
 
         return body
 
-    @cached_property
+    @cached_kernel
     def _gauss_fragmentation_body(self):
         ff = self.formulae_flattened
 
@@ -490,7 +490,7 @@ class FragmentationMethods(BackendMethods):
 
         return body
 
-    @cached_property
+    @cached_kernel
     def _feingold1988_fragmentation_body(self):
         ff = self.formulae_flattened
 
@@ -3,12 +3,11 @@ CPU implementation of backend methods for homogeneous freezing and
 heterogeneous freezing (singular and time-dependent immersion freezing)
 """
 
-from functools import cached_property
-
 import numba
 import numpy as np
 
 from PySDM.backends.impl_common.backend_methods import BackendMethods
+from PySDM.backends.impl_numba.jit_cache import cached_kernel
 
 from ...impl_common.freezing_attributes import (
     SingularAttributes,
@@ -19,7 +18,7 @@ from ...impl_common.freezing_attributes import (
 
 
 class FreezingMethods(BackendMethods):
-    @cached_property
+    @cached_kernel
     def _freeze(self):
         @numba.njit(**{**self.default_jit_flags, **{"parallel": False}})
         def body(signed_water_mass, i):
@@ -28,7 +27,7 @@ class FreezingMethods(BackendMethods):
 
         return body
 
-    @cached_property
+    @cached_kernel
     def _thaw(self):
         @numba.njit(**{**self.default_jit_flags, **{"parallel": False}})
         def body(signed_water_mass, i):
@@ -37,7 +36,7 @@ class FreezingMethods(BackendMethods):
 
         return body
 
-    @cached_property
+    @cached_kernel
     def _thaw_instantaneous_body(self):
         _thaw = self._thaw
         frozen_and_above_freezing_point = (
@@ -55,7 +54,7 @@ class FreezingMethods(BackendMethods):
 
         return body
 
-    @cached_property
+    @cached_kernel
     def _immersion_freezing_singular_body(self):
         _freeze = self._freeze
         unfrozen_and_saturated = self.formulae.trivia.unfrozen_and_saturated
@@ -81,7 +80,7 @@ class FreezingMethods(BackendMethods):
 
         return body
 
-    @cached_property
+    @cached_kernel
     def _immersion_freezing_time_dependent_body(self):
         _freeze = self._freeze
         unfrozen_and_saturated = self.formulae.trivia.unfrozen_and_saturated
@@ -116,7 +115,7 @@ class FreezingMethods(BackendMethods):
 
         return body
 
-    @cached_property
+    @cached_kernel
     def _homogeneous_freezing_time_dependent_body(self):
         _freeze = self._freeze
         unfrozen_and_ice_saturated = self.formulae.trivia.unfrozen_and_ice_saturated
@@ -164,7 +163,7 @@ class FreezingMethods(BackendMethods):
 
         return body
 
-    @cached_property
+    @cached_kernel
     def _homogeneous_freezing_threshold_body(self):
         _freeze = self._freeze
         unfrozen_and_ice_saturated = self.formulae.trivia.unfrozen_and_ice_saturated
@@ -274,7 +273,7 @@ class FreezingMethods(BackendMethods):
             relative_humidity_ice.data,
         )
 
-    @cached_property
+    @cached_kernel
     def _record_freezing_temperatures_body(self):
         ff = self.formulae_flattened
 
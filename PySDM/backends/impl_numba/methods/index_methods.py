@@ -2,15 +2,25 @@
 CPU implementation of shuffling and sorting backend methods
 """
 
-from functools import cached_property
-
 import numba
+import numpy as np
 
 from PySDM.backends.impl_common.backend_methods import BackendMethods
+from PySDM.backends.impl_numba.jit_cache import cached_kernel
+from PySDM.backends.impl_numba.random import uniform_at
+
+SHUFFLE_BUCKET_SIZE = 1024
 
 
 class IndexMethods(BackendMethods):
-    @cached_property
+    KERNEL_SIGNATURES = {
+        "identity_index": {"identity_index": "I"},
+        "shuffle_global": {"shuffle_global": "I,i,F"},
+        "shuffle_global_parallel": {"_shuffle_global_parallel_body": "I,i,F,i"},
+        "shuffle_local": {"shuffle_local": "I,F,I"},
+    }
+
+    @cached_kernel
     def identity_index(self):
         @numba.njit(**self.default_jit_flags)
         def body(idx):
@@ -19,17 +29,80 @@ class IndexMethods(BackendMethods):
 
         return body
 
-    @cached_property
+    @cached_kernel
     def shuffle_global(self):
         @numba.njit(**{**self.default_jit_flags, "parallel": False})
         def body(idx, length, u01):
             for i in range(length - 1, 0, -1):
-                j = int(u01[i] * (i + 1))
+                j = int(uniform_at(u01, i) * (i + 1))
                 idx[i], idx[j] = idx[j], idx[i]
 
         return body
 
-    @cached_property
+    @cached_kernel
+    def _shuffle_global_parallel_body(self):
+        """parallel-friendly variant of `shuffle_global` scattering the indices into
+        buckets (of `SHUFFLE_BUCKET_SIZE` elements on average) selected with the
+        leading digits of `u01` and then applying Fisher-Yates algorithm within each
+        bucket using the remaining digits; since the scatter is stable, the result
+        depends on `u01` only (and not on the number of threads)"""
+
+        @numba.njit(**self.default_jit_flags)
+        def body(idx, length, u01, n_threads):
+            # pylint: disable=not-an-iterable,too-many-locals
+            if length < 2:
+                return
+            n_buckets = max(1, length // SHUFFLE_BUCKET_SIZE)
+            n_chunks = min(n_threads, length)
+            chunk_size = -(-length // n_chunks)
+
+            counts = np.zeros((n_chunks, n_buckets), dtype=np.int64)
+            for chunk in numba.prange(n_chunks):
+                for i in range(
+                    chunk * chunk_size, min(length, (chunk + 1) * chunk_size)
+                ):
+                    counts[
+                        chunk, min(int(uniform_at(u01, i) * n_buckets), n_buckets - 1)
+                    ] += 1
+
+            bucket_start = np.empty(n_buckets + 1, dtype=np.int64)
+            bucket_start[0] = 0
+            for bucket in range(n_buckets):
+                offset = bucket_start[bucket]
+                for chunk in range(n_chunks):
+                    count = counts[chunk, bucket]
+                    counts[chunk, bucket] = offset
+                    offset += count
+                bucket_start[bucket + 1] = offset
+
+            tmp_idx = np.empty(length, dtype=idx.dtype)
+            tmp_u01 = np.empty(length, dtype=np.float64)
+            for chunk in numba.prange(n_chunks):
+                for i in range(
+                    chunk * chunk_size, min(length, (chunk + 1) * chunk_size)
+                ):
+                    u01_i = uniform_at(u01, i)
+                    bucket = min(int(u01_i * n_buckets), n_buckets - 1)
+                    position = counts[chunk, bucket]
+                    counts[chunk, bucket] += 1
+                    tmp_idx[position] = idx[i]
+                    tmp_u01[position] = u01_i * n_buckets - bucket
+
+            for bucket in numba.prange(n_buckets):
+                start = bucket_start[bucket]
+                for i in range(bucket_start[bucket + 1] - 1, start, -1):
+                    j = start + min(int(tmp_u01[i] * (i - start + 1)), i - start)
+                    tmp_idx[i], tmp_idx[j] = tmp_idx[j], tmp_idx[i]
+
+            for i in numba.prange(length):
+                idx[i] = tmp_idx[i]
+
+        return body
+
+    def shuffle_global_parallel(self, idx, length, u01):
+        self._shuffle_global_parallel_body(idx, length, u01, numba.get_num_threads())
+
+    @cached_kernel
     def shuffle_local(self):
         @numba.njit(**self.default_jit_flags)
         def body(idx, u01, cell_start):
@@ -37,12 +110,31 @@ class IndexMethods(BackendMethods):
             for c in numba.prange(len(cell_start) - 1):
                 for i in range(cell_start[c + 1] - 1, cell_start[c], -1):
                     j = int(
-                        cell_start[c] + u01[i] * (cell_start[c + 1] - cell_start[c])
+                        cell_start[c]
+                        + uniform_at(u01, i) * (cell_start[c + 1] - cell_start[c])
                     )
                     idx[i], idx[j] = idx[j], idx[i]
 
         return body
 
+    @cached_kernel
+    def _apply_permutation_body(self):
+        @numba.njit(**self.default_jit_flags)
+        def body(data, idx, length):
+            tmp = np.empty(length, dtype=data.dtype)
+            for row in range(data.shape[0]):
+                for i in numba.prange(length):  # pylint: disable=not-an-iterable
+                    tmp[i] = data[row, idx[i]]
+                for i in numba.prange(length):  # pylint: disable=not-an-iterable
+                    data[row, i] = tmp[i]
+
+        return body
+
+    def apply_permutation(self, data, idx, length):
+        """rearranges `data` in place so that `data[..., i] = data[..., idx[i]]`
+        for `i < length` (vector attributes are rearranged component-wise)"""
+        self._apply_permutation_body(data.reshape(-1, data.shape[-1]), idx, length)
+
     @staticmethod
     def sort_by_key(idx, attr):
         idx.data[:] = attr.data.argsort(kind="stable")[::-1]
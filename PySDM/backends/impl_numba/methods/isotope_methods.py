@@ -2,11 +2,10 @@
 CPU implementation of isotope-relates backend methods
 """
 
-from functools import cached_property
-
 import numba
 
 from PySDM.backends.impl_common.backend_methods import BackendMethods
+from PySDM.backends.impl_numba.jit_cache import cached_kernel
 
 
 class IsotopeMethods(BackendMethods):
@@ -19,7 +18,7 @@ class IsotopeMethods(BackendMethods):
     - heavy-isotope fractionation during condensation/evaporation.
     """
 
-    @cached_property
+    @cached_kernel
     def _isotopic_delta_body(self):
         """Numba kernel to convert isotopic ratios to delta values."""
         ff = self.formulae_flattened
@@ -35,7 +34,7 @@ class IsotopeMethods(BackendMethods):
         """Compute isotopic delta for droplets."""
         self._isotopic_delta_body(output.data, ratio.data, reference_ratio)
 
-    @cached_property
+    @cached_kernel
     def _isotopic_fractionation_body(self):
         """
         Kernel updating heavy-isotope content during phase change.
@@ -113,7 +112,7 @@ class IsotopeMethods(BackendMethods):
             molality_in_dry_air=molality_in_dry_air.data,
         )
 
-    @cached_property
+    @cached_kernel
     def _bolin_number_body(self):
         """
         Kernel computing the Bolin number per droplet.
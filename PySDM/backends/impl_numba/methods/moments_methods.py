@@ -2,16 +2,18 @@
 CPU implementation of moment calculation backend methods
 """
 
-from functools import cached_property
-
 import numba
+import numpy as np
 
 from PySDM.backends.impl_common.backend_methods import BackendMethods
+from PySDM.backends.impl_numba.jit_cache import cached_kernel
 from PySDM.backends.impl_numba.atomic_operations import atomic_add
 
+MAX_PRIVATE_HISTOGRAMS_SIZE = 2**24
+
 
 class MomentsMethods(BackendMethods):
-    @cached_property
+    @cached_kernel
     def _moments_body(self):
         @numba.njit(**self.default_jit_flags)
         def body(
@@ -20,6 +22,7 @@ class MomentsMethods(BackendMethods):
             moments,
             multiplicity,
             attr_data,
+            attr_index,
             cell_id,
             idx,
             length,
@@ -49,7 +52,7 @@ class MomentsMethods(BackendMethods):
                             (
                                 multiplicity[i]
                                 * weighting_attribute[i] ** weighting_rank
-                                * attr_data[i] ** ranks[k]
+                                * attr_data[attr_index[k]][i] ** ranks[k]
                             ),
                         )
             if not skip_division_by_m0:
@@ -70,6 +73,7 @@ class MomentsMethods(BackendMethods):
         moments,
         multiplicity,
         attr_data,
+        attr_index,
         cell_id,
         idx,
         length,
@@ -80,12 +84,19 @@ class MomentsMethods(BackendMethods):
         weighting_attribute,
         weighting_rank,
         skip_division_by_m0,
-    ):
+    ):  # pylint: disable=too-many-locals
+        """computes (in a single pass over super-droplets) the moments of ranks `ranks[k]`
+        of attributes `attr_data[attr_index[k]]` (`attr_data` being a tuple of storages)
+        """
         return self._moments_body(
             moment_0=moment_0.data,
             moments=moments.data,
             multiplicity=multiplicity.data,
-            attr_data=attr_data.data,
+            attr_data=tuple(
+                attr.data if attr.data.dtype == float else attr.data.astype(float)
+                for attr in attr_data
+            ),
+            attr_index=attr_index.data,
             cell_id=cell_id.data,
             idx=idx.data,
             length=length,
@@ -98,7 +109,29 @@ class MomentsMethods(BackendMethods):
             skip_division_by_m0=skip_division_by_m0,
         )
 
-    @cached_property
+    @cached_kernel
+    def _spectrum_moments_cell_spans(self):
+        @numba.njit(**self.default_jit_flags)
+        def body(cell_id, idx, length, n_chunks):
+            """lowest and highest cell id within each of the `n_chunks` contiguous
+            chunks of super-droplets (an empty span `(0, -1)` for empty chunks)"""
+            spans = np.empty((n_chunks, 2), dtype=np.int64)
+            for t in numba.prange(n_chunks):  # pylint: disable=not-an-iterable
+                lo, hi = 0, -1
+                for idx_i in range(
+                    t * length // n_chunks, (t + 1) * length // n_chunks
+                ):
+                    c_id = cell_id[idx[idx_i]]
+                    if hi < lo:
+                        lo, hi = c_id, c_id
+                    else:
+                        lo, hi = min(lo, c_id), max(hi, c_id)
+                spans[t, 0], spans[t, 1] = lo, hi
+            return spans
+
+        return body
+
+    @cached_kernel
     def _spectrum_moments_body(self):
         @numba.njit(**self.default_jit_flags)
         def body(
@@ -115,31 +148,62 @@ class MomentsMethods(BackendMethods):
             x_attr,
             weighting_attribute,
             weighting_rank,
+            spans,
         ):
-            # pylint: disable=too-many-locals
+            """with non-empty `spans`, the super-droplets are split into `len(spans)`
+            contiguous chunks, each accumulated (in parallel) into its own private
+            histogram covering only the cells from `spans[t, 0]` to `spans[t, 1]`,
+            and the histograms are summed at the end; otherwise, a single
+            shared histogram is updated with atomic operations"""
+            # pylint: disable=too-many-locals,too-many-branches
+            n_bins = x_bins.shape[0] - 1
+            n_private = spans.shape[0]
             moment_0[:, :] = 0
             moments[:, :] = 0
-            for idx_i in numba.prange(length):  # pylint: disable=not-an-iterable
-                i = idx[idx_i]
-                for k in range(x_bins.shape[0] - 1):
-                    if x_bins[k] <= x_attr[i] < x_bins[k + 1]:
-                        atomic_add(
-                            moment_0,
-                            (k, cell_id[i]),
-                            multiplicity[i] * weighting_attribute[i] ** weighting_rank,
+            if n_private == 0:
+                for idx_i in numba.prange(length):  # pylint: disable=not-an-iterable
+                    i = idx[idx_i]
+                    k = np.searchsorted(x_bins, x_attr[i], side="right") - 1
+                    if 0 <= k < n_bins:
+                        weight = (
+                            multiplicity[i] * weighting_attribute[i] ** weighting_rank
                         )
+                        atomic_add(moment_0, (k, cell_id[i]), weight)
                         atomic_add(
-                            moments,
-                            (k, cell_id[i]),
-                            (
+                            moments, (k, cell_id[i]), weight * attr_data[i] ** rank
+                        )
+            else:
+                offsets = np.zeros(n_private + 1, dtype=np.int64)
+                for t in range(n_private):
+                    offsets[t + 1] = offsets[t] + n_bins * (
+                        spans[t, 1] - spans[t, 0] + 1
+                    )
+                moment_0_private = np.zeros(offsets[-1])
+                moments_private = np.zeros_like(moment_0_private)
+                for t in numba.prange(n_private):  # pylint: disable=not-an-iterable
+                    n_span = spans[t, 1] - spans[t, 0] + 1
+                    for idx_i in range(
+                        t * length // n_private, (t + 1) * length // n_private
+                    ):
+                        i = idx[idx_i]
+                        k = np.searchsorted(x_bins, x_attr[i], side="right") - 1
+                        if 0 <= k < n_bins:
+                            weight = (
                                 multiplicity[i]
                                 * weighting_attribute[i] ** weighting_rank
-                                * attr_data[i] ** rank
-                            ),
-                        )
-                        break
+                            )
+                            j = offsets[t] + k * n_span + cell_id[i] - spans[t, 0]
+                            moment_0_private[j] += weight
+                            moments_private[j] += weight * attr_data[i] ** rank
+                for k in numba.prange(n_bins):  # pylint: disable=not-an-iterable
+                    for t in range(n_private):
+                        n_span = spans[t, 1] - spans[t, 0] + 1
+                        for c_id in range(spans[t, 0], spans[t, 1] + 1):
+                            j = offsets[t] + k * n_span + c_id - spans[t, 0]
+                            moment_0[k, c_id] += moment_0_private[j]
+                            moments[k, c_id] += moments_private[j]
             for c_id in range(moment_0.shape[1]):
-                for k in range(x_bins.shape[0] - 1):
+                for k in range(n_bins):
                     moments[k, c_id] = (
                         moments[k, c_id] / moment_0[k, c_id]
                         if moment_0[k, c_id] != 0
@@ -148,6 +212,21 @@ class MomentsMethods(BackendMethods):
 
         return body
 
+    def _spectrum_moments_spans(self, *, cell_id, idx, length, n_bins):
+        """cell spans of the thread-private histograms used in `spectrum_moments()`
+        (one per thread, each covering only the cells of the super-droplets
+        handled by the thread, hence with cell-sorted super-droplets the total size
+        is close to that of the output); an empty array, i.e. atomic updates of
+        the output, if they would not fit in the memory budget of
+        `MAX_PRIVATE_HISTOGRAMS_SIZE` elements"""
+        n_chunks = (
+            numba.get_num_threads() if self.default_jit_flags.get("parallel") else 1
+        )
+        spans = self._spectrum_moments_cell_spans(cell_id, idx, length, n_chunks)
+        if n_bins * np.sum(spans[:, 1] - spans[:, 0] + 1) > MAX_PRIVATE_HISTOGRAMS_SIZE:
+            return spans[:0]
+        return spans
+
     def spectrum_moments(
         self,
         *,
@@ -179,4 +258,10 @@ class MomentsMethods(BackendMethods):
             x_attr=x_attr.data,
             weighting_attribute=weighting_attribute.data,
             weighting_rank=weighting_rank,
+            spans=self._spectrum_moments_spans(
+                cell_id=cell_id.data,
+                idx=idx.data,
+                length=length,
+                n_bins=moments.shape[0],
+            ),
         )
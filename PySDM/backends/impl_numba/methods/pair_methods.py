@@ -2,16 +2,22 @@
 CPU implementation of pairwise operations backend methods
 """
 
-from functools import cached_property
-
 import numba
 import numpy as np
 
 from PySDM.backends.impl_common.backend_methods import BackendMethods
+from PySDM.backends.impl_numba.jit_cache import cached_kernel
 
 
 class PairMethods(BackendMethods):
-    @cached_property
+    KERNEL_SIGNATURES = {
+        "find_pairs": {"_find_pairs_body": "I,B,I,I,I,i"},
+        "max_pair": {"_max_pair_body": "F,I,B,I,i"},
+        "sort_within_pair_by_attr": {"_sort_within_pair_by_attr_body": "I,i,B,I"},
+        "sum_pair": {"_sum_pair_body": "F,F,B,I,i"},
+    }
+
+    @cached_kernel
     def _distance_pair_body(self):
         @numba.njit(**self.default_jit_flags)
         def body(data_out, data_in, is_first_in_pair, idx, length):
@@ -31,7 +37,7 @@ class PairMethods(BackendMethods):
             len(idx),
         )
 
-    @cached_property
+    @cached_kernel
     def _find_pairs_body(self):
         @numba.njit(**self.default_jit_flags)
         def body(*, cell_start, is_first_in_pair, cell_id, cell_idx, idx, length):
@@ -54,7 +60,7 @@ class PairMethods(BackendMethods):
             length=len(idx),
         )
 
-    @cached_property
+    @cached_kernel
     def _max_pair_body(self):
         @numba.njit(**self.default_jit_flags)
         def body(data_out, data_in, is_first_in_pair, idx, length):
@@ -74,7 +80,7 @@ class PairMethods(BackendMethods):
             len(idx),
         )
 
-    @cached_property
+    @cached_kernel
     def _min_pair_body(self):
         @numba.njit(**self.default_jit_flags)
         def body(data_out, data_in, is_first_in_pair, idx, length):
@@ -94,7 +100,7 @@ class PairMethods(BackendMethods):
             len(idx),
         )
 
-    @cached_property
+    @cached_kernel
     def _sort_pair_body(self):
         @numba.njit(**self.default_jit_flags)
         def body(data_out, data_in, is_first_in_pair, idx, length):
@@ -123,7 +129,7 @@ class PairMethods(BackendMethods):
             len(idx),
         )
 
-    @cached_property
+    @cached_kernel
     def _sort_within_pair_by_attr_body(self):
         @numba.njit(**self.default_jit_flags)
         def body(idx, length, is_first_in_pair, attr):
@@ -139,7 +145,7 @@ class PairMethods(BackendMethods):
             idx.data, len(idx), is_first_in_pair.indicator.data, attr.data
         )
 
-    @cached_property
+    @cached_kernel
     def _sum_pair_body(self):
         @numba.njit(**self.default_jit_flags)
         def body(data_out, data_in, is_first_in_pair, idx, length):
@@ -159,7 +165,7 @@ class PairMethods(BackendMethods):
             len(idx),
         )
 
-    @cached_property
+    @cached_kernel
     def _multiply_pair_body(self):
         @numba.njit(**self.default_jit_flags)
         def body(data_out, data_in, is_first_in_pair, idx, length):
@@ -2,19 +2,25 @@
 CPU implementation of backend methods wrapping basic physics formulae
 """
 
-from functools import cached_property
-
 import numba
 from numba import prange
 
 from PySDM.backends.impl_common.backend_methods import BackendMethods
+from PySDM.backends.impl_numba.jit_cache import cached_kernel
 
 
 class PhysicsMethods(BackendMethods):
+    KERNEL_SIGNATURES = {
+        "temperature_pressure_rh": {"_temperature_pressure_rh_body": "F,F,F,F,F,F"},
+        "explicit_euler": {"_explicit_euler_body": "F,f,f"},
+        "volume_of_water_mass": {"_volume_of_mass_body": "F,F"},
+        "critical_volume": {"_critical_volume_body": "F,F,F,F,F,F,I"},
+    }
+
     def __init__(self):
         BackendMethods.__init__(self)
 
-    @cached_property
+    @cached_kernel
     def _critical_volume_body(self):
         ff = self.formulae_flattened
 
@@ -46,7 +52,7 @@ class PhysicsMethods(BackendMethods):
             cell=cell.data,
         )
 
-    @cached_property
+    @cached_kernel
     def _temperature_pressure_rh_body(self):
         ff = self.formulae_flattened
 
@@ -75,7 +81,7 @@ class PhysicsMethods(BackendMethods):
             RH=RH.data,
         )
 
-    @cached_property
+    @cached_kernel
     def _a_w_ice_body(self):
         ff = self.formulae_flattened
 
@@ -104,7 +110,7 @@ class PhysicsMethods(BackendMethods):
             RH_ice_out=RH_ice.data,
         )
 
-    @cached_property
+    @cached_kernel
     def _volume_of_mass_body(self):
         ff = self.formulae_flattened
 
@@ -118,7 +124,7 @@ class PhysicsMethods(BackendMethods):
     def volume_of_water_mass(self, volume, mass):
         self._volume_of_mass_body(volume.data, mass.data)
 
-    @cached_property
+    @cached_kernel
     def _mass_of_volume_body(self):
         ff = self.formulae_flattened
 
@@ -132,7 +138,7 @@ class PhysicsMethods(BackendMethods):
     def mass_of_water_volume(self, mass, volume):
         self._mass_of_volume_body(mass.data, volume.data)
 
-    @cached_property
+    @cached_kernel
     def __air_density_body(self):
         formulae = self.formulae.flatten
 
@@ -150,7 +156,7 @@ class PhysicsMethods(BackendMethods):
     def air_density(self, *, output, rhod, water_vapour_mixing_ratio):
         self.__air_density_body(output.data, rhod.data, water_vapour_mixing_ratio.data)
 
-    @cached_property
+    @cached_kernel
     def __air_dynamic_viscosity_body(self):
         formulae = self.formulae.flatten
 
@@ -164,7 +170,7 @@ class PhysicsMethods(BackendMethods):
     def air_dynamic_viscosity(self, *, output, temperature):
         self.__air_dynamic_viscosity_body(output.data, temperature.data)
 
-    @cached_property
+    @cached_kernel
     def __reynolds_number_body(self):
         formulae = self.formulae.flatten
 
@@ -199,7 +205,7 @@ class PhysicsMethods(BackendMethods):
             velocity_wrt_air.data,
         )
 
-    @cached_property
+    @cached_kernel
     def _explicit_euler_body(self):
         ff = self.formulae_flattened
 
@@ -210,4 +216,4 @@ class PhysicsMethods(BackendMethods):
         return body
 
     def explicit_euler(self, y, dt, dy_dt):
-        self._explicit_euler_body(y.data, dt, dy_dt)
+        self._explicit_euler_body(y.data, float(dt), dy_dt)
@@ -1,14 +1,13 @@
 """CPU implementation of backend methods for particle injections"""
 
-from functools import cached_property
-
 import numba
 
 from PySDM.backends.impl_common.backend_methods import BackendMethods
+from PySDM.backends.impl_numba.jit_cache import cached_kernel
 
 
 class SeedingMethods(BackendMethods):  # pylint: disable=too-few-public-methods
-    @cached_property
+    @cached_kernel
     def _seeding(self):
         @numba.njit(**{**self.default_jit_flags, "parallel": False})
         def body(  # pylint: disable=too-many-positional-arguments
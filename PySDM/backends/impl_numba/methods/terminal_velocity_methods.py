@@ -2,35 +2,49 @@
 CPU implementation of backend methods for terminal velocities
 """
 
-from functools import cached_property
-
 import numba
 
 from PySDM.backends.impl_common.backend_methods import BackendMethods
+from PySDM.backends.impl_numba.jit_cache import cached_kernel
 
 
 class TerminalVelocityMethods(BackendMethods):
+    KERNEL_SIGNATURES = {
+        "gunn_and_kinzer_interpolation": {
+            "_gunn_and_kinzer_interpolation_body": "F,F,i,f,F,F"
+        },
+    }
 
-    @cached_property
+    @cached_kernel
     def _gunn_and_kinzer_interpolation_body(self):
         @numba.njit(**self.default_jit_flags)
-        def body(output, radius, factor, b, c):
+        def body(output, radius, factor, maximum_radius, b, c):
+            n_out_of_range = 0
             for i in numba.prange(len(radius)):  # pylint: disable=not-an-iterable
-                if radius[i] > 0:
+                if radius[i] > maximum_radius:
+                    n_out_of_range += 1
+                elif radius[i] > 0:
                     r_id = int(factor * radius[i])
                     r_rest = ((factor * radius[i]) % 1) / factor
                     output[i] = b[r_id] + r_rest * c[r_id]
                 elif radius[i] == 0:
                     output[i] = 0
+            return n_out_of_range
 
         return body
 
-    def gunn_and_kinzer_interpolation(self, *, output, radius, factor, b, c):
-        return self._gunn_and_kinzer_interpolation_body(
-            output.data, radius.data, factor, b.data, c.data
+    def gunn_and_kinzer_interpolation(
+        self, *, output, radius, factor, maximum_radius, b, c
+    ):
+        """returns True if any of the radii exceeds `maximum_radius`"""
+        return (
+            self._gunn_and_kinzer_interpolation_body(
+                output.data, radius.data, factor, maximum_radius, b.data, c.data
+            )
+            > 0
         )
 
-    @cached_property
+    @cached_kernel
     def _rogers_and_yau_terminal_velocity_body(self):
         v_term = self.formulae.terminal_velocity.v_term
 
@@ -45,7 +59,7 @@ class TerminalVelocityMethods(BackendMethods):
     def rogers_and_yau_terminal_velocity(self, *, values, radius):
         self._rogers_and_yau_terminal_velocity_body(values=values, radius=radius)
 
-    @cached_property
+    @cached_kernel
     def _power_series_body(self):
         @numba.njit(**self.default_jit_flags)
         def body(*, values, radius, num_terms, prefactors, powers):
@@ -76,7 +90,7 @@ class TerminalVelocityMethods(BackendMethods):
             pressure=pressure,
         )
 
-    @cached_property
+    @cached_kernel
     def _terminal_velocity_columnar_ice_crystals_body(self):
         v_base_term = self.formulae.terminal_velocity_ice.v_base_term
         atmospheric_correction_factor = (
@@ -105,7 +119,7 @@ class TerminalVelocityMethods(BackendMethods):
             temperature=temperature,
         )
 
-    @cached_property
+    @cached_kernel
     def _terminal_velocity_ice_spheres_body(self):
         v_base_term = self.formulae.terminal_velocity_ice.v_base_term
         stokes_prefactor = self.formulae.terminal_velocity_ice.stokes_regime
@@ -1,19 +1,166 @@
 """
-random number generator class for Numba backend
+random number generator classes for Numba backend: the default one wrapping NumPy's
+ `default_rng()` and a counter-based one (Philox4x32-10, see
+ [Salmon et al. 2011](https://doi.org/10.1145/2063384.2063405)) in which each number
+ is a function of the seed, stream, step (i.e., call count) and element index only,
+ and hence does not depend on the number of threads or on the order of calls
+ made by other dynamics (`philox_uniform()` and `uniform_at()` can be used within
+ kernels, the latter drawing numbers either from an array or on the fly)
 """
 
+import zlib
+from functools import lru_cache
+
+import numba
 import numpy as np
+from numba.extending import overload
 
 from ..impl_common.random_common import RandomCommon
+from . import conf
 
 #  TIP: can be called asynchronously
 #  TIP: sometimes only half array is needed
 
 
 class Random(RandomCommon):  # pylint: disable=too-few-public-methods
-    def __init__(self, size, seed):
-        super().__init__(size, seed)
+    def __init__(self, size, seed, stream=""):
+        super().__init__(size, seed, stream)
         self.generator = np.random.default_rng(seed)
 
     def __call__(self, storage):
         storage.data[:] = self.generator.uniform(0, 1, storage.shape)
+
+
+PHILOX_M = (np.uint64(0xD2511F53), np.uint64(0xCD9E8D57))
+PHILOX_W = (np.uint64(0x9E3779B9), np.uint64(0xBB67AE85))
+UINT32_MASK = np.uint64(0xFFFFFFFF)
+UINT32_BITS = np.uint64(32)
+
+
+@numba.njit(**{**conf.JIT_FLAGS, "fastmath": False})
+def philox4x32_10(counter, key):
+    """Philox4x32 bijection with 10 rounds of a four-element `counter` tuple
+    and a two-element `key` tuple (all elements being uint64 values < 2**32)"""
+    c0, c1, c2, c3 = counter
+    k0, k1 = key
+    for _ in range(10):
+        product0 = PHILOX_M[0] * c0
+        product1 = PHILOX_M[1] * c2
+        c0, c1, c2, c3 = (
+            (product1 >> UINT32_BITS) ^ c1 ^ k0,
+            product1 & UINT32_MASK,
+            (product0 >> UINT32_BITS) ^ c3 ^ k1,
+            product0 & UINT32_MASK,
+        )
+        k0 = (k0 + PHILOX_W[0]) & UINT32_MASK
+        k1 = (k1 + PHILOX_W[1]) & UINT32_MASK
+    return c0, c1, c2, c3
+
+
+@numba.njit(**{**conf.JIT_FLAGS, "fastmath": False})
+def _uniform_53bit(high, low):
+    return (
+        np.float64(high >> np.uint64(5)) * 67108864.0 + np.float64(low >> np.uint64(6))
+    ) / 9007199254740992.0
+
+
+@numba.njit(**{**conf.JIT_FLAGS, "fastmath": False})
+def philox_uniform(key, stream_id, step, i):
+    """uniform [0, 1) double-precision number corresponding to the `i`-th element
+    of the array filled by `CounterBasedRandom` at a given `step`
+    (`key` and `stream_id` being the `CounterBasedRandom` attributes)"""
+    x = philox4x32_10(
+        (
+            np.uint64(i // 2),
+            np.uint64(step) & UINT32_MASK,
+            np.uint64(step) >> UINT32_BITS,
+            np.uint64(stream_id),
+        ),
+        key,
+    )
+    if i % 2 == 0:
+        return _uniform_53bit(x[0], x[1])
+    return _uniform_53bit(x[2], x[3])
+
+
+def uniform_at(u01, i):
+    """`i`-th uniform random number from `u01` being either an array of numbers or
+    the `data` of `InKernelUniforms` (a uint64 array with the generator state,
+    in which case the number is generated on the fly)"""
+    if u01.dtype == np.uint64:
+        return philox_uniform((u01[0], u01[1]), u01[2], u01[3], np.uint64(i) + u01[4])
+    return u01[i]
+
+
+@overload(uniform_at, jit_options={**conf.JIT_FLAGS, "fastmath": False})
+def _uniform_at_impl(u01, i):
+    if u01.dtype == numba.types.uint64:
+        return lambda u01, i: philox_uniform(
+            (u01[0], u01[1]), u01[2], u01[3], np.uint64(i) + u01[4]
+        )
+    return lambda u01, i: u01[i]
+
+
+@lru_cache()
+def _urand_body(parallel):
+    @numba.njit(**{**conf.JIT_FLAGS, "fastmath": False, "parallel": parallel})
+    def body(output, key, stream_id, step):
+        counter = (
+            np.uint64(step) & UINT32_MASK,
+            np.uint64(step) >> UINT32_BITS,
+            np.uint64(stream_id),
+        )
+        for pair in numba.prange(  # pylint: disable=not-an-iterable
+            (len(output) + 1) // 2
+        ):
+            x = philox4x32_10((np.uint64(pair),) + counter, key)
+            output[2 * pair] = _uniform_53bit(x[0], x[1])
+            if 2 * pair + 1 < len(output):
+                output[2 * pair + 1] = _uniform_53bit(x[2], x[3])
+
+    return body
+
+
+class InKernelUniforms:  # pylint: disable=too-few-public-methods
+    """stand-in for a storage filled by `CounterBasedRandom` which holds (in `data`)
+    the generator state (key, stream id, step and element-index offset) instead of
+    the numbers, to be passed to kernels drawing the numbers on the fly with
+    `uniform_at()`; slicing shifts the element-index offset"""
+
+    def __init__(self, key, stream_id, step, offset=0):
+        self.data = np.asarray((*key, stream_id, step, offset), dtype=np.uint64)
+
+    def __getitem__(self, item):
+        assert isinstance(item, slice) and item.step is None
+        key, stream_id, step, offset = (
+            tuple(self.data[:2]),
+            *self.data[2:],
+        )
+        return InKernelUniforms(key, stream_id, step, offset + (item.start or 0))
+
+
+class CounterBasedRandom(RandomCommon):  # pylint: disable=too-few-public-methods
+    """Philox4x32-10 generator keyed by the seed with the counter composed of
+    the element index, the step (incremented with each call) and the stream id
+    (a CRC32 checksum of the `stream` name, e.g., of the dynamic)"""
+
+    def __init__(self, size, seed, stream="", *, parallel=False):
+        super().__init__(size, seed, stream)
+        assert 0 <= seed < 2**64
+        assert size < 2**33
+        self.key = (np.uint64(seed) & UINT32_MASK, np.uint64(seed) >> UINT32_BITS)
+        self.stream_id = np.uint64(zlib.crc32(stream.encode()))
+        self.step = 0
+        self.__body = _urand_body(parallel)
+
+    def __call__(self, storage):
+        assert storage.data.size <= self.size
+        self.__body(storage.data.reshape(-1), self.key, self.stream_id, self.step)
+        self.step += 1
+
+    def draw_in_kernel(self):
+        """counterpart of `__call__` returning `InKernelUniforms` (corresponding
+        to the numbers which would have been written to a storage)"""
+        uniforms = InKernelUniforms(self.key, self.stream_id, self.step)
+        self.step += 1
+        return uniforms
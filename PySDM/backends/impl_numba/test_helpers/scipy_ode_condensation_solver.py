@@ -57,7 +57,7 @@ def _condensation(
             water_vapour_mixing_ratio=particulator.environment[
                 "water_vapour_mixing_ratio"
             ].data,
-            dv_mean=particulator.environment.dv,
+            dv_mean=np.full(particulator.mesh.n_cell, particulator.environment.dv),
             prhod=particulator.environment.get_predicted("rhod").data,
             pthd=particulator.environment.get_predicted("thd").data,
             predicted_water_vapour_mixing_ratio=particulator.environment.get_predicted(
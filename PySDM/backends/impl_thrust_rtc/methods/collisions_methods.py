@@ -5,6 +5,8 @@ GPU implementation of backend methods for particle collisions
 
 from functools import cached_property
 
+import numpy as np
+
 from PySDM.backends.impl_thrust_rtc.conf import NICE_THRUST_FLAGS
 from PySDM.backends.impl_thrust_rtc.nice_thrust import nice_thrust
 
@@ -483,10 +485,12 @@ class CollisionsMethods(
     @cached_property
     def __normalize_body_1(self):
         return trtc.For(
-            param_names=("prob", "cell_id", "norm_factor"),
+            param_names=("prob", "idx", "length", "cell_id", "norm_factor"),
             name_iter="i",
             body="""
-            prob[i] *= norm_factor[cell_id[i]];
+            if (2 * i + 1 < length) {
+                prob[i] *= norm_factor[cell_id[idx[2 * i + 1]]];
+            }
             """,
         )
 
@@ -910,15 +914,34 @@ class CollisionsMethods(
     # pylint: disable=unused-argument
     @nice_thrust(**NICE_THRUST_FLAGS)
     def normalize(
-        self, *, prob, cell_id, cell_idx, cell_start, norm_factor, timestep, dv
+        self,
+        *,
+        prob,
+        idx,
+        length,
+        cell_id,
+        cell_idx,
+        cell_start,
+        norm_factor,
+        timestep,
+        dv,
     ):
+        if np.ndim(dv) != 0:
+            raise NotImplementedError("per-cell volumes are not supported on GPU")
         n_cell = cell_start.shape[0] - 1
         device_dt_div_dv = self._get_floating_point(timestep / dv)
         self.__normalize_body_0.launch_n(
             n=n_cell, args=(cell_start.data, norm_factor.data, device_dt_div_dv)
         )
         self.__normalize_body_1.launch_n(
-            prob.shape[0], (prob.data, cell_id.data, norm_factor.data)
+            prob.shape[0],
+            (
+                prob.data,
+                idx.data,
+                trtc.DVInt64(length),
+                cell_id.data,
+                norm_factor.data,
+            ),
         )
 
     @nice_thrust(**NICE_THRUST_FLAGS)
@@ -1121,3 +1144,199 @@ class CollisionsMethods(
                 trtc.DVBool(nfmax is not None),
             ),
         )
+
+    @cached_property
+    def __geometric_collision_kernel_body(self):
+        const = self.formulae.constants
+        return trtc.For(
+            param_names=(
+                "output",
+                "radius",
+                "fall_velocity",
+                "is_first_in_pair",
+                "idx",
+                "efficiency",
+            ),
+            name_iter="i",
+            body=f"""
+            if (is_first_in_pair[i]) {{
+                auto j = idx[i];
+                auto k = idx[i + 1];
+                output[(int64_t)(i / 2)] = pow(radius[j] + radius[k], 2) * ({const.PI} * efficiency) * abs(fall_velocity[j] - fall_velocity[k]);
+            }}
+            """,
+        )
+
+    @cached_property
+    def __parameterized_collision_kernel_body(self):
+        const = self.formulae.constants
+        return trtc.For(
+            param_names=(
+                "A",
+                "B",
+                "D1",
+                "D2",
+                "E1",
+                "E2",
+                "F1",
+                "F2",
+                "G1",
+                "G2",
+                "G3",
+                "Mf",
+                "Mg",
+                "output",
+                "radius",
+                "fall_velocity",
+                "is_first_in_pair",
+                "idx",
+                "unit",
+            ),
+            name_iter="i",
+            body=f"""
+            if (is_first_in_pair[i]) {{
+                auto j = idx[i];
+                auto k = idx[i + 1];
+                real_type r = 0;
+                real_type r_s = 0;
+                if (radius[j] > radius[k]) {{
+                    r = radius[j] / unit;
+                    r_s = radius[k] / unit;
+                }}
+                else {{
+                    r = radius[k] / unit;
+                    r_s = radius[j] / unit;
+                }}
+                real_type efficiency = 0;
+                real_type p = r_s / r;
+                if (p != 0 && p != 1) {{
+                    real_type G = pow((G1 / r), Mg) + G2 + G3 * r;
+                    real_type Gp = pow((1 - p), G);
+                    if (Gp != 0) {{
+                        real_type D = D1 / pow(r, D2);
+                        real_type E = E1 / pow(r, E2);
+                        real_type F = pow((F1 / r), Mf) + F2;
+                        efficiency = A + B * p + D / pow(p, F) + E / Gp;
+                        if (efficiency < 0) {{
+                            efficiency = 0;
+                        }}
+                    }}
+                }}
+                output[(int64_t)(i / 2)] = pow(efficiency, 2) * {const.PI} * pow(max(radius[j], radius[k]), 2) * abs(fall_velocity[j] - fall_velocity[k]);
+            }}
+        """.replace("real_type", self._get_c_type()),
+        )
+
+    @cached_property
+    def __linear_collision_kernel_body(self):
+        return trtc.For(
+            param_names=("output", "volume", "is_first_in_pair", "idx", "a", "b"),
+            name_iter="i",
+            body="""
+            if (is_first_in_pair[i]) {
+                output[(int64_t)(i / 2)] = (volume[idx[i]] + volume[idx[i + 1]]) * b + a;
+            }
+            """,
+        )
+
+    @cached_property
+    def __long1974_collision_kernel_body(self):
+        return trtc.For(
+            param_names=(
+                "output",
+                "radius",
+                "volume",
+                "is_first_in_pair",
+                "idx",
+                "lin_coeff",
+                "sq_coeff",
+                "r_thres",
+            ),
+            name_iter="i",
+            body="""
+            if (is_first_in_pair[i]) {
+                auto j = idx[i];
+                auto k = idx[i + 1];
+                auto v_lg = max(volume[j], volume[k]);
+                auto v_ratio = min(volume[j], volume[k]);
+                if (v_lg != 0) {
+                    v_ratio /= v_lg;
+                }
+                if (max(radius[j], radius[k]) < r_thres) {
+                    output[(int64_t)(i / 2)] = (pow(v_ratio, 2) + 1) * pow(v_lg, 2) * sq_coeff;
+                }
+                else {
+                    output[(int64_t)(i / 2)] = (v_ratio + 1) * v_lg * lin_coeff;
+                }
+            }
+            """,
+        )
+
+    @nice_thrust(**NICE_THRUST_FLAGS)
+    def geometric_collision_kernel(
+        self, *, output, radius, fall_velocity, is_first_in_pair, collection_efficiency
+    ):
+        trtc.Fill(output.data, self._get_floating_point(0))
+        self.__geometric_collision_kernel_body.launch_n(
+            len(is_first_in_pair) - 1,
+            (
+                output.data,
+                radius.data,
+                fall_velocity.data,
+                is_first_in_pair.indicator.data,
+                radius.idx.data,
+                self._get_floating_point(collection_efficiency),
+            ),
+        )
+
+    @nice_thrust(**NICE_THRUST_FLAGS)
+    def parameterized_collision_kernel(
+        self, *, params, output, radius, fall_velocity, is_first_in_pair, unit
+    ):
+        trtc.Fill(output.data, self._get_floating_point(0))
+        self.__parameterized_collision_kernel_body.launch_n(
+            len(is_first_in_pair) - 1,
+            (
+                *(self._get_floating_point(param) for param in params),
+                output.data,
+                radius.data,
+                fall_velocity.data,
+                is_first_in_pair.indicator.data,
+                radius.idx.data,
+                self._get_floating_point(unit),
+            ),
+        )
+
+    @nice_thrust(**NICE_THRUST_FLAGS)
+    def linear_collision_kernel(self, *, output, volume, is_first_in_pair, a, b):
+        trtc.Fill(output.data, self._get_floating_point(0))
+        self.__linear_collision_kernel_body.launch_n(
+            len(is_first_in_pair) - 1,
+            (
+                output.data,
+                volume.data,
+                is_first_in_pair.indicator.data,
+                volume.idx.data,
+                self._get_floating_point(a),
+                self._get_floating_point(b),
+            ),
+        )
+
+    @nice_thrust(**NICE_THRUST_FLAGS)
+    def long1974_collision_kernel(
+        self, *, output, radius, volume, is_first_in_pair, lin_coeff, sq_coeff, r_thres
+    ):
+        trtc.Fill(output.data, self._get_floating_point(0))
+        self.__long1974_collision_kernel_body.launch_n(
+            len(is_first_in_pair) - 1,
+            (
+                output.data,
+                radius.data,
+                volume.data,
+                is_first_in_pair.indicator.data,
+                radius.idx.data,
+                self._get_floating_point(lin_coeff),
+                self._get_floating_point(sq_coeff),
+                self._get_floating_point(r_thres),
+            ),
+        )
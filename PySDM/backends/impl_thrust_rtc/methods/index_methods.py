@@ -36,6 +36,8 @@ class IndexMethods(ThrustRTCBackendMethods):
 
         trtc.Sort_By_Key(u01.range(0, length), idx.range(0, length))
 
+    shuffle_global_parallel = shuffle_global  # random-key sort is parallel already
+
     @cached_property
     def __shuffle_local_body(self):
         return trtc.For(
@@ -58,6 +60,10 @@ class IndexMethods(ThrustRTCBackendMethods):
             cell_start.size() - 1, [cell_start, u01, idx]
         )
 
+    @staticmethod
+    def apply_permutation(data, idx, length):
+        raise NotImplementedError()
+
     @staticmethod
     @nice_thrust(**NICE_THRUST_FLAGS)
     def sort_by_key(idx, attr):
@@ -38,45 +38,59 @@ double (*atomicAdd)(double*, double) = &Commons::atomicAdd;
 class MomentsMethods(ThrustRTCBackendMethods):
     def __init__(self, double_precision):
         ThrustRTCBackendMethods.__init__(self)
+        self.__moments_body_0_kernels = {}
 
         if trtc.Get_PTX_Arch() < 60 and double_precision:
             self.commons = DOUBLE_ATOMIC_ADD_FOR_COMPUTE_LT_60
         else:
             self.commons = ""
 
-    @cached_property
-    def __moments_body_0(self):
-        return trtc.For(
-            (
-                "idx",
-                "min_x",
-                "attr_data",
-                "x_attr",
-                "max_x",
-                "moment_0",
-                "cell_id",
-                "multiplicity",
-                "n_ranks",
-                "moments",
-                "ranks",
-                "n_sd",
-                "n_cell",
-            ),
-            "fake_i",
-            self.commons + """
+    def __moments_body_0(self, n_attr):
+        """kernel accumulating, in a single launch, the moments of `n_attr` attributes
+        (passed as separate arguments `attr_data_0`, `attr_data_1`, ...; generated
+        and compiled upon first use for a given `n_attr`)"""
+        if n_attr not in self.__moments_body_0_kernels:
+            attr_value = "".join(
+                f"""
+                    {"if" if attr_id == 0 else "else if"} (attr_index[k] == {attr_id}) {{
+                        attr_value = attr_data_{attr_id}[i];
+                    }}"""
+                for attr_id in range(n_attr)
+            )
+            self.__moments_body_0_kernels[n_attr] = trtc.For(
+                (
+                    "idx",
+                    "min_x",
+                    *(f"attr_data_{attr_id}" for attr_id in range(n_attr)),
+                    "attr_index",
+                    "x_attr",
+                    "max_x",
+                    "moment_0",
+                    "cell_id",
+                    "multiplicity",
+                    "n_ranks",
+                    "moments",
+                    "ranks",
+                    "n_sd",
+                    "n_cell",
+                ),
+                "fake_i",
+                self.commons + f"""
             auto i = idx[fake_i];
-            if (min_x <= x_attr[i] && x_attr[i] < max_x) {
+            if (min_x <= x_attr[i] && x_attr[i] < max_x) {{
                 atomicAdd((real_type*)&moment_0[cell_id[i]], (real_type)(multiplicity[i]));
-                for (auto k = 0; k < n_ranks; k+=1) {
+                for (auto k = 0; k < n_ranks; k+=1) {{
+                    real_type attr_value = 0;{attr_value}
                     auto value = multiplicity[i] * pow(
-                        (real_type)(attr_data[i]),
+                        (real_type)(attr_value),
                         (real_type)(ranks[k])
                     );
                     atomicAdd((real_type*) &moments[n_cell * k + cell_id[i]], value);
-               }
-            }
+                }}
+            }}
         """.replace("real_type", self._get_c_type()),
-        )
+            )
+        return self.__moments_body_0_kernels[n_attr]
 
     @cached_property
     def __moments_body_1(self):
@@ -162,6 +176,7 @@ class MomentsMethods(ThrustRTCBackendMethods):
         moments,
         multiplicity,
         attr_data,
+        attr_index,
         cell_id,
         idx,
         length,
@@ -186,12 +201,13 @@ class MomentsMethods(ThrustRTCBackendMethods):
         moments[:] = 0
         moment_0[:] = 0
 
-        self.__moments_body_0.launch_n(
+        self.__moments_body_0(len(attr_data)).launch_n(
             length,
             (
                 idx.data,
                 self._get_floating_point(min_x),
-                attr_data.data,
+                *(attr.data for attr in attr_data),
+                attr_index.data,
                 x_attr.data,
                 self._get_floating_point(max_x),
                 moment_0.data,
@@ -70,9 +70,13 @@ class TerminalVelocityMethods(ThrustRTCBackendMethods):
     def __gunn_and_kinzer_interpolation_body(self):
         # TODO #599 r<0
         return trtc.For(
-            ("output", "radius", "factor", "a", "b"),
+            ("output", "radius", "factor", "maximum_radius", "a", "b", "out_of_range"),
             "i",
             """
+            if (radius[i] > maximum_radius) {
+                out_of_range[0] = 1;
+                return;
+            }
             auto r_id = (int64_t)(factor * radius[i]);
             auto r_rest = (factor * radius[i] - r_id) / factor;
             output[i] = a[r_id] + r_rest * b[r_id];
@@ -124,11 +128,25 @@ class TerminalVelocityMethods(ThrustRTCBackendMethods):
         )
 
     @nice_thrust(**NICE_THRUST_FLAGS)
-    def gunn_and_kinzer_interpolation(self, *, output, radius, factor, b, c):
+    def gunn_and_kinzer_interpolation(
+        self, *, output, radius, factor, maximum_radius, b, c
+    ):
         factor_device = trtc.DVInt64(factor)
+        out_of_range = trtc.device_vector("int64_t", 1)
+        trtc.Fill(out_of_range, trtc.DVInt64(0))
         self.__gunn_and_kinzer_interpolation_body.launch_n(
-            len(radius), (output.data, radius.data, factor_device, b.data, c.data)
+            len(radius),
+            (
+                output.data,
+                radius.data,
+                factor_device,
+                self._get_floating_point(maximum_radius),
+                b.data,
+                c.data,
+                out_of_range,
+            ),
         )
+        return out_of_range.to_host()[0] != 0
 
     @cached_property
     def __power_series_body(self):
@@ -28,8 +28,8 @@ class Random(RandomCommon):  # pylint: disable=too-few-public-methods
         """,
     )
 
-    def __init__(self, size, seed):
-        super().__init__(size, seed)
+    def __init__(self, size, seed, stream=""):
+        super().__init__(size, seed, stream)
         rng = rndrtc.DVRNG()
         self.generator = trtc.device_vector("RNGState", size)
         dseed = trtc.DVInt64(seed)
@@ -5,18 +5,39 @@ Multi-threaded CPU backend using LLVM-powered just-in-time compilation
 import os
 import platform
 import warnings
+from functools import lru_cache, partial
 
 import numba
 from numba import prange
 import numpy as np
 
 from PySDM.backends.impl_numba import methods
+from PySDM.backends.impl_numba.jit_cache import JITCache
+from PySDM.backends.impl_numba.random import CounterBasedRandom
 from PySDM.backends.impl_numba.random import Random as ImportedRandom
 from PySDM.backends.impl_numba.storage import Storage as ImportedStorage
 from PySDM.formulae import Formulae
 from PySDM.backends.impl_numba.conf import JIT_FLAGS
 
 
+@lru_cache()
+def _check_threading(prange_impl, n_threads):
+    """checks (once per process) if Numba threads are correctly numbered"""
+
+    @numba.jit(parallel=True, nopython=True)
+    def fill_array_with_thread_id(arr):
+        """writes thread id to corresponding array element"""
+        for i in prange_impl(n_threads):  # pylint: disable=not-an-iterable
+            arr[i] = numba.get_thread_id()
+
+    fill_array_with_thread_id(arr := np.full(n_threads, -1))
+    if not max(arr) == arr[-1] == n_threads - 1:
+        raise ValueError(
+            "Numba threading enabled but does not work as expected"
+            " (try setting the NUMBA_THREADING_LAYER env var to 'workqueue')"
+        )
+
+
 class Numba(  # pylint: disable=too-many-ancestors,duplicate-code
     methods.CollisionsMethods,
     methods.FragmentationMethods,
@@ -39,12 +60,26 @@ class Numba(  # pylint: disable=too-many-ancestors,duplicate-code
     default_croupier = "local"
 
     def __init__(
-        self, formulae=None, *, double_precision=True, override_jit_flags=None
+        self,
+        formulae=None,
+        *,
+        double_precision=True,
+        override_jit_flags=None,
+        jit_cache=None,
+        counter_based_random=False,
     ):
+        """`jit_cache` is an optional path to a directory in which the compiled kernels
+        are stored for reuse across processes (see `PySDM.backends.impl_numba.jit_cache`);
+        `counter_based_random` flag selects the Philox generator (see
+        `PySDM.backends.impl_numba.random.CounterBasedRandom`) yielding independent
+        per-stream sequences that do not depend on the number of threads
+        """
         if not double_precision:
             raise NotImplementedError()
         self.formulae = formulae or Formulae()
-        self.formulae_flattened = self.formulae.flatten
+        self.jit_cache = (
+            JITCache(jit_cache, self.formulae) if jit_cache is not None else None
+        )
 
         parallel_default = True
 
@@ -68,29 +103,16 @@ class Numba(  # pylint: disable=too-many-ancestors,duplicate-code
                     )
                 parallel_default = False
 
-            if not numba.config.DISABLE_JIT:  # pylint: disable=no-member
-
-                @numba.jit(parallel=True, nopython=True)
-                def fill_array_with_thread_id(arr):
-                    """writes thread id to corresponding array element"""
-                    for i in prange(  # pylint: disable=not-an-iterable
-                        numba.get_num_threads()
-                    ):
-                        arr[i] = numba.get_thread_id()
-
-                fill_array_with_thread_id(arr := np.full(numba.get_num_threads(), -1))
-                if not max(arr) == arr[-1] == numba.get_num_threads() - 1:
-                    raise ValueError(
-                        "Numba threading enabled but does not work as expected"
-                        " (try setting the NUMBA_THREADING_LAYER env var to 'workqueue')"
-                    )
-
         assert "fastmath" not in (override_jit_flags or {})
         self.default_jit_flags = {
             **JIT_FLAGS,  # here parallel=False (for out-of-backend code)
             **{"fastmath": self.formulae.fastmath, "parallel": parallel_default},
             **(override_jit_flags or {}),
         }
+        if counter_based_random:
+            self.Random = partial(  # pylint: disable=invalid-name
+                CounterBasedRandom, parallel=self.default_jit_flags["parallel"]
+            )
 
         methods.CollisionsMethods.__init__(self)
         methods.FragmentationMethods.__init__(self)
@@ -106,3 +128,90 @@ class Numba(  # pylint: disable=too-many-ancestors,duplicate-code
         methods.IsotopeMethods.__init__(self)
         methods.SeedingMethods.__init__(self)
         methods.DepositionMethods.__init__(self)
+
+    @property
+    def formulae_flattened(self):
+        """`PySDM.formulae.Formulae.flatten` evaluated on first use (i.e., when
+        the first kernel is created) rather than in the constructor"""
+        return self.formulae.flatten
+
+    def check_threading(self):
+        """called before creation of each kernel, checks (once per process and
+        thread count, and only if needed) that Numba threading works as expected"""
+        if (
+            self.default_jit_flags["parallel"]
+            and not numba.config.DISABLE_JIT  # pylint: disable=no-member
+        ):
+            _check_threading(prange, numba.get_num_threads())
+
+    def kernel_argument_types(self, *, n_dims, condensation_solver=None) -> dict:
+        """Numba types of the kernel arguments, keyed by the aliases used in the
+        `KERNEL_SIGNATURES` tables of the backend method classes: `F`, `I` and `B`
+        for 1d arrays of the `Storage` float, int and bool dtypes, `F2` and `I2` for
+        their 2d counterparts, `f`, `i` and `b` for scalars, `f_range` and
+        `berry_params` for tuples of floats (a range and the parameters of
+        `PySDM.dynamics.collisions.collision_kernels.impl.parameterized.Parameterized`
+        kernels), and the mesh- and solver-dependent types (`courant`, `scheme`
+        and the condensation arguments)"""
+        float_array, int_array, bool_array = (
+            np.empty(0, dtype=dtype)
+            for dtype in (self.Storage.FLOAT, self.Storage.INT, self.Storage.BOOL)
+        )
+        types = {
+            "F": float_array,
+            "I": int_array,
+            "B": bool_array,
+            "F2": np.empty((0, 0), dtype=self.Storage.FLOAT),
+            "I2": np.empty((0, 0), dtype=self.Storage.INT),
+            "f": self.Storage.FLOAT(0),
+            "i": self.Storage.INT(0),
+            "b": True,
+            "f_range": (self.Storage.FLOAT(0), self.Storage.FLOAT(0)),
+            "berry_params": (self.Storage.FLOAT(0),) * 13,
+            "n_dims": n_dims,
+        }
+        if n_dims > 0:
+            types["courant"] = np.empty((0,) * n_dims, dtype=self.Storage.FLOAT)
+            types["scheme"] = self.formulae.particle_advection.displacement
+        if condensation_solver is not None:
+            types.update(
+                methods.CondensationMethods.condensation_argument_samples(
+                    float_array, int_array, condensation_solver
+                )
+            )
+        return {
+            key: value if key == "n_dims" else numba.typeof(value)
+            for key, value in types.items()
+        }
+
+    def warm_up(self, backend_methods, *, n_dims, condensation_solver=None, tag=None):
+        """compiles (or loads from the JIT cache, if set) the kernels of the
+        given backend methods (as declared by the dynamics, see
+        `PySDM.builder.Builder.build`) with the signatures listed in the
+        `KERNEL_SIGNATURES` tables of the backend method classes; kernels which
+        are not listed there (e.g., those taking in-kernel random number generators,
+        or breakup efficiencies and fragmentation functions) are compiled on first
+        call; if `tag` is given and the backend has a `jit_cache`, the kernels listed
+        in the manifest saved with `PySDM.particulator.Particulator.save_jit_manifest`
+        under the same `tag` are compiled as well"""
+        types = self.kernel_argument_types(
+            n_dims=n_dims, condensation_solver=condensation_solver
+        )
+        kernel_signatures = {}
+        for cls in reversed(type(self).__mro__):
+            kernel_signatures.update(vars(cls).get("KERNEL_SIGNATURES", {}))
+        for method in dict.fromkeys(backend_methods):
+            for name, signature in kernel_signatures.get(method, {}).items():
+                name = name.format(**types)
+                aliases = signature.split(",")
+                if not all(alias in types for alias in aliases):
+                    continue
+                getattr(self, name).compile(tuple(types[alias] for alias in aliases))
+        if tag is None or self.jit_cache is None:
+            return
+        for name, signatures in self.jit_cache.load_manifest(tag).items():
+            kernel = self.jit_cache.kernels.get(name, None) or getattr(self, name, None)
+            if kernel is None:
+                continue
+            for signature in signatures:
+                kernel.compile(signature)
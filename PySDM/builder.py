@@ -14,6 +14,7 @@ from PySDM.initialisation.discretise_multiplicities import (  # TODO #324
 )
 from PySDM.particulator import Particulator
 from PySDM.physics.particle_shape_and_density import LiquidSpheres, MixedPhaseSpheres
+from PySDM.products.impl.moment_planner import MomentPlanner
 
 
 class Builder:
@@ -73,8 +74,22 @@ class Builder:
         attributes: dict,
         products: tuple = (),
         int_caster=discretise_multiplicities,
+        warm_up: bool = False,
+        plan_moments: bool = True,
     ):
+        """`warm_up` flag enables compilation (Numba backend only) of the kernels
+        needed by the registered dynamics and derived attributes (as declared in their
+        `backend_methods()`)
+        before the first timestep; with `jit_cache` set, the kernels recorded with
+        `PySDM.particulator.Particulator.save_jit_manifest` (if any) are compiled too;
+        `plan_moments` flag enables fusing the evaluation of the moments declared by
+        the products (see `PySDM.products.impl.moment_planner.MomentPlanner`)"""
         assert self.particulator.environment is not None
+        if warm_up and not hasattr(self.particulator.backend, "warm_up"):
+            raise NotImplementedError(
+                "warm-up is only supported by the Numba backend"
+                f" (got {type(self.particulator.backend).__name__})"
+            )
 
         if "volume" in attributes and "water mass" not in attributes:
             assert self.particulator.formulae.particle_shape_and_density.__name__ in (
@@ -107,6 +122,10 @@ class Builder:
         single_buffer_for_all_products = np.empty(self.particulator.mesh.grid)
         for product in products:
             self._register_product(product, single_buffer_for_all_products)
+        if plan_moments:
+            self.particulator.moment_planner = MomentPlanner(
+                self.particulator, products=self.particulator.products.values()
+            )
 
         for attribute in attributes:
             self.request_attribute(attribute)
@@ -119,7 +138,7 @@ class Builder:
                 )
             )
         attributes["multiplicity"] = int_caster(attributes["multiplicity"])
-        if self.particulator.mesh.dimension == 0:
+        if self.particulator.mesh.dimension == 0 and "cell id" not in attributes:
             attributes["cell id"] = np.zeros_like(
                 attributes["multiplicity"], dtype=np.int64
             )
@@ -135,4 +154,20 @@ class Builder:
             self.particulator.attributes.healthy = False
             self.particulator.attributes.sanitize()
 
+        if warm_up:
+            self.particulator.backend.warm_up(
+                [
+                    method
+                    for component in (
+                        *self.particulator.dynamics.values(),
+                        *self.req_attr.values(),
+                    )
+                    if hasattr(component, "backend_methods")
+                    for method in component.backend_methods()
+                ],
+                n_dims=self.particulator.mesh.dimension,
+                condensation_solver=self.particulator.condensation_solver,
+                tag=self.particulator.jit_manifest_tag,
+            )
+
         return self.particulator
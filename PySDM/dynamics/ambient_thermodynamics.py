@@ -13,5 +13,12 @@ class AmbientThermodynamics:
     def register(self, builder):
         self.particulator = builder.particulator
 
+    def backend_methods(self):
+        """see `PySDM.dynamics.collisions.collision.Collision.backend_methods`"""
+        environment = self.particulator.environment
+        if hasattr(environment, "backend_methods"):
+            return environment.backend_methods()
+        return ()
+
     def __call__(self):
         self.particulator.environment.sync()
@@ -54,6 +54,8 @@ class AqueousChemistry:  # pylint: disable=too-many-instance-attributes
         self.equilibrium_consts = {}
         self.dissociation_factors = {}
         self.do_chemistry_flag = None
+        self.pH_iterations = None
+        self.counters = {}
         self.specific_gravities = None
 
     def register(self, builder):
@@ -62,10 +64,9 @@ class AqueousChemistry:  # pylint: disable=too-many-instance-attributes
             self.particulator.formulae.constants
         )
 
-        for key, compound in GASEOUS_COMPOUNDS.items():
-            shape = (1,)
+        for compound in GASEOUS_COMPOUNDS.values():
             self.environment_mixing_ratios[compound] = np.full(
-                shape,
+                self.particulator.mesh.n_cell,
                 self.particulator.formulae.trivia.mole_fraction_2_mixing_ratio(
                     self.environment_mole_fractions[compound],
                     self.specific_gravities[compound],
@@ -97,6 +98,14 @@ class AqueousChemistry:  # pylint: disable=too-many-instance-attributes
         self.do_chemistry_flag = self.particulator.Storage.empty(
             self.particulator.n_sd, dtype=bool
         )
+        self.pH_iterations = self.particulator.Storage.empty(
+            self.particulator.n_sd, dtype=int
+        )
+        for counter in ("n_pH_solves", "n_pH_iterations"):
+            self.counters[counter] = self.particulator.Storage.empty(
+                self.particulator.mesh.n_cell, dtype=int
+            )
+            self.counters[counter][:] = 0
 
     def __call__(self):
         self.particulator.chem_recalculate_cell_data(
@@ -36,6 +36,8 @@ DEFAULTS = namedtuple(
     max_multiplicity=get_attribute_class("multiplicity").MAX_VALUE // int(2e5),
 )
 
+CROUPIERS = ("local", "global", "global_parallel")
+
 
 @register_dynamic()
 class Collision:  # pylint: disable=too-many-instance-attributes
@@ -48,6 +50,7 @@ class Collision:  # pylint: disable=too-many-instance-attributes
         fragmentation_function,
         croupier=None,
         optimized_random=False,
+        in_kernel_random=False,
         substeps: int = DEFAULTS.substeps,
         adaptive: bool = DEFAULTS.adaptive,
         dt_coal_range=DEFAULTS.dt_coal_range,
@@ -76,6 +79,7 @@ class Collision:  # pylint: disable=too-many-instance-attributes
         assert dt_coal_range[0] > 0
         self.croupier = croupier
         self.optimized_random = optimized_random
+        self.in_kernel_random = in_kernel_random
         self.__substeps = substeps
         self.adaptive = adaptive
         self.stats_n_substep = None
@@ -104,11 +108,20 @@ class Collision:  # pylint: disable=too-many-instance-attributes
             "optimized_random": self.optimized_random,
             "dt_min": self.dt_coal_range[0],
             "seed": builder.formulae.seed,
+            "in_kernel": self.in_kernel_random,
         }
-        self.rnd_opt_coll = RandomGeneratorOptimizer(**rnd_args)
+        stream = type(self).__name__
+        self.rnd_opt_coll = RandomGeneratorOptimizer(
+            **rnd_args, stream=f"{stream}:collision"
+        )
         if self.enable_breakup:
-            self.rnd_opt_proc = RandomGeneratorOptimizerNoPair(**rnd_args)
-            self.rnd_opt_frag = RandomGeneratorOptimizerNoPair(**rnd_args)
+            self.rnd_opt_proc = RandomGeneratorOptimizerNoPair(
+                **rnd_args, stream=f"{stream}:collision process"
+            )
+            self.rnd_opt_frag = RandomGeneratorOptimizerNoPair(
+                **{**rnd_args, "in_kernel": False},  # modified by fragmentation kernels
+                stream=f"{stream}:collision fragmentation",
+            )
 
         if self.particulator.n_sd < 2:
             raise ValueError("No one to collide with!")
@@ -140,6 +153,7 @@ class Collision:  # pylint: disable=too-many-instance-attributes
 
         if self.croupier is None:
             self.croupier = self.particulator.backend.default_croupier
+        assert self.croupier in CROUPIERS
 
         counter_args = (np.zeros(self.particulator.mesh.n_cell, dtype=int),)
         self.collision_rate = self.particulator.Storage.from_ndarray(*counter_args)
@@ -171,6 +185,29 @@ class Collision:  # pylint: disable=too-many-instance-attributes
                 *counter_args
             )
 
+    def backend_methods(self):
+        """names of the backend methods called in each step (used for compiling
+        the kernels in `PySDM.builder.Builder.build` if `warm_up` is set)"""
+        methods = [
+            "find_pairs",
+            "sort_within_pair_by_attr",
+            "max_pair",
+            "normalize",
+            "identity_index",
+            "collision_coalescence_breakup"
+            if self.enable_breakup
+            else "collision_coalescence",
+        ]
+        if not self.in_kernel_random:
+            methods += ["compute_gamma", f"shuffle_{self.croupier}"]
+        if self.adaptive:
+            methods += ["scale_prob_for_adaptive_sdm_gamma", "adaptive_sdm_end"]
+        if self.enable_breakup:
+            methods += ["sum_pair"]
+        if hasattr(self.collision_kernel, "backend_methods"):
+            methods += self.collision_kernel.backend_methods()
+        return tuple(methods)
+
     def __call__(self):
         if self.enable:
             if not self.adaptive:
@@ -236,7 +273,11 @@ class Collision:  # pylint: disable=too-many-instance-attributes
     def toss_candidate_pairs_and_sort_within_pair_by_multiplicity(
         self, is_first_in_pair, u01
     ):
-        self.particulator.attributes.permutation(u01, self.croupier == "local")
+        self.particulator.attributes.permutation(
+            u01,
+            local=self.croupier == "local",
+            parallel=self.croupier == "global_parallel",
+        )
         is_first_in_pair.update(
             self.particulator.attributes.cell_start,
             self.particulator.attributes.cell_idx,
@@ -299,6 +340,7 @@ class Coalescence(Collision):
         coalescence_efficiency=ConstEc(Ec=1),
         croupier=None,
         optimized_random=False,
+        in_kernel_random=False,
         substeps: int = DEFAULTS.substeps,
         adaptive: bool = DEFAULTS.adaptive,
         dt_coal_range=DEFAULTS.dt_coal_range,
@@ -312,6 +354,7 @@ class Coalescence(Collision):
             fragmentation_function=fragmentation_function,
             croupier=croupier,
             optimized_random=optimized_random,
+            in_kernel_random=in_kernel_random,
             substeps=substeps,
             adaptive=adaptive,
             dt_coal_range=dt_coal_range,
@@ -328,6 +371,7 @@ class Breakup(Collision):
         fragmentation_function,
         croupier=None,
         optimized_random=False,
+        in_kernel_random=False,
         substeps: int = DEFAULTS.substeps,
         adaptive: bool = DEFAULTS.adaptive,
         dt_coal_range=DEFAULTS.dt_coal_range,
@@ -342,6 +386,7 @@ class Breakup(Collision):
             fragmentation_function=fragmentation_function,
             croupier=croupier,
             optimized_random=optimized_random,
+            in_kernel_random=in_kernel_random,
             substeps=substeps,
             adaptive=adaptive,
             dt_coal_range=dt_coal_range,
@@ -3,7 +3,6 @@ basic geometric kernel
 """
 
 from PySDM.dynamics.collisions.collision_kernels.impl.gravitational import Gravitational
-from PySDM.physics import constants as const
 
 
 class Geometric(Gravitational):
@@ -13,10 +12,14 @@ class Geometric(Gravitational):
         self.x = x
 
     def __call__(self, output, is_first_in_pair):
-        output.sum(self.particulator.attributes["radius"], is_first_in_pair)
-        output **= 2
-        output *= const.PI * self.collection_efficiency
-        self.pair_tmp.distance(
-            self.particulator.attributes["relative fall velocity"], is_first_in_pair
+        self.particulator.backend.geometric_collision_kernel(
+            output=output,
+            radius=self.particulator.attributes["radius"],
+            fall_velocity=self.particulator.attributes["relative fall velocity"],
+            is_first_in_pair=is_first_in_pair,
+            collection_efficiency=self.collection_efficiency,
         )
-        output *= self.pair_tmp
+
+    @staticmethod
+    def backend_methods():
+        return ("geometric_collision_kernel",)
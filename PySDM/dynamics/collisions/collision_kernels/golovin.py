@@ -14,13 +14,22 @@ class Golovin:
         self.particulator = None
 
     def __call__(self, output, is_first_in_pair):
-        output.sum(self.particulator.attributes["volume"], is_first_in_pair)
-        output *= self.b
+        self.particulator.backend.linear_collision_kernel(
+            output=output,
+            volume=self.particulator.attributes["volume"],
+            is_first_in_pair=is_first_in_pair,
+            a=0,
+            b=self.b,
+        )
 
     def register(self, builder):
         self.particulator = builder.particulator
         builder.request_attribute("volume")
 
+    @staticmethod
+    def backend_methods():
+        return ("linear_collision_kernel",)
+
     def analytic_solution(self, x, t, x_0, N_0):
         tau = 1 - np.exp(-N_0 * self.b * x_0 * t)
 
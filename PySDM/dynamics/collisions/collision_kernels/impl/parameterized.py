@@ -8,23 +8,18 @@ from .gravitational import Gravitational
 class Parameterized(Gravitational):
     def __init__(self, params):
         super().__init__()
-        self.params = params
+        self.params = tuple(float(param) for param in params)
 
     def __call__(self, output, is_first_in_pair):
-        self.particulator.backend.linear_collection_efficiency(
+        self.particulator.backend.parameterized_collision_kernel(
             params=self.params,
             output=output,
-            radii=self.particulator.attributes["radius"],
+            radius=self.particulator.attributes["radius"],
+            fall_velocity=self.particulator.attributes["relative fall velocity"],
             is_first_in_pair=is_first_in_pair,
             unit=const.si.um,
         )
-        output **= 2
-        output *= const.PI
-        self.pair_tmp.max(self.particulator.attributes["radius"], is_first_in_pair)
-        self.pair_tmp **= 2
-        output *= self.pair_tmp
 
-        self.pair_tmp.distance(
-            self.particulator.attributes["relative fall velocity"], is_first_in_pair
-        )
-        output *= self.pair_tmp
+    @staticmethod
+    def backend_methods():
+        return ("parameterized_collision_kernel",)
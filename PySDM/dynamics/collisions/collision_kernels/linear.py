@@ -10,10 +10,18 @@ class Linear:
         self.particulator = None
 
     def __call__(self, output, is_first_in_pair):
-        output.sum_pair(self.particulator.attributes["volume"], is_first_in_pair)
-        output *= self.b
-        output += self.a
+        self.particulator.backend.linear_collision_kernel(
+            output=output,
+            volume=self.particulator.attributes["volume"],
+            is_first_in_pair=is_first_in_pair,
+            a=self.a,
+            b=self.b,
+        )
 
     def register(self, builder):
         self.particulator = builder.particulator
         builder.request_attribute("volume")
+
+    @staticmethod
+    def backend_methods():
+        return ("linear_collision_kernel",)
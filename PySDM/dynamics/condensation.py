@@ -93,6 +93,11 @@ class Condensation:  # pylint: disable=too-many-instance-attributes
         self.success[:] = False
         self.cell_order = np.arange(self.particulator.mesh.n_cell)
 
+    @staticmethod
+    def backend_methods():
+        """see `PySDM.dynamics.collisions.collision.Collision.backend_methods`"""
+        return ("condensation",)
+
     def __call__(self):
         if self.enable:
             if self.schedule == "dynamic":
@@ -13,7 +13,9 @@ import numpy as np
 
 from PySDM.dynamics.impl import register_dynamic
 
-DEFAULTS = namedtuple("_", ("rtol", "adaptive"))(rtol=1e-2, adaptive=True)
+DEFAULTS = namedtuple("_", ("rtol", "adaptive", "substeps_per_cell"))(
+    rtol=1e-2, adaptive=True, substeps_per_cell=False
+)
 
 
 @register_dynamic()
@@ -24,7 +26,13 @@ class Displacement:  # pylint: disable=too-many-instance-attributes
         precipitation_counting_level_index: int = 0,
         adaptive=DEFAULTS.adaptive,
         rtol=DEFAULTS.rtol,
+        substeps_per_cell=DEFAULTS.substeps_per_cell,
     ):  # pylint: disable=too-many-arguments
+        """with `substeps_per_cell=True`, the number of (adaptive) substeps is set
+        separately for each cell (as the maximum over the cell and its neighbours of
+        the numbers of substeps needed for the Courant-number differences across each
+        cell) and each super-droplet takes the number of substeps assigned to the cell
+        it is in at the beginning of the timestep (Numba backend only)"""
         self.particulator = None
         self.enable_sedimentation = enable_sedimentation
         self.dimension = None
@@ -39,7 +47,22 @@ class Displacement:  # pylint: disable=too-many-instance-attributes
         self.rtol = rtol
         self._n_substeps = 1
 
+        self.substeps_per_cell = substeps_per_cell
+        self._n_substeps_per_cell = None
+        self._courant_flat = None
+        self._courant_offsets = None
+        self._courant_strides = None
+
     def register(self, builder):
+        # pylint: disable-next=import-outside-toplevel
+        from PySDM.backends import ThrustRTC
+
+        if self.substeps_per_cell and isinstance(
+            builder.particulator.backend, ThrustRTC
+        ):
+            raise NotImplementedError(
+                "substeps_per_cell=True is not supported by the ThrustRTC (GPU) backend"
+            )
         builder.request_attribute("relative fall velocity")
         self.particulator = builder.particulator
         self.dimension = len(builder.particulator.environment.mesh.grid)
@@ -71,12 +94,67 @@ class Displacement:  # pylint: disable=too-many-instance-attributes
         self.temp = self.particulator.Storage.from_ndarray(
             np.zeros((self.dimension, self.particulator.n_sd), dtype=np.int64)
         )
+        if self.substeps_per_cell:
+            self._n_substeps_per_cell = self.particulator.Storage.from_ndarray(
+                np.ones(self.particulator.mesh.n_cell, dtype=np.int64)
+            )
+            self._courant_flat = self.particulator.Storage.from_ndarray(
+                np.concatenate([component.ravel() for component in courant_field])
+            )
+            self._courant_offsets = self.particulator.Storage.from_ndarray(
+                np.cumsum([0] + [component.size for component in courant_field[:-1]])
+            )
+            self._courant_strides = self.particulator.Storage.from_ndarray(
+                np.array(
+                    [
+                        [
+                            np.prod(component.shape[i + 1 :])
+                            for i in range(self.dimension)
+                        ]
+                        for component in courant_field
+                    ],
+                    dtype=np.int64,
+                )
+            )
+
+    @property
+    def n_substeps_per_cell(self):
+        """numbers of substeps (indexed by cell id) used in the last timestep: the
+        per-cell ones with `substeps_per_cell=True`, otherwise the global one"""
+        if self.substeps_per_cell:
+            return self._n_substeps_per_cell.to_ndarray()
+        return np.full(self.particulator.mesh.n_cell, self._n_substeps)
+
+    def backend_methods(self):
+        """see `PySDM.dynamics.collisions.collision.Collision.backend_methods`"""
+        methods = ["flag_out_of_column"]
+        if self.substeps_per_cell:
+            methods += ["displace_with_substeps_per_cell"]
+        else:
+            methods += ["calculate_displacement"]
+        if self.enable_sedimentation and not self.substeps_per_cell:
+            methods += ["flag_precipitated"]
+        return tuple(methods)
 
     def upload_courant_field(self, courant_field):
         for i, component in enumerate(courant_field):
             self.courant[i].upload(component)
 
-        # note: to be improved, should make n_substeps variable in space as in cond/coal
+        if self.substeps_per_cell:
+            self._courant_flat.upload(
+                np.concatenate(
+                    [
+                        np.asarray(component, dtype=float).ravel()
+                        for component in courant_field
+                    ]
+                )
+            )
+            if self.adaptive:
+                n_substeps = self.__n_substeps_per_cell(courant_field)
+                self._n_substeps_per_cell.upload(n_substeps.ravel())
+                self._n_substeps = int(np.amax(n_substeps))
+            return
+
         if self.adaptive:
             error_estimate = self.rtol
             self._n_substeps = 0.5
@@ -97,12 +175,74 @@ class Displacement:  # pylint: disable=too-many-instance-attributes
                         ),
                     )
 
+    def __n_substeps_per_cell(self, courant_field):
+        """smallest powers of two for which the error estimate is below `rtol`
+        in each cell, followed by a maximum over neighbouring cells (as super-droplets
+        may reach the adjacent cells within a timestep)"""
+        abs_delta_courant = tuple(
+            np.abs(np.diff(component, axis=i))
+            for i, component in enumerate(courant_field)
+        )
+        n_substeps = np.ones(abs_delta_courant[0].shape, dtype=np.int64)
+        while True:
+            error_estimate = np.zeros(n_substeps.shape)
+            for max_abs_delta_courant in abs_delta_courant:
+                max_abs_delta_courant = max_abs_delta_courant / n_substeps
+                with np.errstate(divide="ignore"):
+                    error_estimate = np.maximum(
+                        error_estimate,
+                        np.where(
+                            max_abs_delta_courant == 0,
+                            0,
+                            1 / (1 / max_abs_delta_courant - 1),
+                        ),
+                    )
+            too_large = error_estimate >= self.rtol
+            if not too_large.any():
+                break
+            n_substeps[too_large] *= 2
+
+        for axis in range(n_substeps.ndim):
+            padded = np.pad(
+                n_substeps,
+                tuple((1, 1) if i == axis else (0, 0) for i in range(n_substeps.ndim)),
+                mode="edge" if axis == n_substeps.ndim - 1 else "wrap",
+            )
+            n_substeps = np.maximum.reduce(
+                [
+                    np.take(
+                        padded, range(shift, shift + n_substeps.shape[axis]), axis=axis
+                    )
+                    for shift in range(3)
+                ]
+            )
+        return n_substeps
+
     def __call__(self):
         # TIP: not need all array only [idx[:sd_num]]
         cell_origin = self.particulator.attributes["cell origin"]
         position_in_cell = self.particulator.attributes["position in cell"]
 
         self.precipitation_mass_in_last_step = 0.0
+        if self.substeps_per_cell:
+            self.precipitation_mass_in_last_step += (
+                self.particulator.displace_with_substeps_per_cell(
+                    displacement=self.displacement,
+                    courant=self._courant_flat,
+                    courant_offsets=self._courant_offsets,
+                    courant_strides=self._courant_strides,
+                    grid=self.grid,
+                    n_substeps=self._n_substeps_per_cell,
+                    enable_sedimentation=self.enable_sedimentation,
+                    precipitation_counting_level_index=self.precipitation_counting_level_index,
+                )
+            )
+            self.particulator.flag_out_of_column()
+            self.particulator.recalculate_cell_id()
+            for key in ("position in cell", "cell origin", "cell id"):
+                self.particulator.attributes.mark_updated(key)
+            return
+
         for _ in range(self._n_substeps):
             self.calculate_displacement(
                 self.displacement, self.courant, cell_origin, position_in_cell
@@ -71,7 +71,9 @@ class Freezing:  # pylint: disable=too-many-instance-attributes
                 self.particulator.n_sd, dtype=float
             )
             self.rng = self.particulator.Random(
-                self.particulator.n_sd, self.particulator.formulae.seed
+                self.particulator.n_sd,
+                self.particulator.formulae.seed,
+                stream=f"{type(self).__name__}:freezing",
             )
 
     def __call__(self):
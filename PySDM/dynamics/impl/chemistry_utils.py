@@ -3,9 +3,13 @@ aqueous chemistry helper utils including specific gravity constants with
  values obtained using [chempy](https://pythonhosted.org/chempy/)'s `Substance`
 """
 
+from collections import namedtuple
+
+import numba
 import numpy as np
 from chempy import Substance
 
+from PySDM.backends.impl_numba import conf
 from PySDM.physics.constants import K_H2O, M, si
 
 
@@ -97,15 +101,35 @@ GASEOUS_COMPOUNDS = {
     "O3": "O3",
 }
 
+
+_K = namedtuple("_K", ("NH3", "SO2", "HSO3", "HSO4", "HCO3", "CO2", "HNO3"))
+_DF = namedtuple("_DF", tuple(DIFFUSION_CONST))
+
+
+@numba.njit(**{**conf.JIT_FLAGS, **{"parallel": False}})
+def calc_dissociation_factors(H, K):
+    """dissociation factors of all compounds for given H+ concentration and
+    equilibrium constants (`_K` namedtuple)"""
+    return _DF(
+        HNO3=1 + K.HNO3 / H,
+        H2O2=1.0,
+        NH3=1 + K.NH3 / K_H2O * H,
+        SO2=1 + K.SO2 * (1 / H + K.HSO3 / (H**2)),
+        CO2=1 + K.CO2 * (1 / H + K.HCO3 / (H**2)),
+        O3=1.0,
+    )
+
+
+def _dissociation_factor(compound):
+    def fun(H, eqc, cell_id):
+        K = _K(**{key: eqc[f"K_{key}"].data[cell_id] for key in _K._fields})
+        return getattr(calc_dissociation_factors(H, K), compound)
+
+    return fun
+
+
 DISSOCIATION_FACTORS = {
-    "CO2": lambda H, eqc, cell_id: 1
-    + eqc["K_CO2"].data[cell_id] * (1 / H + eqc["K_HCO3"].data[cell_id] / (H**2)),
-    "SO2": lambda H, eqc, cell_id: 1
-    + eqc["K_SO2"].data[cell_id] * (1 / H + eqc["K_HSO3"].data[cell_id] / (H**2)),
-    "NH3": lambda H, eqc, cell_id: 1 + eqc["K_NH3"].data[cell_id] / K_H2O * H,
-    "HNO3": lambda H, eqc, cell_id: 1 + eqc["K_HNO3"].data[cell_id] / H,
-    "O3": lambda _, __, ___: 1,
-    "H2O2": lambda _, __, ___: 1,
+    compound: _dissociation_factor(compound) for compound in DIFFUSION_CONST
 }
 
 
@@ -6,15 +6,23 @@ import math
 
 
 class RandomGeneratorOptimizer:  # pylint: disable=too-many-instance-attributes
-    def __init__(self, optimized_random, dt_min, seed):
+    """with `in_kernel=True`, no buffers are allocated and the kernels consuming
+    the numbers draw them on the fly (see
+    `PySDM.backends.impl_numba.random.CounterBasedRandom.draw_in_kernel`)"""
+
+    def __init__(
+        self, optimized_random, dt_min, seed, stream="", in_kernel=False
+    ):  # pylint: disable=too-many-arguments
         self.particulator = None
         self.optimized_random = optimized_random
         self.dt_min = dt_min
         self.seed = seed
+        self.stream = stream
         self.substep = 0
         self.pairs_rand = None
         self.rand = None
         self.rnd = None
+        self.in_kernel = in_kernel
 
     def register(self, builder):
         self.particulator = builder.particulator
@@ -23,13 +31,21 @@ class RandomGeneratorOptimizer:  # pylint: disable=too-many-instance-attributes
             if self.optimized_random
             else 0
         )
-        self.pairs_rand = self.particulator.Storage.empty(
-            self.particulator.n_sd + shift, dtype=float
-        )
-        self.rand = self.particulator.Storage.empty(
-            self.particulator.n_sd // 2, dtype=float
+        self.rnd = self.particulator.Random(
+            self.particulator.n_sd + shift, self.seed, self.stream
         )
-        self.rnd = self.particulator.Random(self.particulator.n_sd + shift, self.seed)
+        if self.in_kernel and not hasattr(self.rnd, "draw_in_kernel"):
+            raise ValueError(
+                "in-kernel random number generation requires a counter-based"
+                " generator, e.g., Numba(counter_based_random=True) backend"
+            )
+        if not self.in_kernel:
+            self.pairs_rand = self.particulator.Storage.empty(
+                self.particulator.n_sd + shift, dtype=float
+            )
+            self.rand = self.particulator.Storage.empty(
+                self.particulator.n_sd // 2, dtype=float
+            )
 
     def reset(self):
         self.substep = 0
@@ -38,11 +54,17 @@ class RandomGeneratorOptimizer:  # pylint: disable=too-many-instance-attributes
         if self.optimized_random:
             shift = self.substep
             if self.substep == 0:
-                self.pairs_rand.urand(self.rnd)
-                self.rand.urand(self.rnd)
+                self.__draw()
         else:
             shift = 0
-            self.pairs_rand.urand(self.rnd)
-            self.rand.urand(self.rnd)
+            self.__draw()
         self.substep += 1
         return self.pairs_rand[shift : self.particulator.n_sd + shift], self.rand
+
+    def __draw(self):
+        if self.in_kernel:
+            self.pairs_rand = self.rnd.draw_in_kernel()
+            self.rand = self.rnd.draw_in_kernel()
+        else:
+            self.pairs_rand.urand(self.rnd)
+            self.rand.urand(self.rnd)
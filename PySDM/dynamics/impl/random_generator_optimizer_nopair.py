@@ -5,15 +5,19 @@ TODO #744
 import math
 
 
-class RandomGeneratorOptimizerNoPair:
-    def __init__(self, optimized_random, dt_min, seed):
+class RandomGeneratorOptimizerNoPair:  # pylint: disable=too-many-instance-attributes
+    def __init__(
+        self, optimized_random, dt_min, seed, stream="", in_kernel=False
+    ):  # pylint: disable=too-many-arguments
         self.particulator = None
         self.optimized_random = optimized_random
         self.dt_min = dt_min
         self.seed = seed
+        self.stream = stream
         self.substep = 0
         self.rand = None
         self.rnd = None
+        self.in_kernel = in_kernel
 
     def register(self, builder):
         self.particulator = builder.particulator
@@ -22,19 +26,27 @@ class RandomGeneratorOptimizerNoPair:
             if self.optimized_random
             else 0
         )
-        self.rand = self.particulator.Storage.empty(
-            self.particulator.n_sd // 2, dtype=float
+        self.rnd = self.particulator.Random(
+            self.particulator.n_sd + shift, self.seed, self.stream
         )
-        self.rnd = self.particulator.Random(self.particulator.n_sd + shift, self.seed)
+        if self.in_kernel and not hasattr(self.rnd, "draw_in_kernel"):
+            raise ValueError(
+                "in-kernel random number generation requires a counter-based"
+                " generator, e.g., Numba(counter_based_random=True) backend"
+            )
+        if not self.in_kernel:
+            self.rand = self.particulator.Storage.empty(
+                self.particulator.n_sd // 2, dtype=float
+            )
 
     def reset(self):
         self.substep = 0
 
     def get_random_arrays(self):
-        if self.optimized_random:
-            if self.substep == 0:
+        if not self.optimized_random or self.substep == 0:
+            if self.in_kernel:
+                self.rand = self.rnd.draw_in_kernel()
+            else:
                 self.rand.urand(self.rnd)
-        else:
-            self.rand.urand(self.rnd)
         self.substep += 1
         return self.rand
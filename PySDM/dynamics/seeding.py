@@ -47,7 +47,9 @@ class Seeding:
         )
         if len(self.seeded_particle_multiplicity) > 1:
             self.rnd = self.particulator.Random(
-                len(self.seeded_particle_multiplicity), self.particulator.formulae.seed
+                len(self.seeded_particle_multiplicity),
+                self.particulator.formulae.seed,
+                stream=f"{type(self).__name__}:seeding",
             )
             self.u01 = self.particulator.Storage.empty(
                 len(self.seeded_particle_multiplicity), dtype=float
@@ -4,6 +4,8 @@ terminal velocities used for things like coalescence kernel evaluation, particle
 displacement, ventilation factor, etc
 """
 
+from functools import lru_cache
+
 import numba
 import numpy as np
 from scipy.interpolate import Rbf
@@ -11,130 +13,148 @@ from scipy.interpolate import Rbf
 from PySDM.backends.impl_numba import conf
 from PySDM.physics import constants as const
 
-
-class GunnKinzer1949:  # pylint: disable=too-few-public-methods
-    def __init__(self, particulator, small_r_limit=None):
-        self.particulator = particulator
-
-        """
-        Table 2 in
-        [Gunn & Kinzer 1949](https://doi.org/10.1175/1520-0469(1949)006%3C0243:TTVOFF%3E2.0.CO;2)
-        """
-        ir = (
-            np.array(
-                [
-                    0.078,
-                    0.1,
-                    0.2,
-                    0.3,
-                    0.4,
-                    0.5,
-                    0.6,
-                    0.7,
-                    0.8,
-                    0.9,
-                    1.0,
-                    1.2,
-                    1.4,
-                    1.6,
-                    1.8,
-                    2.0,
-                    2.2,
-                    2.4,
-                    2.6,
-                    2.8,
-                    3.0,
-                    3.2,
-                    3.4,
-                    3.6,
-                    3.8,
-                    4.0,
-                    4.2,
-                    4.4,
-                    4.6,
-                    4.8,
-                    5.0,
-                    5.2,
-                    5.4,
-                    5.6,
-                    5.8,
-                ]
-            )
-            * 1e-3
-            / 2
+FACTOR = 100000
+MAXIMUM_RADIUS = 0.6 * const.si.cm
+
+
+@lru_cache()
+def interpolation_table(small_r_limit):
+    """
+    returns read-only arrays of values and slopes of the terminal velocity on a uniform
+    radius grid (spacing of 1/`FACTOR` m up to `MAXIMUM_RADIUS`), computed once per process
+    and per `small_r_limit` value and shared by all `GunnKinzer1949` instances
+    """
+    # Table 2 in
+    # [Gunn & Kinzer 1949](https://doi.org/10.1175/1520-0469(1949)006%3C0243:TTVOFF%3E2.0.CO;2)
+    ir = (
+        np.array(
+            [
+                0.078,
+                0.1,
+                0.2,
+                0.3,
+                0.4,
+                0.5,
+                0.6,
+                0.7,
+                0.8,
+                0.9,
+                1.0,
+                1.2,
+                1.4,
+                1.6,
+                1.8,
+                2.0,
+                2.2,
+                2.4,
+                2.6,
+                2.8,
+                3.0,
+                3.2,
+                3.4,
+                3.6,
+                3.8,
+                4.0,
+                4.2,
+                4.4,
+                4.6,
+                4.8,
+                5.0,
+                5.2,
+                5.4,
+                5.6,
+                5.8,
+            ]
         )
-        iu = (
-            np.array(
-                [
-                    18,
-                    27,
-                    72,
-                    117,
-                    162,
-                    206,
-                    247,
-                    287,
-                    327,
-                    367,
-                    403,
-                    464,
-                    517,
-                    565,
-                    609,
-                    649,
-                    690,
-                    727,
-                    757,
-                    782,
-                    806,
-                    826,
-                    844,
-                    860,
-                    872,
-                    883,
-                    892,
-                    898,
-                    903,
-                    907,
-                    909,
-                    912,
-                    914,
-                    916,
-                    917,
-                ]
-            )
-            / 100
+        * 1e-3
+        / 2
+    )
+    iu = (
+        np.array(
+            [
+                18,
+                27,
+                72,
+                117,
+                162,
+                206,
+                247,
+                287,
+                327,
+                367,
+                403,
+                464,
+                517,
+                565,
+                609,
+                649,
+                690,
+                727,
+                757,
+                782,
+                806,
+                826,
+                844,
+                860,
+                872,
+                883,
+                892,
+                898,
+                903,
+                907,
+                909,
+                912,
+                914,
+                916,
+                917,
+            ]
         )
+        / 100
+    )
+
+    rbf = Rbf(ir, iu)
+    num = 6 * FACTOR // 1000 + 1
 
-        rbf = Rbf(ir, iu)
-        self.factor = 100000
-        num = 6 * self.factor // 1000 + 1
+    space, step = np.linspace(0, MAXIMUM_RADIUS, num, retstep=True)
+    u = np.empty(num)
+    u[:] = rbf(space)
+    u[0] = 0
+    approximation_small = TpDependent.make(only_small=True)
+    approximation_small(u[1:], space[1:], small_r_limit)
+    b = np.append(np.diff(u), [u[-1] - u[-2]]) / step
+    for array in (u, b):
+        array.setflags(write=False)
+    return u, b
 
+
+class GunnKinzer1949:  # pylint: disable=too-few-public-methods
+    def __init__(self, particulator, small_r_limit=None):
+        self.particulator = particulator
+        self.factor = FACTOR
         self.minimum_radius = 0
-        self.maximum_radius = 0.6 * const.si.cm
-        space, step = np.linspace(
-            self.minimum_radius, self.maximum_radius, num, retstep=True
-        )
-        u = np.empty(num)
-        u[:] = rbf(space)
-        u[0] = 0
-        approximation_small = TpDependent.make(only_small=True)
-        small_r_limit = small_r_limit or 40 * const.si.um
-        approximation_small(u[1:], space[1:], small_r_limit)
+        self.maximum_radius = MAXIMUM_RADIUS
+        u, b = interpolation_table(small_r_limit or 40 * const.si.um)
         self.a = particulator.backend.Storage.from_ndarray(u)
-        b = np.append(np.diff(u), [u[-1] - u[-2]]) / step
         self.b = particulator.backend.Storage.from_ndarray(b)
 
+    @staticmethod
+    def backend_methods():
+        return ("gunn_and_kinzer_interpolation",)
+
     def __call__(self, output, radius):
-        r_max = radius.amax()
-        if r_max > self.maximum_radius:
+        out_of_range = self.particulator.backend.gunn_and_kinzer_interpolation(
+            output=output,
+            radius=radius,
+            factor=self.factor,
+            maximum_radius=self.maximum_radius,
+            b=self.a,
+            c=self.b,
+        )
+        if out_of_range:
             raise ValueError(
                 f"Radii can be interpolated up to {self.maximum_radius} m"
-                + f" (max value of {r_max} m within input data)"
+                + f" (max value of {radius.amax()} m within input data)"
             )
-        self.particulator.backend.gunn_and_kinzer_interpolation(
-            output=output, radius=radius, factor=self.factor, b=self.a, c=self.b
-        )
 
 
 class TpDependent:
@@ -70,6 +70,12 @@ class Moist:
             RH=target["RH"],
         )
 
+    @staticmethod
+    def backend_methods():
+        """names of the backend methods called in `sync` (see
+        `PySDM.dynamics.ambient_thermodynamics.AmbientThermodynamics`)"""
+        return ("temperature_pressure_rh",)
+
     def sync(self):
         target = self._tmp
         target["water_vapour_mixing_ratio"].ravel(self.get_water_vapour_mixing_ratio())
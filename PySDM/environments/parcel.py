@@ -163,6 +163,9 @@ class Parcel(Moist):  # pylint: disable=too-many-instance-attributes
         for var in self.variables:
             self._tmp[var][:] = self[var][:]
 
+    def backend_methods(self):
+        return super().backend_methods() + ("explicit_euler",)
+
     def sync(self):
         self.sync_parcel_vars()
         self.advance_parcel_vars()
@@ -0,0 +1,218 @@
+"""
+Ensemble of independent adiabatic parcels mapped onto the cells of a single particulator
+ (one cell per ensemble member), for parameter sweeps over updraft velocity, initial
+ thermodynamic conditions and aerosol spectra with a single build (and a single JIT
+ compilation) and with condensation, collisions and products evaluated for all members
+ within single backend calls
+"""
+
+from typing import List, Optional
+
+import numpy as np
+
+from PySDM.environments.impl import register_environment
+from PySDM.environments.impl.moist import Moist
+from PySDM.environments.parcel import Parcel
+from PySDM.impl.mesh import Mesh
+from PySDM.initialisation.hygroscopic_equilibrium import (
+    default_rtol,
+    equilibrate_wet_radii,
+)
+
+
+@register_environment()
+class ParcelEnsemble(Parcel):  # pylint: disable=too-many-instance-attributes
+    """`mass_of_dry_air`, `p0`, `T0`, `z0` and the initial humidity can be given as scalars
+    (common to all members) or as arrays (one value per member); `w` can be a scalar,
+    an array, a callable of time returning a scalar or an array, or a sequence
+    of per-member scalars or callables; the number of members is inferred from
+    the array arguments; products (as well as `environment[...]` fields) yield
+    arrays with one value per member"""
+
+    def __init__(
+        self,
+        *,
+        dt,
+        mass_of_dry_air,
+        p0,
+        T0,
+        w,
+        z0=0,
+        mixed_phase=False,
+        variables: Optional[List[str]] = None,
+        initial_water_vapour_mixing_ratio=None,
+        initial_relative_humidity=None,
+    ):
+        w_is_sequence = not callable(w) and np.ndim(w) != 0
+        self.n_members = int(
+            np.prod(
+                np.broadcast_shapes(
+                    *(
+                        np.shape(arg)
+                        for arg in (
+                            mass_of_dry_air,
+                            p0,
+                            T0,
+                            z0,
+                            initial_water_vapour_mixing_ratio,
+                            initial_relative_humidity,
+                        )
+                        if arg is not None
+                    ),
+                    (len(w),) if w_is_sequence else (),
+                )
+            )
+        )
+
+        def per_member(arg):
+            return None if arg is None else np.full(self.n_members, arg, dtype=float)
+
+        super().__init__(
+            dt=dt,
+            mass_of_dry_air=per_member(mass_of_dry_air),
+            p0=per_member(p0),
+            T0=per_member(T0),
+            w=w,
+            z0=per_member(z0),
+            mixed_phase=mixed_phase,
+            variables=variables,
+            initial_water_vapour_mixing_ratio=per_member(
+                initial_water_vapour_mixing_ratio
+            ),
+            initial_relative_humidity=per_member(initial_relative_humidity),
+        )
+        self.mesh = Mesh.mesh_0d(n_cell=self.n_members)
+        if w_is_sequence:
+            self.w = lambda t: [
+                w_member(t) if callable(w_member) else w_member for w_member in w
+            ]
+        self.delta_liquid_water_mixing_ratio = np.full(self.n_members, np.nan)
+
+    @property
+    def dv(self):
+        rhod_mean = (
+            self.get_predicted("rhod").to_ndarray() + self["rhod"].to_ndarray()
+        ) / 2
+        return self.particulator.formulae.trivia.volume_of_density_mass(
+            rhod_mean, self.mass_of_dry_air
+        )
+
+    def register(self, builder):
+        formulae = builder.particulator.formulae
+
+        if self.initial_relative_humidity is not None:
+            self.initial_water_vapour_mixing_ratio = (
+                formulae.trivia.water_vapour_mixing_ratio(
+                    self.p0,
+                    self.initial_relative_humidity,
+                    formulae.saturation_vapour_pressure.pvs_water(self.T0),
+                )
+            )
+
+        pd0 = formulae.trivia.p_d(self.p0, self.initial_water_vapour_mixing_ratio)
+        rhod0 = formulae.state_variable_triplet.rhod_of_pd_T(pd0, self.T0)
+        self.mesh.dv = formulae.trivia.volume_of_density_mass(
+            rhod0, self.mass_of_dry_air
+        )
+
+        Moist.register(self, builder)
+
+        self["water_vapour_mixing_ratio"].upload(self.initial_water_vapour_mixing_ratio)
+        self["thd"].upload(formulae.trivia.th_std(pd0, self.T0))
+        self["rhod"].upload(rhod0)
+        self["z"].upload(self.z0)
+
+        self._tmp["water_vapour_mixing_ratio"].upload(
+            self.initial_water_vapour_mixing_ratio
+        )
+
+        self.sync_parcel_vars()
+        Moist.sync(self)
+        self.notify()
+
+    def init_attributes(
+        self,
+        *,
+        n_in_dv: np.ndarray,
+        kappa,
+        r_dry: np.ndarray,
+        rtol=default_rtol,
+        include_dry_volume_in_attribute: bool = True,
+    ):
+        """`n_in_dv` and `r_dry` are arrays of shape `(n_members, n_sd_per_member)`
+        or `(n_sd_per_member,)` (same spectrum for all members), `kappa` is a scalar
+        or an array of per-member values; returned attributes (incl. "cell id")
+        are flattened member by member"""
+        shape = (self.n_members, max(np.shape(n_in_dv)[-1], np.shape(r_dry)[-1]))
+        n_in_dv = np.broadcast_to(n_in_dv, shape).ravel()
+        r_dry = np.broadcast_to(r_dry, shape).ravel()
+        cell_id = np.repeat(np.arange(self.n_members), shape[1])
+        kappa = np.broadcast_to(kappa, (self.n_members,))[cell_id]
+
+        attributes = {}
+        dry_volume = self.particulator.formulae.trivia.volume(radius=r_dry)
+        attributes["kappa times dry volume"] = dry_volume * kappa
+        attributes["multiplicity"] = n_in_dv
+        attributes["cell id"] = cell_id
+        r_wet = equilibrate_wet_radii(
+            r_dry=r_dry,
+            environment=self,
+            kappa_times_dry_volume=attributes["kappa times dry volume"],
+            cell_id=cell_id,
+            rtol=rtol,
+        )
+        attributes["volume"] = self.particulator.formulae.trivia.volume(radius=r_wet)
+        if include_dry_volume_in_attribute:
+            attributes["dry volume"] = dry_volume
+        return attributes
+
+    def advance_parcel_vars(self):
+        """vectorised (over ensemble members) counterpart of
+        `PySDM.environments.parcel.Parcel.advance_parcel_vars`"""
+        dt = self.particulator.dt
+        formulae = self.particulator.formulae
+        T = self["T"].to_ndarray()
+        p = self["p"].to_ndarray()
+
+        dz_dt = np.full(
+            self.n_members,
+            self.w((self.particulator.n_steps + 1 / 2) * dt),  # "mid-point"
+            dtype=float,
+        )
+        water_vapour_mixing_ratio = (
+            self["water_vapour_mixing_ratio"].to_ndarray()
+            - self.delta_liquid_water_mixing_ratio / 2
+        )
+
+        drho_dz = formulae.hydrostatics.drho_dz(
+            p=p,
+            T=T,
+            water_vapour_mixing_ratio=water_vapour_mixing_ratio,
+            lv=formulae.latent_heat_vapourisation.lv(T),
+            d_liquid_water_mixing_ratio__dz=(
+                self.delta_liquid_water_mixing_ratio / dz_dt / dt
+            ),
+        )
+        drhod_dz = drho_dz  # TODO #407
+
+        self.particulator.backend.explicit_euler(self._tmp["z"], dt, dz_dt)
+        self.particulator.backend.explicit_euler(
+            self._tmp["rhod"], dt, dz_dt * drhod_dz
+        )
+
+        self.mesh.dv = formulae.trivia.volume_of_density_mass(
+            (self._tmp["rhod"].to_ndarray() + self["rhod"].to_ndarray()) / 2,
+            self.mass_of_dry_air,
+        )
+
+    def backend_methods(self):
+        # explicit_euler is called here with per-member derivatives
+        return Moist.backend_methods()
+
+    def sync_parcel_vars(self):
+        self.delta_liquid_water_mixing_ratio = (
+            self._tmp["water_vapour_mixing_ratio"].to_ndarray()
+            - self["water_vapour_mixing_ratio"].to_ndarray()
+        )
+        for var in self.variables:
+            self._tmp[var][:] = self[var][:]
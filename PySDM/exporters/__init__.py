@@ -1,9 +1,12 @@
 """
 Exporters handling output to metadata-rich file formats incl. netCDF and VTK
+ (and to a compact memory-mappable binary format for super-droplet attributes)
 """
 
+from .binary_attributes_exporter import BinaryAttributesExporter
 from .netcdf_exporter import NetCDFExporter
 from .netcdf_exporter_1d import NetCDFExporter_1d, readNetCDF_1d
+from .streaming_netcdf_exporter import StreamingNetCDFExporter
 from .vtk_exporter import VTKExporter
 from .vtk_exporter_1d import VTKExporter_1d
 from .vtk_exporter_parcel import VTKExporterParcel
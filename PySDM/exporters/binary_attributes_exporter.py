@@ -0,0 +1,78 @@
+"""
+compact binary super-droplet attribute snapshots (one file per export, see
+ `PySDM.impl.aligned_binary_file`) holding values of valid super-droplets only
+ (in the order defined by the current permutation index) with per-attribute dtypes;
+ the files are read through `np.memmap`, hence picking a few attributes from many
+ snapshots does not involve reading the remaining ones
+"""
+
+import os
+
+from PySDM.impl import aligned_binary_file
+
+MAGIC = b"PySDM-attributes-v1\n"
+
+
+class BinaryAttributesExporter:
+    """
+    Example of use:
+
+    exporter = BinaryAttributesExporter(attributes=("multiplicity", "water mass"))
+
+    for step in range(settings.n_steps):
+        simulation.particulator.run(1)
+        exporter.export_attributes(simulation.particulator)
+
+    multiplicities = [
+        BinaryAttributesExporter.read(path)[1]["multiplicity"]
+        for path in exporter.exported_files
+    ]
+    """
+
+    def __init__(
+        self,
+        *,
+        path=".",
+        attributes=None,
+        attributes_filename="sd_attributes",
+        file_num_len=10,
+    ):
+        self.path = os.path.join(path, "output")
+        if not os.path.isdir(self.path):
+            os.mkdir(self.path)
+        self.attributes = attributes
+        self.attributes_file_path = os.path.join(self.path, attributes_filename)
+        self.num_len = file_num_len
+        self.exported_files = []
+
+    def export_attributes(self, particulator):
+        """writes a snapshot of the selected attributes (all attributes if none
+        were given) of valid super-droplets to a file named after the current
+        step number; returns the path of the file (also appended to
+        `exported_files`)"""
+        path = f"{self.attributes_file_path}_num{particulator.n_steps:0{self.num_len}d}.bin"
+        names = (
+            particulator.attributes.keys()
+            if self.attributes is None
+            else self.attributes
+        )
+        aligned_binary_file.write(
+            path,
+            magic=MAGIC,
+            header={
+                "n_steps": particulator.n_steps,
+                "time": particulator.n_steps * particulator.dt,
+                "super_droplet_count": particulator.attributes.super_droplet_count,
+            },
+            arrays={name: particulator.attributes[name].to_ndarray() for name in names},
+        )
+        self.exported_files.append(path)
+        return path
+
+    @staticmethod
+    def read(path):
+        """returns a tuple of: a dictionary with step number, time and super-droplet
+        count; and a dictionary of read-only memory-mapped attribute arrays"""
+        header, arrays = aligned_binary_file.read(path, magic=MAGIC)
+        del header["arrays"]
+        return header, arrays
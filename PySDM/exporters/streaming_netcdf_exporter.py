@@ -0,0 +1,227 @@
+"""netCDF4 (HDF5-based) exporter implemented using
+[netCDF4-python](https://unidata.github.io/netcdf4-python/) writing compressed chunked
+variables step by step from a background thread (so that the I/O overlaps with
+time-stepping) and storing super-droplet attributes as contiguous ragged arrays
+(following the CF conventions with a `super_droplet_count` variable per output step);
+netCDF4-python is an optional dependency (`pip install PySDM[netCDF4]`) imported
+only when the exporter is instantiated
+"""
+
+import queue
+import threading
+
+import numpy as np
+
+from PySDM.products.impl.spectrum_moment_product import SpectrumMomentProduct
+
+DIM_SUFFIX = "_bin_left_edges"
+TIME = "T"
+SD_DIM = "super_droplet"
+SD_COUNT = "super_droplet_count"
+N_BUFFERS = 2
+
+
+class StreamingNetCDFExporter:  # pylint: disable=too-many-instance-attributes
+    """
+    Example of use:
+
+    with StreamingNetCDFExporter(
+        "output.nc", particulator, attributes=("multiplicity", "water mass")
+    ) as exporter:
+        for _ in range(n_outputs):
+            particulator.run(steps_per_output)
+            exporter.write()
+
+    each `write()` call only copies the product values into one of two preallocated
+    snapshot buffers (along with copies of the attribute values of valid
+    super-droplets) and returns, the data is compressed and written by a background
+    thread (the call blocks only if both buffers are still waiting to be written)
+    """
+
+    def __init__(
+        self,
+        filename,
+        particulator,
+        *,
+        products=None,
+        attributes=(),
+        complevel=4,
+    ):
+        self.particulator = particulator
+        self.products = (
+            tuple(particulator.products.keys()) if products is None else products
+        )
+        self.attributes = attributes
+        self.complevel = complevel
+        self.n_written = 0
+        self.n_sd_written = 0
+
+        from netCDF4 import Dataset  # pylint: disable=import-outside-toplevel
+
+        self.ncdf = Dataset(filename, mode="w", format="NETCDF4")
+        self._create_dimensions()
+        self.vars = {}
+        self._create_coordinates()
+
+        self.__free = queue.Queue()
+        for _ in range(N_BUFFERS):
+            self.__free.put({})
+        self.__pending = queue.Queue()
+        self.__error = None
+        self.__thread = threading.Thread(target=self._writer_loop, daemon=True)
+        self.__thread.start()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *_):
+        self.close()
+
+    @property
+    def _spatial_dims(self):
+        return {0: (), 1: ("Z",), 2: ("X", "Z"), 3: ("X", "Y", "Z")}[
+            self.particulator.mesh.dimension
+        ]
+
+    def _create_dimensions(self):
+        self.ncdf.createDimension(TIME, None)
+        for label, size in zip(self._spatial_dims, self.particulator.mesh.grid):
+            self.ncdf.createDimension(label, size)
+        if len(self.attributes) > 0:
+            self.ncdf.createDimension(SD_DIM, None)
+
+    def _create_coordinates(self):
+        self.vars[TIME] = self.ncdf.createVariable(TIME, "f8", (TIME,))
+        self.vars[TIME].units = "seconds"
+
+        mesh = self.particulator.mesh
+        for index, label in enumerate(self._spatial_dims):
+            self.vars[label] = self.ncdf.createVariable(label, "f8", (label,))
+            self.vars[label][:] = (mesh.size[index] / mesh.grid[index]) * (
+                1 / 2 + np.arange(mesh.grid[index])
+            )
+            self.vars[label].units = "metres"
+
+        for name in self.products:
+            instance = self.particulator.products[name]
+            if isinstance(instance, SpectrumMomentProduct):
+                label = f"{name}{DIM_SUFFIX}"
+                self.ncdf.createDimension(label, len(instance.attr_bins_edges) - 1)
+                self.vars[label] = self.ncdf.createVariable(label, "f8", (label,))
+                self.vars[label][:] = instance.attr_bins_edges.to_ndarray()[:-1]
+                self.vars[label].units = instance.attr_unit
+
+        if len(self.attributes) > 0:
+            self.vars[SD_COUNT] = self.ncdf.createVariable(SD_COUNT, "i8", (TIME,))
+            self.vars[SD_COUNT].sample_dimension = SD_DIM
+
+    def _create_product_variable(self, name, value):
+        if name in self.vars:
+            raise AssertionError(
+                f"product ({name}) has same name as one of netCDF dimensions"
+            )
+        dimensions = (TIME,)
+        for axis, size in enumerate(value.shape):
+            label = f"{name}_dim{axis}"
+            if axis < len(self._spatial_dims) and size == len(
+                self.ncdf.dimensions[self._spatial_dims[axis]]
+            ):
+                label = self._spatial_dims[axis]
+            elif f"{name}{DIM_SUFFIX}" in self.ncdf.dimensions and size == len(
+                self.ncdf.dimensions[f"{name}{DIM_SUFFIX}"]
+            ):
+                label = f"{name}{DIM_SUFFIX}"
+            if label not in self.ncdf.dimensions:
+                self.ncdf.createDimension(label, size)
+            dimensions += (label,)
+        self.vars[name] = self.ncdf.createVariable(
+            name,
+            "f8",
+            dimensions,
+            zlib=self.complevel > 0,
+            complevel=self.complevel,
+            chunksizes=(1,) + value.shape,
+        )
+        self.vars[name].units = self.particulator.products[name].unit
+
+    def _create_attribute_variable(self, name, value):
+        dimensions = (SD_DIM,)
+        if value.ndim == 2:
+            label = f"{name}_component"
+            self.ncdf.createDimension(label, value.shape[0])
+            dimensions = (label, SD_DIM)
+        self.vars[name] = self.ncdf.createVariable(
+            name,
+            value.dtype,
+            dimensions,
+            zlib=self.complevel > 0,
+            complevel=self.complevel,
+        )
+
+    def write(self):
+        """takes a snapshot of the products and attributes and queues it for writing"""
+        self._raise_writer_error()
+        buffer = self.__free.get()
+        for name in self.products:
+            value = np.asarray(self.particulator.products[name].get())
+            if name not in buffer:
+                buffer[name] = np.empty_like(value, dtype=float)
+            np.copyto(buffer[name], value)
+
+        for name in self.attributes:
+            buffer[name] = self.particulator.attributes[name].to_ndarray()
+
+        self.__pending.put((self.particulator.n_steps * self.particulator.dt, buffer))
+
+    def _writer_loop(self):
+        while True:
+            item = self.__pending.get()
+            if item is None:
+                return
+            time, buffer = item
+            try:
+                if self.__error is None:
+                    self._write_snapshot(time, buffer)
+            except Exception as error:  # pylint: disable=broad-exception-caught
+                self.__error = error
+            self.__free.put(buffer)
+
+    def _write_snapshot(self, time, buffer):
+        i = self.n_written
+        self.vars[TIME][i] = time
+        for name in self.products:
+            if name not in self.vars:
+                self._create_product_variable(name, buffer[name])
+            self.vars[name][i, ...] = buffer[name]
+
+        if len(self.attributes) > 0:
+            sd_count = buffer[self.attributes[0]].shape[-1]
+            self.vars[SD_COUNT][i] = sd_count
+            for name in self.attributes:
+                if name not in self.vars:
+                    self._create_attribute_variable(name, buffer[name])
+                self.vars[name][
+                    ..., self.n_sd_written : self.n_sd_written + sd_count
+                ] = buffer.pop(name)
+            self.n_sd_written += sd_count
+        self.n_written += 1
+
+    def _raise_writer_error(self):
+        if self.__error is not None:
+            raise RuntimeError("netCDF writer thread failed") from self.__error
+
+    def flush(self):
+        """blocks until all queued snapshots are written"""
+        buffers = [self.__free.get() for _ in range(N_BUFFERS)]
+        for buffer in buffers:
+            self.__free.put(buffer)
+        self._raise_writer_error()
+
+    def close(self):
+        """waits for the pending writes to complete and closes the file"""
+        if self.__thread.is_alive():
+            self.__pending.put(None)
+            self.__thread.join()
+        if self.ncdf.isopen():
+            self.ncdf.close()
+        self._raise_writer_error()
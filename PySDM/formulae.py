@@ -6,6 +6,7 @@ import inspect
 import math
 import numbers
 import re
+import time
 import warnings
 from collections import namedtuple
 from functools import lru_cache, partial, cached_property
@@ -71,7 +72,18 @@ class Formulae:  # pylint: disable=too-few-public-methods,too-many-instance-attr
         air_dynamic_viscosity: str = "ZografosEtAl1987",
         bulk_phase_partitioning: str = "Null",
         handle_all_breakups: bool = False,
+        tabulate: Optional[dict] = None,
+        tabulation_rtol: float = 1e-6,
     ):
+        """`tabulate` enables replacing (within `flatten` only) single-argument formulae
+        with linear interpolation in lookup tables; keys are the flattened names
+        (e.g., "saturation_vapour_pressure__pvs_water") and values are tuples of
+        `(x_min, x_max, n_points)` defining uniform grids of table nodes (outside
+        of which the original formulae are used); a `ValueError` is raised if the
+        maximal relative interpolation error, measured against the formula evaluated
+        over a dense validation sample (several points within each interval between
+        table nodes), exceeds `tabulation_rtol` - see `tabulation_report()` for
+        the validation errors and speedups"""
         # initialisation of the fields below is just to silence pylint and to enable code hints
         # in PyCharm and alike, all these fields are later overwritten within this ctor
         self.optical_albedo = optical_albedo
@@ -117,7 +129,8 @@ class Formulae:  # pylint: disable=too-few-public-methods,too-many-instance-attr
         self._components = tuple(
             i
             for i in dir(self)
-            if not i.startswith("__") and i not in ("flatten", "get_constant")
+            if not i.startswith("__")
+            and i not in ("flatten", "get_constant", "tabulation_report")
         )
 
         constants_defaults = {
@@ -149,23 +162,19 @@ class Formulae:  # pylint: disable=too-few-public-methods,too-many-instance-attr
         self.handle_all_breakups = handle_all_breakups
         dimensional_analysis = physics.impl.flag.DIMENSIONAL_ANALYSIS
 
-        self.trivia = _magick(
-            "Trivia", physics.trivia, fastmath, constants, dimensional_analysis
-        )
-
-        # each `component` corresponds to one subdirectory of PySDM/physics
+        # each `component` corresponds to one subdirectory of PySDM/physics; the
+        # selections are validated here, while the JIT-compilable formulae are
+        # generated ("boosted") on first access (see `__getattr__`)
+        self._component_names = {"trivia": "Trivia"}
         for component in self._components:
-            setattr(
-                self,
-                component,
-                _magick(
-                    value=getattr(self, component),
-                    module=getattr(physics, component),
-                    fastmath=fastmath,
-                    constants=constants,
-                    dimensional_analysis=dimensional_analysis,
-                ),
+            self._component_names[component] = getattr(self, component)
+            _pick(
+                self._component_names[component],
+                _choices(getattr(physics, component)),
+                constants,
             )
+            delattr(self, component)
+        self._dimensional_analysis = dimensional_analysis
 
         # TODO #348
         self.terminal_velocity_class = {
@@ -179,12 +188,61 @@ class Formulae:  # pylint: disable=too-few-public-methods,too-many-instance-attr
             "IceSphere": IceSphere,
         }[terminal_velocity_ice]
 
+        self.tabulate = dict(tabulate or {})
+        self.tabulation_rtol = tabulation_rtol
+        self._tables = {}
+        for name, (x_min, x_max, n_points) in self.tabulate.items():
+            component, item = name.split("__", 1)
+            function = getattr(getattr(self, component), item)
+            py_func = getattr(function, "py_func", function)
+            if dimensional_analysis or not inspect.isfunction(py_func):
+                raise ValueError(f"{name} is not a JIT-compiled formula")
+            if len(inspect.signature(py_func).parameters) != 1:
+                raise ValueError(f"{name} is not a single-argument formula")
+            self._tables[name] = _Table(
+                function, x_min, x_max, n_points, fastmath=fastmath
+            )
+            if self._tables[name].validation_error > tabulation_rtol:
+                raise ValueError(
+                    f"tabulation error for {name} measured over the validation sample"
+                    f" ({self._tables[name].validation_error:.2g}) exceeds"
+                    f" tabulation_rtol ({tabulation_rtol:.2g}), increase n_points"
+                )
+
+    def __getattr__(self, name):
+        """boosts the selected physics component on first access"""
+        component_names = self.__dict__.get("_component_names", {})
+        if name not in component_names:
+            raise AttributeError(
+                f"'{type(self).__name__}' object has no attribute '{name}'"
+            )
+        value = _magick(
+            value=component_names[name],
+            module=getattr(physics, name),
+            fastmath=self.fastmath,
+            constants=self.constants,
+            dimensional_analysis=self._dimensional_analysis,
+        )
+        setattr(self, name, value)
+        return value
+
+    def __dir__(self):
+        return sorted(
+            set(super().__dir__()) | set(self.__dict__.get("_component_names", {}))
+        )
+
     def __str__(self):
         description = []
         for attr in dir(self):
-            if not attr.startswith("_") and attr != "flatten":
+            if not attr.startswith("_") and attr not in (
+                "flatten",
+                "tabulation_report",
+            ):
+                if attr in self._component_names:
+                    description.append(f"{attr}: {self._component_names[attr]}")
+                    continue
                 attr_value = getattr(self, attr)
-                if attr_value.__class__ in (bool, int, float):
+                if attr_value.__class__ in (bool, int, float, dict):
                     value = attr_value
                 elif attr_value.__class__.__name__ == "Constants":
                     value = str(attr_value)
@@ -205,17 +263,124 @@ class Formulae:  # pylint: disable=too-few-public-methods,too-many-instance-attr
             for item in dir(getattr(self, component)):
                 attr = getattr(getattr(self, component), item)
                 if not item.startswith("__") and callable(attr):
-                    functions[component + "__" + item] = attr
+                    name = component + "__" + item
+                    functions[name] = (
+                        self._tables[name].function if name in self._tables else attr
+                    )
         for attr in ("constants", "fastmath"):
             functions[attr] = getattr(self, attr)
         return namedtuple("FlattenedFormulae", functions.keys())(**functions)
 
+    def tabulation_report(self, n_samples: int = 10**6, seed: int = 44) -> dict:
+        """for each tabulated formula, returns the a-priori interpolation error estimate,
+        the maximal relative error found at `n_samples` random points within the table
+        range, and the speedup of table lookups over evaluation of the formula (ratio of
+        JIT-compiled loop wall times)"""
+        rng = np.random.default_rng(seed)
+        report = {}
+        for name, table in self._tables.items():
+            args = rng.uniform(table.x_min, table.x_max, n_samples)
+            times = {}
+            values = {}
+            for key, function in (
+                ("formula", table.formula),
+                ("table", table.function),
+            ):
+                values[key] = np.empty_like(args)
+                _evaluate(function, args[:1], values[key][:1])
+                start = time.perf_counter()
+                _evaluate(function, args, values[key])
+                times[key] = time.perf_counter() - start
+            report[name] = {
+                "range": (table.x_min, table.x_max),
+                "n_points": table.n_points,
+                "validation_error": table.validation_error,
+                "max_sampled_error": float(
+                    np.amax(_relative_error(values["table"], values["formula"]))
+                ),
+                "speedup": times["formula"] / times["table"],
+            }
+        return report
+
     def get_constant(self, key: str):
         """getter-like method for cases where using the `constants` named tuple is not possible
         (e.g., if calling from a language which does not support named tuples)"""
         return getattr(self.constants, key)
 
 
+def _relative_error(actual, expected):
+    return np.abs(actual - expected) / np.where(expected == 0, 1, np.abs(expected))
+
+
+@numba.njit(**{**conf.JIT_FLAGS, **{"parallel": False, "cache": False}})
+def _evaluate(function, args, output):
+    for i, arg in enumerate(args):
+        output[i] = function(arg)
+
+
+class _Table:  # pylint: disable=too-few-public-methods
+    """lookup table with linear interpolation between uniformly spaced nodes; the
+    `validation_error` is the maximal relative difference between the interpolated
+    values and the formula evaluated at `VALIDATION_POINTS_PER_INTERVAL - 1` points
+    evenly spaced within each interval (including its midpoint)"""
+
+    VALIDATION_POINTS_PER_INTERVAL = 8
+
+    def __init__(
+        self, formula, x_min, x_max, n_points, fastmath
+    ):  # pylint: disable=too-many-arguments
+        if not x_min < x_max or n_points < 3:
+            raise ValueError("table requires x_min < x_max and n_points >= 3")
+        self.formula = formula
+        self.x_min = x_min
+        self.x_max = x_max
+        self.n_points = n_points
+
+        nodes = np.linspace(x_min, x_max, n_points)
+        values = np.empty_like(nodes)
+        _evaluate(formula, nodes, values)
+
+        weights = (
+            np.arange(1, self.VALIDATION_POINTS_PER_INTERVAL)
+            / self.VALIDATION_POINTS_PER_INTERVAL
+        )
+        sample = nodes[:-1, None] * (1 - weights) + nodes[1:, None] * weights
+        sample_values = np.empty(sample.size)
+        _evaluate(formula, sample.ravel(), sample_values)
+        self.validation_error = float(
+            np.amax(
+                _relative_error(
+                    (values[:-1, None] * (1 - weights) + values[1:, None] * weights),
+                    sample_values.reshape(sample.shape),
+                )
+            )
+        )
+
+        dx = (x_max - x_min) / (n_points - 1)
+        last_interval = n_points - 2
+
+        @numba.njit(
+            **{
+                **conf.JIT_FLAGS,
+                **{
+                    "parallel": False,
+                    "inline": "always",
+                    "cache": False,
+                    "fastmath": fastmath,
+                },
+            }
+        )
+        def function(arg):
+            position = (arg - x_min) / dx
+            if not 0 <= position <= n_points - 1:
+                return formula(arg)
+            i = min(int(position), last_interval)
+            weight = position - i
+            return values[i] * (1 - weight) + values[i + 1] * weight
+
+        self.function = function
+
+
 def _formula(func, constants, dimensional_analysis, **kw):
     parameters_keys = tuple(inspect.signature(func).parameters.keys())
     special_params = ("_", "const")
@@ -0,0 +1,67 @@
+"""
+simple binary container used for checkpoints and attribute dumps: a magic string,
+ the length of a JSON header, the header (with dtype, shape and offset of each array)
+ and a block of raw arrays aligned to `ALIGNMENT` bytes; on reading, the arrays are
+ returned as read-only views of a single `np.memmap` buffer (i.e., no data is read
+ until accessed)
+"""
+
+import json
+
+import numpy as np
+
+ALIGNMENT = 64
+
+
+def _aligned(offset):
+    return -(-offset // ALIGNMENT) * ALIGNMENT
+
+
+def write(path: str, *, magic: bytes, header: dict, arrays: dict):
+    """writes the `header` dictionary (JSON-serialisable) and the `arrays`
+    (a dictionary of `np.ndarray` instances) to a file at `path`; the file is
+    padded up to the end of the last array (which may start past the last written
+    byte if empty)"""
+    header = {**header, "arrays": {}}
+    offset = 0
+    for key, array in arrays.items():
+        offset = _aligned(offset)
+        header["arrays"][key] = {
+            "dtype": array.dtype.str,
+            "shape": array.shape,
+            "offset": offset,
+        }
+        offset += array.nbytes
+    encoded_header = json.dumps(header).encode()
+
+    with open(path, "wb") as file:
+        file.write(magic)
+        file.write(np.uint64(len(encoded_header)).tobytes())
+        file.write(encoded_header)
+        start = _aligned(file.tell())
+        for key, array in arrays.items():
+            file.seek(start + header["arrays"][key]["offset"])
+            file.write(np.ascontiguousarray(array).tobytes())
+        file.truncate(start + offset)
+
+
+def read(path: str, *, magic: bytes):
+    """returns the header and a dictionary of read-only arrays which are views
+    of a single memory-mapped buffer"""
+    with open(path, "rb") as file:
+        if file.read(len(magic)) != magic:
+            raise ValueError(f"{path} is not a {magic.decode().strip()} file")
+        header_length = int(np.frombuffer(file.read(8), dtype=np.uint64)[0])
+        header = json.loads(file.read(header_length))
+        start = _aligned(file.tell())
+    buffer = np.memmap(path, dtype=np.uint8, mode="r")
+    arrays = {
+        key: np.ndarray(
+            shape=tuple(spec["shape"]),
+            dtype=np.dtype(spec["dtype"]),
+            buffer=buffer,
+            offset=start + spec["offset"],
+        )
+        for key, spec in header["arrays"].items()
+    }
+    return header, arrays
@@ -0,0 +1,239 @@
+"""
+checkpoint/restart logic for `PySDM.particulator.Particulator` - the state of particle
+ attributes (incl. the permutation index, cell-sorting data and the healthy flag),
+ of the environment, dynamics, products and observers (incl. the states of
+ numpy-based random number generators) is stored in a single
+ `PySDM.impl.aligned_binary_file` (with scalar values kept in the JSON header),
+ so that on restart the arrays are read as views of one memory-mapped buffer
+ and uploaded directly into the backend storages; values of other types held by
+ PySDM objects raise `TypeError` on save (except for functions, classes, modules
+ and JIT-compiled kernels, which carry no state); objects defined outside of PySDM
+ (e.g., the Eulerian solvers of `PySDM.dynamics.eulerian_advection.EulerianAdvection`
+ or user-supplied observers) are checkpointed only if they implement the
+ `checkpoint_state()` method returning a dictionary of arrays (views of the object
+ state, overwritten in place on restore) and scalars, as well as the
+ `restore_checkpoint_state(state)` method called with the restored dictionary;
+ other such objects raise `TypeError` on save
+"""
+
+import inspect
+from functools import partial
+
+import numpy as np
+
+from PySDM.attributes.impl import DerivedAttribute, DummyAttribute
+from PySDM.backends.impl_common.backend_methods import BackendMethods
+from PySDM.formulae import Formulae
+from PySDM.impl import aligned_binary_file
+
+MAGIC = b"PySDM-checkpoint-v1\n"
+SEPARATOR = "/"
+
+
+def _is_walkable(obj):
+    return hasattr(obj, "__dict__") and type(obj).__module__.startswith("PySDM.")
+
+
+def _is_stateless(obj):
+    return (
+        inspect.isroutine(obj)
+        or inspect.isclass(obj)
+        or inspect.ismodule(obj)
+        or isinstance(obj, (partial, np.ufunc))
+        or type(obj).__name__ == "CPUDispatcher"
+    )
+
+
+def _is_scalar(obj):
+    return obj is None or isinstance(obj, (bool, int, float, str, np.number))
+
+
+def _roots(particulator):
+    roots = {
+        "attributes": particulator.attributes,
+        "environment": particulator.environment,
+        "dynamics": particulator.dynamics,
+        "products": particulator.products,
+        "observers": particulator.observers,
+    }
+    return roots
+
+
+def _walk(obj, path, visitor, particulator, stack, restorers):
+    """traverses the object graph calling
+    `visitor(path, value, setter)` for every storage, array, random number generator
+    or scalar found (values referring back to the particulator, backend or
+    formulae, as well as stateless callables are not traversed; objects defined
+    outside of PySDM are traversed through their `checkpoint_state()` dictionaries
+    which are appended, together with the objects, to `restorers`; other values
+    raise `TypeError`)"""
+    if id(obj) in stack:
+        return
+    stack = stack | {id(obj)}
+
+    if isinstance(obj, dict):
+        items = [(key, value) for key, value in obj.items() if isinstance(key, str)]
+        setter = obj.__setitem__
+    elif isinstance(obj, (list, tuple)):
+        items = list(enumerate(obj))
+        setter = obj.__setitem__ if isinstance(obj, list) else None
+    elif _is_walkable(obj):
+        items = list(vars(obj).items())
+
+        def setter(key, value):
+            setattr(obj, key, value)
+
+    else:
+        return
+
+    for key, value in items:
+        if value is particulator or isinstance(value, (BackendMethods, Formulae)):
+            continue
+        item_path = path + (str(key),)
+        item_setter = None if setter is None else (lambda v, k=key: setter(k, v))
+        if _is_scalar(value) or isinstance(
+            value, (particulator.backend.Storage, np.ndarray, np.random.Generator)
+        ):
+            visitor(item_path, value, item_setter)
+        elif isinstance(value, (dict, list, tuple)) or _is_walkable(value):
+            _walk(value, item_path, visitor, particulator, stack, restorers)
+        elif hasattr(value, "checkpoint_state"):
+            state = value.checkpoint_state()
+            restorers.append((value, state))
+            _walk(state, item_path, visitor, particulator, stack, restorers)
+        elif not _is_stateless(value):
+            raise TypeError(
+                f"{SEPARATOR.join(item_path)}: checkpointing values of type"
+                f" {type(value).__name__} is not supported (objects defined outside"
+                " of PySDM need to implement checkpoint_state() and"
+                " restore_checkpoint_state() methods)"
+            )
+
+
+def _base_attributes(particulator):
+    attributes = (
+        particulator.attributes._ParticleAttributes__attributes  # pylint: disable=protected-access
+    )
+    return [
+        name
+        for name, attribute in attributes.items()
+        if not isinstance(attribute, (DerivedAttribute, DummyAttribute))
+    ]
+
+
+def save(particulator, path: str):
+    """writes the particulator state to a file at `path`"""
+    arrays = {}
+    scalars = {}
+
+    def visitor(path, value, _):
+        key = SEPARATOR.join(path)
+        if isinstance(value, particulator.backend.Storage):
+            if isinstance(value, particulator.Index):
+                scalars[key + SEPARATOR + "length"] = int(value.length)
+            arrays[key] = (
+                value.to_ndarray(raw=True)
+                if isinstance(value, particulator.IndexedStorage)
+                else value.to_ndarray()
+            )
+        elif isinstance(value, np.ndarray):
+            arrays[key] = value
+        elif isinstance(value, np.random.Generator):
+            scalars[key] = {"bit_generator": value.bit_generator.state}
+        else:
+            scalars[key] = value.item() if isinstance(value, np.number) else value
+
+    for name, root in _roots(particulator).items():
+        _walk(root, (name,), visitor, particulator, set(), [])
+
+    aligned_binary_file.write(
+        path,
+        magic=MAGIC,
+        header={
+            "n_sd": particulator.n_sd,
+            "n_steps": particulator.n_steps,
+            "initialised": len(particulator.initialisers) == 0,
+            "base_attributes": {
+                name: SEPARATOR.join(
+                    ("attributes", "_ParticleAttributes__attributes", name, "data")
+                )
+                for name in _base_attributes(particulator)
+            },
+            "scalars": scalars,
+        },
+        arrays=arrays,
+    )
+
+
+def load(path: str):
+    """returns the header and a dictionary of read-only arrays which are views
+    of a single memory-mapped buffer"""
+    return aligned_binary_file.read(path, magic=MAGIC)
+
+
+def restore(path: str, builder, products=()):
+    """builds a particulator using the `builder` (which is expected to be set up
+    with the same environment and dynamics as the one used for the checkpointed
+    simulation) and overwrites its state with the one read from `path`"""
+    header, arrays = load(path)
+    if header["n_sd"] != builder.particulator.n_sd:
+        raise ValueError(
+            f"checkpoint saved with n_sd={header['n_sd']}"
+            f" while the builder uses n_sd={builder.particulator.n_sd}"
+        )
+    particulator = builder.build(
+        attributes={
+            name: arrays[key] for name, key in header["base_attributes"].items()
+        },
+        products=products,
+        int_caster=np.asarray,
+    )
+
+    missing = set(arrays) | set(header["scalars"])
+
+    def visitor(path, value, setter):
+        key = SEPARATOR.join(path)
+        if key not in missing:
+            return
+        missing.discard(key)
+        if isinstance(value, (particulator.backend.Storage, np.ndarray)):
+            if key not in arrays:
+                setter(header["scalars"][key])
+                return
+            array = arrays[key]
+            if array.shape != tuple(value.shape):
+                raise ValueError(
+                    f"shape mismatch for {key}: {array.shape} vs. {value.shape}"
+                )
+            if isinstance(value, np.ndarray):
+                value[...] = array
+            else:
+                value.upload(array)
+            if isinstance(value, particulator.Index):
+                value.length = particulator.Storage.INT(
+                    header["scalars"][key + SEPARATOR + "length"]
+                )
+                missing.discard(key + SEPARATOR + "length")
+        elif isinstance(value, np.random.Generator):
+            value.bit_generator.state = header["scalars"][key]["bit_generator"]
+        elif key in arrays:
+            missing.add(key)
+        elif setter is not None:
+            scalar = header["scalars"][key]
+            setter(type(value)(scalar) if isinstance(value, np.number) else scalar)
+
+    restorers = []
+    for name, root in _roots(particulator).items():
+        _walk(root, (name,), visitor, particulator, set(), restorers)
+
+    if missing:
+        raise ValueError(
+            f"checkpoint entries not matching the built particulator: {sorted(missing)}"
+        )
+    for obj, state in restorers:
+        obj.restore_checkpoint_state(state)
+
+    particulator.n_steps = header["n_steps"]
+    if header["initialised"]:
+        particulator.initialisers.clear()
+    return particulator
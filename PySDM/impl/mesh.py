@@ -38,9 +38,16 @@ class Mesh:
         }[self.n_dims]
 
     @staticmethod
-    def mesh_0d(dv=None):
+    def mesh_0d(dv=None, n_cell=1):
+        """zero-dimensional mesh, with `n_cell > 1` representing an ensemble of
+        independent zero-dimensional domains (e.g., parcels)"""
         return Mesh(
-            grid=(1,), size=tuple(), n_cell=1, dv=dv or np.nan, n_dims=0, strides=(-1,)
+            grid=(n_cell,),
+            size=tuple(),
+            n_cell=n_cell,
+            dv=dv or np.nan,
+            n_dims=0,
+            strides=(-1,),
         )
 
     @staticmethod
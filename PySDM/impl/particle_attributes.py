@@ -8,6 +8,16 @@ from typing import Dict
 import numpy as np
 
 from PySDM.attributes.impl.attribute import Attribute
+from PySDM.attributes.impl.base_attribute import BaseAttribute
+
+
+def _buffer_key(storage):
+    """identifies the memory underlying a storage (distinct storage objects may
+    wrap the same buffer)"""
+    interface = getattr(storage.data, "__array_interface__", None)
+    if interface is None:
+        return id(storage.data)
+    return interface["data"][0], interface["shape"], interface["strides"]
 
 
 class ParticleAttributes:  # pylint: disable=too-many-instance-attributes
@@ -61,6 +71,17 @@ class ParticleAttributes:  # pylint: disable=too-many-instance-attributes
         assert self.healthy
         return len(self.__idx)
 
+    @property
+    def timestamp(self) -> int:
+        """sum of the timestamps of all base attributes (grows with any update of any
+        of them; derived attributes are excluded as their timestamps change upon
+        recalculation, i.e. also when merely read)"""
+        return sum(
+            attribute.timestamp
+            for attribute in self.__attributes.values()
+            if isinstance(attribute, BaseAttribute)
+        )
+
     def mark_updated(self, key):
         self.__attributes[key].mark_updated()
 
@@ -95,15 +116,48 @@ class ParticleAttributes:  # pylint: disable=too-many-instance-attributes
     def __contains__(self, key):
         return key in self.__attributes
 
-    def permutation(self, u01, local):
+    def permutation(self, u01, local, parallel=False):
         """apply Fisher-Yates algorithm to all super-droplets (local=False) or
-        otherwise on a per-cell basis"""
+        otherwise on a per-cell basis; with parallel=True, the global permutation
+        is obtained with the multi-threaded bucketed variant of the algorithm"""
         if local:
             self.__idx.shuffle(u01, parts=self.cell_start)
         else:
-            self.__idx.shuffle(u01)
+            self.__idx.shuffle(u01, parallel=parallel)
             self.__sorted = False
 
+    def reorder(self):
+        """rearranges the storage of all attributes (including the extensive-attribute
+        matrix whose rows are the extensive attributes' storages) into the cell-sorted
+        order of super-droplets, and resets the permutation to identity so that
+        the super-droplets of each cell are subsequently accessed contiguously;
+        each underlying buffer is rearranged once, even if shared by several
+        attributes; derived attributes are rearranged as well (keeping the state of
+        those which use their previous values, e.g., pH) and are then invalidated
+        (by marking all base attributes as updated) so that they get recalculated
+        upon next access; per-super-droplet data held outside of attributes is
+        not rearranged, hence dynamics must not keep such data across
+        time steps (scratch storages overwritten within each step are fine);
+        multiplicities past the super-droplet count are zeroed as the slots there
+        hold stale copies of super-droplets rearranged to the front"""
+        self.sanitize()
+        if not self.__sorted:
+            self.__sort_by_cell_id()
+        reordered = set()
+        for attribute in self.__attributes.values():
+            if attribute.data is None:
+                continue
+            key = _buffer_key(attribute.data)
+            if key in reordered:
+                continue
+            self.__idx.apply(attribute.data)
+            reordered.add(key)
+        self["multiplicity"][len(self.__idx) :] = 0
+        self.__idx.reset_index()
+        for attribute in self.__attributes.values():
+            if isinstance(attribute, BaseAttribute):
+                attribute.mark_updated()
+
     def __sort_by_cell_id(self):
         self.__cell_caretaker(
             self["cell id"], self.cell_idx, self.__cell_start, self.__idx
@@ -0,0 +1,296 @@
+"""
+hot-path profiler for `PySDM.particulator.Particulator`: while attached, every public
+ backend method or kernel call, including the `_..._body` kernels invoked by the
+ backend methods (as well as calls to the condensation solver and to the
+ cell-sorting logic) is timed and attributed to the dynamic within which it
+ happened (using the per-dynamic timers of the particulator), along with an estimate
+ of the number of bytes touched (sum of sizes of the array arguments); times are
+ inclusive, i.e. nested backend calls are also accounted for in the outer call;
+ events can be exported in the Chrome trace format (chrome://tracing, Perfetto)
+"""
+
+import json
+import threading
+import time
+import types
+from collections import namedtuple
+from functools import cached_property
+
+import numpy as np
+
+from PySDM.impl.wall_timer import WallTimer
+
+ProfilerEvent = namedtuple(
+    "ProfilerEvent", ("name", "dynamic", "step", "start", "duration", "n_bytes")
+)
+ProfilerStats = namedtuple("ProfilerStats", ("count", "time", "n_bytes"))
+
+DYNAMIC_CATEGORY = "dynamic"
+
+
+def _n_bytes(arg):
+    data = getattr(arg, "data", arg)
+    if isinstance(data, np.ndarray):
+        return data.nbytes
+    if hasattr(arg, "shape") and hasattr(arg, "dtype"):
+        try:
+            return int(np.prod(arg.shape)) * np.dtype(arg.dtype).itemsize
+        except TypeError:
+            return 0
+    return 0
+
+
+class _DynamicTimer(WallTimer):
+    def __init__(self, profiler, key, timer):
+        super().__init__()
+        self.profiler = profiler
+        self.key = key
+        self.timer = timer
+
+    def __enter__(self):
+        self.profiler.current_dynamic = self.key
+        self.timer.__enter__()
+        super().__enter__()
+
+    def __exit__(self, *args):
+        super().__exit__(*args)
+        self.timer.__exit__(*args)
+        self.profiler.current_dynamic = None
+        self.profiler.record(
+            name=self.key, category=DYNAMIC_CATEGORY, duration=self.time
+        )
+
+
+class _LazyKernel:
+    """stands in for a backend kernel (cached property) not created yet at the time of
+    attaching the profiler: calls are timed, any other access is forwarded"""
+
+    def __init__(self, profiler, name, descriptor):
+        self.__descriptor = descriptor
+        self.__backend = profiler.particulator.backend
+        self.__kernel = None
+        self.__timed = None
+        self.__profiler = profiler
+        self.__name = name
+        self.created = False
+
+    def get(self):
+        """returns the kernel (creating it upon first call through the descriptor
+        protocol, so that, e.g., `cached_kernel` hooks are honoured)"""
+        if not self.created:
+            backend_vars = vars(self.__backend)
+            placeholder = backend_vars.pop(self.__name)
+            try:
+                self.__kernel = self.__descriptor.__get__(
+                    self.__backend, type(self.__backend)
+                )
+            finally:
+                backend_vars[self.__name] = placeholder
+            self.created = True
+        return self.__kernel
+
+    def __call__(self, *args, **kwargs):
+        if self.__timed is None:
+            self.__timed = self.__profiler.timed(self.__name, self.get())
+        return self.__timed(*args, **kwargs)
+
+    def __getattr__(self, item):
+        return getattr(self.get(), item)
+
+    def __getitem__(self, item):
+        return self.get()[item]
+
+
+class Profiler:  # pylint: disable=too-many-instance-attributes
+    """
+    Example of use:
+
+    with particulator.profile() as profiler:
+        particulator.run(steps=10)
+
+    print(profiler.report())
+    profiler.export_chrome_trace("trace.json")
+    """
+
+    def __init__(self, particulator, *, record_events=True):
+        self.particulator = particulator
+        self.record_events = record_events
+        self.current_dynamic = None
+        self.events = []
+        self.__stats = {}
+        self.__originals = {}
+        self.__t0 = time.perf_counter()
+        self.__lock = threading.Lock()
+
+    def __enter__(self):
+        self.attach()
+        return self
+
+    def __exit__(self, *_):
+        self.detach()
+
+    def timed(self, name, function):
+        """returns a wrapper of `function` recording each of its calls"""
+        profiler = self
+
+        def wrapper(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return function(*args, **kwargs)
+            finally:
+                profiler.record(
+                    name=name,
+                    category=profiler.current_dynamic,
+                    duration=time.perf_counter() - start,
+                    n_bytes=sum(_n_bytes(arg) for arg in args)
+                    + sum(_n_bytes(arg) for arg in kwargs.values()),
+                )
+
+        wrapper.__wrapped__ = function
+        return wrapper
+
+    def __replace(self, owner, name, new_value):
+        self.__originals[(id(owner), name)] = (owner, name, vars(owner).get(name))
+        setattr(owner, name, new_value)
+
+    def attach(self):
+        """instruments the backend methods and the particulator timers"""
+        backend = self.particulator.backend
+        for cls in type(backend).__mro__[:-1]:
+            for name, attr in vars(cls).items():
+                if name.startswith("__") or (id(backend), name) in self.__originals:
+                    continue
+                if name.startswith("_") and not (
+                    isinstance(attr, cached_property) and name.endswith("_body")
+                ):
+                    continue
+                if isinstance(attr, (types.FunctionType, staticmethod)):
+                    self.__replace(
+                        backend, name, self.timed(name, getattr(backend, name))
+                    )
+                elif isinstance(attr, cached_property):
+                    if name not in vars(backend):
+                        self.__replace(backend, name, _LazyKernel(self, name, attr))
+                    elif callable(kernel := vars(backend)[name]):
+                        self.__replace(backend, name, self.timed(name, kernel))
+
+        if self.particulator.condensation_solver is not None:
+            self.__replace(
+                self.particulator,
+                "condensation_solver",
+                self.timed(
+                    "condensation_solver", self.particulator.condensation_solver
+                ),
+            )
+
+        attributes = self.particulator.attributes
+        caretaker = "_ParticleAttributes__cell_caretaker"
+        if attributes is not None and hasattr(attributes, caretaker):
+            self.__replace(
+                attributes,
+                caretaker,
+                self.timed("sort_by_cell_id", getattr(attributes, caretaker)),
+            )
+
+        self.__replace(
+            self.particulator,
+            "timers",
+            {
+                key: _DynamicTimer(self, key, timer)
+                for key, timer in self.particulator.timers.items()
+            },
+        )
+
+    def detach(self):
+        """restores the original backend methods and particulator timers
+        (keeping the kernels created while attached)"""
+        for owner, name, original in self.__originals.values():
+            replacement = vars(owner)[name]
+            if isinstance(replacement, _LazyKernel) and replacement.created:
+                setattr(owner, name, replacement.get())
+            elif original is None:
+                delattr(owner, name)
+            else:
+                setattr(owner, name, original)
+        self.__originals.clear()
+
+    def record(self, *, name, category, duration, n_bytes=0):
+        """registers a single call (invoked by the instrumented methods)"""
+        key = (category, name)
+        with self.__lock:
+            stats = self.__stats.get(key, ProfilerStats(0, 0.0, 0))
+            self.__stats[key] = ProfilerStats(
+                count=stats.count + 1,
+                time=stats.time + duration,
+                n_bytes=stats.n_bytes + n_bytes,
+            )
+            if self.record_events:
+                self.events.append(
+                    ProfilerEvent(
+                        name=name,
+                        dynamic=category,
+                        step=self.particulator.n_steps,
+                        start=time.perf_counter() - duration - self.__t0,
+                        duration=duration,
+                        n_bytes=n_bytes,
+                    )
+                )
+
+    @property
+    def stats(self) -> dict:
+        """cumulative statistics (count, total time and bytes) indexed by
+        `(dynamic, method)` tuples (with `dynamic` set to `"dynamic"` for the
+        per-dynamic totals and to `None` for calls made outside of dynamics,
+        e.g., when computing products)"""
+        return dict(self.__stats)
+
+    def step_stats(self, step: int) -> dict:
+        """statistics of the calls made during a given step (requires `record_events`)"""
+        result = {}
+        for event in self.events:
+            if event.step == step:
+                key = (event.dynamic, event.name)
+                stats = result.get(key, ProfilerStats(0, 0.0, 0))
+                result[key] = ProfilerStats(
+                    count=stats.count + 1,
+                    time=stats.time + event.duration,
+                    n_bytes=stats.n_bytes + event.n_bytes,
+                )
+        return result
+
+    def report(self) -> str:
+        """returns a table of the cumulative statistics sorted by total time"""
+        lines = [
+            f"{'dynamic':>24} {'method':>40} {'count':>8} {'time [s]':>12} {'MB':>10}"
+        ]
+        for (dynamic, name), stats in sorted(
+            self.__stats.items(), key=lambda item: -item[1].time
+        ):
+            lines.append(
+                f"{str(dynamic):>24} {name:>40} {stats.count:>8}"
+                f" {stats.time:>12.6f} {stats.n_bytes / 2**20:>10.3f}"
+            )
+        return "\n".join(lines)
+
+    def export_chrome_trace(self, path: str):
+        """writes the recorded events in the Chrome trace-event JSON format"""
+        with open(path, "w", encoding="utf-8") as file:
+            json.dump(
+                {
+                    "traceEvents": [
+                        {
+                            "name": event.name,
+                            "cat": str(event.dynamic),
+                            "ph": "X",
+                            "ts": event.start * 1e6,
+                            "dur": event.duration * 1e6,
+                            "pid": 0,
+                            "tid": 0,
+                            "args": {"step": event.step, "bytes": event.n_bytes},
+                        }
+                        for event in self.events
+                    ],
+                    "displayTimeUnit": "ms",
+                },
+                file,
+            )
@@ -15,7 +15,9 @@ from PySDM.backends.impl_common.index import make_Index
 from PySDM.backends.impl_common.indexed_storage import make_IndexedStorage
 from PySDM.backends.impl_common.pair_indicator import make_PairIndicator
 from PySDM.backends.impl_common.pairwise_storage import make_PairwiseStorage
+from PySDM.impl import checkpoint
 from PySDM.impl.particle_attributes import ParticleAttributes
+from PySDM.impl.profiler import Profiler
 
 
 class Particulator:  # pylint: disable=too-many-public-methods,too-many-instance-attributes
@@ -35,7 +37,9 @@ class Particulator:  # pylint: disable=too-many-public-methods,too-many-instance
         self.n_steps = 0
 
         self.sorting_scheme = "default"
+        self.__reordering_interval = None
         self.condensation_solver = None
+        self.moment_planner = None
 
         self.Index = make_Index(backend)  # pylint: disable=invalid-name
         self.PairIndicator = make_PairIndicator(backend)  # pylint: disable=invalid-name
@@ -49,16 +53,85 @@ class Particulator:  # pylint: disable=too-many-public-methods,too-many-instance
         self.timers = {}
         self.null = self.Storage.empty(0, dtype=float)
 
+    @property
+    def reordering_interval(self):
+        """number of timesteps between rearrangements of attribute storages into
+        the cell-sorted order of super-droplets (see
+        `PySDM.impl.particle_attributes.ParticleAttributes.reorder`), `None` disables
+        reordering (Numba backend only)"""
+        return self.__reordering_interval
+
+    @reordering_interval.setter
+    def reordering_interval(self, value):
+        # pylint: disable-next=import-outside-toplevel
+        from PySDM.backends import ThrustRTC
+
+        if value is not None:
+            if isinstance(self.backend, ThrustRTC):
+                raise NotImplementedError(
+                    "reordering_interval is not supported on the ThrustRTC backend"
+                )
+            if int(value) != value or value < 1:
+                raise ValueError("reordering_interval must be a positive integer")
+        self.__reordering_interval = value
+
     def run(self, steps):
         if len(self.initialisers) > 0:
             self._notify_initialisers()
         for _ in range(steps):
+            if (
+                self.reordering_interval is not None
+                and self.n_steps % self.reordering_interval == 0
+            ):
+                self.attributes.reorder()
             for key, dynamic in self.dynamics.items():
                 with self.timers[key]:
                     dynamic()
             self.n_steps += 1
             self._notify_observers()
 
+    def save_jit_manifest(self):
+        """records the signatures of the kernels compiled so far (Numba backend with
+        `jit_cache` set) for use in subsequent `PySDM.builder.Builder.build` calls with
+        `warm_up=True` and the same dynamics, products and mesh dimension (see
+        `PySDM.particulator.Particulator.jit_manifest_tag`); complements the kernels
+        declared by the dynamics with those compiled on first call"""
+        if getattr(self.backend, "jit_cache", None) is None:
+            raise ValueError(
+                "saving JIT manifest requires a backend instantiated with jit_cache"
+            )
+        self.backend.jit_cache.save_manifest(self.jit_manifest_tag)
+
+    @property
+    def jit_manifest_tag(self) -> str:
+        """identifies the set of kernels needed by the registered dynamics and products
+        (see `PySDM.backends.impl_numba.jit_cache.JITCache`)"""
+        return ";".join(
+            (
+                "+".join(sorted(self.dynamics)),
+                "+".join(sorted({type(p).__name__ for p in self.products.values()})),
+                str(self.mesh.dimension if self.mesh is not None else None),
+            )
+        )
+
+    def checkpoint(self, path: str):
+        """saves the simulation state to a single memory-mappable file
+        (see `PySDM.impl.checkpoint`) allowing to continue the run bit-for-bit
+        with `PySDM.particulator.Particulator.restore`"""
+        checkpoint.save(self, path)
+
+    @staticmethod
+    def restore(path: str, builder, products: tuple = ()):
+        """returns a particulator built with the `builder` (set up with the same
+        environment and dynamics as the checkpointed one) and with the state
+        read from a file saved with `PySDM.particulator.Particulator.checkpoint`"""
+        return checkpoint.restore(path, builder, products)
+
+    def profile(self, *, record_events: bool = True) -> Profiler:
+        """returns a context manager within which backend method calls are timed
+        per dynamic (see `PySDM.impl.profiler.Profiler`)"""
+        return Profiler(self, record_events=record_events)
+
     def _notify_observers(self):
         reversed_order_so_that_environment_is_last = reversed(self.observers)
         for observer in reversed_order_so_that_environment_is_last:
@@ -96,6 +169,8 @@ class Particulator:  # pylint: disable=too-many-public-methods,too-many-instance
     def normalize(self, prob, norm_factor):
         self.backend.normalize(
             prob=prob,
+            idx=self.attributes._ParticleAttributes__idx,
+            length=self.attributes.super_droplet_count,
             cell_id=self.attributes["cell id"],
             cell_idx=self.attributes.cell_idx,
             cell_start=self.attributes.cell_start,
@@ -266,7 +341,6 @@ class Particulator:  # pylint: disable=too-many-public-methods,too-many-instance
     ):
         self.backend.dissolution(
             n_cell=self.mesh.n_cell,
-            n_threads=1,
             cell_order=np.arange(self.mesh.n_cell),
             cell_start_arg=self.attributes.cell_start,
             idx=self.attributes._ParticleAttributes__idx,
@@ -336,34 +410,39 @@ class Particulator:  # pylint: disable=too-many-public-methods,too-many-instance
         """
         Writes to `moment_0` and `moment` the zero-th and the k-th statistical moments
         of particle attributes computed filtering by value of the attribute `attr_name`
-        to fall within `attr_range`. The moment ranks are defined by `specs`.
+        to fall within `attr_range`. The moment ranks are defined by `specs`, all
+        the moments being computed in a single pass over super-droplets.
 
         Parameters:
-            specs: e.g., `specs={'volume': (1,2,3), 'kappa': (1)}` computes three moments
-                of volume and one moment of kappa
+            specs: e.g., `specs={'volume': (1,2,3), 'kappa': (1,)}` computes three moments
+                of volume and one moment of kappa (written to consecutive rows of `moments`)
             skip_division_by_m0: if set to `True`, the values written to `moments` are
                 multiplied by the 0-th moment (e.g., total volume instead of mean volume)
         """
         if len(specs) == 0:
             raise ValueError("empty specs passed")
-        attr_data, ranks = [], []
+        attr_data, attr_index, ranks = [], [], []
         for attr in specs:
+            if len(specs[attr]) == 0:
+                continue
             for rank in specs[attr]:
-                attr_data.append(self.attributes[attr])
+                attr_index.append(len(attr_data))
                 ranks.append(rank)
-        assert len(set(attr_data)) <= 1
+            attr_data.append(self.attributes[attr])
         if len(attr_data) == 0:
-            attr_data = self.backend.Storage.empty((0,), dtype=float)
-        else:
-            attr_data = attr_data[0]
+            attr_data.append(self.backend.Storage.empty((0,), dtype=float))
 
         ranks = self.backend.Storage.from_ndarray(np.array(ranks, dtype=float))
+        attr_index = self.backend.Storage.from_ndarray(
+            np.array(attr_index, dtype=np.int64)
+        )
 
         self.backend.moments(
             moment_0=moment_0,
             moments=moments,
             multiplicity=self.attributes["multiplicity"],
-            attr_data=attr_data,
+            attr_data=tuple(attr_data),
+            attr_index=attr_index,
             cell_id=self.attributes["cell id"],
             idx=self.attributes._ParticleAttributes__idx,
             length=self.attributes.super_droplet_count,
@@ -448,6 +527,52 @@ class Particulator:  # pylint: disable=too-many-public-methods,too-many-instance
                 n_substeps=n_substeps,
             )
 
+    def displace_with_substeps_per_cell(
+        self,
+        *,
+        displacement,
+        courant,
+        courant_offsets,
+        courant_strides,
+        grid,
+        n_substeps,
+        enable_sedimentation,
+        precipitation_counting_level_index,
+    ) -> float:
+        """moves super-droplets over a timestep split into the number of substeps
+        (`n_substeps`, indexed by cell id) assigned to the cell each super-droplet
+        is in at the beginning of the step, optionally with sedimentation, in which
+        case the super-droplets precipitating in any substep are removed and
+        the mass of water they carried is returned; out-of-column super-droplets are
+        left to be flagged by the caller (Numba backend only,
+        see `PySDM.dynamics.displacement.Displacement`)"""
+        rainfall_mass = self.backend.displace_with_substeps_per_cell(
+            courant=courant,
+            courant_offsets=courant_offsets,
+            courant_strides=courant_strides,
+            grid=grid,
+            cell_origin=self.attributes["cell origin"],
+            position_in_cell=self.attributes["position in cell"],
+            displacement=displacement,
+            cell_id=self.attributes["cell id"],
+            n_substeps=n_substeps,
+            idx=self.attributes._ParticleAttributes__idx,
+            length=self.attributes.super_droplet_count,
+            fall_velocity=(
+                self.attributes["relative fall velocity"]
+                if enable_sedimentation
+                else self.null
+            ),
+            dt=self.dt if enable_sedimentation else np.nan,
+            dz=self.mesh.dz,
+            precipitation_counting_level_index=precipitation_counting_level_index,
+            water_mass=self.attributes["water mass"],
+            multiplicity=self.attributes["multiplicity"],
+            healthy=self.attributes._ParticleAttributes__healthy_memory,
+        )
+        self.attributes.sanitize()
+        return rainfall_mass
+
     def isotopic_fractionation(self, heavy_isotopes: tuple):
         for isotope in heavy_isotopes:
             self.backend.isotopic_fractionation(
@@ -48,7 +48,7 @@ class Trivia:  # pylint: disable=too-many-public-methods
         return np.power(10, -pH) * 1e3
 
     @staticmethod
-    def vant_hoff(const, K, dH, T, *, T_0):
+    def vant_hoff(const, K, dH, T, T_0):
         return K * np.exp(-dH / const.R_str * (1 / T - 1 / T_0))
 
     @staticmethod
@@ -3,6 +3,7 @@ products pertinent to the `PySDM.dynamics.aqueous_chemistry.AqueousChemistry` dy
 """
 
 from .acidity import Acidity
+from .acidity_iterations import AcidityIterations
 from .aqueous_mass_spectrum import AqueousMassSpectrum
 from .aqueous_mole_fraction import AqueousMoleFraction
 from .gaseous_mole_fraction import GaseousMoleFraction
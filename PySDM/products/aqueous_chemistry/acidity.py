@@ -30,24 +30,28 @@ class Acidity(MomentProduct):
             raise NotImplementedError()
 
         self.radius_range = radius_range
+        self.volume_range = None
+        self.__spec = None
         super().__init__(name=name, unit=unit)
 
     def register(self, builder):
         builder.request_attribute("conc_H")
         super().register(builder)
-
-    def _impl(self, **kwargs):
-        self._download_moment_to_buffer(
+        self.volume_range = (
+            self.formulae.trivia.volume(self.radius_range[0]),
+            self.formulae.trivia.volume(self.radius_range[1]),
+        )
+        self.__spec = self._declare_moment(
             attr=self.attr,
             rank=1,
-            filter_range=(
-                self.formulae.trivia.volume(self.radius_range[0]),
-                self.formulae.trivia.volume(self.radius_range[1]),
-            ),
+            filter_range=self.volume_range,
             filter_attr="volume",
             weighting_attribute="volume",
             weighting_rank=self.weighting_rank,
         )
+
+    def _impl(self, **kwargs):
+        self._download_moment_to_buffer(self.__spec)
         if self.attr == "conc_H":
             self.buffer[:] = self.formulae.trivia.H2pH(self.buffer[:])
         elif self.attr == "pH":
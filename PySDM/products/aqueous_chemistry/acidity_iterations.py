@@ -0,0 +1,38 @@
+"""
+mean number of pH root-finding iterations (bracket expansions plus TOMS748 iterations)
+per pH root search in between product get() calls (super-droplets already in equilibrium
+are not counted, fetching a value resets the statistics, cells with no root searches
+yield NaN), to be used for assessing
+the cost of a given `pH_rtol` setting of the
+`PySDM.dynamics.aqueous_chemistry.AqueousChemistry` dynamic
+"""
+
+import numpy as np
+
+from PySDM.products.impl import Product, register_product
+
+
+@register_product()
+class AcidityIterations(Product):
+    def __init__(self, name=None, unit="dimensionless"):
+        super().__init__(name=name, unit=unit)
+        self.aqueous_chemistry = None
+        self.previous = None
+
+    def register(self, builder):
+        super().register(builder)
+        self.aqueous_chemistry = self.particulator.dynamics["AqueousChemistry"]
+        self.previous = {
+            counter: np.zeros_like(self.buffer)
+            for counter in ("n_pH_solves", "n_pH_iterations")
+        }
+
+    def _impl(self, **kwargs):
+        delta = {}
+        for counter, previous in self.previous.items():
+            self._download_to_buffer(self.aqueous_chemistry.counters[counter])
+            delta[counter] = self.buffer - previous
+            previous[:] = self.buffer
+        with np.errstate(invalid="ignore"):
+            self.buffer[:] = delta["n_pH_iterations"] / delta["n_pH_solves"]
+        return self.buffer
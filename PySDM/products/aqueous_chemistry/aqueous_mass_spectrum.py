@@ -17,6 +17,7 @@ class AqueousMassSpectrum(SpectrumMomentProduct):
         self, *, key, dry_radius_bins_edges, specific=False, name=None, unit="kg/m^3"
     ):
         super().__init__(name=name, unit=unit, attr_unit="m")
+        self.__spec = None
         self.key = key
         self.dry_radius_bins_edges = dry_radius_bins_edges
         self.molar_mass = (
@@ -38,12 +39,13 @@ class AqueousMassSpectrum(SpectrumMomentProduct):
         super().register(builder)
 
         self.shape = (*builder.particulator.mesh.grid, len(self.attr_bins_edges) - 1)
+        self.__spec = self._declare_spectrum_moment(
+            attr=f"moles_{self.key}", rank=1, filter_attr="dry volume"
+        )
 
     def _impl(self, **kwargs):
         vals = np.empty([self.particulator.mesh.n_cell, len(self.attr_bins_edges) - 1])
-        self._recalculate_spectrum_moment(
-            attr=f"moles_{self.key}", rank=1, filter_attr="dry volume"
-        )
+        self._recalculate_spectrum_moment(self.__spec)
 
         for i in range(vals.shape[1]):
             self._download_spectrum_moment_to_buffer(rank=1, bin_number=i)
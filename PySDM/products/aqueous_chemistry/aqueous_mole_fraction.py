@@ -13,18 +13,21 @@ class AqueousMoleFraction(MomentProduct):
         super().__init__(unit=unit, name=name)
         self.aqueous_chemistry = None
         self.key = key
+        self.__specs = None
 
     def register(self, builder):
         super().register(builder)
         self.aqueous_chemistry = self.particulator.dynamics["AqueousChemistry"]
+        self.__specs = {
+            rank: self._declare_moment(attr="moles_" + self.key, rank=rank)
+            for rank in (0, 1)
+        }
 
     def _impl(self, **kwargs):
-        attr = "moles_" + self.key
-
-        self._download_moment_to_buffer(attr=attr, rank=0)
+        self._download_moment_to_buffer(self.__specs[0])
         number = self.buffer.copy()
 
-        self._download_moment_to_buffer(attr=attr, rank=1)
+        self._download_moment_to_buffer(self.__specs[1])
         tmp = self.buffer.copy()
         tmp[:] *= number
         tmp[:] *= DUMMY_SPECIFIC_GRAVITY * self.formulae.constants.Md
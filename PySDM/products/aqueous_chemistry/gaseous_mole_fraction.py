@@ -22,4 +22,4 @@ class GaseousMoleFraction(Product):
             self.aqueous_chemistry.environment_mixing_ratios[self.compound],
             specific_gravity=self.aqueous_chemistry.specific_gravities[self.compound],
         )
-        return tmp
+        return tmp.reshape(self.shape)
@@ -12,12 +12,19 @@ class TotalDryMassMixingRatio(MomentProduct):
     def __init__(self, density, name=None, unit="kg/kg"):
         super().__init__(unit=unit, name=name)
         self.density = density
+        self.__specs = None
+
+    def register(self, builder):
+        super().register(builder)
+        self.__specs = {
+            rank: self._declare_moment(attr="dry volume", rank=rank) for rank in (1, 0)
+        }
 
     def _impl(self, **kwargs):
-        self._download_moment_to_buffer(attr="dry volume", rank=1)
+        self._download_moment_to_buffer(self.__specs[1])
         self.buffer[:] *= self.density
         result = np.copy(self.buffer)
-        self._download_moment_to_buffer(attr="dry volume", rank=0)
+        self._download_moment_to_buffer(self.__specs[0])
         result[:] *= self.buffer
         self._download_to_buffer(self.particulator.environment["rhod"])
         result[:] /= self.particulator.mesh.dv
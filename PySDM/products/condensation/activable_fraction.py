@@ -14,27 +14,35 @@ class ActivableFraction(MomentProduct):
     ):
         super().__init__(name=name, unit=unit)
         self.filter_attr = filter_attr
+        self.__activable = None
+        self.__total = None
 
     def register(self, builder):
         super().register(builder)
         builder.request_attribute(self.filter_attr)
+        if self.filter_attr.startswith("wet to critical volume ratio"):
+            self.__activable = self._declare_moment(
+                attr="volume",
+                rank=0,
+                filter_range=(1, np.inf),
+                filter_attr=self.filter_attr,
+            )
+        self.__total = self._declare_moment(attr="volume", rank=0)
 
     def _impl(self, **kwargs):
         if self.filter_attr.startswith("critical saturation"):
             s_max = kwargs["S_max"]
             assert not np.isfinite(s_max) or 0 < s_max < 1.1
-            filter_range = (0, s_max)
+            # filter range known only at runtime, hence evaluated outside of the plan
+            activable = self.__total._replace(
+                filter_attr=self.filter_attr, filter_range=(0, s_max)
+            )
         elif self.filter_attr.startswith("wet to critical volume ratio"):
-            filter_range = (1, np.inf)
+            activable = self.__activable
         else:
             assert False
-        self._download_moment_to_buffer(
-            attr="volume",
-            rank=0,
-            filter_range=filter_range,
-            filter_attr=self.filter_attr,
-        )
+        self._download_moment_to_buffer(activable)
         frac = self.buffer.copy()
-        self._download_moment_to_buffer(attr="volume", rank=0)
+        self._download_moment_to_buffer(self.__total)
         frac /= self.buffer
         return frac
@@ -0,0 +1,21 @@
+"""
+number of substeps taken by the `PySDM.dynamics.displacement.Displacement` dynamic
+in each grid cell (varies across cells with `substeps_per_cell=True`)
+"""
+
+from PySDM.products.impl import Product, register_product
+
+
+@register_product()
+class DisplacementSubsteps(Product):
+    def __init__(self, name=None, unit="dimensionless"):
+        super().__init__(unit=unit, name=name)
+        self.displacement = None
+
+    def register(self, builder):
+        super().register(builder)
+        self.displacement = self.particulator.dynamics["Displacement"]
+
+    def _impl(self, **kwargs):
+        self.buffer.ravel()[:] = self.displacement.n_substeps_per_cell
+        return self.buffer
@@ -9,11 +9,13 @@ from PySDM.products.impl import MomentProduct, register_product
 class CoolingRate(MomentProduct):
     def __init__(self, unit="K/s", name=None):
         super().__init__(unit=unit, name=name)
+        self.__spec = None
 
     def register(self, builder):
         builder.request_attribute("cooling rate")
         super().register(builder)
+        self.__spec = self._declare_moment(attr="cooling rate", rank=1)
 
     def _impl(self, **kwargs):
-        self._download_moment_to_buffer(attr="cooling rate", rank=1)
+        self._download_moment_to_buffer(self.__spec)
         return self.buffer
@@ -11,6 +11,7 @@ from PySDM.products.impl import SpectrumMomentProduct, register_product
 class FreezableSpecificConcentration(SpectrumMomentProduct):
     def __init__(self, temperature_bins_edges, name=None, unit="kg^-1 K^-1"):
         super().__init__(name=name, unit=unit, attr_unit="K")
+        self.__spec = None
         self.attr_bins_edges = temperature_bins_edges
 
     def register(self, builder):
@@ -21,12 +22,13 @@ class FreezableSpecificConcentration(SpectrumMomentProduct):
         )
         super().register(builder)
         self.shape = (*particulator.mesh.grid, len(self.attr_bins_edges) - 1)
+        self.__spec = self._declare_spectrum_moment(
+            attr="volume", filter_attr="freezing temperature", rank=0
+        )
 
     def _impl(self, **kwargs):
         vals = np.empty([self.particulator.mesh.n_cell, len(self.attr_bins_edges) - 1])
-        self._recalculate_spectrum_moment(
-            attr="volume", filter_attr="freezing temperature", rank=0
-        )
+        self._recalculate_spectrum_moment(self.__spec)
 
         for i in range(vals.shape[1]):
             self._download_spectrum_moment_to_buffer(rank=0, bin_number=i)
@@ -25,18 +25,20 @@ class FrozenParticleConcentration(ConcentrationProduct):
             self.__filter_range[0] = -1
         if not count_unactivated:
             self.__filter_range[1] = -1
+        self.__spec = None
 
     def register(self, builder):
         super().register(builder)
         builder.request_attribute("wet to critical volume ratio")
-
-    def _impl(self, **kwargs):
-        self._download_moment_to_buffer(
+        self.__spec = self._declare_moment(
             attr="volume",
             rank=0,
             filter_attr="wet to critical volume ratio",
             filter_range=self.__filter_range,
         )
+
+    def _impl(self, **kwargs):
+        self._download_moment_to_buffer(self.__spec)
         return super()._impl(**kwargs)
 
 
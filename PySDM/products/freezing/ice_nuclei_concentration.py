@@ -16,6 +16,7 @@ class IceNucleiConcentration(ConcentrationProduct):
             np.inf,
         )
         self.__filter_attr = None
+        self.__spec = None
 
     def register(self, builder):
         super().register(builder)
@@ -26,14 +27,15 @@ class IceNucleiConcentration(ConcentrationProduct):
             True: "freezing temperature",
             False: "immersed surface area",
         }[singular]
-
-    def _impl(self, **kwargs):
-        self._download_moment_to_buffer(
+        self.__spec = self._declare_moment(
             attr="volume",
             rank=0,
             filter_attr=self.__filter_attr,
             filter_range=self.__nonzero_filter_range,
         )
+
+    def _impl(self, **kwargs):
+        self._download_moment_to_buffer(self.__spec)
         return super()._impl(**kwargs)
 
 
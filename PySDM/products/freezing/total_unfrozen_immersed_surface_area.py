@@ -6,21 +6,29 @@ import numpy as np
 
 from PySDM.products.impl import MomentProduct, register_product
 
+_PARAMS = {
+    "attr": "immersed surface area",
+    "filter_attr": "volume",
+    "filter_range": (0, np.inf),
+}
+
 
 @register_product()
 class TotalUnfrozenImmersedSurfaceArea(MomentProduct):
     def __init__(self, unit="m^2", name=None):
         super().__init__(unit=unit, name=name)
+        self.__specs = None
 
-    def _impl(self, **kwargs):
-        params = {
-            "attr": "immersed surface area",
-            "filter_attr": "volume",
-            "filter_range": (0, np.inf),
+    def register(self, builder):
+        super().register(builder)
+        self.__specs = {
+            rank: self._declare_moment(**_PARAMS, rank=rank) for rank in (1, 0)
         }
-        self._download_moment_to_buffer(**params, rank=1)
+
+    def _impl(self, **kwargs):
+        self._download_moment_to_buffer(self.__specs[1])
         result = np.copy(self.buffer)
-        self._download_moment_to_buffer(**params, rank=0)
+        self._download_moment_to_buffer(self.__specs[0])
         result[:] *= self.buffer
         # TODO #599 per volume / per gridbox ?
         return result
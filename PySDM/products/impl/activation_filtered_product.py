@@ -19,8 +19,11 @@ class ActivationFilteredProduct:
         if not count_unactivated:
             self.__filter_range[0] = 1
 
-    def impl(self, *, attr, rank):
-        getattr(self, "_download_moment_to_buffer")(
+    def impl(self, spec):
+        getattr(self, "_download_moment_to_buffer")(spec)
+
+    def declare(self, *, attr, rank):
+        return getattr(self, "_declare_moment")(
             attr=attr,
             rank=rank,
             filter_attr=self.__filter_attr,
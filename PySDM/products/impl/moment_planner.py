@@ -0,0 +1,170 @@
+"""
+planner fusing the evaluation of statistical moments declared by
+ `PySDM.products.impl.moment_product.MomentProduct` and
+ `PySDM.products.impl.spectrum_moment_product.SpectrumMomentProduct` instances:
+ requests sharing the filter attribute, filter range (or bins) and weighting
+ are grouped and served from a single evaluation, the results being reused
+ for as long as the particulator state does not change
+"""
+
+from collections import namedtuple
+
+MomentSpec = namedtuple(
+    "MomentSpec",
+    (
+        "attr",
+        "rank",
+        "filter_attr",
+        "filter_range",
+        "weighting_attribute",
+        "weighting_rank",
+    ),
+)
+SpectrumMomentSpec = namedtuple(
+    "SpectrumMomentSpec",
+    (
+        "attr",
+        "rank",
+        "filter_attr",
+        "attr_bins",
+        "weighting_attribute",
+        "weighting_rank",
+    ),
+)
+
+
+def _group_key(filter_attr, filter_range, weighting_attribute, weighting_rank):
+    return (
+        filter_attr,
+        tuple(float(x) for x in filter_range),
+        weighting_attribute,
+        weighting_rank,
+    )
+
+
+class MomentPlanner:
+    """created by `PySDM.builder.Builder.build` (unless `plan_moments=False` is passed)
+    with a plan compiled from the moment specs the products declare in their
+    `register()` methods: each group of moments (same filter and weighting) is computed
+    in a single pass over super-droplets; for spectra, each group (same filter, bins and
+    weighting) is evaluated once per distinct attribute and rank (the spectrum backend
+    method handles one rank per pass); specs of products not passed to the planner
+    are evaluated on their own, bypassing the plan"""
+
+    def __init__(self, particulator, products=()):
+        self.particulator = particulator
+        self.plan = {}
+        self.spectrum_plan = {}
+        for product in products:
+            for spec in getattr(product, "moment_specs", ()):
+                ranks = self.plan.setdefault(
+                    _group_key(*spec[2:]), {}
+                ).setdefault(spec.attr, [])
+                if spec.rank not in ranks:
+                    ranks.append(spec.rank)
+            for spec in getattr(product, "spectrum_moment_specs", ()):
+                self.spectrum_plan.setdefault(_group_key(*spec[2:]), set()).add(
+                    (spec.attr, spec.rank)
+                )
+        self.__results = {}
+        self.__state = None
+
+    def __current_state(self):
+        return (
+            self.particulator.n_steps,
+            self.particulator.attributes.timestamp,
+            self.particulator.attributes.super_droplet_count,
+        )
+
+    def __invalidate_if_state_changed(self):
+        state = self.__current_state()
+        if state != self.__state:
+            self.__results = {}
+            self.__state = state
+
+    def moments(self, *, moment_0, moments, spec, skip_division_by_m0):
+        """writes to `moment_0` and `moments[0, :]` the same values as
+        `PySDM.particulator.Particulator.moments` called with
+        `specs={spec.attr: (spec.rank,)}` and the filter and weighting of `spec`"""
+        attr, rank = spec.attr, spec.rank
+        key = _group_key(*spec[2:])
+        specs = self.plan.get(key, {})
+        if rank not in specs.get(attr, ()):
+            self.particulator.moments(
+                moment_0=moment_0,
+                moments=moments,
+                specs={attr: (rank,)},
+                attr_name=spec.filter_attr,
+                attr_range=spec.filter_range,
+                weighting_attribute=spec.weighting_attribute,
+                weighting_rank=spec.weighting_rank,
+                skip_division_by_m0=skip_division_by_m0,
+            )
+            return
+
+        self.__invalidate_if_state_changed()
+        if key not in self.__results:
+            self.__results[key] = self.__evaluate(key)
+        group_moment_0, group_moments, rows = self.__results[key]
+
+        moment_0.fill(group_moment_0)
+        moments[0, :].fill(group_moments[rows[attr] + specs[attr].index(rank), :])
+        if not skip_division_by_m0:
+            moments[0, :].divide_if_not_zero(moment_0)
+
+    def spectrum_moments(self, *, moment_0, moments, spec, attr_bins):
+        """writes to `moment_0` and `moments` the same values as
+        `PySDM.particulator.Particulator.spectrum_moments` called with the attribute,
+        rank, filter and weighting of `spec` and with `attr_bins` (a storage holding
+        the `spec.attr_bins` values)"""
+        attr, rank = spec.attr, spec.rank
+        key = _group_key(*spec[2:])
+        kwargs = {
+            "attr": attr,
+            "rank": rank,
+            "attr_bins": attr_bins,
+            "attr_name": spec.filter_attr,
+            "weighting_attribute": spec.weighting_attribute,
+            "weighting_rank": spec.weighting_rank,
+        }
+        if (attr, rank) not in self.spectrum_plan.get(key, ()):
+            self.particulator.spectrum_moments(
+                moment_0=moment_0, moments=moments, **kwargs
+            )
+            return
+
+        self.__invalidate_if_state_changed()
+        result_key = (key, attr, rank)
+        if result_key not in self.__results:
+            result = (
+                self.particulator.Storage.empty(moment_0.shape, dtype=float),
+                self.particulator.Storage.empty(moments.shape, dtype=float),
+            )
+            self.particulator.spectrum_moments(
+                moment_0=result[0], moments=result[1], **kwargs
+            )
+            self.__results[result_key] = result
+        moment_0.fill(self.__results[result_key][0])
+        moments.fill(self.__results[result_key][1])
+
+    def __evaluate(self, key):
+        filter_attr, filter_range, weighting_attribute, weighting_rank = key
+        specs = {attr: tuple(ranks) for attr, ranks in self.plan[key].items()}
+        rows, n_moments = {}, 0
+        for attr, ranks in specs.items():
+            rows[attr] = n_moments
+            n_moments += len(ranks)
+        n_cell = self.particulator.mesh.n_cell
+        moment_0 = self.particulator.Storage.empty(n_cell, dtype=float)
+        moments = self.particulator.Storage.empty((n_moments, n_cell), dtype=float)
+        self.particulator.moments(
+            moment_0=moment_0,
+            moments=moments,
+            specs=specs,
+            attr_name=filter_attr,
+            attr_range=filter_range,
+            weighting_attribute=weighting_attribute,
+            weighting_rank=weighting_rank,
+            skip_division_by_m0=True,
+        )
+        return moment_0, moments, rows
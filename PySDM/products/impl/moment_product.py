@@ -4,6 +4,7 @@ from abc import ABC
 
 import numpy as np
 
+from PySDM.products.impl.moment_planner import MomentSpec
 from PySDM.products.impl.product import Product
 
 
@@ -12,6 +13,7 @@ class MomentProduct(Product, ABC):
         super().__init__(name=name, unit=unit)
         self.moment_0 = None
         self.moments = None
+        self.moment_specs = []
 
     def register(self, builder):
         super().register(builder)
@@ -22,7 +24,7 @@ class MomentProduct(Product, ABC):
             (1, self.particulator.mesh.n_cell), dtype=float
         )
 
-    def _download_moment_to_buffer(
+    def _declare_moment(
         self,
         *,
         attr,
@@ -31,19 +33,42 @@ class MomentProduct(Product, ABC):
         filter_range=(-np.inf, np.inf),
         weighting_attribute="water mass",
         weighting_rank=0,
-        skip_division_by_m0=False,
     ):
-        self.particulator.moments(
-            moment_0=self.moment_0,
-            moments=self.moments,
-            specs={attr: (rank,)},
-            attr_name=filter_attr,
-            attr_range=filter_range,
+        """to be called from `register()`, returns the spec to be passed to
+        `_download_moment_to_buffer()` and records it for
+        `PySDM.products.impl.moment_planner.MomentPlanner` to plan its evaluation"""
+        spec = MomentSpec(
+            attr=attr,
+            rank=rank,
+            filter_attr=filter_attr,
+            filter_range=tuple(filter_range),
             weighting_attribute=weighting_attribute,
             weighting_rank=weighting_rank,
-            skip_division_by_m0=skip_division_by_m0,
         )
-        if rank == 0:  # TODO #217
+        self.moment_specs.append(spec)
+        return spec
+
+    def _download_moment_to_buffer(self, spec, *, skip_division_by_m0=False):
+        """evaluates the moment defined by a `spec` returned by `_declare_moment()`"""
+        if self.particulator.moment_planner is None:
+            self.particulator.moments(
+                moment_0=self.moment_0,
+                moments=self.moments,
+                specs={spec.attr: (spec.rank,)},
+                attr_name=spec.filter_attr,
+                attr_range=spec.filter_range,
+                weighting_attribute=spec.weighting_attribute,
+                weighting_rank=spec.weighting_rank,
+                skip_division_by_m0=skip_division_by_m0,
+            )
+        else:
+            self.particulator.moment_planner.moments(
+                moment_0=self.moment_0,
+                moments=self.moments,
+                spec=spec,
+                skip_division_by_m0=skip_division_by_m0,
+            )
+        if spec.rank == 0:  # TODO #217
             self._download_to_buffer(self.moment_0)
         else:
             self._download_to_buffer(self.moments[0, :])
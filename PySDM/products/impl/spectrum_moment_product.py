@@ -5,6 +5,7 @@ common code for products computing **binned** statistical moments
 
 from abc import ABC
 
+from PySDM.products.impl.moment_planner import SpectrumMomentSpec
 from PySDM.products.impl.product import Product
 
 
@@ -15,6 +16,7 @@ class SpectrumMomentProduct(ABC, Product):
         self.attr_unit = attr_unit
         self.moment_0 = None
         self.moments = None
+        self.spectrum_moment_specs = []
 
     def register(self, builder):
         super().register(builder)
@@ -26,7 +28,7 @@ class SpectrumMomentProduct(ABC, Product):
         )
         _ = self._parse_unit(self.attr_unit)
 
-    def _recalculate_spectrum_moment(
+    def _declare_spectrum_moment(
         self,
         *,
         attr,
@@ -35,16 +37,41 @@ class SpectrumMomentProduct(ABC, Product):
         weighting_attribute="volume",
         weighting_rank=0,
     ):
-        self.particulator.spectrum_moments(
-            moment_0=self.moment_0,
-            moments=self.moments,
+        """to be called from `register()` (once `attr_bins_edges` are set), returns
+        the spec to be passed to `_recalculate_spectrum_moment()` and records it for
+        `PySDM.products.impl.moment_planner.MomentPlanner` to plan its evaluation"""
+        spec = SpectrumMomentSpec(
             attr=attr,
             rank=rank,
-            attr_bins=self.attr_bins_edges,
-            attr_name=filter_attr,
+            filter_attr=filter_attr,
+            attr_bins=tuple(self.attr_bins_edges.to_ndarray()),
             weighting_attribute=weighting_attribute,
             weighting_rank=weighting_rank,
         )
+        self.spectrum_moment_specs.append(spec)
+        return spec
+
+    def _recalculate_spectrum_moment(self, spec):
+        """evaluates the binned moment defined by a `spec` returned by
+        `_declare_spectrum_moment()`"""
+        if self.particulator.moment_planner is None:
+            self.particulator.spectrum_moments(
+                moment_0=self.moment_0,
+                moments=self.moments,
+                attr=spec.attr,
+                rank=spec.rank,
+                attr_bins=self.attr_bins_edges,
+                attr_name=spec.filter_attr,
+                weighting_attribute=spec.weighting_attribute,
+                weighting_rank=spec.weighting_rank,
+            )
+        else:
+            self.particulator.moment_planner.spectrum_moments(
+                moment_0=self.moment_0,
+                moments=self.moments,
+                spec=spec,
+                attr_bins=self.attr_bins_edges,
+            )
 
     def _download_spectrum_moment_to_buffer(self, rank, bin_number):
         if rank == 0:  # TODO #217
@@ -27,19 +27,24 @@ class ParcelLiquidWaterPath(MomentProduct, ActivationFilteredProduct):
         )
         self.previous = {"z": 0.0, "cwc": 0.0}
         self.cwp = 0.0
+        self.__specs = None
 
     def register(self, builder):
         if not isinstance(builder.particulator.environment, Parcel):
             raise NotImplementedError()
         ActivationFilteredProduct.register(self, builder)
         MomentProduct.register(self, builder)
+        self.__specs = {
+            rank: ActivationFilteredProduct.declare(self, attr="water mass", rank=rank)
+            for rank in (1, 0)
+        }
         self.particulator.observers.append(self)
 
     def notify(self):
-        ActivationFilteredProduct.impl(self, attr="water mass", rank=1)
+        ActivationFilteredProduct.impl(self, self.__specs[1])
         avg_mass = self.buffer.copy()
 
-        ActivationFilteredProduct.impl(self, attr="water mass", rank=0)
+        ActivationFilteredProduct.impl(self, self.__specs[0])
         tot_numb = self.buffer.copy()
 
         self._download_to_buffer(self.particulator.environment["z"])
@@ -24,12 +24,15 @@ def make_arbitrary_moment_product(**kwargs):
             + ("" if kwargs["skip_division_by_dv"] else " / m**3"),
         ):
             super().__init__(name=name, unit=unit)
+            self.__spec = None
+
+        def register(self, builder):
+            super().register(builder)
+            self.__spec = self._declare_moment(attr=kwargs["attr"], rank=kwargs["rank"])
 
         def _impl(self, **_):
             self._download_moment_to_buffer(
-                attr=kwargs["attr"],
-                rank=kwargs["rank"],
-                skip_division_by_m0=kwargs["skip_division_by_m0"],
+                self.__spec, skip_division_by_m0=kwargs["skip_division_by_m0"]
             )
             if not kwargs["skip_division_by_dv"]:
                 self.buffer /= self.particulator.mesh.dv
@@ -21,36 +21,32 @@ class CloudWaterContent(MomentProduct):
         self.specific = specific
         self.liquid = liquid
         self.ice = ice
+        self.__specs = {}
+
+    def register(self, builder):
+        super().register(builder)
+        for rank in (1, 0):
+            if self.liquid:
+                self.__specs["liquid", rank] = self._declare_moment(
+                    attr="water mass", rank=rank, filter_range=(0, np.inf)
+                )
+            if self.ice:
+                self.__specs["ice", rank] = self._declare_moment(
+                    attr="water mass",
+                    rank=rank,
+                    filter_range=(-np.inf, 0),
+                    filter_attr="signed water mass",
+                )
 
     def _impl(self, **kwargs):
         cwc = 0.0
-        if self.liquid:
-            self._download_moment_to_buffer(
-                attr="water mass", rank=1, filter_range=(0, np.inf)
-            )
+        for phase in ("liquid", "ice"):
+            if not getattr(self, phase):
+                continue
+            self._download_moment_to_buffer(self.__specs[phase, 1])
             mass = self.buffer.copy()
 
-            self._download_moment_to_buffer(
-                attr="water mass", rank=0, filter_range=(0, np.inf)
-            )
-            number = self.buffer
-            cwc += mass * number / self.particulator.mesh.dv
-
-        if self.ice:
-            self._download_moment_to_buffer(
-                attr="water mass",
-                rank=1,
-                filter_range=(-np.inf, 0),
-                filter_attr="signed water mass",
-            )
-            mass = self.buffer.copy()
-
-            self._download_moment_to_buffer(
-                attr="water mass",
-                rank=0,
-                filter_range=(-np.inf, 0),
-                filter_attr="signed water mass",
-            )
+            self._download_moment_to_buffer(self.__specs[phase, 0])
             number = self.buffer
             cwc += mass * number / self.particulator.mesh.dv
 
@@ -19,10 +19,20 @@ class EffectiveRadius(MomentProduct):
         super().__init__(name=name, unit=unit)
         self.volume_range = None
         self.radius_range = radius_range or (0, np.inf)
+        self.__specs = None
 
     def register(self, builder):
         super().register(builder)
         self.volume_range = self.formulae.trivia.volume(np.asarray(self.radius_range))
+        self.__specs = tuple(
+            self._declare_moment(
+                attr="volume",
+                rank=rank,
+                filter_range=self.volume_range,
+                filter_attr="volume",
+            )
+            for rank in (2 / 3, 1)
+        )
 
     @staticmethod
     @numba.njit(**JIT_FLAGS)
@@ -40,19 +50,9 @@ class EffectiveRadius(MomentProduct):
 
     def _impl(self, **kwargs):
         tmp = np.empty_like(self.buffer)
-        self._download_moment_to_buffer(
-            attr="volume",
-            rank=2 / 3,
-            filter_range=self.volume_range,
-            filter_attr="volume",
-        )
+        self._download_moment_to_buffer(self.__specs[0])
         tmp[:] = self.buffer[:]
-        self._download_moment_to_buffer(
-            attr="volume",
-            rank=1,
-            filter_range=self.volume_range,
-            filter_attr="volume",
-        )
+        self._download_moment_to_buffer(self.__specs[1])
         EffectiveRadius.nan_aware_reff_impl(
             input_volume_output_reff=self.buffer, volume_2_3=tmp
         )
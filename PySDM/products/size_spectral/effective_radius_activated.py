@@ -21,24 +21,21 @@ class ActivatedEffectiveRadius(MomentProduct, ActivationFilteredProduct):
         ActivationFilteredProduct.__init__(
             self, count_activated=count_activated, count_unactivated=count_unactivated
         )
+        self.__specs = None
 
     def register(self, builder):
         ActivationFilteredProduct.register(self, builder)
         MomentProduct.register(self, builder)
+        self.__specs = tuple(
+            ActivationFilteredProduct.declare(self, attr="volume", rank=rank)
+            for rank in (2 / 3, 1)
+        )
 
     def _impl(self, **kwargs):
-        ActivationFilteredProduct.impl(
-            self,
-            attr="volume",
-            rank=2 / 3,
-        )
+        ActivationFilteredProduct.impl(self, self.__specs[0])
         tmp = np.empty_like(self.buffer)
         tmp[:] = self.buffer[:]
-        ActivationFilteredProduct.impl(
-            self,
-            attr="volume",
-            rank=1,
-        )
+        ActivationFilteredProduct.impl(self, self.__specs[1])
         EffectiveRadius.nan_aware_reff_impl(
             input_volume_output_reff=self.buffer, volume_2_3=tmp
         )
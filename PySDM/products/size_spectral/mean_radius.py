@@ -16,25 +16,29 @@ class MeanRadius(MomentProduct):
         radius_range=(0, np.inf),
     ):
         self.radius_range = radius_range
+        self.mass_range = None
+        self.__spec = None
         super().__init__(name=name, unit=unit)
 
     def register(self, builder):
         builder.request_attribute("volume")
         super().register(builder)
-
-    def _impl(self, **kwargs):
-        self._download_moment_to_buffer(
+        self.mass_range = (
+            self.formulae.particle_shape_and_density.radius_to_mass(
+                self.radius_range[0]
+            ),
+            self.formulae.particle_shape_and_density.radius_to_mass(
+                self.radius_range[1]
+            ),
+        )
+        self.__spec = self._declare_moment(
             attr="volume",
             rank=1 / 3,
-            filter_range=(
-                self.formulae.particle_shape_and_density.radius_to_mass(
-                    self.radius_range[0]
-                ),
-                self.formulae.particle_shape_and_density.radius_to_mass(
-                    self.radius_range[1]
-                ),
-            ),
+            filter_range=self.mass_range,
             filter_attr="signed water mass",
         )
+
+    def _impl(self, **kwargs):
+        self._download_moment_to_buffer(self.__spec)
         self.buffer[:] /= self.formulae.constants.PI_4_3 ** (1 / 3)
         return self.buffer
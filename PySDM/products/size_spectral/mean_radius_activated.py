@@ -18,12 +18,16 @@ class ActivatedMeanRadius(MomentProduct, ActivationFilteredProduct):
         ActivationFilteredProduct.__init__(
             self, count_activated=count_activated, count_unactivated=count_unactivated
         )
+        self.__spec = None
 
     def register(self, builder):
         for base_class in (ActivationFilteredProduct, MomentProduct):
             base_class.register(self, builder)
+        self.__spec = ActivationFilteredProduct.declare(
+            self, attr="volume", rank=1 / 3
+        )
 
     def _impl(self, **kwargs):
-        ActivationFilteredProduct.impl(self, attr="volume", rank=1 / 3)
+        ActivationFilteredProduct.impl(self, self.__spec)
         self.buffer[:] /= self.formulae.constants.PI_4_3 ** (1 / 3)
         return self.buffer
@@ -18,11 +18,15 @@ class MeanVolumeRadius(MomentProduct, ActivationFilteredProduct):
         ActivationFilteredProduct.__init__(
             self, count_activated=count_activated, count_unactivated=count_unactivated
         )
+        self.__spec = None
 
     def register(self, builder):
         for base_class in (ActivationFilteredProduct, MomentProduct):
             base_class.register(self, builder)
+        self.__spec = ActivationFilteredProduct.declare(
+            self, attr="volume", rank=1
+        )
 
     def _impl(self, **kwargs):
-        ActivationFilteredProduct.impl(self, attr="volume", rank=1)
+        ActivationFilteredProduct.impl(self, self.__spec)
         return self.formulae.trivia.radius(self.buffer[:])
@@ -20,21 +20,26 @@ class ParticleConcentration(ConcentrationProduct):
         unit="m^-3",
     ):
         self.radius_range = radius_range
+        self.mass_range = None
+        self.__spec = None
         super().__init__(name=name, unit=unit, specific=specific, stp=stp)
 
-    def _impl(self, **kwargs):
-        self._download_moment_to_buffer(
-            attr="water mass",
-            rank=0,
-            filter_range=(
-                self.formulae.particle_shape_and_density.volume_to_mass(
-                    self.formulae.trivia.volume(radius=self.radius_range[0])
-                ),
-                self.formulae.particle_shape_and_density.volume_to_mass(
-                    self.formulae.trivia.volume(self.radius_range[1])
-                ),
+    def register(self, builder):
+        super().register(builder)
+        self.mass_range = (
+            self.formulae.particle_shape_and_density.volume_to_mass(
+                self.formulae.trivia.volume(radius=self.radius_range[0])
+            ),
+            self.formulae.particle_shape_and_density.volume_to_mass(
+                self.formulae.trivia.volume(self.radius_range[1])
             ),
         )
+        self.__spec = self._declare_moment(
+            attr="water mass", rank=0, filter_range=self.mass_range
+        )
+
+    def _impl(self, **kwargs):
+        self._download_moment_to_buffer(self.__spec)
         return super()._impl(**kwargs)
 
 
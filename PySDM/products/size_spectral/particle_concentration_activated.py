@@ -29,13 +29,15 @@ class ActivatedParticleConcentration(ConcentrationProduct, ActivationFilteredPro
         ActivationFilteredProduct.__init__(
             self, count_activated=count_activated, count_unactivated=count_unactivated
         )
+        self.__spec = None
 
     def register(self, builder):
         for base_class in (ActivationFilteredProduct, ConcentrationProduct):
             base_class.register(self, builder)
+        self.__spec = ActivationFilteredProduct.declare(self, attr="volume", rank=0)
 
     def _impl(self, **kwargs):
-        ActivationFilteredProduct.impl(self, attr="volume", rank=0)
+        ActivationFilteredProduct.impl(self, self.__spec)
         return ConcentrationProduct._impl(self, **kwargs)
 
 
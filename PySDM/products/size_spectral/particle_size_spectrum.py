@@ -31,6 +31,7 @@ class ParticleSizeSpectrum(SpectrumMomentProduct, ABC):
         self.stp = stp
         self.rho_stp = None
         super().__init__(name=name, unit=unit, attr_unit="m^3")
+        self.__spec = None
 
     def register(self, builder):
         builder.request_attribute(self.volume_attr)
@@ -46,12 +47,13 @@ class ParticleSizeSpectrum(SpectrumMomentProduct, ABC):
 
         self.shape = (*builder.particulator.mesh.grid, len(self.attr_bins_edges) - 1)
         self.rho_stp = builder.formulae.constants.rho_STP
+        self.__spec = self._declare_spectrum_moment(
+            attr=self.volume_attr, rank=1, filter_attr=self.volume_attr
+        )
 
     def _impl(self, **kwargs):
         vals = np.empty([self.particulator.mesh.n_cell, len(self.attr_bins_edges) - 1])
-        self._recalculate_spectrum_moment(
-            attr=self.volume_attr, rank=1, filter_attr=self.volume_attr
-        )
+        self._recalculate_spectrum_moment(self.__spec)
 
         for i in range(vals.shape[1]):
             self._download_spectrum_moment_to_buffer(rank=0, bin_number=i)
@@ -13,6 +13,7 @@ from PySDM.products.impl import SpectrumMomentProduct, register_product
 class ParticleVolumeVersusRadiusLogarithmSpectrum(SpectrumMomentProduct):
     def __init__(self, radius_bins_edges, name=None, unit="dimensionless", dry=False):
         super().__init__(name=name, unit=unit, attr_unit="m^3")
+        self.__spec = None
         self.radius_bins_edges = radius_bins_edges
         self.moment_0 = None
         self.moments = None
@@ -31,10 +32,13 @@ class ParticleVolumeVersusRadiusLogarithmSpectrum(SpectrumMomentProduct):
         super().register(builder)
 
         self.shape = (*builder.particulator.mesh.grid, len(self.attr_bins_edges) - 1)
+        self.__spec = self._declare_spectrum_moment(
+            attr=self.attr, rank=1, filter_attr=self.attr
+        )
 
     def _impl(self, **kwargs):
         vals = np.empty([self.particulator.mesh.n_cell, len(self.attr_bins_edges) - 1])
-        self._recalculate_spectrum_moment(attr=self.attr, rank=1, filter_attr=self.attr)
+        self._recalculate_spectrum_moment(self.__spec)
 
         for i in range(vals.shape[1]):
             self._download_spectrum_moment_to_buffer(rank=1, bin_number=i)
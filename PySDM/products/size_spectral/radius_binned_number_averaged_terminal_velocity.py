@@ -14,6 +14,7 @@ RANK = 1
 class RadiusBinnedNumberAveragedTerminalVelocity(SpectrumMomentProduct):
     def __init__(self, radius_bin_edges, name=None, unit="m/s"):
         super().__init__(name=name, unit=unit, attr_unit="m")
+        self.__spec = None
         self.radius_bin_edges = radius_bin_edges
 
     def register(self, builder):
@@ -29,14 +30,12 @@ class RadiusBinnedNumberAveragedTerminalVelocity(SpectrumMomentProduct):
         super().register(builder)
 
         self.shape = (*builder.particulator.mesh.grid, len(self.attr_bins_edges) - 1)
+        self.__spec = self._declare_spectrum_moment(attr=ATTR, rank=RANK)
 
     def _impl(self, **kwargs):
         vals = np.empty([self.particulator.mesh.n_cell, len(self.attr_bins_edges) - 1])
 
-        self._recalculate_spectrum_moment(
-            attr=ATTR,
-            rank=RANK,
-        )
+        self._recalculate_spectrum_moment(self.__spec)
 
         for i in range(vals.shape[1]):
             self._download_spectrum_moment_to_buffer(rank=RANK, bin_number=i)
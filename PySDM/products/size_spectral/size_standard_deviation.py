@@ -28,17 +28,22 @@ class _SizeStandardDeviation(MomentProduct, ActivationFilteredProduct):
             self, count_activated=count_activated, count_unactivated=count_unactivated
         )
         self.tmp = None
+        self.__specs = None
 
     def register(self, builder):
         builder.request_attribute(self.attr)
         for base_class in (ActivationFilteredProduct, MomentProduct):
             base_class.register(self, builder)
+        self.__specs = tuple(
+            ActivationFilteredProduct.declare(self, attr=self.attr, rank=rank)
+            for rank in (1, 2)
+        )
         self.tmp = np.empty_like(self.buffer)
 
     def _impl(self, **kwargs):
-        ActivationFilteredProduct.impl(self, attr=self.attr, rank=1)
+        ActivationFilteredProduct.impl(self, self.__specs[0])
         self.tmp[:] = -self.buffer**2
-        ActivationFilteredProduct.impl(self, attr=self.attr, rank=2)
+        ActivationFilteredProduct.impl(self, self.__specs[1])
         self.tmp[:] += self.buffer
         self.tmp[:] = np.sqrt(self.tmp)
         return self.tmp
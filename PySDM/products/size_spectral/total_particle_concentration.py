@@ -9,7 +9,12 @@ from PySDM.products.impl import ConcentrationProduct, register_product
 class TotalParticleConcentration(ConcentrationProduct):
     def __init__(self, name=None, unit="m^-3", stp=False):
         super().__init__(name=name, unit=unit, specific=False, stp=stp)
+        self.__spec = None
+
+    def register(self, builder):
+        super().register(builder)
+        self.__spec = self._declare_moment(attr="water mass", rank=0)
 
     def _impl(self, **kwargs):
-        self._download_moment_to_buffer(attr="water mass", rank=0)
+        self._download_moment_to_buffer(self.__spec)
         return super()._impl(**kwargs)
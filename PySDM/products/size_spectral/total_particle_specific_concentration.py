@@ -9,7 +9,12 @@ from PySDM.products.impl import ConcentrationProduct, register_product
 class TotalParticleSpecificConcentration(ConcentrationProduct):
     def __init__(self, name=None, unit="kg^-1"):
         super().__init__(name=name, unit=unit, stp=False, specific=True)
+        self.__spec = None
+
+    def register(self, builder):
+        super().register(builder)
+        self.__spec = self._declare_moment(attr="volume", rank=0)
 
     def _impl(self, **kwargs):
-        self._download_moment_to_buffer(attr="volume", rank=0)
+        self._download_moment_to_buffer(self.__spec)
         return super()._impl(**kwargs)
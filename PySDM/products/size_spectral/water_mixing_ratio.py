@@ -13,6 +13,7 @@ class WaterMixingRatio(MomentProduct):
     def __init__(self, radius_range=None, name=None, unit="dimensionless"):
         self.radius_range = radius_range or (0, np.inf)
         self.signed_mass_range = None
+        self.__specs = None
         super().__init__(unit=unit, name=name)
 
     def register(self, builder):
@@ -23,22 +24,21 @@ class WaterMixingRatio(MomentProduct):
             )
         )
         self.radius_range = None
+        self.__specs = {
+            rank: self._declare_moment(
+                attr="water mass",
+                rank=rank,
+                filter_range=self.signed_mass_range,
+                filter_attr="signed water mass",
+            )
+            for rank in (0, 1)
+        }
 
     def _impl(self, **kwargs):  # TODO #217
-        self._download_moment_to_buffer(
-            attr="water mass",
-            rank=0,
-            filter_range=self.signed_mass_range,
-            filter_attr="signed water mass",
-        )
+        self._download_moment_to_buffer(self.__specs[0])
         number = self.buffer.copy()
 
-        self._download_moment_to_buffer(
-            attr="water mass",
-            rank=1,
-            filter_range=self.signed_mass_range,
-            filter_attr="signed water mass",
-        )
+        self._download_moment_to_buffer(self.__specs[1])
         result = self.buffer.copy()
         result[:] *= number
         result[:] /= self.particulator.mesh.dv
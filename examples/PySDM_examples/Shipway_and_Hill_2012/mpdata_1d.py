@@ -78,5 +78,13 @@ class MPDATA_1D:
         np.testing.assert_array_less(np.abs(self.advector), 1)
         self.__t += 0.5 * self.dt
 
+    def checkpoint_state(self) -> dict:
+        """arrays (views of the solver fields, overwritten in place on restore) and
+        scalars needed to continue the simulation, see `PySDM.impl.checkpoint`"""
+        return {"t": self.__t, "advectee": self.advectee, "advector": self.advector}
+
+    def restore_checkpoint_state(self, state: dict):
+        self.__t = state["t"]
+
     def __call__(self, _):
         self.solver.advance(1)
@@ -6,3 +6,4 @@ from .basic_simulation import BasicSimulation
 from .dummy_controller import DummyController
 from .progbar_controller import ProgBarController
 from .read_vtk_1d import readVTK_1d
+from .sweep import SweepDone, SweepFailure, SweepOutput, run_sweep
@@ -0,0 +1,18 @@
+"""
+benchmark suite timing each dynamic in isolation across environments,
+ super-droplet counts, grids and thread counts, e.g.:
+
+    results = run_benchmarks(
+        cases=("Coalescence", "Condensation"),
+        n_sds=(10**3, 10**5, 10**7),
+        path="benchmarks.json",
+    )
+    regressions = find_regressions(load("baseline.json"), results)
+
+(see also `run_spectrum_moments_benchmark()` for timings of the spectral products' kernel)
+"""
+
+from .cases import CASES
+from .environments import ENVIRONMENTS, PrescribedFlow
+from .runner import find_regressions, load, make_particulator, run_benchmarks
+from .spectrum_moments import run_spectrum_moments_benchmark
@@ -0,0 +1,219 @@
+"""
+definitions of the benchmarked dynamics: for each, the environments it is
+ benchmarked in, the dynamics to be registered (with the benchmarked one last,
+ preceded by its prerequisites), the formulae options, ambient conditions
+ and the attributes needed on top of the ones provided by the environment
+"""
+
+from collections import namedtuple
+
+import numpy as np
+from PySDM_examples.utils.benchmarks.environments import KAPPA, Ambient
+
+from PySDM.dynamics import (
+    AqueousChemistry,
+    Coalescence,
+    Collision,
+    Condensation,
+    Displacement,
+    Freezing,
+    IsotopicFractionation,
+    VapourDepositionOnIce,
+)
+from PySDM.dynamics.collisions.breakup_efficiencies import ConstEb
+from PySDM.dynamics.collisions.breakup_fragmentations import AlwaysN
+from PySDM.dynamics.collisions.coalescence_efficiencies import ConstEc
+from PySDM.dynamics.collisions.collision_kernels import Golovin
+from PySDM.dynamics.impl.chemistry_utils import AQUEOUS_COMPOUNDS
+from PySDM.dynamics.isotopic_fractionation import HEAVY_ISOTOPES
+from PySDM.physics import si
+from PySDM.physics.constants import PPB, PPM
+
+Case = namedtuple(
+    "Case",
+    (
+        "environments",
+        "dynamics",
+        "formulae",
+        "ambient",
+        "environment_options",
+        "attributes",
+        "backends",
+    ),
+    defaults=({}, Ambient(T=283 * si.K, p=900 * si.hPa, RH=0.99), {}, None, None),
+)
+
+ALL_ENVIRONMENTS = ("Box", "Parcel", "Kinematic1D", "Kinematic2D")
+MOIST_ENVIRONMENTS = ("Parcel", "Kinematic1D", "Kinematic2D")
+COLD = Ambient(T=250 * si.K, p=500 * si.hPa, RH=1.01)
+
+DRY_RHO = 1800 * si.kg / si.m**3
+DRY_MOLAR_MASS = 115.11 * si.g / si.mole  # NH4HSO4
+ENVIRONMENT_MOLE_FRACTIONS = {
+    "SO2": 0.2 * PPB,
+    "O3": 50 * PPB,
+    "H2O2": 0.5 * PPB,
+    "CO2": 360 * PPM,
+    "HNO3": 0.1 * PPB,
+    "NH3": 0.1 * PPB,
+}
+ISOTOPES = ("2H", "18O")
+MOLAR_MASSES = {
+    "2H": "M_2H_1H_16O",
+    "3H": "M_3H_1H_16O",
+    "17O": "M_1H2_17O",
+    "18O": "M_1H2_18O",
+}
+MOLALITY_IN_DRY_AIR = 0.1
+DRY_VOLUME_RATIO = 1e-6 * si.m**3 / si.kg
+
+
+def _immersed_surface_area(particulator, attributes):
+    attributes["immersed surface area"] = np.full(particulator.n_sd, 1 * si.um**2)
+    return attributes
+
+
+def _ice(particulator, attributes):
+    """replaces the droplets with ice crystals (of sizes for which the explicit
+    depositional growth scheme is stable at the benchmark timestep)"""
+    attributes["signed water mass"] = -(
+        particulator.formulae.trivia.volume(
+            radius=np.geomspace(5 * si.um, 50 * si.um, particulator.n_sd)
+        )
+        * particulator.formulae.constants.rho_i
+    )
+    return attributes
+
+
+def _chemistry(_, attributes):
+    dry_volume = attributes.pop("dry volume")
+    for compound in AQUEOUS_COMPOUNDS:
+        attributes[f"moles_{compound}"] = (
+            dry_volume * DRY_RHO / DRY_MOLAR_MASS
+            if compound in ("N_mIII", "S_VI")
+            else np.zeros_like(dry_volume)
+        )
+    return attributes
+
+
+def _isotopes(particulator, attributes):
+    """sets the isotopic composition of particles to that of VSMOW
+    and the ambient fields needed for isotopic fractionation"""
+    attributes["dry volume"] = attributes["signed water mass"] * DRY_VOLUME_RATIO
+    attributes["kappa times dry volume"] = KAPPA * attributes["dry volume"]
+    environment = particulator.environment
+    environment["dry_air_density"] = 1 * si.kg / si.m**3
+    for isotope in HEAVY_ISOTOPES:
+        environment[f"molality {isotope} in dry air"] = MOLALITY_IN_DRY_AIR
+
+    const = particulator.formulae.constants
+    for isotope in HEAVY_ISOTOPES:
+        attributes[f"moles_{isotope}"] = particulator.formulae.trivia.moles_heavy_atom(
+            atoms_per_heavy_molecule=1,
+            mass_total=attributes["signed water mass"],
+            mass_other_heavy_isotopes=0,
+            molar_mass_light_molecule=const.M_1H2_16O,
+            molar_mass_heavy_molecule=getattr(const, MOLAR_MASSES[isotope]),
+            molecular_isotopic_ratio=getattr(const, f"VSMOW_R_{isotope}"),
+        )
+    return attributes
+
+
+def _disabled(dynamic):
+    dynamic.enable = False
+    return dynamic
+
+
+CASES = {
+    "Coalescence": Case(
+        environments=ALL_ENVIRONMENTS,
+        dynamics=lambda: (Coalescence(collision_kernel=Golovin(b=1.5e3 / si.s)),),
+    ),
+    "AdaptiveCoalescence": Case(
+        # note: upper bound of the coalescence timestep forcing ten substeps per step
+        #       (each involving the per-cell reduction of the adaptive timestep)
+        environments=ALL_ENVIRONMENTS,
+        dynamics=lambda: (
+            Coalescence(
+                collision_kernel=Golovin(b=1.5e3 / si.s),
+                adaptive=True,
+                dt_coal_range=(1 * si.ms, 100 * si.ms),
+            ),
+        ),
+    ),
+    "Collision": Case(
+        environments=ALL_ENVIRONMENTS,
+        dynamics=lambda: (
+            Collision(
+                collision_kernel=Golovin(b=1.5e3 / si.s),
+                coalescence_efficiency=ConstEc(Ec=0.9),
+                breakup_efficiency=ConstEb(Eb=1),
+                fragmentation_function=AlwaysN(n=2),
+            ),
+        ),
+    ),
+    "Condensation": Case(
+        environments=MOIST_ENVIRONMENTS,
+        dynamics=lambda: (Condensation(),),
+    ),
+    "Displacement": Case(
+        environments=("Kinematic1D", "Kinematic2D"),
+        dynamics=lambda: (Displacement(enable_sedimentation=True),),
+    ),
+    "Freezing": Case(
+        environments=ALL_ENVIRONMENTS,
+        dynamics=lambda: (
+            Freezing(immersion_freezing="time-dependent", thaw="instantaneous"),
+        ),
+        formulae={
+            "particle_shape_and_density": "MixedPhaseSpheres",
+            "heterogeneous_ice_nucleation_rate": "Constant",
+            "constants": {"J_HET": 1e10 / si.m**2 / si.s},
+        },
+        ambient=COLD,
+        environment_options={"mixed_phase": True},
+        attributes=_immersed_surface_area,
+    ),
+    "AqueousChemistry": Case(
+        environments=MOIST_ENVIRONMENTS,
+        dynamics=lambda: (
+            AqueousChemistry(
+                environment_mole_fractions=ENVIRONMENT_MOLE_FRACTIONS,
+                system_type="closed",
+                n_substep=2,
+                dry_rho=DRY_RHO,
+                dry_molar_mass=DRY_MOLAR_MASS,
+            ),
+        ),
+        ambient=Ambient(T=285.2 * si.K, p=950 * si.hPa, RH=0.95),
+        attributes=_chemistry,
+    ),
+    "VapourDepositionOnIce": Case(
+        environments=("Parcel",),  # TODO #1524: multi-cell environments
+        dynamics=lambda: (VapourDepositionOnIce(),),
+        formulae={"particle_shape_and_density": "MixedPhaseSpheres"},
+        ambient=COLD,
+        environment_options={"mixed_phase": True},
+        attributes=_ice,
+    ),
+    "IsotopicFractionation": Case(
+        # note: the isotope kernel expects per-cell volume array (as in Box with
+        #       array-valued dv) and Condensation (which has to be registered prior
+        #       to IsotopicFractionation) is not supported in Box, hence disabled
+        environments=("Box",),
+        dynamics=lambda: (
+            _disabled(Condensation()),
+            IsotopicFractionation(isotopes=ISOTOPES),
+        ),
+        formulae={
+            "isotope_relaxation_timescale": "ZabaEtAl",
+            "isotope_diffusivity_ratios": "GrahamsLaw",
+            "isotope_equilibrium_fractionation_factors": "VanHook1968",
+            "isotope_ratio_evolution": "GedzelmanAndArnold1994",
+            "drop_growth": "Mason1971",
+        },
+        environment_options={"dv": np.ones(1) * si.m**3},
+        attributes=_isotopes,
+        backends=("Numba",),  # TODO #1787
+    ),
+}
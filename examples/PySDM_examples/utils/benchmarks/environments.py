@@ -0,0 +1,207 @@
+"""
+factories of the environments used in benchmarks: each returns the environment
+ along with the dynamics needed to drive it and a function returning the initial
+ attributes; the kinematic environments use a prescribed (time-independent)
+ flow and prescribed Eulerian fields (`PrescribedFlow`) in place of the PyMPDATA
+ solvers so that the timings are not affected by the Eulerian advection
+"""
+
+from collections import namedtuple
+
+import numpy as np
+
+from PySDM.dynamics import AmbientThermodynamics, EulerianAdvection
+from PySDM.environments import Box, Kinematic1D, Kinematic2D, Parcel
+from PySDM.impl.mesh import Mesh
+from PySDM.initialisation.sampling.spatial_sampling import Pseudorandom
+from PySDM.initialisation.sampling.spectral_sampling import ConstantMultiplicity
+from PySDM.initialisation.spectra import Exponential, Lognormal
+from PySDM.physics import si
+
+ENVIRONMENTS = ("Box", "Parcel", "Kinematic1D", "Kinematic2D")
+
+DEFAULT_GRIDS = {
+    "Box": (None,),
+    "Parcel": (None,),
+    "Kinematic1D": ((64,),),
+    "Kinematic2D": ((32, 32),),
+}
+
+Ambient = namedtuple("Ambient", ("T", "p", "RH"))
+
+KAPPA = 1.28
+N_PER_VOLUME = 100 / si.cm**3
+DOMAIN_SIZE = {1: (1.5 * si.km,), 2: (1.5 * si.km, 1.5 * si.km)}
+MAX_COURANT = 0.2
+
+EnvironmentSetup = namedtuple(
+    "EnvironmentSetup", ("environment", "dynamics", "init_attributes", "flow")
+)
+
+
+class PrescribedFlow:
+    """stand-in for the Eulerian solvers of the kinematic environments holding
+    fixed (i.e., not advected) fields and uploading a prescribed Courant field
+    to the `Displacement` dynamic (if present)"""
+
+    def __init__(self, *, advectees, courant_field):
+        self.advectees = advectees
+        self.courant_field = courant_field
+
+    def __getitem__(self, key: str):
+        return self.advectees[key]
+
+    @property
+    def advectee(self):
+        return self.advectees["water_vapour_mixing_ratio"]
+
+    def wait(self):
+        pass
+
+    def __call__(self, displacement):
+        if displacement is not None and self.courant_field is not None:
+            displacement.upload_courant_field(self.courant_field)
+            self.courant_field = None
+
+
+def single_eddy_courant_field(grid):
+    """a discretely non-divergent Courant field derived from a stream function
+    vanishing at the domain boundaries (a 1D profile vanishing at the top and
+    bottom in the case of a 1D grid)"""
+    if len(grid) == 1:
+        z_vec = np.linspace(0, 1, grid[0] + 1)
+        return (MAX_COURANT * np.sin(np.pi * z_vec),)
+    x_vec, z_vec = (np.linspace(0, 1, n + 1) for n in grid)
+    stream_function = np.outer(np.sin(np.pi * x_vec), np.sin(np.pi * z_vec))
+    courant_field = (
+        np.diff(stream_function, axis=1),
+        -np.diff(stream_function, axis=0),
+    )
+    scale = MAX_COURANT / max(np.amax(np.abs(component)) for component in courant_field)
+    return tuple(component * scale for component in courant_field)
+
+
+def _thermodynamic_state(formulae, ambient):
+    water_vapour_mixing_ratio = formulae.trivia.water_vapour_mixing_ratio(
+        ambient.p, ambient.RH, formulae.saturation_vapour_pressure.pvs_water(ambient.T)
+    )
+    pd = formulae.trivia.p_d(ambient.p, water_vapour_mixing_ratio)
+    return (
+        water_vapour_mixing_ratio,
+        formulae.trivia.th_std(pd, ambient.T),
+        formulae.state_variable_triplet.rhod_of_pd_T(pd, ambient.T),
+    )
+
+
+def _aerosol(norm_factor):
+    return Lognormal(norm_factor=norm_factor, m_mode=0.04 * si.um, s_geom=1.4)
+
+
+def _box(*, formulae, dt, ambient, dv=1 * si.m**3, **_):
+    environment = Box(dt=dt, dv=dv)
+
+    def init_attributes(particulator):
+        for key, value in ambient._asdict().items():
+            particulator.environment[key] = value
+        particulator.environment["a_w_ice"] = np.nan
+        volume, multiplicity = ConstantMultiplicity(
+            Exponential(
+                norm_factor=N_PER_VOLUME * np.sum(environment.mesh.dv),
+                scale=formulae.trivia.volume(radius=30.531 * si.um),
+            )
+        ).sample_deterministic(particulator.n_sd)
+        return {"multiplicity": multiplicity, "volume": volume}
+
+    return EnvironmentSetup(environment, (), init_attributes, None)
+
+
+def _parcel(*, formulae, dt, ambient, mixed_phase=False, **_):
+    mass_of_dry_air = 1 * si.kg
+    environment = Parcel(
+        dt=dt,
+        mass_of_dry_air=mass_of_dry_air,
+        p0=ambient.p,
+        T0=ambient.T,
+        initial_relative_humidity=ambient.RH,
+        w=1 * si.m / si.s,
+        mixed_phase=mixed_phase,
+    )
+    rhod = _thermodynamic_state(formulae, ambient)[2]
+
+    def init_attributes(particulator):
+        r_dry, n_in_dv = ConstantMultiplicity(
+            _aerosol(N_PER_VOLUME / rhod * mass_of_dry_air)
+        ).sample_deterministic(particulator.n_sd)
+        return particulator.environment.init_attributes(
+            n_in_dv=n_in_dv, kappa=KAPPA, r_dry=r_dry
+        )
+
+    return EnvironmentSetup(
+        environment, (AmbientThermodynamics(),), init_attributes, None
+    )
+
+
+def _kinematic(*, formulae, dt, ambient, grid, mixed_phase=False, **_):
+    water_vapour_mixing_ratio, thd, rhod = _thermodynamic_state(formulae, ambient)
+    flow = PrescribedFlow(
+        advectees={
+            "water_vapour_mixing_ratio": np.full(grid, water_vapour_mixing_ratio),
+            "th": np.full(grid, thd),
+        },
+        courant_field=single_eddy_courant_field(grid),
+    )
+    spectrum = _aerosol(N_PER_VOLUME / rhod)
+
+    if len(grid) == 1:
+        environment = Kinematic1D(
+            dt=dt,
+            mesh=Mesh(grid=grid, size=DOMAIN_SIZE[1]),
+            thd_of_z=lambda z: np.full_like(z, thd),
+            rhod_of_z=lambda z: np.full_like(z, rhod),
+        )
+        flow.advectees["th"] = environment.thd0
+
+        def init_attributes(particulator):
+            return particulator.environment.init_attributes(
+                spatial_discretisation=Pseudorandom(),
+                spectral_discretisation=ConstantMultiplicity(spectrum),
+                kappa=KAPPA,
+            )
+
+    else:
+        environment = Kinematic2D(
+            dt=dt,
+            grid=grid,
+            size=DOMAIN_SIZE[2],
+            rhod_of=lambda zZ: np.full_like(zZ, rhod),
+            mixed_phase=mixed_phase,
+        )
+
+        def init_attributes(particulator):
+            return particulator.environment.init_attributes(
+                spatial_discretisation=Pseudorandom(),
+                dry_radius_spectrum=spectrum,
+                kappa=KAPPA,
+            )
+
+    return EnvironmentSetup(
+        environment,
+        (AmbientThermodynamics(), EulerianAdvection(flow)),
+        init_attributes,
+        flow,
+    )
+
+
+FACTORIES = {
+    "Box": _box,
+    "Parcel": _parcel,
+    "Kinematic1D": _kinematic,
+    "Kinematic2D": _kinematic,
+}
+
+
+def make_environment(name, **kwargs) -> EnvironmentSetup:
+    """returns the environment of a given name (one of `ENVIRONMENTS`)
+    along with the dynamics needed to drive it (to be registered ahead of
+    the benchmarked dynamic) and the initial-attribute factory"""
+    return FACTORIES[name](**kwargs)
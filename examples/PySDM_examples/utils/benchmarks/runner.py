@@ -0,0 +1,265 @@
+"""
+benchmark driver timing each of the `CASES` in isolation (i.e., using the wall time
+ recorded by the particulator for the benchmarked dynamic only) for a range of
+ environments, grids, super-droplet counts and Numba thread counts; each particulator
+ is first advanced by a number of untimed warm-up steps (so that the reported times
+ exclude JIT compilation); results are returned (and optionally saved) as JSON-compatible
+ dictionaries so that they can be compared between releases with `find_regressions()`
+"""
+
+import datetime
+import json
+import os
+import platform
+
+import numba
+import numpy as np
+from PySDM_examples.utils.benchmarks.cases import CASES
+from PySDM_examples.utils.benchmarks.environments import (
+    DEFAULT_GRIDS,
+    ENVIRONMENTS,
+    make_environment,
+)
+
+import PySDM
+from PySDM import Builder, Formulae
+from PySDM.backends import CPU, Numba
+from PySDM.physics import si
+
+N_SDS = tuple(10**exponent for exponent in range(3, 8))
+DT = 1 * si.s
+KEY_FIELDS = (
+    "case",
+    "environment",
+    "grid",
+    "n_sd",
+    "n_threads",
+    "backend",
+    "reordering_interval",
+    "sorting_scheme",
+)
+
+
+def timer_key(dynamic) -> str:
+    """key of the particulator timer corresponding to a given dynamic"""
+    return type(dynamic).__mro__[-2].__name__
+
+
+def make_particulator(
+    case_name,
+    environment_name,
+    *,
+    n_sd,
+    backend,
+    grid=None,
+    dt=DT,
+    reordering_interval=None,
+    sorting_scheme="default",
+):  # pylint: disable=too-many-arguments
+    """returns a particulator set up for benchmarking a given case in a given
+    environment along with the key of the timer of the benchmarked dynamic
+    (`reordering_interval` and `sorting_scheme` are passed to the particulator, see
+    `PySDM.impl.particle_attributes.ParticleAttributes.reorder`)"""
+    case = CASES[case_name]
+    setup = make_environment(
+        environment_name,
+        formulae=backend.formulae,
+        dt=dt,
+        ambient=case.ambient,
+        grid=grid,
+        **case.environment_options,
+    )
+    dynamics = case.dynamics()
+    builder = Builder(
+        n_sd=n_sd,
+        backend=backend,
+        environment=setup.environment,
+        dynamics=setup.dynamics + dynamics,
+    )
+    builder.particulator.sorting_scheme = sorting_scheme
+    attributes = setup.init_attributes(builder.particulator)
+    if "volume" in attributes:
+        attributes["signed water mass"] = (
+            backend.formulae.particle_shape_and_density.volume_to_mass(
+                attributes.pop("volume")
+            )
+        )
+    elif "water mass" in attributes:
+        attributes["signed water mass"] = attributes.pop("water mass")
+    if case.attributes is not None:
+        attributes = case.attributes(builder.particulator, attributes)
+    particulator = builder.build(attributes=attributes)
+    particulator.reordering_interval = reordering_interval
+    return particulator, timer_key(dynamics[-1])
+
+
+def time_steps(particulator, key, n_steps):
+    """advances the particulator step by step returning the wall times
+    of the dynamic with a given timer key"""
+    times = []
+    for _ in range(n_steps):
+        particulator.run(steps=1)
+        times.append(particulator.timers[key].time)
+    return times
+
+
+def metadata(backend_name):
+    """information on the software and hardware used"""
+    return {
+        "timestamp": datetime.datetime.now(datetime.timezone.utc).isoformat(),
+        "backend": backend_name,
+        "versions": {
+            "PySDM": PySDM.__version__,
+            "numba": numba.__version__,
+            "numpy": np.__version__,
+            "python": platform.python_version(),
+        },
+        "platform": platform.platform(),
+        "processor": platform.processor(),
+        "cpu_count": os.cpu_count(),
+        "numba_num_threads": numba.config.NUMBA_NUM_THREADS,  # pylint: disable=no-member
+    }
+
+
+def _status(case, environment_name, backend):
+    if environment_name not in case.environments:
+        return "unsupported"
+    if case.backends is not None and type(backend).__name__ not in case.backends:
+        return "unsupported"
+    return "ok"
+
+
+def run_benchmarks(
+    *,
+    cases=tuple(CASES),
+    environments=ENVIRONMENTS,
+    n_sds=N_SDS,
+    n_threads=None,
+    grids=None,
+    backend_class=CPU,
+    n_steps=10,
+    n_warm_up_steps=2,
+    dt=DT,
+    reordering_interval=None,
+    sorting_scheme="default",
+    path=None,
+):  # pylint: disable=too-many-arguments,too-many-locals,too-many-nested-blocks
+    """runs the benchmarks for all combinations of the given cases, environments,
+    grids (dictionary indexed by environment name, defaults to `DEFAULT_GRIDS`),
+    super-droplet counts and thread counts (defaults to one and all threads;
+    applicable to the Numba backend only), optionally with the attribute storage
+    reordered into cell-sorted layout every `reordering_interval` steps and with
+    a given cell-sorting scheme (see `Particulator.sorting_scheme`), and returns
+    a dictionary with metadata and a list of results (also saved as JSON if `path`
+    is given)"""
+    grids = {**DEFAULT_GRIDS, **(grids or {})}
+    if n_threads is None:
+        n_threads = sorted(
+            {1, numba.config.NUMBA_NUM_THREADS}  # pylint: disable=no-member
+        )
+
+    results = []
+    backend_name = None
+    for case_name in cases:
+        backend = backend_class(formulae=Formulae(**CASES[case_name].formulae))
+        backend_name = type(backend).__name__
+        thread_counts = n_threads if isinstance(backend, Numba) else (None,)
+        for environment_name in environments:
+            status = _status(CASES[case_name], environment_name, backend)
+            for grid in grids[environment_name]:
+                for n_sd in n_sds:
+                    for threads in thread_counts:
+                        result = {
+                            "case": case_name,
+                            "environment": environment_name,
+                            "grid": None if grid is None else list(grid),
+                            "n_sd": n_sd,
+                            "n_threads": threads,
+                            "backend": backend_name,
+                            "reordering_interval": reordering_interval,
+                            "sorting_scheme": sorting_scheme,
+                            "status": status,
+                        }
+                        if status == "ok":
+                            result.update(
+                                _run_one(
+                                    case_name,
+                                    environment_name,
+                                    n_sd=n_sd,
+                                    backend=backend,
+                                    grid=grid,
+                                    dt=dt,
+                                    reordering_interval=reordering_interval,
+                                    sorting_scheme=sorting_scheme,
+                                    threads=threads,
+                                    n_steps=n_steps,
+                                    n_warm_up_steps=n_warm_up_steps,
+                                )
+                            )
+                        results.append(result)
+
+    output = {"metadata": metadata(backend_name), "results": results}
+    if path is not None:
+        with open(path, "w", encoding="utf-8") as file:
+            json.dump(output, file, indent=1)
+    return output
+
+
+def _run_one(
+    case_name, environment_name, *, threads, n_steps, n_warm_up_steps, **kwargs
+):
+    default_threads = numba.get_num_threads()
+    try:
+        if threads is not None:
+            numba.set_num_threads(threads)
+        particulator, key = make_particulator(case_name, environment_name, **kwargs)
+        warm_up = time_steps(particulator, key, n_warm_up_steps)
+        times = time_steps(particulator, key, n_steps)
+    except Exception as error:  # pylint: disable=broad-exception-caught
+        return {"status": "failed", "error": repr(error)}
+    finally:
+        numba.set_num_threads(default_threads)
+    return {
+        "warm_up_time": sum(warm_up),
+        "times": times,
+        "min": min(times),
+        "median": float(np.median(times)),
+        "mean": float(np.mean(times)),
+        "super_droplet_count": particulator.attributes.super_droplet_count,
+    }
+
+
+def load(path):
+    """reads results saved by `run_benchmarks()`"""
+    with open(path, encoding="utf-8") as file:
+        return json.load(file)
+
+
+def find_regressions(baseline, current, *, tolerance=0.1, statistic="median"):
+    """compares two sets of results (as returned by `run_benchmarks()` or `load()`)
+    returning a list of the cases in which the given statistic of the timings
+    grew by more than the given relative tolerance (sorted by the slowdown ratio)"""
+
+    def index(results):
+        return {
+            tuple(json.dumps(result.get(field)) for field in KEY_FIELDS): result
+            for result in results["results"]
+            if result["status"] == "ok"
+        }
+
+    baseline, current = index(baseline), index(current)
+    regressions = []
+    for key, result in current.items():
+        if key not in baseline:
+            continue
+        ratio = result[statistic] / baseline[key][statistic]
+        if ratio > 1 + tolerance:
+            regressions.append(
+                {
+                    **{field: result.get(field) for field in KEY_FIELDS},
+                    "baseline": baseline[key][statistic],
+                    "current": result[statistic],
+                    "ratio": ratio,
+                }
+            )
+    return sorted(regressions, key=lambda regression: -regression["ratio"])
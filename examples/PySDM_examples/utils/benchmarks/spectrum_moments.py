@@ -0,0 +1,122 @@
+"""
+benchmark of the `spectrum_moments()` backend method (used by spectral products such as
+ `PySDM.products.size_spectral.particle_size_spectrum.ParticleSizeSpectrumPerVolume`)
+ comparing accumulation into thread-private histograms with atomic updates of
+ a single shared one for a range of bin counts and Numba thread counts, with
+ super-droplets in random order and sorted by cell (as after the collision step);
+ the defaults correspond to the large-grid case of 64x64 cells
+"""
+
+import itertools
+import json
+import time
+
+import numba
+import numpy as np
+from PySDM_examples.utils.benchmarks.runner import metadata
+
+from PySDM.backends import CPU
+from PySDM.backends.impl_numba.methods.moments_methods import (
+    MAX_PRIVATE_HISTOGRAMS_SIZE,
+)
+
+N_BINS = (16, 128, 1024)
+MODES = ("private", "atomic")
+ORDERS = ("shuffled", "cell-sorted")
+
+
+def run_spectrum_moments_benchmark(
+    *,
+    n_sd=10**6,
+    n_cell=64 * 64,
+    n_bins=N_BINS,
+    n_threads=None,
+    orders=ORDERS,
+    n_repeats=5,
+    seed=44,
+    path=None,
+):  # pylint: disable=too-many-arguments,too-many-locals
+    """times the Numba `spectrum_moments()` kernel for log-uniformly spaced bins with
+    super-droplets in the given `orders` in both `MODES` checking that they yield
+    the same histograms (the size of the private histograms is reported along with
+    a flag telling if it fits in `MAX_PRIVATE_HISTOGRAMS_SIZE`, i.e. if the
+    private mode would be selected by the backend); the first (untimed) call
+    of each configuration triggers JIT compilation"""
+    if n_threads is None:
+        n_threads = sorted(
+            {1, numba.config.NUMBA_NUM_THREADS}  # pylint: disable=no-member
+        )
+    backend = CPU()
+    rng = np.random.default_rng(seed)
+    storage = backend.Storage.from_ndarray
+    x_attr = storage(10 ** rng.uniform(-7, -3, size=n_sd))
+    cell_id = rng.integers(0, n_cell, size=n_sd)
+    idx = {
+        "shuffled": rng.permutation(n_sd),
+        "cell-sorted": np.argsort(cell_id, kind="stable"),
+    }
+    kwargs = {
+        "multiplicity": storage(rng.integers(1, 10**6, size=n_sd)).data,
+        "attr_data": x_attr.data,
+        "cell_id": storage(cell_id).data,
+        "length": n_sd,
+        "rank": 1,
+        "x_attr": x_attr.data,
+        "weighting_attribute": x_attr.data,
+        "weighting_rank": 0,
+    }
+
+    default_threads = numba.get_num_threads()
+    results = []
+    try:
+        for order, bins, threads in itertools.product(orders, n_bins, n_threads):
+            x_bins = np.geomspace(1e-7, 1e-3, bins + 1)
+            numba.set_num_threads(threads)
+            # pylint: disable-next=protected-access
+            spans = backend._spectrum_moments_cell_spans(
+                kwargs["cell_id"], idx[order], n_sd, threads
+            )
+            private_size = int(bins * np.sum(spans[:, 1] - spans[:, 0] + 1))
+            histograms = {}
+            for mode in MODES:
+                moment_0 = np.empty((bins, n_cell))
+                moments = np.empty((bins, n_cell))
+                times = []
+                for _ in range(n_repeats + 1):
+                    start = time.perf_counter()
+                    # pylint: disable-next=protected-access
+                    backend._spectrum_moments_body(
+                        moment_0=moment_0,
+                        moments=moments,
+                        idx=idx[order],
+                        x_bins=x_bins,
+                        spans=spans if mode == "private" else spans[:0],
+                        **kwargs,
+                    )
+                    times.append(time.perf_counter() - start)
+                histograms[mode] = moment_0, moments
+                results.append(
+                    {
+                        "order": order,
+                        "n_bins": bins,
+                        "n_cell": n_cell,
+                        "n_sd": n_sd,
+                        "n_threads": threads,
+                        "mode": mode,
+                        "private_size": private_size,
+                        "within_budget": private_size <= MAX_PRIVATE_HISTOGRAMS_SIZE,
+                        "times": times[1:],
+                        "min": min(times[1:]),
+                        "median": float(np.median(times[1:])),
+                    }
+                )
+            for actual, expected in zip(*histograms.values()):
+                np.testing.assert_allclose(actual, expected, rtol=1e-10)
+    finally:
+        numba.set_num_threads(default_threads)
+
+    output = {"metadata": metadata("Numba"), "results": results}
+    if path is not None:
+        with open(path, "w", encoding="utf-8") as file:
+            json.dump(output, file, indent=1)
+    return output
@@ -103,6 +103,21 @@ class MPDATA_2D:
             return self.mpdatas[key].advectee.get()
         return self.advectees[key]
 
+    def checkpoint_state(self) -> dict:
+        """arrays (views of the solver fields, overwritten in place on restore) and
+        scalars needed to continue the simulation, see `PySDM.impl.checkpoint`"""
+        mpdata = next(iter(self.mpdatas.values()))  # the advector field is shared
+        return {
+            "t": self.t,
+            "advectees": {k: v.advectee.get() for k, v in self.mpdatas.items()},
+            "advector": [
+                mpdata.advector.get_component(d) for d in range(len(self._grid))
+            ],
+        }
+
+    def restore_checkpoint_state(self, state: dict):
+        self.t = state["t"]
+
     def __call__(self, displacement):
         if self.asynchronous:
             self.thread = Thread(target=self.step, args=())
@@ -0,0 +1,207 @@
+"""
+process-pool driver for embarrassingly parallel parameter sweeps, e.g.:
+
+    for message in run_sweep(
+        make_particulator,
+        settings_list,
+        n_steps=100,
+        steps_per_output=10,
+        n_workers=4,
+        n_threads_per_worker=2,
+        jit_cache=".pysdm_jit_cache",
+    ):
+        if isinstance(message, SweepOutput):
+            results[message.index][message.step] = message.products
+
+where `make_particulator(settings, backend_class)` is a module-level (i.e., picklable)
+ function returning a built particulator, e.g., for `Shipway_and_Hill_2012`:
+
+    def make_particulator(settings, backend_class):
+        return Simulation(settings, backend=backend_class).particulator
+
+each worker process limits Numba to a fixed number of threads (the `Numba` backend
+ defaults to `parallel=True` and would otherwise use all cores in every worker) and
+ uses a `CPU` backend attached to a shared on-disk JIT cache (see
+ `PySDM.backends.impl_numba.jit_cache`) which is warmed up by a single short run
+ (in a separate process) before the runs are dispatched; products are sent back through a queue
+ every `steps_per_output` steps, as they are produced, and the messages are yielded
+ in the order of arrival
+"""
+
+import functools
+import multiprocessing
+import os
+import queue as queue_module
+import time
+import traceback
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+
+import numba
+import numpy as np
+
+from PySDM.backends import CPU
+
+SweepOutput = namedtuple("SweepOutput", ("index", "step", "products"))
+SweepDone = namedtuple("SweepDone", ("index", "wall_time", "jit_cache"))
+SweepFailure = namedtuple("SweepFailure", ("index", "traceback"))
+
+_QUEUE = None
+
+
+def _init_worker(n_threads, queue):
+    global _QUEUE  # pylint: disable=global-statement
+    _QUEUE = queue
+    numba.set_num_threads(
+        min(n_threads, numba.config.NUMBA_NUM_THREADS)  # pylint: disable=no-member
+    )
+
+
+def _warm_up(make_particulator, settings, *, n_steps, jit_cache):
+    particulator = make_particulator(
+        settings, functools.partial(CPU, jit_cache=jit_cache)
+    )
+    particulator.run(steps=n_steps)
+    for product in particulator.products.values():
+        product.get()
+    return particulator.backend.jit_cache.summary
+
+
+def _run(
+    make_particulator,
+    settings,
+    *,
+    index,
+    n_steps,
+    steps_per_output,
+    products,
+    jit_cache,
+):  # pylint: disable=too-many-arguments
+    try:
+        start = time.perf_counter()
+        particulator = make_particulator(
+            settings, functools.partial(CPU, jit_cache=jit_cache)
+        )
+        names = tuple(particulator.products) if products is None else products
+        step = 0
+        while True:
+            _QUEUE.put(
+                SweepOutput(
+                    index=index,
+                    step=step,
+                    products={
+                        name: np.copy(particulator.products[name].get())
+                        for name in names
+                    },
+                )
+            )
+            if step == n_steps:
+                break
+            steps = min(steps_per_output, n_steps - step)
+            particulator.run(steps=steps)
+            step += steps
+        _QUEUE.put(
+            SweepDone(
+                index=index,
+                wall_time=time.perf_counter() - start,
+                jit_cache=particulator.backend.jit_cache.summary,
+            )
+        )
+    except Exception:  # pylint: disable=broad-exception-caught
+        _QUEUE.put(SweepFailure(index=index, traceback=traceback.format_exc()))
+
+
+def run_sweep(
+    make_particulator,
+    settings_list,
+    *,
+    n_steps: int,
+    jit_cache: str,
+    steps_per_output: int = None,
+    products: tuple = None,
+    n_workers: int = None,
+    n_threads_per_worker: int = 1,
+    n_warm_up_steps: int = 1,
+    start_method: str = "spawn",
+    poll_interval: float = 1,
+):  # pylint: disable=too-many-arguments,too-many-locals
+    """generator running `make_particulator(settings, backend_class)` for each of
+    the `settings_list` elements in a pool of `n_workers` processes (by default,
+    as many as fit into the number of cores with `n_threads_per_worker` threads
+    each) and yielding, for each run:
+    `SweepOutput(index, step, products)` for the initial state and then after
+    every `steps_per_output` (by default, `n_steps`) steps, with `products` being
+    a dictionary of copies of the values of all (or of the selected) products;
+    and finally either `SweepDone(index, wall_time, jit_cache)` (the latter being
+    the JIT-cache hit/miss summary of the run) or `SweepFailure(index, traceback)`;
+    `n_warm_up_steps` of the first run are performed (and the compiled kernels are
+    stored in `jit_cache`) before the runs are dispatched (zero disables the warm-up);
+    a `ValueError` is raised (upon first iteration) for negative `n_steps` or
+    non-positive `steps_per_output`"""
+    if n_steps < 0:
+        raise ValueError("n_steps must not be negative")
+    if steps_per_output is not None and steps_per_output < 1:
+        raise ValueError("steps_per_output must be positive")
+    settings_list = list(settings_list)
+    if n_workers is None:
+        n_workers = max(1, (os.cpu_count() or 1) // n_threads_per_worker)
+    context = multiprocessing.get_context(start_method)
+    queue = context.Queue()
+
+    if n_warm_up_steps > 0 and len(settings_list) > 0:
+        # in a separate short-lived process so that all workers load kernels from disk;
+        #  failures are not reported here as they resurface in the first run
+        with ProcessPoolExecutor(
+            max_workers=1,
+            mp_context=context,
+            initializer=_init_worker,
+            initargs=(n_threads_per_worker, None),
+        ) as executor:
+            executor.submit(
+                _warm_up,
+                make_particulator,
+                settings_list[0],
+                n_steps=n_warm_up_steps,
+                jit_cache=jit_cache,
+            ).exception()
+
+    with ProcessPoolExecutor(
+        max_workers=max(1, min(n_workers, len(settings_list))),
+        mp_context=context,
+        initializer=_init_worker,
+        initargs=(n_threads_per_worker, queue),
+    ) as executor:
+        futures = {
+            executor.submit(
+                _run,
+                make_particulator,
+                settings,
+                index=index,
+                n_steps=n_steps,
+                steps_per_output=steps_per_output or n_steps,
+                products=products,
+                jit_cache=jit_cache,
+            ): index
+            for index, settings in enumerate(settings_list)
+        }
+        running = set(futures.values())
+        try:
+            while len(running) > 0:
+                try:
+                    message = queue.get(timeout=poll_interval)
+                except queue_module.Empty:
+                    # e.g., unpicklable arguments or a worker process killed
+                    for future, index in futures.items():
+                        if index in running and future.done():
+                            if future.exception() is not None:
+                                running.remove(index)
+                                yield SweepFailure(
+                                    index=index, traceback=repr(future.exception())
+                                )
+                    continue
+                if not isinstance(message, SweepOutput):
+                    running.discard(message.index)
+                yield message
+        finally:
+            for future in futures:
+                future.cancel()
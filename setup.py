@@ -32,7 +32,8 @@ dependencies = [
 ]
 
 optional_dependencies = {
-    "unit-tests": ["pytest", "pytest-timeout", "matplotlib!=3.9.1"],
+    "netCDF4": ["netCDF4"],
+    "unit-tests": ["pytest", "pytest-timeout", "matplotlib!=3.9.1", "netCDF4"],
     "nonunit-tests": ["pytest", "PySDM-examples", "PyPartMC"],
     "CI_version_pins": [
         "PyPartMC==2.0.7",
@@ -41,6 +42,7 @@ optional_dependencies = {
         "Pint==0.24.4",
         "chempy==0.10.1",
         "pyevtk==1.6.0",
+        "netCDF4==1.7.2",
     ],
 }
 
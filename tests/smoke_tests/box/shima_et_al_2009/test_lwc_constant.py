@@ -32,13 +32,13 @@ def check(*, n_part, dv, n_sd, rho, attributes, step):
     np.testing.assert_approx_equal(LWC, check_lwc, 3)
 
 
-@pytest.mark.parametrize("croupier", ["local", "global"])
+@pytest.mark.parametrize("croupier", ["local", "global", "global_parallel"])
 @pytest.mark.parametrize("adaptive", [True, False])
 # pylint: disable=too-many-locals
 def test_lwc_constant(backend_class, croupier, adaptive):
     if backend_class == ThrustRTC and croupier == "local":  # TODO #358
         pytest.skip()
-    if backend_class == ThrustRTC and adaptive and croupier == "global":  # TODO #329
+    if backend_class == ThrustRTC and adaptive and croupier != "local":  # TODO #329
         pytest.skip()
     # Arrange
     formulae = Formulae(seed=256)
@@ -0,0 +1,107 @@
+# pylint: disable=missing-module-docstring,missing-class-docstring,missing-function-docstring
+import numpy as np
+from PySDM_examples.Arabas_et_al_2015 import Settings
+from PySDM_examples.utils.kinematic_2d.mpdata_2d import MPDATA_2D
+
+from PySDM import Builder, Formulae
+from PySDM.backends import CPU
+from PySDM.dynamics import (
+    AmbientThermodynamics,
+    Coalescence,
+    Condensation,
+    Displacement,
+    EulerianAdvection,
+)
+from PySDM.environments import Kinematic2D
+from PySDM.initialisation.sampling.spatial_sampling import Pseudorandom
+from PySDM.particulator import Particulator
+from PySDM.physics import si
+
+
+def _builder(settings):
+    advectees = {
+        key: np.repeat(profile.reshape(1, -1), settings.grid[0], axis=0)
+        for key, profile in {
+            "th": settings.initial_dry_potential_temperature_profile,
+            "water_vapour_mixing_ratio": settings.initial_vapour_mixing_ratio_profile,
+        }.items()
+    }
+    return Builder(
+        n_sd=settings.n_sd,
+        backend=CPU(formulae=settings.formulae),
+        environment=Kinematic2D(
+            dt=settings.dt,
+            grid=settings.grid,
+            size=settings.size,
+            rhod_of=settings.rhod_of_zZ,
+        ),
+        dynamics=(
+            AmbientThermodynamics(),
+            Condensation(),
+            EulerianAdvection(
+                MPDATA_2D(
+                    advectees=advectees,
+                    stream_function=settings.stream_function,
+                    rhod_of_zZ=settings.rhod_of_zZ,
+                    dt=settings.dt,
+                    grid=settings.grid,
+                    size=settings.size,
+                )
+            ),
+            Displacement(enable_sedimentation=True),
+            Coalescence(collision_kernel=settings.kernel),
+        ),
+    )
+
+
+def _build(settings):
+    builder = _builder(settings)
+    return builder.build(
+        attributes=builder.particulator.environment.init_attributes(
+            spatial_discretisation=Pseudorandom(),
+            dry_radius_spectrum=settings.spectrum_per_mass_of_dry_air,
+            kappa=settings.kappa,
+        )
+    )
+
+
+def _state(particulator):
+    return {
+        "water mass": particulator.attributes["water mass"].to_ndarray(),
+        "cell id": particulator.attributes["cell id"].to_ndarray(),
+        "thd": particulator.environment.get_thd().copy(),
+        "water_vapour_mixing_ratio": (
+            particulator.environment.get_water_vapour_mixing_ratio().copy()
+        ),
+        "RH": particulator.environment["RH"].to_ndarray(),
+    }
+
+
+def test_restart_with_mpdata_bit_for_bit(tmp_path):
+    # arrange
+    settings = Settings(formulae=Formulae(seed=44))
+    settings.grid = (8, 8)
+    settings.n_sd_per_gridbox = 4
+    settings.dt = 5 * si.s
+    n_steps, n_steps_before_checkpoint = 6, 3
+    path = str(tmp_path / "checkpoint.bin")
+
+    reference = _build(settings)
+    reference.run(n_steps)
+
+    particulator = _build(settings)
+    particulator.run(n_steps_before_checkpoint)
+
+    # act
+    particulator.checkpoint(path)
+    restored = Particulator.restore(path, _builder(settings))
+    restored.run(n_steps - n_steps_before_checkpoint)
+
+    # assert
+    expected = _state(reference)
+    actual = _state(restored)
+    for key, value in expected.items():
+        np.testing.assert_array_equal(actual[key], value)
+    assert restored.dynamics["EulerianAdvection"].solvers.t == (
+        reference.dynamics["EulerianAdvection"].solvers.t
+    )
@@ -0,0 +1,94 @@
+"""
+smoke tests of the benchmark suite (tiny super-droplet counts, two timesteps)
+"""
+
+import json
+
+import pytest
+from PySDM_examples.utils.benchmarks import (
+    CASES,
+    ENVIRONMENTS,
+    find_regressions,
+    load,
+    run_benchmarks,
+    run_spectrum_moments_benchmark,
+)
+from PySDM_examples.utils.benchmarks.spectrum_moments import MODES, ORDERS
+
+N_SD = 64
+
+
+@pytest.fixture(scope="module", name="results")
+def results_fixture(tmp_path_factory):
+    path = tmp_path_factory.mktemp("benchmarks") / "results.json"
+    run_benchmarks(
+        n_sds=(N_SD,), n_threads=(1,), n_steps=2, n_warm_up_steps=1, path=path
+    )
+    return load(path)
+
+
+class TestBenchmarks:
+    @staticmethod
+    def test_all_combinations_covered(results):
+        # arrange
+        expected = {(case, env) for case in CASES for env in ENVIRONMENTS}
+
+        # act
+        covered = {(r["case"], r["environment"]) for r in results["results"]}
+
+        # assert
+        assert covered == expected
+        assert json.dumps(results)
+
+    @staticmethod
+    @pytest.mark.parametrize("case", CASES)
+    def test_supported_combinations_timed(results, case):
+        # arrange
+        supported = [
+            r
+            for r in results["results"]
+            if r["case"] == case and r["environment"] in CASES[case].environments
+        ]
+
+        # act
+        statuses = {r["status"] for r in supported}
+
+        # assert
+        assert len(supported) > 0
+        assert statuses == {"ok"}
+        for result in supported:
+            assert len(result["times"]) == 2
+            assert result["min"] > 0
+
+    @staticmethod
+    def test_find_regressions(results):
+        # arrange
+        slower = json.loads(json.dumps(results))
+        for result in slower["results"]:
+            if result["status"] == "ok" and result["case"] == "Coalescence":
+                result["median"] *= 2
+
+        # act
+        regressions = find_regressions(results, slower, tolerance=0.5)
+
+        # assert
+        assert {r["case"] for r in regressions} == {"Coalescence"}
+        assert all(r["ratio"] == pytest.approx(2) for r in regressions)
+
+    @staticmethod
+    def test_spectrum_moments_benchmark():
+        # arrange
+        n_bins = (8, 64)
+
+        # act
+        results = run_spectrum_moments_benchmark(
+            n_sd=N_SD, n_cell=4, n_bins=n_bins, n_threads=(1,), n_repeats=2
+        )
+
+        # assert
+        assert {(r["order"], r["n_bins"], r["mode"]) for r in results["results"]} == {
+            (order, bins, mode) for order in ORDERS for bins in n_bins for mode in MODES
+        }
+        for result in results["results"]:
+            assert len(result["times"]) == 2
+            assert result["within_budget"]
@@ -0,0 +1,130 @@
+"""
+smoke tests of the process-pool sweep driver (tiny Box simulations with coalescence)
+"""
+
+import numpy as np
+import pytest
+from PySDM_examples.utils.sweep import SweepDone, SweepFailure, SweepOutput, run_sweep
+
+from PySDM import Builder, Formulae
+from PySDM.backends import CPU
+from PySDM.dynamics import Coalescence
+from PySDM.dynamics.collisions.collision_kernels import Golovin
+from PySDM.environments import Box
+from PySDM.initialisation.sampling.spectral_sampling import ConstantMultiplicity
+from PySDM.initialisation.spectra import Exponential
+from PySDM.physics import si
+from PySDM.products import ParticleConcentration, SuperDropletCountPerGridbox
+
+N_SD = 2**6
+N_STEPS = 4
+STEPS_PER_OUTPUT = 2
+SETTINGS = tuple({"seed": seed, "b": 15000 / si.s} for seed in (1, 2, 3))
+
+
+def make_particulator(settings, backend_class):
+    """module-level (hence picklable) particulator factory"""
+    if settings["b"] < 0:
+        raise ValueError("negative kernel coefficient")
+    builder = Builder(
+        n_sd=N_SD,
+        backend=backend_class(formulae=Formulae(seed=settings["seed"])),
+        environment=Box(dt=1 * si.s, dv=1 * si.m**3),
+        dynamics=(Coalescence(collision_kernel=Golovin(b=settings["b"])),),
+    )
+    volume, multiplicity = ConstantMultiplicity(
+        Exponential(
+            norm_factor=2**23 / si.m**3, scale=4 * np.pi / 3 * (30 * si.um) ** 3
+        )
+    ).sample_deterministic(N_SD)
+    return builder.build(
+        attributes={"volume": volume, "multiplicity": multiplicity},
+        products=(ParticleConcentration(name="n"), SuperDropletCountPerGridbox()),
+    )
+
+
+@pytest.fixture(scope="module", name="messages")
+def messages_fixture(tmp_path_factory):
+    return list(
+        run_sweep(
+            make_particulator,
+            SETTINGS + ({"seed": 4, "b": -1 / si.s},),
+            n_steps=N_STEPS,
+            steps_per_output=STEPS_PER_OUTPUT,
+            n_workers=2,
+            jit_cache=str(tmp_path_factory.mktemp("jit_cache")),
+        )
+    )
+
+
+class TestSweep:
+    @staticmethod
+    def test_outputs_streamed_for_each_run(messages):
+        # act
+        steps = {
+            index: [
+                m.step
+                for m in messages
+                if isinstance(m, SweepOutput) and m.index == index
+            ]
+            for index in range(len(SETTINGS))
+        }
+
+        # assert
+        for index in range(len(SETTINGS)):
+            assert steps[index] == list(range(0, N_STEPS + 1, STEPS_PER_OUTPUT))
+            assert isinstance([m for m in messages if m.index == index][-1], SweepDone)
+
+    @staticmethod
+    def test_same_products_as_serial_run(messages):
+        # arrange
+        expected = []
+        for settings in SETTINGS:
+            particulator = make_particulator(settings, CPU)
+            particulator.run(steps=N_STEPS)
+            expected.append(particulator.products["n"].get().copy())
+
+        # act
+        actual = {
+            m.index: m.products["n"]
+            for m in messages
+            if isinstance(m, SweepOutput) and m.step == N_STEPS
+        }
+
+        # assert
+        for index, value in enumerate(expected):
+            np.testing.assert_array_equal(actual[index], value)
+        assert len({float(value[0]) for value in expected}) == len(SETTINGS)
+
+    @staticmethod
+    def test_failure_reported(messages):
+        # act
+        failures = [m for m in messages if isinstance(m, SweepFailure)]
+
+        # assert
+        assert len(failures) == 1
+        assert failures[0].index == len(SETTINGS)
+        assert "negative kernel coefficient" in failures[0].traceback
+
+    @staticmethod
+    def test_kernels_loaded_from_warm_jit_cache(messages):
+        # act
+        summaries = [m.jit_cache for m in messages if isinstance(m, SweepDone)]
+
+        # assert
+        assert len(summaries) == len(SETTINGS)
+        for summary in summaries:
+            assert summary.misses == 0
+            assert summary.hits > 0
+
+    @staticmethod
+    @pytest.mark.parametrize(
+        "kwargs", ({"n_steps": -1}, {"n_steps": N_STEPS, "steps_per_output": 0})
+    )
+    def test_invalid_step_counts_rejected(kwargs, tmp_path):
+        with pytest.raises(ValueError, match="n_steps|steps_per_output"):
+            next(
+                run_sweep(
+                    make_particulator, SETTINGS, jit_cache=str(tmp_path), **kwargs
+                )
+            )
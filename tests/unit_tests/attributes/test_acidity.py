@@ -7,11 +7,8 @@ from chempy import Equilibrium
 from chempy.chemistry import Species
 from chempy.equilibria import EqSystem
 
-from PySDM.backends.impl_numba.methods.chemistry_methods import (
-    _K,
-    ChemistryMethods,
-    _conc,
-)
+from PySDM.backends import CPU
+from PySDM.backends.impl_numba.methods.chemistry_methods import _conc
 from PySDM.dynamics import aqueous_chemistry
 from PySDM.dynamics.impl.chemistry_utils import EquilibriumConsts, M
 from PySDM.formulae import Formulae
@@ -19,6 +16,63 @@ from PySDM.physics.constants import K_H2O
 
 FORMULAE = Formulae()
 EQUILIBRIUM_CONST = EquilibriumConsts(FORMULAE).EQUILIBRIUM_CONST
+EQS_AT_ROOM_TEMP = {
+    key: np.full(1, const.at(FORMULAE.constants.ROOM_TEMP))
+    for key, const in EQUILIBRIUM_CONST.items()
+}
+NON_TRIVIAL_CONC = {
+    "N_mIII": 0.5,
+    "N_V": 0.01,
+    "C_IV": 0.1,
+    "S_IV": 0.05,
+    "S_VI": 0.02,
+}
+
+
+def _equilibrate_pH(*, conc, equilibrium_consts, pH=None, cell_id=None):
+    backend = CPU(formulae=FORMULAE)
+    n_sd = max(
+        np.size(value) for value in (*conc.values(), pH, cell_id) if value is not None
+    )
+    n_cell = 1 if cell_id is None else max(cell_id) + 1
+    result = backend.Storage.from_ndarray(
+        np.full(n_sd, FORMULAE.constants.pH_w if pH is None else pH, dtype=float)
+    )
+    iterations = backend.Storage.empty(n_sd, dtype=int)
+    counters = {
+        key: backend.Storage.from_ndarray(np.zeros(n_cell, dtype=int))
+        for key in ("n_pH_solves", "n_pH_iterations")
+    }
+    backend.equilibrate_H(
+        equilibrium_consts={
+            key: backend.Storage.from_ndarray(value)
+            for key, value in equilibrium_consts.items()
+        },
+        cell_id=backend.Storage.from_ndarray(
+            np.zeros(n_sd, dtype=int) if cell_id is None else np.asarray(cell_id)
+        ),
+        conc=_conc(
+            **{
+                key: backend.Storage.from_ndarray(np.full(n_sd, value, dtype=float))
+                for key, value in conc.items()
+            }
+        ),
+        # output
+        do_chemistry_flag=backend.Storage.empty(n_sd, dtype=bool),
+        pH=result,
+        iterations=iterations,
+        counters=counters,
+        # params
+        H_min=FORMULAE.trivia.pH2H(aqueous_chemistry.DEFAULTS.pH_max),
+        H_max=FORMULAE.trivia.pH2H(aqueous_chemistry.DEFAULTS.pH_min),
+        ionic_strength_threshold=aqueous_chemistry.DEFAULTS.ionic_strength_threshold,
+        rtol=aqueous_chemistry.DEFAULTS.pH_rtol,
+    )
+    return (
+        result.to_ndarray(),
+        iterations.to_ndarray(),
+        {key: value.to_ndarray() for key, value in counters.items()},
+    )
 
 
 class TestAcidity:
@@ -30,36 +84,8 @@ class TestAcidity:
             eqs[key] = np.full(1, const.at(FORMULAE.constants.ROOM_TEMP))
 
         # Act
-        result = np.empty(1)
-        ChemistryMethods.equilibrate_H_body(
-            within_tolerance=FORMULAE.trivia.within_tolerance,
-            pH2H=FORMULAE.trivia.pH2H,
-            H2pH=FORMULAE.trivia.H2pH,
-            conc=_conc(
-                N_mIII=np.zeros(1),
-                N_V=np.zeros(1),
-                C_IV=np.zeros(1),
-                S_IV=np.zeros(1),
-                S_VI=np.zeros(1),
-            ),
-            K=_K(
-                HNO3=eqs["K_HNO3"].data,
-                HCO3=eqs["K_HCO3"].data,
-                HSO3=eqs["K_HSO3"].data,
-                HSO4=eqs["K_HSO4"].data,
-                CO2=eqs["K_CO2"].data,
-                NH3=eqs["K_NH3"].data,
-                SO2=eqs["K_SO2"].data,
-            ),
-            cell_id=np.zeros(1, dtype=int),
-            # output
-            do_chemistry_flag=np.empty(1),
-            pH=result,
-            # params
-            H_min=FORMULAE.trivia.pH2H(aqueous_chemistry.DEFAULTS.pH_max),
-            H_max=FORMULAE.trivia.pH2H(aqueous_chemistry.DEFAULTS.pH_min),
-            ionic_strength_threshold=aqueous_chemistry.DEFAULTS.ionic_strength_threshold,
-            rtol=aqueous_chemistry.DEFAULTS.pH_rtol,
+        result, _, _ = _equilibrate_pH(
+            conc={key: 0 for key in _conc._fields}, equilibrium_consts=eqs
         )
 
         # Assert
@@ -123,36 +149,98 @@ class TestAcidity:
         for key, const in EQUILIBRIUM_CONST.items():
             eqs[key] = np.full(1, const.at(env_T))
 
-        actual_pH = np.empty(1)
-        ChemistryMethods.equilibrate_H_body(
-            within_tolerance=FORMULAE.trivia.within_tolerance,
-            pH2H=FORMULAE.trivia.pH2H,
-            H2pH=FORMULAE.trivia.H2pH,
-            conc=_conc(
-                N_mIII=np.full(1, init_conc["NH3"] * 1e3),
-                N_V=np.full(1, init_conc["HNO3(aq)"] * 1e3),
-                C_IV=np.full(1, init_conc["H2CO3(aq)"] * 1e3),
-                S_IV=np.full(1, init_conc["H2SO3(aq)"] * 1e3),
-                S_VI=np.full(1, init_conc["HSO4-"] * 1e3),
-            ),
-            K=_K(
-                HNO3=eqs["K_HNO3"].data,
-                HCO3=eqs["K_HCO3"].data,
-                HSO3=eqs["K_HSO3"].data,
-                HSO4=eqs["K_HSO4"].data,
-                CO2=eqs["K_CO2"].data,
-                NH3=eqs["K_NH3"].data,
-                SO2=eqs["K_SO2"].data,
-            ),
-            cell_id=np.zeros(1, dtype=int),
-            # output
-            do_chemistry_flag=np.empty(1),
-            pH=actual_pH,
-            # params
-            H_min=FORMULAE.trivia.pH2H(aqueous_chemistry.DEFAULTS.pH_max),
-            H_max=FORMULAE.trivia.pH2H(aqueous_chemistry.DEFAULTS.pH_min),
-            ionic_strength_threshold=aqueous_chemistry.DEFAULTS.ionic_strength_threshold,
-            rtol=aqueous_chemistry.DEFAULTS.pH_rtol,
+        actual_pH, _, _ = _equilibrate_pH(
+            conc={
+                "N_mIII": init_conc["NH3"] * 1e3,
+                "N_V": init_conc["HNO3(aq)"] * 1e3,
+                "C_IV": init_conc["H2CO3(aq)"] * 1e3,
+                "S_IV": init_conc["H2SO3(aq)"] * 1e3,
+                "S_VI": init_conc["HSO4-"] * 1e3,
+            },
+            equilibrium_consts=eqs,
         )
 
         np.testing.assert_allclose(actual_pH[0], expected_pH, rtol=1e-5)
+
+    @staticmethod
+    @pytest.mark.parametrize("initial_pH", (1.5, 4, 7, 10, 13))
+    def test_equilibrate_pH_independent_of_initial_pH(initial_pH):
+        # act
+        actual_pH, _, _ = _equilibrate_pH(
+            conc=NON_TRIVIAL_CONC, equilibrium_consts=EQS_AT_ROOM_TEMP, pH=initial_pH
+        )
+        expected_pH, _, _ = _equilibrate_pH(
+            conc=NON_TRIVIAL_CONC, equilibrium_consts=EQS_AT_ROOM_TEMP
+        )
+
+        # assert
+        np.testing.assert_allclose(actual_pH, expected_pH, rtol=1e-5)
+
+    @staticmethod
+    def test_equilibrate_pH_warm_start():
+        # arrange
+        pH, cold_start_iterations, _ = _equilibrate_pH(
+            conc=NON_TRIVIAL_CONC, equilibrium_consts=EQS_AT_ROOM_TEMP
+        )
+
+        # act
+        _, warm_start_iterations, _ = _equilibrate_pH(
+            conc={key: value * 1.01 for key, value in NON_TRIVIAL_CONC.items()},
+            equilibrium_consts=EQS_AT_ROOM_TEMP,
+            pH=pH,
+        )
+
+        # assert
+        assert 0 < warm_start_iterations[0] < cold_start_iterations[0]
+
+    @staticmethod
+    def test_equilibrate_pH_iteration_counters_per_cell():
+        # arrange
+        cell_id = np.asarray([0, 2, 2, 0, 2, 1])
+        pH = np.linspace(2, 12, len(cell_id))
+
+        # act
+        actual_pH, iterations, counters = _equilibrate_pH(
+            conc=NON_TRIVIAL_CONC,
+            equilibrium_consts={
+                key: np.repeat(value, 3) for key, value in EQS_AT_ROOM_TEMP.items()
+            },
+            pH=pH,
+            cell_id=cell_id,
+        )
+
+        # assert
+        np.testing.assert_allclose(actual_pH, actual_pH[0], rtol=1e-5)
+        np.testing.assert_array_equal(counters["n_pH_solves"], (2, 1, 3))
+        np.testing.assert_array_equal(
+            counters["n_pH_iterations"],
+            [iterations[cell_id == i].sum() for i in range(3)],
+        )
+        assert (iterations > 0).all()
+
+    @staticmethod
+    def test_equilibrate_pH_counters_skip_droplets_already_in_equilibrium():
+        # arrange
+        cell_id = np.asarray([0, 1, 1])
+        equilibrium_consts = {
+            key: np.repeat(value, 2) for key, value in EQS_AT_ROOM_TEMP.items()
+        }
+        pH, _, _ = _equilibrate_pH(
+            conc=NON_TRIVIAL_CONC,
+            equilibrium_consts=equilibrium_consts,
+            cell_id=cell_id,
+        )
+        pH[1] = 4
+
+        # act
+        _, iterations, counters = _equilibrate_pH(
+            conc=NON_TRIVIAL_CONC,
+            equilibrium_consts=equilibrium_consts,
+            pH=pH,
+            cell_id=cell_id,
+        )
+
+        # assert
+        assert iterations[0] == iterations[2] == 0
+        np.testing.assert_array_equal(counters["n_pH_solves"], (0, 1))
+        np.testing.assert_array_equal(counters["n_pH_iterations"], (0, iterations[1]))
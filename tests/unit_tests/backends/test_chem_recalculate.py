@@ -0,0 +1,102 @@
+# pylint: disable=missing-module-docstring,missing-class-docstring,missing-function-docstring
+import numpy as np
+import pytest
+
+from PySDM.backends import CPU
+from PySDM.backends.impl_numba.storage import Storage
+from PySDM.dynamics.impl.chemistry_utils import DIFFUSION_CONST, DISSOCIATION_FACTORS
+from PySDM.physics import si
+from PySDM.physics.constants import K_H2O
+
+N_CELL = 7
+N_SD = 100
+TEMPERATURE = np.linspace(250, 310, N_CELL) * si.K
+
+
+@pytest.fixture(name="backend", scope="module")
+def backend_fixture():
+    return CPU()
+
+
+def _cell_data(backend):
+    equilibrium_consts = {
+        key: Storage.empty(N_CELL, dtype=float)
+        for key in backend.EQUILIBRIUM_CONST.EQUILIBRIUM_CONST
+    }
+    kinetic_consts = {
+        key: Storage.empty(N_CELL, dtype=float)
+        for key in backend.KINETIC_CONST.KINETIC_CONST
+    }
+    backend.chem_recalculate_cell_data(
+        equilibrium_consts=equilibrium_consts,
+        kinetic_consts=kinetic_consts,
+        temperature=Storage.from_ndarray(TEMPERATURE),
+    )
+    return equilibrium_consts, kinetic_consts
+
+
+class TestChemRecalculate:
+    @staticmethod
+    def test_cell_data(backend):
+        # act
+        equilibrium_consts, kinetic_consts = _cell_data(backend)
+
+        # assert
+        for key, value in equilibrium_consts.items():
+            np.testing.assert_allclose(
+                value.to_ndarray(),
+                backend.EQUILIBRIUM_CONST.EQUILIBRIUM_CONST[key].at(TEMPERATURE),
+                rtol=1e-12,
+            )
+        for key, value in kinetic_consts.items():
+            np.testing.assert_allclose(
+                value.to_ndarray(),
+                backend.KINETIC_CONST.KINETIC_CONST[key].at(TEMPERATURE),
+                rtol=1e-12,
+            )
+        assert len(set(equilibrium_consts["K_SO2"].to_ndarray())) == N_CELL
+
+    @staticmethod
+    def test_drop_data(backend):
+        # arrange
+        equilibrium_consts, _ = _cell_data(backend)
+        rng = np.random.default_rng(seed=44)
+        pH = rng.uniform(2, 8, N_SD)
+        cell_id = rng.integers(0, N_CELL, N_SD)
+        dissociation_factors = {
+            key: Storage.empty(N_SD, dtype=float) for key in DIFFUSION_CONST
+        }
+
+        # act
+        backend.chem_recalculate_drop_data(
+            dissociation_factors=dissociation_factors,
+            equilibrium_consts=equilibrium_consts,
+            cell_id=Storage.from_ndarray(cell_id),
+            pH=Storage.from_ndarray(pH),
+        )
+
+        # assert
+        H = backend.formulae.trivia.pH2H(pH)
+        K = {
+            key[2:]: value.to_ndarray()[cell_id]
+            for key, value in equilibrium_consts.items()
+        }
+        expected = {
+            "HNO3": 1 + K["HNO3"] / H,
+            "H2O2": np.ones(N_SD),
+            "NH3": 1 + K["NH3"] / K_H2O * H,
+            "SO2": 1 + K["SO2"] * (1 / H + K["HSO3"] / H**2),
+            "CO2": 1 + K["CO2"] * (1 / H + K["HCO3"] / H**2),
+            "O3": np.ones(N_SD),
+        }
+        for key, value in dissociation_factors.items():
+            np.testing.assert_allclose(value.to_ndarray(), expected[key], rtol=1e-12)
+            np.testing.assert_allclose(
+                value.to_ndarray(),
+                [
+                    DISSOCIATION_FACTORS[key](H_i, equilibrium_consts, cell_id[i])
+                    for i, H_i in enumerate(H)
+                ],
+                rtol=1e-12,
+            )
+        assert (dissociation_factors["SO2"].to_ndarray() > 1).all()
@@ -203,10 +203,74 @@ class TestCollisionMethods:
         np.testing.assert_array_almost_equal(_gamma.to_ndarray(), expected_gamma)
         np.testing.assert_array_equal(_n_substep, np.asarray(expected_n_substep))
 
+    @staticmethod
+    @pytest.mark.parametrize("n_cell", (1, 7, 100))
+    # pylint: disable=too-many-locals
+    def test_scale_prob_for_adaptive_sdm_gamma_matches_serial_reduction(n_cell):
+        # Arrange
+        backend = CPU()
+        rng = np.random.default_rng(seed=44)
+        n_sd = 2000
+        cell_id = np.sort(rng.integers(0, n_cell, size=n_sd))
+        is_first_in_pair = np.zeros(n_sd, dtype=bool)
+        for cid in range(n_cell):
+            (in_cell,) = np.nonzero(cell_id == cid)
+            is_first_in_pair[in_cell[: 2 * (len(in_cell) // 2) : 2]] = True
+        multiplicity = rng.integers(1, 100, size=n_sd)
+        gamma = rng.uniform(0, 50, size=n_sd // 2) * (rng.uniform(size=n_sd // 2) > 0.1)
+        dt, dt_range = 10.0, (0.1, 5.0)
+        dt_left = np.full(n_cell, dt)
+        dt_min = np.full(n_cell, dt)
+
+        _gamma = backend.Storage.from_ndarray(gamma.copy())
+        _idx = make_Index(backend).from_ndarray(np.arange(n_sd))
+        _multiplicity = make_IndexedStorage(backend).from_ndarray(_idx, multiplicity)
+        _cell_id = backend.Storage.from_ndarray(cell_id)
+        _dt_left = backend.Storage.from_ndarray(dt_left.copy())
+        _is_first_in_pair = make_PairIndicator(backend)(n_sd)
+        _is_first_in_pair.indicator[:] = is_first_in_pair
+        _n_substep = backend.Storage.from_ndarray(np.zeros(n_cell, dtype=int))
+        _dt_min = backend.Storage.from_ndarray(dt_min.copy())
+
+        expected_dt_todo = np.minimum(dt_left, dt_range[1])
+        expected_dt_min = dt_min.copy()
+        for i, prob in enumerate(gamma):
+            j, k, skip_pair = pair_indices(i, np.arange(n_sd), is_first_in_pair, gamma)
+            if skip_pair:
+                continue
+            dt_optimal = max(
+                dt * (multiplicity[j] // multiplicity[k]) / prob, dt_range[0]
+            )
+            expected_dt_todo[cell_id[j]] = min(expected_dt_todo[cell_id[j]], dt_optimal)
+            expected_dt_min[cell_id[j]] = min(expected_dt_min[cell_id[j]], dt_optimal)
+
+        # Act
+        backend.scale_prob_for_adaptive_sdm_gamma(
+            prob=_gamma,
+            multiplicity=_multiplicity,
+            cell_id=_cell_id,
+            dt_left=_dt_left,
+            dt=dt,
+            dt_range=dt_range,
+            is_first_in_pair=_is_first_in_pair,
+            stats_n_substep=_n_substep,
+            stats_dt_min=_dt_min,
+        )
+
+        # Assert
+        np.testing.assert_array_equal(_dt_min.to_ndarray(), expected_dt_min)
+        np.testing.assert_array_equal(_dt_left.to_ndarray(), dt_left - expected_dt_todo)
+        np.testing.assert_array_equal(_n_substep.to_ndarray(), np.ones(n_cell))
+
     @staticmethod
     @pytest.mark.parametrize(
         "backend_class, scheme",
-        ((CPU, "counting_sort"), (CPU, "counting_sort_parallel"), (GPU, "default")),
+        (
+            (CPU, "counting_sort"),
+            (CPU, "counting_sort_parallel"),
+            (CPU, "incremental"),
+            (GPU, "default"),
+        ),
     )
     def test_cell_caretaker(backend_class, scheme):
         # Arrange
@@ -236,6 +300,51 @@ class TestCollisionMethods:
         # Assert
         assert all(cell_start.to_ndarray()[:] == np.array([0, 3]))
 
+    @staticmethod
+    @pytest.mark.parametrize("moved_fraction", (0, 0.01, 0.2, 0.5))
+    @pytest.mark.parametrize("global_shuffle", (False, True))
+    # pylint: disable=too-many-locals
+    def test_incremental_cell_caretaker_matches_counting_sort(
+        moved_fraction, global_shuffle
+    ):
+        # Arrange
+        backend = CPU()
+        rng = np.random.default_rng(seed=44)
+        n_sd, n_cell = 1000, 16
+        cell_id_data = rng.integers(0, n_cell, size=n_sd)
+
+        idx = make_Index(backend).identity_index(n_sd)
+        cell_id = make_IndexedStorage(backend).from_ndarray(idx, cell_id_data)
+        cell_idx = make_Index(backend).identity_index(n_cell)
+        cell_start = backend.Storage.from_ndarray(np.zeros(n_cell + 1, dtype=int))
+        sut = backend.make_cell_caretaker(
+            idx.shape, idx.dtype, len(cell_start), scheme="incremental"
+        )
+        sut(cell_id, cell_idx, cell_start, idx)
+
+        moved = rng.random(n_sd) < moved_fraction
+        cell_id_data[moved] = rng.integers(0, n_cell, size=np.count_nonzero(moved))
+        cell_id.upload(cell_id_data)
+        if global_shuffle:
+            idx.shuffle(backend.Storage.from_ndarray(rng.uniform(size=n_sd)))
+
+        # Act
+        sut(cell_id, cell_idx, cell_start, idx)
+
+        # Assert
+        actual_idx = idx.to_ndarray()
+        actual_cell_start = cell_start.to_ndarray()
+        np.testing.assert_array_equal(
+            actual_cell_start,
+            np.concatenate(
+                ((0,), np.cumsum(np.bincount(cell_id_data, minlength=n_cell)))
+            ),
+        )
+        assert sorted(actual_idx) == list(range(n_sd))
+        for cell in range(n_cell):
+            bucket = actual_idx[actual_cell_start[cell] : actual_cell_start[cell + 1]]
+            assert (cell_id_data[bucket] == cell).all()
+
     @staticmethod
     @pytest.mark.parametrize(
         "gamma, permutation, multiplicity, cell_id, dt_left, dt, dt_max, is_first_in_pair, ",
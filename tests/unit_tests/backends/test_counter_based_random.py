@@ -0,0 +1,210 @@
+# pylint: disable=missing-module-docstring,missing-class-docstring,missing-function-docstring
+import numpy as np
+import pytest
+
+from PySDM import Builder
+from PySDM.backends import CPU
+from PySDM.backends.impl_numba.random import (
+    CounterBasedRandom,
+    philox4x32_10,
+    philox_uniform,
+    uniform_at,
+)
+from PySDM.backends.impl_numba.storage import Storage
+from PySDM.dynamics import Breakup, Coalescence, Seeding
+from PySDM.dynamics.collisions.breakup_fragmentations import ExponFrag
+from PySDM.dynamics.collisions.collision_kernels import Golovin
+from PySDM.environments import Box
+from PySDM.physics import si
+
+SEED = 44
+SIZE = 1001
+
+
+def _draw(sut, size=SIZE):
+    storage = Storage.empty(size, dtype=float)
+    storage.urand(sut)
+    return storage.to_ndarray()
+
+
+class TestCounterBasedRandom:
+    @staticmethod
+    @pytest.mark.parametrize(
+        "counter, key, expected",
+        (  # Random123 known-answer tests (kat_vectors)
+            (
+                (0, 0, 0, 0),
+                (0, 0),
+                (0x6627E8D5, 0xE169C58D, 0xBC57AC4C, 0x9B00DBD8),
+            ),
+            (
+                (0xFFFFFFFF,) * 4,
+                (0xFFFFFFFF,) * 2,
+                (0x408F276D, 0x41C83B0E, 0xA20BC7C6, 0x6D5451FD),
+            ),
+            (
+                (0x243F6A88, 0x85A308D3, 0x13198A2E, 0x03707344),
+                (0xA4093822, 0x299F31D0),
+                (0xD16CFE09, 0x94FDCCEB, 0x5001E420, 0x24126EA1),
+            ),
+        ),
+    )
+    def test_philox_known_answers(counter, key, expected):
+        # act
+        actual = philox4x32_10(
+            tuple(np.uint64(c) for c in counter), tuple(np.uint64(k) for k in key)
+        )
+
+        # assert
+        assert tuple(int(x) for x in actual) == expected
+
+    @staticmethod
+    def test_independent_of_parallelism():
+        # act
+        serial = _draw(CounterBasedRandom(SIZE, SEED, parallel=False))
+        parallel = _draw(CounterBasedRandom(SIZE, SEED, parallel=True))
+
+        # assert
+        np.testing.assert_array_equal(serial, parallel)
+
+    @staticmethod
+    def test_uniform():
+        # act
+        u01 = _draw(CounterBasedRandom(10**6, SEED), size=10**6)
+
+        # assert
+        assert 0 <= u01.min() < u01.max() < 1
+        np.testing.assert_allclose(u01.mean(), 0.5, atol=1e-3)
+        np.testing.assert_allclose(
+            np.histogram(u01, bins=10, range=(0, 1))[0], 10**5, rtol=1e-2
+        )
+
+    @staticmethod
+    def test_streams_and_steps_independent():
+        # arrange
+        sut = CounterBasedRandom(SIZE, SEED, "a")
+
+        # act
+        step_0 = _draw(sut)
+        step_1 = _draw(sut)
+        other_stream = _draw(CounterBasedRandom(SIZE, SEED, "b"))
+        other_seed = _draw(CounterBasedRandom(SIZE, SEED + 1, "a"))
+
+        # assert
+        for other in (step_1, other_stream, other_seed):
+            assert abs(np.corrcoef(step_0, other)[0, 1]) < 0.1
+        np.testing.assert_array_equal(
+            _draw(CounterBasedRandom(SIZE, SEED, "a")), step_0
+        )
+
+    @staticmethod
+    def test_sequence_not_affected_by_other_streams():
+        # arrange
+        sut = CounterBasedRandom(SIZE, SEED, "a")
+        other = CounterBasedRandom(SIZE, SEED, "b")
+
+        # act
+        expected = _draw(CounterBasedRandom(SIZE, SEED, "a"))
+        _draw(other)
+        actual = _draw(sut)
+
+        # assert
+        np.testing.assert_array_equal(actual, expected)
+
+    @staticmethod
+    @pytest.mark.parametrize("size", (SIZE, SIZE - 1))
+    def test_philox_uniform_matches_drawn_array(size):
+        # arrange
+        sut = CounterBasedRandom(size, SEED, "stream")
+        _draw(sut, size)
+
+        # act
+        drawn = _draw(sut, size)
+        elementwise = [
+            philox_uniform(sut.key, sut.stream_id, 1, i) for i in range(size)
+        ]
+
+        # assert
+        np.testing.assert_array_equal(drawn, elementwise)
+
+    @staticmethod
+    @pytest.mark.parametrize("offset", (0, 3))
+    def test_in_kernel_uniforms_match_drawn_array(offset):
+        # arrange
+        sut = CounterBasedRandom(SIZE, SEED, "stream")
+        drawn = _draw(CounterBasedRandom(SIZE, SEED, "stream"))
+
+        # act
+        in_kernel = sut.draw_in_kernel()[offset:]
+        elementwise = [uniform_at(in_kernel.data, i) for i in range(SIZE - offset)]
+
+        # assert
+        assert sut.step == 1
+        np.testing.assert_array_equal(elementwise, drawn[offset:])
+
+    @staticmethod
+    def test_backend_flag():
+        # arrange
+        backend = CPU(counter_based_random=True)
+
+        # act
+        sut = backend.Random(SIZE, SEED, "stream")
+
+        # assert
+        assert isinstance(sut, CounterBasedRandom)
+        assert not isinstance(CPU().Random(SIZE, SEED), CounterBasedRandom)
+        np.testing.assert_array_equal(
+            _draw(sut), _draw(CounterBasedRandom(SIZE, SEED, "stream"))
+        )
+
+    @staticmethod
+    def test_co_registered_dynamics_draw_different_numbers():
+        # arrange
+        n_sd = 64
+        builder = Builder(
+            n_sd=n_sd,
+            backend=CPU(counter_based_random=True),
+            environment=Box(dt=1 * si.s, dv=1 * si.m**3),
+            dynamics=(
+                Breakup(
+                    collision_kernel=Golovin(b=1500 / si.s),
+                    fragmentation_function=ExponFrag(scale=(50 * si.um) ** 3),
+                ),
+                Seeding(
+                    super_droplet_injection_rate=lambda time: 0,
+                    seeded_particle_multiplicity=[1] * n_sd,
+                    seeded_particle_extensive_attributes={
+                        "signed water mass": [0.001 * si.ng] * n_sd
+                    },
+                ),
+            ),
+        )
+        particulator = builder.build(
+            attributes={
+                "volume": np.full(n_sd, si.um**3),
+                "multiplicity": np.ones(n_sd),
+            }
+        )
+        breakup = particulator.dynamics["Collision"]
+        seeding = particulator.dynamics["Seeding"]
+        seeding.post_register_setup_when_attributes_are_known()
+        coalescence = Coalescence(collision_kernel=Golovin(b=1500 / si.s))
+        coalescence.register(builder)
+
+        # act
+        generators = (
+            breakup.rnd_opt_coll.rnd,
+            breakup.rnd_opt_proc.rnd,
+            breakup.rnd_opt_frag.rnd,
+            coalescence.rnd_opt_coll.rnd,
+            seeding.rnd,
+        )
+        draws = [_draw(generator, n_sd) for generator in generators]
+
+        # assert
+        assert len({generator.stream_id for generator in generators}) == len(
+            generators
+        )
+        for i, draw in enumerate(draws):
+            for other in draws[i + 1 :]:
+                assert (draw != other).all()
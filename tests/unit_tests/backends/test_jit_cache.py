@@ -0,0 +1,314 @@
+# pylint: disable=missing-module-docstring,missing-class-docstring,missing-function-docstring
+import numba
+import numpy as np
+import pytest
+
+from PySDM import Builder, Formulae
+from PySDM.backends import GPU, Numba
+from PySDM.backends.impl_numba import jit_cache
+from PySDM.backends.impl_numba.jit_cache import JITCache, JITCacheStats, formulae_key
+from PySDM.backends.impl_numba.random import uniform_at
+from PySDM.dynamics import Coalescence
+from PySDM.dynamics.collisions.collision_kernels import (
+    Electric,
+    Geometric,
+    Golovin,
+    Hydrodynamic,
+    Long1974,
+)
+from PySDM.environments import Box
+from PySDM.products import ParticleConcentration
+
+
+def _compute_identity_index(backend):
+    idx = backend.Storage.from_ndarray(np.zeros(10, dtype=int))
+    backend.identity_index(idx.data)
+    return idx.to_ndarray()
+
+
+def _helper(x):
+    return x + 1
+
+
+def _kernel_with_python_callee(x):
+    return _helper(x)
+
+
+def _kernel_with_overloaded_callee(u01):
+    return uniform_at(u01, 0)
+
+
+_UNSUPPORTED_GLOBAL = {"a": 1}
+
+
+def _kernel_with_unsupported_global(x):
+    return x + _UNSUPPORTED_GLOBAL["a"]
+
+
+def _cache_key(sut, func):
+    dispatcher = numba.njit(func)
+    assert sut.enable(dispatcher)
+    return dispatcher._cache.key  # pylint: disable=protected-access
+
+
+def _compiled_signatures(backend):
+    return {
+        name: tuple(value.signatures)
+        for name, value in vars(backend).items()
+        if hasattr(value, "signatures")
+    }
+
+
+def _build_box_coalescence(backend, warm_up=False, collision_kernel=None):
+    n_sd = 16
+    builder = Builder(
+        n_sd=n_sd,
+        backend=backend,
+        environment=Box(dt=1, dv=1),
+        dynamics=(
+            Coalescence(collision_kernel=collision_kernel or Golovin(b=1.5e3)),
+        ),
+    )
+    return builder.build(
+        attributes={
+            "multiplicity": np.full(n_sd, 1e6),
+            "volume": np.full(n_sd, 1e-15),
+        },
+        products=(ParticleConcentration(),),
+        warm_up=warm_up,
+    )
+
+
+class TestJITCache:
+    @staticmethod
+    def test_formulae_key():
+        # arrange
+        key = formulae_key(Formulae())
+
+        # act
+        same_key = formulae_key(Formulae(seed=44))
+        other_constants_key = formulae_key(Formulae(constants={"rho_w": 1}))
+        other_component_key = formulae_key(
+            Formulae(saturation_vapour_pressure="AugustRocheMagnus")
+        )
+        other_tabulation_key = formulae_key(
+            Formulae(tabulate={"latent_heat_vapourisation__lv": (250, 300, 10)})
+        )
+
+        # assert
+        assert key == same_key
+        assert key not in (
+            other_constants_key,
+            other_component_key,
+            other_tabulation_key,
+        )
+
+    @staticmethod
+    def test_cache_reused_across_backend_instances(tmp_path):
+        if numba.config.DISABLE_JIT:  # pylint: disable=no-member
+            pytest.skip()
+
+        # arrange
+        sut = Numba(jit_cache=str(tmp_path))
+        np.testing.assert_array_equal(_compute_identity_index(sut), np.arange(10))
+        assert sut.jit_cache.summary == JITCacheStats(hits=0, misses=1)
+
+        # act
+        sut = Numba(jit_cache=str(tmp_path))
+        result = _compute_identity_index(sut)
+
+        # assert
+        np.testing.assert_array_equal(result, np.arange(10))
+        assert sut.jit_cache.stats == {
+            "identity_index": JITCacheStats(hits=1, misses=0)
+        }
+
+    @staticmethod
+    def test_cache_not_shared_between_formulae(tmp_path):
+        if numba.config.DISABLE_JIT:  # pylint: disable=no-member
+            pytest.skip()
+
+        # arrange
+        _compute_identity_index(Numba(jit_cache=str(tmp_path)))
+
+        # act
+        sut = Numba(Formulae(constants={"rho_w": 1}), jit_cache=str(tmp_path))
+        _compute_identity_index(sut)
+
+        # assert
+        assert sut.jit_cache.summary == JITCacheStats(hits=0, misses=1)
+
+    @staticmethod
+    def test_no_cache_by_default():
+        assert Numba().jit_cache is None
+
+    @staticmethod
+    def test_warm_up_compiles_declared_kernels():
+        if numba.config.DISABLE_JIT:  # pylint: disable=no-member
+            pytest.skip()
+
+        # arrange
+        backend = Numba()
+
+        # act
+        particulator = _build_box_coalescence(backend, warm_up=True)
+
+        # assert
+        warmed_up = _compiled_signatures(backend)
+        assert "_collision_coalescence_body" in warmed_up
+        particulator.run(1)
+        assert _compiled_signatures(backend) == warmed_up
+
+    @staticmethod
+    @pytest.mark.parametrize(
+        "collision_kernel, kernel_body",
+        (
+            (Geometric(), "_geometric_collision_kernel_body"),
+            (Hydrodynamic(), "_parameterized_collision_kernel_body"),
+            (Electric(), "_parameterized_collision_kernel_body"),
+            (Long1974(), "_long1974_collision_kernel_body"),
+        ),
+    )
+    def test_warm_up_compiles_fused_collision_kernels(collision_kernel, kernel_body):
+        if numba.config.DISABLE_JIT:  # pylint: disable=no-member
+            pytest.skip()
+
+        # arrange
+        backend = Numba()
+
+        # act
+        particulator = _build_box_coalescence(
+            backend, warm_up=True, collision_kernel=collision_kernel
+        )
+
+        # assert
+        warmed_up = _compiled_signatures(backend)
+        assert len(warmed_up.get(kernel_body, ())) == 1
+        particulator.run(1)
+        assert _compiled_signatures(backend)[kernel_body] == warmed_up[kernel_body]
+
+    @staticmethod
+    def test_warm_up_with_manifest(tmp_path):
+        if numba.config.DISABLE_JIT:  # pylint: disable=no-member
+            pytest.skip()
+
+        # arrange
+        particulator = _build_box_coalescence(Numba(jit_cache=str(tmp_path)))
+        particulator.run(1)
+        particulator.save_jit_manifest()
+        backend = Numba(jit_cache=str(tmp_path))
+
+        # act
+        particulator = _build_box_coalescence(backend, warm_up=True)
+
+        # assert
+        warmed_up = backend.jit_cache.summary
+        assert warmed_up.hits > 0 and warmed_up.misses == 0
+        particulator.run(1)
+        assert backend.jit_cache.summary == warmed_up
+
+    @staticmethod
+    def test_warm_up_requires_numba_backend():
+        with pytest.raises(NotImplementedError, match="Numba"):
+            _build_box_coalescence(GPU(), warm_up=True)
+
+    @staticmethod
+    def test_manifest_not_written_by_run(tmp_path):
+        # arrange
+        particulator = _build_box_coalescence(Numba(jit_cache=str(tmp_path)))
+
+        # act
+        particulator.run(1)
+
+        # assert
+        assert not tuple(tmp_path.glob("manifest-*.pkl"))
+
+    @staticmethod
+    def test_save_jit_manifest_requires_jit_cache():
+        with pytest.raises(ValueError):
+            _build_box_coalescence(Numba()).save_jit_manifest()
+
+    @staticmethod
+    def test_manifest_written_only_when_changed(tmp_path):
+        if numba.config.DISABLE_JIT:  # pylint: disable=no-member
+            pytest.skip()
+
+        # arrange
+        particulator = _build_box_coalescence(Numba(jit_cache=str(tmp_path)))
+        particulator.run(1)
+        particulator.save_jit_manifest()
+        (manifest,) = tmp_path.glob("manifest-*.pkl")
+        manifest.unlink()
+
+        # act
+        particulator.run(1)
+        particulator.save_jit_manifest()
+
+        # assert
+        assert not manifest.exists()
+
+    @staticmethod
+    def test_key_covers_python_callees(tmp_path, monkeypatch):
+        if numba.config.DISABLE_JIT:  # pylint: disable=no-member
+            pytest.skip()
+
+        # arrange
+        sut = JITCache(str(tmp_path), Formulae())
+        key = _cache_key(sut, _kernel_with_python_callee)
+
+        # act
+        monkeypatch.setitem(globals(), "_helper", lambda x: x + 2)
+
+        # assert
+        assert _cache_key(sut, _kernel_with_python_callee) != key
+
+    @staticmethod
+    def test_key_covers_sources_of_overloaded_callees(tmp_path, monkeypatch):
+        if numba.config.DISABLE_JIT:  # pylint: disable=no-member
+            pytest.skip()
+
+        # arrange
+        sut = JITCache(str(tmp_path), Formulae())
+        key = _cache_key(sut, _kernel_with_overloaded_callee)
+        module_digest = jit_cache._module_digest  # pylint: disable=protected-access
+
+        # act
+        monkeypatch.setattr(
+            jit_cache,
+            "_module_digest",
+            lambda name: module_digest(name)
+            + ("edited" if name == uniform_at.__module__ else ""),
+        )
+
+        # assert
+        assert _cache_key(sut, _kernel_with_overloaded_callee) != key
+
+    @staticmethod
+    def test_unsupported_global_not_cached(tmp_path):
+        if numba.config.DISABLE_JIT:  # pylint: disable=no-member
+            pytest.skip()
+
+        # arrange
+        sut = JITCache(str(tmp_path), Formulae())
+
+        # act
+        enabled = sut.enable(numba.njit(_kernel_with_unsupported_global))
+
+        # assert
+        assert not enabled
+        assert not sut.kernels
+
+    @staticmethod
+    def test_untested_numba_version_not_cached(tmp_path, monkeypatch):
+        if numba.config.DISABLE_JIT:  # pylint: disable=no-member
+            pytest.skip()
+
+        # arrange
+        monkeypatch.setattr(numba, "__version__", "1.0.0")
+
+        # act
+        with pytest.warns(UserWarning, match="JIT cache disabled"):
+            sut = JITCache(str(tmp_path), Formulae())
+
+        # assert
+        assert not sut.enable(numba.njit(_kernel_with_python_callee))
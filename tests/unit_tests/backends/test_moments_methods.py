@@ -3,6 +3,7 @@ import numpy as np
 import pytest
 
 from PySDM import Formulae
+from PySDM.backends import CPU
 
 
 @pytest.mark.parametrize(
@@ -27,7 +28,8 @@ def test_moments_range(backend_class, min_x, max_x, value, expected):
 
     kw_args = {
         "multiplicity": arr(1),
-        "attr_data": arr(0),
+        "attr_data": (arr(0),),
+        "attr_index": arr(0),
         "cell_id": arr(0),
         "idx": arr(0),
         "length": 1,
@@ -45,3 +47,89 @@ def test_moments_range(backend_class, min_x, max_x, value, expected):
 
     # Assert
     assert moment_0.to_ndarray()[:] == moments.to_ndarray()[:] == expected
+
+
+@pytest.mark.parametrize("n_cell", (1, 5))
+@pytest.mark.parametrize("private_histograms", (True, False))
+@pytest.mark.parametrize("cell_sorted", (True, False))
+# pylint: disable=too-many-locals,too-many-arguments
+def test_spectrum_moments_match_linear_search(
+    backend_class, n_cell, private_histograms, cell_sorted, monkeypatch
+):
+    # Arrange
+    backend = backend_class(Formulae(), double_precision=True)
+    if not private_histograms:
+        if not hasattr(backend, "_spectrum_moments_spans"):
+            pytest.skip("Numba-only option")
+        monkeypatch.setattr(
+            backend,
+            "_spectrum_moments_spans",
+            lambda **_: np.empty((0, 2), dtype=np.int64),
+        )
+    rng = np.random.default_rng(seed=44)
+    n_sd = 1000
+    x_bins = np.linspace(0, 1, 129)
+    x_attr = rng.uniform(-0.1, 1.1, size=n_sd)
+    x_attr[:10] = x_bins[rng.integers(0, len(x_bins), size=10)]
+    multiplicity = rng.integers(1, 100, size=n_sd)
+    attr_data = rng.uniform(size=n_sd)
+    cell_id = rng.integers(0, n_cell, size=n_sd)
+    idx = np.argsort(cell_id, kind="stable") if cell_sorted else rng.permutation(n_sd)
+
+    expected_moment_0 = np.zeros((len(x_bins) - 1, n_cell))
+    expected_moments = np.zeros_like(expected_moment_0)
+    for i in idx:
+        for k in range(len(x_bins) - 1):
+            if x_bins[k] <= x_attr[i] < x_bins[k + 1]:
+                expected_moment_0[k, cell_id[i]] += multiplicity[i]
+                expected_moments[k, cell_id[i]] += multiplicity[i] * attr_data[i] ** 2
+    expected_moments = np.divide(
+        expected_moments,
+        expected_moment_0,
+        out=np.zeros_like(expected_moments),
+        where=expected_moment_0 != 0,
+    )
+
+    moment_0 = backend.Storage.from_ndarray(np.full(expected_moment_0.shape, np.nan))
+    moments = backend.Storage.from_ndarray(np.full(expected_moments.shape, np.nan))
+
+    # Act
+    backend.spectrum_moments(
+        moment_0=moment_0,
+        moments=moments,
+        multiplicity=backend.Storage.from_ndarray(multiplicity),
+        attr_data=backend.Storage.from_ndarray(attr_data),
+        cell_id=backend.Storage.from_ndarray(cell_id),
+        idx=backend.Storage.from_ndarray(idx),
+        length=n_sd,
+        rank=2,
+        x_bins=backend.Storage.from_ndarray(x_bins),
+        x_attr=backend.Storage.from_ndarray(x_attr),
+        weighting_attribute=backend.Storage.from_ndarray(np.ones(n_sd)),
+        weighting_rank=0,
+    )
+
+    # Assert
+    np.testing.assert_array_equal(moment_0.to_ndarray(), expected_moment_0)
+    np.testing.assert_allclose(moments.to_ndarray(), expected_moments, rtol=1e-12)
+
+
+@pytest.mark.parametrize("n_chunks", (1, 3, 8))
+def test_spectrum_moments_cell_spans_of_cell_sorted_droplets(n_chunks):
+    # Arrange
+    n_cell, n_sd = 64 * 64, 10000
+    rng = np.random.default_rng(seed=44)
+    cell_id = rng.integers(0, n_cell, size=n_sd)
+    idx = np.argsort(cell_id, kind="stable")
+
+    # Act
+    spans = CPU()._spectrum_moments_cell_spans(  # pylint: disable=protected-access
+        cell_id, idx, n_sd, n_chunks
+    )
+
+    # Assert
+    assert spans.shape == (n_chunks, 2)
+    for t, (lo, hi) in enumerate(spans):
+        chunk = cell_id[idx[t * n_sd // n_chunks : (t + 1) * n_sd // n_chunks]]
+        assert (lo, hi) == (chunk.min(), chunk.max())
+    assert np.sum(spans[:, 1] - spans[:, 0] + 1) <= n_cell + n_chunks - 1
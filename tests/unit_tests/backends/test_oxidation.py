@@ -42,10 +42,8 @@ volume = PI_4_3 * (1 * si.um) ** 3
 pH = 5.0
 n_sd = 1
 eqc = {
-    k: Storage.from_ndarray(
-        np.full(n_sd, equilibrium_consts.EQUILIBRIUM_CONST[k].at(T_STP))
-    )
-    for k in ("K_HSO3", "K_SO2")
+    k: Storage.from_ndarray(np.full(n_sd, const.at(T_STP)))
+    for k, const in equilibrium_consts.EQUILIBRIUM_CONST.items()
 }
 cell_ids = Storage.from_ndarray(np.zeros(n_sd, dtype=int))
 H = formulae.trivia.pH2H(pH)
@@ -9,7 +9,7 @@ from PySDM.initialisation.spectra.lognormal import Lognormal
 from ...dummy_particulator import DummyParticulator
 
 
-@pytest.mark.parametrize("croupier", ["local", "global"])
+@pytest.mark.parametrize("croupier", ["local", "global", "global_parallel"])
 def test_final_state(croupier, backend_class):
     if backend_class is ThrustRTC:
         pytest.skip("TODO #330")
@@ -43,7 +43,11 @@ def test_final_state(croupier, backend_class):
 
     # Act
     u01 = backend_class.Storage.from_ndarray(np.random.random(n_sd))
-    particulator.attributes.permutation(u01, local=particulator.croupier == "local")
+    particulator.attributes.permutation(
+        u01,
+        local=particulator.croupier == "local",
+        parallel=particulator.croupier == "global_parallel",
+    )
     _ = particulator.attributes.cell_start
 
     # Assert
@@ -0,0 +1,102 @@
+# pylint: disable=missing-module-docstring,missing-class-docstring,missing-function-docstring
+import numpy as np
+import pytest
+
+from PySDM import Builder
+from PySDM.backends import CPU
+from PySDM.dynamics import Breakup, Coalescence, Collision
+from PySDM.dynamics.collisions.breakup_efficiencies import ConstEb
+from PySDM.dynamics.collisions.breakup_fragmentations import ExponFrag
+from PySDM.dynamics.collisions.coalescence_efficiencies import ConstEc
+from PySDM.dynamics.collisions.collision_kernels import Golovin
+from PySDM.environments import Box
+from PySDM.initialisation.sampling.spectral_sampling import ConstantMultiplicity
+from PySDM.initialisation.spectra import Exponential
+from PySDM.physics import si
+
+N_SD = 2**8
+N_STEPS = 10
+
+
+def _dynamic(name, **kwargs):
+    if name == "Coalescence":
+        return Coalescence(collision_kernel=Golovin(b=1500 / si.s), **kwargs)
+    if name == "Breakup":
+        return Breakup(
+            collision_kernel=Golovin(b=1500 / si.s),
+            fragmentation_function=ExponFrag(scale=(50 * si.um) ** 3),
+            **kwargs,
+        )
+    return Collision(
+        collision_kernel=Golovin(b=1500 / si.s),
+        coalescence_efficiency=ConstEc(Ec=0.5),
+        breakup_efficiency=ConstEb(Eb=1),
+        fragmentation_function=ExponFrag(scale=(50 * si.um) ** 3),
+        **kwargs,
+    )
+
+
+def _run(dynamic, backend=None):
+    builder = Builder(
+        n_sd=N_SD,
+        backend=backend or CPU(counter_based_random=True),
+        environment=Box(dt=1 * si.s, dv=1 * si.m**3),
+        dynamics=(dynamic,),
+    )
+    volume, multiplicity = ConstantMultiplicity(
+        Exponential(norm_factor=2**23 / si.m**3, scale=(30 * si.um) ** 3)
+    ).sample_deterministic(N_SD)
+    particulator = builder.build(
+        attributes={"volume": volume, "multiplicity": multiplicity}
+    )
+    particulator.run(steps=N_STEPS)
+    return particulator
+
+
+class TestInKernelRandom:
+    @staticmethod
+    @pytest.mark.parametrize("name", ("Coalescence", "Breakup", "Collision"))
+    @pytest.mark.parametrize(
+        "kwargs",
+        (
+            {},
+            {"croupier": "global"},
+            {"croupier": "global_parallel"},
+            {"optimized_random": True},
+            {"adaptive": False, "substeps": 2},
+        ),
+    )
+    def test_same_as_buffered(name, kwargs):
+        # act
+        buffered = _run(_dynamic(name, **kwargs))
+        in_kernel = _run(_dynamic(name, in_kernel_random=True, **kwargs))
+
+        # assert
+        assert in_kernel.attributes.super_droplet_count == N_SD
+        for attr in ("multiplicity", "water mass"):
+            np.testing.assert_array_equal(
+                in_kernel.attributes[attr].to_ndarray(),
+                buffered.attributes[attr].to_ndarray(),
+            )
+        assert (
+            buffered.attributes["multiplicity"].to_ndarray() != N_SD * [2**15]
+        ).any()
+
+    @staticmethod
+    def test_no_buffers_allocated():
+        # act
+        particulator = _run(_dynamic("Collision", in_kernel_random=True))
+
+        # assert
+        sut = particulator.dynamics["Collision"]
+        for optimizer in (sut.rnd_opt_coll, sut.rnd_opt_proc):
+            assert optimizer.in_kernel
+        assert not isinstance(sut.rnd_opt_coll.pairs_rand, particulator.Storage)
+        assert not isinstance(sut.rnd_opt_coll.rand, particulator.Storage)
+        assert not isinstance(sut.rnd_opt_proc.rand, particulator.Storage)
+        assert isinstance(sut.rnd_opt_frag.rand, particulator.Storage)
+
+    @staticmethod
+    def test_raises_without_counter_based_random():
+        with pytest.raises(ValueError, match="counter-based"):
+            _run(_dynamic("Coalescence", in_kernel_random=True), backend=CPU())
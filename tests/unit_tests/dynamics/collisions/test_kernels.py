@@ -5,12 +5,65 @@ import pytest
 from PySDM import Builder
 from PySDM.backends import CPU
 from PySDM.dynamics.collisions.collision_kernels import (
+    Electric,
+    Geometric,
     Golovin,
-    SimpleGeometric,
+    Hydrodynamic,
+    Linear,
     Long1974,
+    SimpleGeometric,
 )
 from PySDM.environments import Box
 from PySDM.formulae import Formulae
+from PySDM.physics import si
+
+RADII = np.asarray([10, 12, 1, 30, 500, 45, 0, 0, 800, 800]) * si.um
+
+
+def _evaluate(kernel, backend_class):
+    builder = Builder(
+        backend=backend_class(double_precision=True),
+        n_sd=RADII.size,
+        environment=Box(dv=None, dt=None),
+    )
+    kernel.register(builder)
+    builder.request_attribute("relative fall velocity")
+    particulator = builder.build(
+        attributes={
+            "volume": builder.formulae.trivia.volume(radius=RADII),
+            "multiplicity": np.ones_like(RADII),
+        }
+    )
+    output = particulator.PairwiseStorage.from_ndarray(np.full(RADII.size // 2, -1.0))
+    is_first_in_pair = particulator.PairIndicator(length=RADII.size)
+    is_first_in_pair.indicator = particulator.Storage.from_ndarray(
+        np.arange(RADII.size) % 2 == 0
+    )
+    kernel(output, is_first_in_pair=is_first_in_pair)
+    pairs = {
+        key: particulator.attributes[key].to_ndarray().reshape(-1, 2)
+        for key in ("radius", "volume", "relative fall velocity")
+    }
+    return output.to_ndarray(), pairs, particulator, is_first_in_pair
+
+
+def _geometric(pairs, efficiency=1.0):
+    return (
+        efficiency
+        * np.pi
+        * pairs["radius"].sum(axis=1) ** 2
+        * np.abs(np.diff(pairs["relative fall velocity"], axis=1)[:, 0])
+    )
+
+
+def _long1974(pairs, lin_coeff=5.78e3, sq_coeff=9.44e15, r_thres=5e-5):
+    v_lg = pairs["volume"].max(axis=1)
+    v_ratio = pairs["volume"].min(axis=1) / np.where(v_lg == 0, 1, v_lg)
+    return np.where(
+        pairs["radius"].max(axis=1) < r_thres,
+        sq_coeff * (1 + v_ratio**2) * v_lg**2,
+        lin_coeff * (1 + v_ratio) * v_lg,
+    )
 
 
 class TestKernels:
@@ -124,3 +177,49 @@ class TestKernels:
             np.testing.assert_array_less(output.to_ndarray(), [3.0e-9])
         else:
             np.testing.assert_array_less([3.0e-9], output.to_ndarray())
+
+    @staticmethod
+    @pytest.mark.parametrize(
+        "kernel, expected",
+        (
+            (Geometric(), _geometric),
+            (Geometric(collection_efficiency=0.5), lambda p: _geometric(p, 0.5)),
+            (Golovin(b=1.5e3), lambda p: 1.5e3 * p["volume"].sum(axis=1)),
+            (Linear(a=1e-3, b=2e3), lambda p: 1e-3 + 2e3 * p["volume"].sum(axis=1)),
+            (Long1974(), _long1974),
+        ),
+    )
+    def test_fused_kernels_against_pairwise_formulae(kernel, expected, backend_class):
+        # act
+        output, pairs, _, _ = _evaluate(kernel, backend_class)
+
+        # assert
+        np.testing.assert_allclose(output, expected(pairs), rtol=1e-12)
+        assert np.count_nonzero(output) >= 3
+
+    @staticmethod
+    @pytest.mark.parametrize("kernel_class", (Hydrodynamic, Electric))
+    def test_fused_parameterized_kernels(kernel_class, backend_class):
+        # act
+        output, pairs, particulator, is_first_in_pair = _evaluate(
+            kernel_class(), backend_class
+        )
+
+        # assert
+        efficiency = particulator.PairwiseStorage.empty(RADII.size // 2, dtype=float)
+        particulator.backend.linear_collection_efficiency(
+            params=kernel_class().params,
+            output=efficiency,
+            radii=particulator.attributes["radius"],
+            is_first_in_pair=is_first_in_pair,
+            unit=si.um,
+        )
+        np.testing.assert_allclose(
+            output,
+            efficiency.to_ndarray() ** 2
+            * np.pi
+            * pairs["radius"].max(axis=1) ** 2
+            * np.abs(np.diff(pairs["relative fall velocity"], axis=1)[:, 0]),
+            rtol=1e-12,
+        )
+        assert output[-1] == 0
@@ -11,7 +11,7 @@ from PySDM.initialisation.sampling.spatial_sampling import Pseudorandom
 from .conftest import get_dummy_particulator_and_coalescence
 
 
-class TestSDMMultiCell:  # pylint: disable=too-few-public-methods
+class TestSDMMultiCell:
     @staticmethod
     @pytest.mark.parametrize("n_sd", [2, 3, 8000])
     @pytest.mark.parametrize("adaptive", [False, True])
@@ -43,3 +43,56 @@ class TestSDMMultiCell:  # pylint: disable=too-few-public-methods
         np.testing.assert_array_equal(
             cell_id, particulator.attributes["cell id"].to_ndarray(raw=True)
         )
+
+    @staticmethod
+    def test_normalize_uses_cell_of_pair(backend_class):
+        if isinstance(backend_class(), ThrustRTC):
+            pytest.skip("TODO #330")
+
+        # Arrange
+        env = Box(dv=1, dt=1)
+        env.mesh = Mesh(grid=(2, 1), size=(2, 1))
+        particulator, _ = get_dummy_particulator_and_coalescence(
+            backend_class, n_length=8, environment=env
+        )
+        cell_id = np.asarray([1, 1, 1, 1, 1, 1, 0, 0])
+        particulator.build(
+            {
+                "multiplicity": np.ones_like(cell_id),
+                "volume": np.ones(8),
+                "cell id": cell_id,
+            }
+        )
+        prob = particulator.PairwiseStorage.from_ndarray(np.ones(4))
+        norm_factor = particulator.Storage.empty(2, dtype=float)
+
+        # Act
+        particulator.normalize(prob, norm_factor)
+
+        # Assert
+        np.testing.assert_array_equal(norm_factor.to_ndarray(), [1, 5])
+        np.testing.assert_array_equal(prob.to_ndarray(), [1, 5, 5, 5])
+
+    @staticmethod
+    def test_normalize_skips_pairs_of_removed_super_droplets(backend_class):
+        # Arrange
+        particulator, _ = get_dummy_particulator_and_coalescence(
+            backend_class, n_length=8, environment=Box(dv=1, dt=1)
+        )
+        particulator.build(
+            {
+                "multiplicity": np.asarray([1, 1, 1, 1, 1, 1, 0, 0]),
+                "volume": np.ones(8),
+            }
+        )
+        particulator.attributes.healthy = False
+        particulator.attributes.sanitize()
+        prob = particulator.PairwiseStorage.from_ndarray(np.ones(4))
+        norm_factor = particulator.Storage.empty(1, dtype=float)
+
+        # Act
+        particulator.normalize(prob, norm_factor)
+
+        # Assert
+        assert particulator.attributes.super_droplet_count == 6
+        np.testing.assert_array_equal(prob.to_ndarray(), [5, 5, 5, 1])
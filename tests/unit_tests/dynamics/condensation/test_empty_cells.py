@@ -0,0 +1,66 @@
+# pylint: disable=missing-module-docstring,missing-class-docstring,missing-function-docstring
+from collections import namedtuple
+
+import numpy as np
+
+from PySDM import Builder
+from PySDM.backends import CPU
+from PySDM.dynamics import AmbientThermodynamics, Condensation
+from PySDM.environments import Kinematic1D
+from PySDM.impl.mesh import Mesh
+from PySDM.physics import si
+
+NZ = 4
+
+
+class EulerianAdvection:
+    solvers = namedtuple(typename="_", field_names=("advectee",))(
+        advectee=np.full(NZ, 5 * si.g / si.kg)
+    )
+
+    def instantiate(self, *, builder):
+        assert builder
+        return self
+
+    def __call__(self):
+        pass
+
+
+def test_condensation_with_empty_cells():
+    # arrange
+    builder = Builder(
+        n_sd=2,
+        backend=CPU(),
+        environment=Kinematic1D(
+            dt=1 * si.s,
+            mesh=Mesh(grid=(NZ,), size=(NZ * 100 * si.m,)),
+            thd_of_z=lambda z: 0 * z + 300 * si.K,
+            rhod_of_z=lambda z: 0 * z + 1 * si.kg / si.m**3,
+        ),
+        dynamics=(AmbientThermodynamics(), EulerianAdvection(), Condensation()),
+    )
+    cell_attributes = {}
+    (
+        cell_attributes["cell id"],
+        cell_attributes["cell origin"],
+        cell_attributes["position in cell"],
+    ) = builder.particulator.environment.mesh.cellular_attributes(
+        positions=np.asarray([[0.25, 0.75]])
+    )
+    dry_volume = builder.formulae.trivia.volume(radius=np.full(2, 50 * si.nm))
+    particulator = builder.build(
+        attributes={
+            "multiplicity": np.full(2, 1e6),
+            "volume": builder.formulae.trivia.volume(radius=np.full(2, 1 * si.um)),
+            "dry volume": dry_volume,
+            "kappa times dry volume": 1.28 * dry_volume,
+            **cell_attributes,
+        }
+    )
+    assert set(particulator.attributes["cell id"].to_ndarray()) == {0}
+
+    # act
+    particulator.run(steps=1)
+
+    # assert
+    assert particulator.dynamics["Condensation"].success.all()
@@ -18,13 +18,19 @@ VOLUMES = (1.0, -1.0)
 class TestSedimentation:  # pylint: disable=too-few-public-methods
     @staticmethod
     @pytest.mark.parametrize("volume", [np.asarray((v,)) for v in VOLUMES])
-    def test_boundary_condition(backend_class, volume):
+    @pytest.mark.parametrize("substeps_per_cell", (False, True))
+    def test_boundary_condition(backend_class, volume, substeps_per_cell):
+        if substeps_per_cell and backend_class.__name__ != "Numba":
+            pytest.skip("Numba-only feature")
+
         # Arrange
         settings = DisplacementSettings(n_sd=len(volume), volume=volume)
         settings.dt = 1
         settings.sedimentation = True
         sut, particulator = settings.get_displacement(
-            backend_class, scheme="ImplicitInSpace"
+            backend_class,
+            scheme="ImplicitInSpace",
+            substeps_per_cell=substeps_per_cell,
         )
 
         particulator.attributes._ParticleAttributes__attributes[
@@ -0,0 +1,182 @@
+# pylint: disable=missing-module-docstring,missing-class-docstring,missing-function-docstring,protected-access
+import numpy as np
+import pytest
+
+from .displacement_settings import DisplacementSettings
+
+GRID = (6, 4)
+
+
+def _settings(courant_field, n_sd=200, seed=44):
+    rng = np.random.default_rng(seed)
+    settings = DisplacementSettings(n_sd=n_sd)
+    settings.grid = GRID
+    settings.courant_field_data = courant_field
+    settings.positions = [
+        list(rng.uniform(0, GRID[0], n_sd)),
+        list(rng.uniform(0.5, GRID[1] - 0.5, n_sd)),
+    ]
+    return settings
+
+
+def _courant_field(strong_column=None):
+    """divergence-free (in the interior) horizontally periodic field with a strong
+    updraft (and the associated horizontal convergence) at `strong_column`"""
+    c_x = np.zeros((GRID[0] + 1, GRID[1]))
+    c_z = np.zeros((GRID[0], GRID[1] + 1))
+    c_x[:, :] = 0.1
+    c_z[:, 1:-1] = 0.05
+    if strong_column is not None:
+        c_z[strong_column, 1:-1] = 0.45
+        c_x[strong_column, 1:-1] = -0.2
+        c_x[strong_column + 1, 1:-1] = 0.2
+    return c_x, c_z
+
+
+class _FallVelocity:  # pylint: disable=too-few-public-methods
+    def __init__(self, backend, values):
+        self.values = backend.Storage.from_ndarray(values)
+
+    def get(self):
+        return self.values
+
+
+class TestSubstepsPerCell:
+    @staticmethod
+    @pytest.mark.parametrize("strong_column", (None, 2))
+    def test_n_substeps_per_cell(backend_class, strong_column):
+        if backend_class.__name__ != "Numba":
+            pytest.skip("Numba-only feature")
+
+        # Arrange
+        settings = _settings(_courant_field(strong_column))
+
+        # Act
+        sut_global, _ = settings.get_displacement(backend_class, "ImplicitInSpace")
+        sut, _ = settings.get_displacement(
+            backend_class, "ImplicitInSpace", substeps_per_cell=True
+        )
+
+        # Assert
+        n_substeps = sut._n_substeps_per_cell.to_ndarray().reshape(GRID)
+        assert n_substeps.max() == sut_global._n_substeps == sut._n_substeps
+        if strong_column is not None:
+            far = n_substeps[strong_column + 3, :]
+            near = n_substeps[strong_column - 1 : strong_column + 2, :]
+            assert (far < n_substeps.max()).all()
+            assert (near == n_substeps.max()).all()
+
+    @staticmethod
+    def test_same_as_global_for_uniform_substeps(backend_class):
+        if backend_class.__name__ != "Numba":
+            pytest.skip("Numba-only feature")
+
+        # Arrange
+        settings = _settings(_courant_field())
+        sut_global, particulator_global = settings.get_displacement(
+            backend_class, "ImplicitInSpace"
+        )
+        sut, particulator = settings.get_displacement(
+            backend_class, "ImplicitInSpace", substeps_per_cell=True
+        )
+        assert (sut._n_substeps_per_cell.to_ndarray() == sut_global._n_substeps).all()
+
+        # Act
+        for _ in range(3):
+            sut_global()
+            sut()
+
+        # Assert
+        for attr in ("position in cell", "cell origin", "cell id"):
+            np.testing.assert_array_equal(
+                particulator.attributes[attr].to_ndarray(),
+                particulator_global.attributes[attr].to_ndarray(),
+            )
+
+    @staticmethod
+    def test_close_to_global_with_strong_updraft(backend_class):
+        if backend_class.__name__ != "Numba":
+            pytest.skip("Numba-only feature")
+
+        # Arrange
+        settings = _settings(_courant_field(strong_column=2))
+        sut_global, particulator_global = settings.get_displacement(
+            backend_class, "ImplicitInSpace"
+        )
+        sut, particulator = settings.get_displacement(
+            backend_class, "ImplicitInSpace", substeps_per_cell=True
+        )
+
+        # Act
+        sut_global()
+        sut()
+
+        # Assert
+        def position(p):
+            return (
+                p.attributes["cell origin"].to_ndarray()
+                + p.attributes["position in cell"].to_ndarray()
+            )
+
+        assert (
+            particulator.attributes.super_droplet_count
+            == particulator_global.attributes.super_droplet_count
+        )
+        np.testing.assert_allclose(
+            position(particulator), position(particulator_global), atol=0.05
+        )
+
+    @staticmethod
+    def test_same_rainfall_as_global_for_uniform_substeps(backend_class):
+        if backend_class.__name__ != "Numba":
+            pytest.skip("Numba-only feature")
+
+        # Arrange
+        settings = _settings(_courant_field())
+        settings.dt = 1
+        settings.sedimentation = True
+        fall_velocity = np.random.default_rng(44).uniform(0.01, 0.2, len(settings.n))
+        suts = {}
+        for substeps_per_cell in (False, True):
+            sut, particulator = settings.get_displacement(
+                backend_class, "ImplicitInSpace", substeps_per_cell=substeps_per_cell
+            )
+            particulator.attributes._ParticleAttributes__attributes[
+                "relative fall velocity"
+            ] = _FallVelocity(particulator.backend, fall_velocity)
+            suts[substeps_per_cell] = sut, particulator
+
+        # Act
+        rainfall = {key: [] for key in suts}
+        for _ in range(5):
+            for key, (sut, particulator) in suts.items():
+                sut()
+                particulator.attributes.sanitize()
+                rainfall[key].append(sut.precipitation_mass_in_last_step)
+
+        # Assert
+        (sut_global, particulator_global), (sut, particulator) = suts.values()
+        np.testing.assert_array_equal(
+            sut.n_substeps_per_cell, sut_global.n_substeps_per_cell
+        )
+        assert 0 < np.sum(rainfall[True])
+        assert (
+            particulator.attributes.super_droplet_count
+            == particulator_global.attributes.super_droplet_count
+            < len(settings.n)
+        )
+        np.testing.assert_allclose(rainfall[True], rainfall[False], rtol=1e-12)
+
+    @staticmethod
+    def test_rejected_on_gpu_at_registration(backend_class):
+        if backend_class.__name__ != "ThrustRTC":
+            pytest.skip("GPU-only check")
+
+        # Arrange
+        settings = _settings(_courant_field())
+
+        # Act & Assert
+        with pytest.raises(NotImplementedError, match="substeps_per_cell"):
+            settings.get_displacement(
+                backend_class, "ImplicitInSpace", substeps_per_cell=True
+            )
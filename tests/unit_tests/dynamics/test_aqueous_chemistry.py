@@ -0,0 +1,176 @@
+"""tests of the aqueous chemistry dynamic in multi-cell environments"""
+
+import numba
+import numpy as np
+import pytest
+
+from PySDM import Builder
+from PySDM.backends import CPU
+from PySDM.dynamics import AmbientThermodynamics, AqueousChemistry, Condensation
+from PySDM.dynamics.impl.chemistry_utils import AQUEOUS_COMPOUNDS, GASEOUS_COMPOUNDS
+from PySDM.environments import Parcel, ParcelEnsemble
+from PySDM.physics import si
+from PySDM.physics.constants import PPB, PPM
+from PySDM.products import AcidityIterations, GaseousMoleFraction
+
+N_SD = 16
+N_STEPS = 30
+DT = 1 * si.s
+P0 = 1000 * si.hPa
+INITIAL_RH = 0.999
+DRY_RHO = 1800 * si.kg / si.m**3
+DRY_MOLAR_MASS = 115.11 * si.g / si.mole
+R_DRY = np.geomspace(50 * si.nm, 500 * si.nm, N_SD)
+N_IN_DV = np.full(N_SD, 1e8)
+MEMBERS = {
+    "w": np.array([1, 2, 4]) * si.m / si.s,
+    "T0": np.array([280, 285, 290]) * si.K,
+    "mass_of_dry_air": np.array([1, 2, 3]) * si.kg,
+}
+ENVIRONMENT_MOLE_FRACTIONS = {
+    "SO2": 0.2 * PPB,
+    "O3": 50 * PPB,
+    "H2O2": 0.5 * PPB,
+    "CO2": 360 * PPM,
+    "HNO3": 0.1 * PPB,
+    "NH3": 0.1 * PPB,
+}
+
+
+def _run(environment, n_in_dv, system_type):
+    n_members = getattr(environment, "n_members", 1)
+    builder = Builder(
+        n_sd=N_SD * n_members,
+        backend=CPU(),
+        environment=environment,
+        dynamics=(
+            AmbientThermodynamics(),
+            Condensation(),
+            AqueousChemistry(
+                environment_mole_fractions=ENVIRONMENT_MOLE_FRACTIONS,
+                system_type=system_type,
+                n_substep=2,
+                dry_rho=DRY_RHO,
+                dry_molar_mass=DRY_MOLAR_MASS,
+            ),
+        ),
+    )
+    attributes = builder.particulator.environment.init_attributes(
+        n_in_dv=n_in_dv,
+        kappa=0.61,
+        r_dry=R_DRY,
+        include_dry_volume_in_attribute=False,
+    )
+    dry_moles = np.tile(
+        builder.particulator.formulae.trivia.volume(R_DRY) * DRY_RHO / DRY_MOLAR_MASS,
+        n_members,
+    )
+    for compound in AQUEOUS_COMPOUNDS:
+        attributes[f"moles_{compound}"] = (
+            dry_moles if compound in ("N_mIII", "S_VI") else np.zeros_like(dry_moles)
+        )
+    particulator = builder.build(
+        attributes=attributes,
+        products=(
+            *(GaseousMoleFraction(key, name=key) for key in GASEOUS_COMPOUNDS),
+            AcidityIterations(name="pH iterations"),
+        ),
+    )
+    particulator.run(steps=N_STEPS)
+    return particulator
+
+
+def _run_ensemble(system_type):
+    return _run(
+        ParcelEnsemble(dt=DT, p0=P0, initial_relative_humidity=INITIAL_RH, **MEMBERS),
+        n_in_dv=np.outer(MEMBERS["mass_of_dry_air"], N_IN_DV),
+        system_type=system_type,
+    )
+
+
+class TestAqueousChemistry:
+    @staticmethod
+    @pytest.mark.parametrize("system_type", ("closed", "open"))
+    def test_same_as_individual_parcels(system_type):
+        # act
+        ensemble = _run_ensemble(system_type)
+        individual = [
+            _run(
+                Parcel(
+                    dt=DT,
+                    p0=P0,
+                    initial_relative_humidity=INITIAL_RH,
+                    **{key: value[i] for key, value in MEMBERS.items()},
+                ),
+                n_in_dv=MEMBERS["mass_of_dry_air"][i] * N_IN_DV,
+                system_type=system_type,
+            )
+            for i in range(len(MEMBERS["w"]))
+        ]
+
+        # assert
+        for i, expected in enumerate(individual):
+            for key in GASEOUS_COMPOUNDS:
+                np.testing.assert_allclose(
+                    ensemble.products[key].get()[i],
+                    expected.products[key].get()[0],
+                    rtol=1e-10,
+                )
+            for key in AQUEOUS_COMPOUNDS:
+                np.testing.assert_allclose(
+                    ensemble.attributes[f"moles_{key}"]
+                    .to_ndarray()
+                    .reshape(-1, N_SD)[i],
+                    expected.attributes[f"moles_{key}"].to_ndarray(),
+                    rtol=1e-10,
+                )
+        moles_S_IV = ensemble.attributes["moles_S_IV"].to_ndarray().reshape(-1, N_SD)
+        assert (moles_S_IV.max(axis=1)[1:] > 0).all()
+
+    @staticmethod
+    def test_environment_mixing_ratios_per_cell():
+        # act
+        particulator = _run_ensemble("closed")
+
+        # assert
+        sut = particulator.dynamics["AqueousChemistry"]
+        for compound in GASEOUS_COMPOUNDS.values():
+            assert sut.environment_mixing_ratios[compound].shape == (
+                particulator.mesh.n_cell,
+            )
+        assert len(set(particulator.products["N_mIII"].get())) == len(MEMBERS["w"])
+
+    @staticmethod
+    def test_independent_of_number_of_threads():
+        # arrange
+        n_threads = numba.get_num_threads()
+
+        # act
+        try:
+            numba.set_num_threads(1)
+            serial = _run_ensemble("closed")
+        finally:
+            numba.set_num_threads(n_threads)
+        parallel = _run_ensemble("closed")
+
+        # assert
+        for key in AQUEOUS_COMPOUNDS:
+            np.testing.assert_array_equal(
+                serial.attributes[f"moles_{key}"].to_ndarray(),
+                parallel.attributes[f"moles_{key}"].to_ndarray(),
+            )
+
+    @staticmethod
+    def test_acidity_iterations_per_cell():
+        # arrange
+        particulator = _run_ensemble("closed")
+        sut = particulator.products["pH iterations"]
+
+        # act
+        since_start = sut.get().copy()
+        since_last_get = sut.get().copy()
+
+        # assert
+        assert since_start.shape == (len(MEMBERS["w"]),)
+        assert (since_start > 0).all()
+        assert np.isnan(since_last_get).all()
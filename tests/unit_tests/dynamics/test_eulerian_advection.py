@@ -7,7 +7,7 @@ from ..dummy_environment import DummyEnvironment
 from ..dummy_particulator import DummyParticulator
 
 
-class TestEulerianAdvection:  # pylint: disable=too-few-public-methods
+class TestEulerianAdvection:
     @staticmethod
     def test_update(backend_class):
         # Arrange
@@ -37,3 +37,21 @@ class TestEulerianAdvection:  # pylint: disable=too-few-public-methods
         np.testing.assert_array_equal(
             env.get_thd(), env.get_predicted("thd").to_ndarray().reshape(grid)
         )
+
+    @staticmethod
+    def test_update_without_displacement(backend_class):
+        # Arrange
+        particulator = DummyParticulator(backend_class)
+        env = DummyEnvironment(grid=(3, 2), halo=1)
+        env.register(builder=particulator)
+        particulator.environment = env
+        displacements = []
+
+        sut = EulerianAdvection(displacements.append)
+        sut.register(particulator)
+
+        # Act
+        sut()
+
+        # Assert
+        assert displacements == [None]
@@ -11,6 +11,11 @@ from PySDM.dynamics.terminal_velocity import (
     PowerSeries,
     RogersYau,
 )
+from PySDM.dynamics.terminal_velocity.gunn_and_kinzer import (
+    FACTOR,
+    MAXIMUM_RADIUS,
+    interpolation_table,
+)
 from PySDM.environments import Box
 from PySDM.physics import constants as const
 from PySDM.physics import si
@@ -50,6 +55,60 @@ def test_approximation(backend_class, plot=False):
         plt.show()
 
 
+def test_gunn_kinzer_table_shared_between_instances(backend_class):
+    # arrange
+    GunnKinzer1949(DummyParticulator(backend_class, n_sd=0))
+    hits = interpolation_table.cache_info().hits
+
+    # act
+    sut = [GunnKinzer1949(DummyParticulator(backend_class, n_sd=0)) for _ in range(2)]
+
+    # assert
+    assert interpolation_table.cache_info().hits == hits + 2
+    np.testing.assert_array_equal(sut[0].a.to_ndarray(), sut[1].a.to_ndarray())
+    np.testing.assert_array_equal(sut[0].b.to_ndarray(), sut[1].b.to_ndarray())
+
+
+def test_gunn_kinzer_out_of_range_radius_among_valid_ones(backend_class):
+    # arrange
+    particulator = DummyParticulator(backend_class, n_sd=3)
+    sut = GunnKinzer1949(particulator)
+    radius = particulator.backend.Storage.from_ndarray(
+        np.asarray([0.1 * si.mm, 1 * si.cm, 1 * si.mm])
+    )
+    output = particulator.backend.Storage.empty((3,), float)
+
+    # act & assert
+    with pytest.raises(ValueError, match="max value of 0.01 m"):
+        sut(output, radius)
+
+
+@pytest.mark.parametrize(
+    "radius, exception_context",
+    (
+        (MAXIMUM_RADIUS, nullcontext()),
+        (
+            MAXIMUM_RADIUS * (1 + 1e-9),
+            pytest.raises(ValueError, match="Radii can be interpolated"),
+        ),
+        (
+            MAXIMUM_RADIUS + 0.5 / FACTOR,
+            pytest.raises(ValueError, match="Radii can be interpolated"),
+        ),
+    ),
+)
+def test_gunn_kinzer_maximum_radius(backend_class, radius, exception_context):
+    # arrange
+    particulator = DummyParticulator(backend_class, n_sd=1)
+    sut = GunnKinzer1949(particulator)
+    output = particulator.backend.Storage.empty((1,), float)
+
+    # act & assert
+    with exception_context:
+        sut(output, particulator.backend.Storage.from_ndarray(np.asarray([radius])))
+        assert np.isfinite(output.to_ndarray()).all()
+
+
 @pytest.mark.parametrize(
     "variant, water_mass, exception_context, expected_v_term",
     (
@@ -0,0 +1,208 @@
+"""tests for the parcel-ensemble environment"""
+
+import numpy as np
+import pytest
+
+from PySDM import Builder
+from PySDM.backends import ThrustRTC
+from PySDM.dynamics import AmbientThermodynamics, Coalescence, Condensation
+from PySDM.dynamics.collisions.collision_kernels import Golovin
+from PySDM.environments import Parcel, ParcelEnsemble
+from PySDM.physics import si
+from PySDM.products import (
+    AmbientRelativeHumidity,
+    AmbientTemperature,
+    ParcelDisplacement,
+    ParticleConcentration,
+    WaterMixingRatio,
+)
+
+N_SD = 8
+DT = 1 * si.s
+P0 = 1000 * si.hPa
+R_DRY = np.geomspace(10 * si.nm, 500 * si.nm, N_SD)
+N_IN_DV = np.full(N_SD, 1e8)
+MEMBERS = {
+    "w": np.array([0.5, 1, 2]) * si.m / si.s,
+    "T0": np.array([280, 285, 290]) * si.K,
+    "mass_of_dry_air": np.array([1, 2, 3]) * si.kg,
+}
+
+
+def _run(backend_class, environment, n_in_dv, n_steps=20):
+    builder = Builder(
+        n_sd=N_SD * getattr(environment, "n_members", 1),
+        backend=backend_class(double_precision=True),
+        environment=environment,
+        dynamics=(AmbientThermodynamics(), Condensation()),
+    )
+    particulator = builder.build(
+        attributes=builder.particulator.environment.init_attributes(
+            n_in_dv=n_in_dv, kappa=0.5, r_dry=R_DRY
+        ),
+        products=(
+            AmbientRelativeHumidity(name="RH"),
+            AmbientTemperature(name="T"),
+            ParcelDisplacement(name="z"),
+            WaterMixingRatio(name="ql"),
+        ),
+    )
+    particulator.run(steps=n_steps)
+    return {
+        name: product.get().copy() for name, product in particulator.products.items()
+    }
+
+
+@pytest.mark.parametrize(
+    "kwargs, n_members",
+    (
+        ({"w": 1, "T0": 280}, 1),
+        ({"w": 1, "T0": [280, 290]}, 2),
+        ({"w": [1, 2, 3], "T0": 280}, 3),
+        ({"w": (1, lambda _: 2), "T0": 280}, 2),
+        ({"w": lambda _: np.ones(4), "T0": np.full(4, 280)}, 4),
+    ),
+)
+def test_n_members(kwargs, n_members):
+    # act
+    sut = ParcelEnsemble(
+        dt=DT,
+        mass_of_dry_air=1 * si.kg,
+        p0=P0,
+        initial_relative_humidity=0.98,
+        **kwargs,
+    )
+
+    # assert
+    assert sut.n_members == n_members
+    assert sut.mesh.n_cell == n_members
+    assert np.shape(sut.w(0)) in ((), (n_members,))
+
+
+def test_same_as_individual_parcels(backend_class):
+    if backend_class is ThrustRTC:
+        pytest.skip("per-cell volumes not supported on GPU")
+
+    # act
+    ensemble = _run(
+        backend_class,
+        ParcelEnsemble(dt=DT, p0=P0, initial_relative_humidity=0.98, **MEMBERS),
+        n_in_dv=np.outer(MEMBERS["mass_of_dry_air"], N_IN_DV),
+    )
+    individual = [
+        _run(
+            backend_class,
+            Parcel(
+                dt=DT,
+                p0=P0,
+                initial_relative_humidity=0.98,
+                **{key: value[i] for key, value in MEMBERS.items()},
+            ),
+            n_in_dv=MEMBERS["mass_of_dry_air"][i] * N_IN_DV,
+        )
+        for i in range(len(MEMBERS["w"]))
+    ]
+
+    # assert
+    for i, expected in enumerate(individual):
+        for name, value in expected.items():
+            np.testing.assert_allclose(ensemble[name][i], value[0], rtol=1e-10)
+    assert (np.diff(ensemble["z"]) > 0).all()
+
+
+def test_collisions_within_members(backend_class):
+    if backend_class is ThrustRTC:
+        pytest.skip("per-cell volumes not supported on GPU")
+
+    # arrange
+    n_members = 4
+    builder = Builder(
+        n_sd=N_SD * n_members,
+        backend=backend_class(double_precision=True),
+        environment=ParcelEnsemble(
+            dt=DT,
+            mass_of_dry_air=np.linspace(1, 2, n_members) * si.kg,
+            p0=P0,
+            T0=280 * si.K,
+            w=0.1 * si.m / si.s,
+            initial_relative_humidity=0.5,
+        ),
+        dynamics=(
+            AmbientThermodynamics(),
+            Coalescence(collision_kernel=Golovin(b=1e9 / si.s)),
+        ),
+    )
+    attributes = builder.particulator.environment.init_attributes(
+        n_in_dv=np.outer(np.linspace(1, 2, n_members), N_IN_DV), kappa=0.5, r_dry=R_DRY
+    )
+    particulator = builder.build(
+        attributes=attributes,
+        products=(ParticleConcentration(name="n"),),
+    )
+
+    def water_mass_per_member():
+        return np.bincount(
+            particulator.attributes["cell id"].to_ndarray(),
+            weights=particulator.attributes["water mass"].to_ndarray()
+            * particulator.attributes["multiplicity"].to_ndarray(),
+            minlength=n_members,
+        )
+
+    water_mass = water_mass_per_member()
+    concentration = particulator.products["n"].get().copy()
+
+    # act
+    particulator.run(steps=10)
+
+    # assert
+    np.testing.assert_allclose(water_mass_per_member(), water_mass, rtol=1e-10)
+    assert (particulator.products["n"].get() < concentration).all()
+
+
+def test_collisions_invariant_to_member_mass_of_dry_air(backend_class):
+    """multiplicities scaled with the mass of dry air (and hence with the volume)
+    of a member should yield the same collision statistics for a given random seed"""
+    if backend_class is ThrustRTC:
+        pytest.skip("per-cell volumes not supported on GPU")
+
+    # arrange
+    def scaled_multiplicities(mass_of_dry_air):
+        builder = Builder(
+            n_sd=N_SD * len(mass_of_dry_air),
+            backend=backend_class(double_precision=True),
+            environment=ParcelEnsemble(
+                dt=DT,
+                mass_of_dry_air=mass_of_dry_air,
+                p0=P0,
+                T0=280 * si.K,
+                w=0.1 * si.m / si.s,
+                initial_relative_humidity=0.5,
+            ),
+            dynamics=(
+                AmbientThermodynamics(),
+                Coalescence(collision_kernel=Golovin(b=1e9 / si.s)),
+            ),
+        )
+        particulator = builder.build(
+            attributes=builder.particulator.environment.init_attributes(
+                n_in_dv=np.outer(mass_of_dry_air / si.kg, N_IN_DV),
+                kappa=0.5,
+                r_dry=R_DRY,
+            )
+        )
+        particulator.run(steps=10)
+        multiplicity = particulator.attributes["multiplicity"].to_ndarray()
+        cell_id = particulator.attributes["cell id"].to_ndarray()
+        return [
+            np.sort(multiplicity[cell_id == i]) / mass_of_dry_air[i]
+            for i in range(len(mass_of_dry_air))
+        ]
+
+    # act
+    reference = scaled_multiplicities(np.array([1, 1]) * si.kg)
+    scaled = scaled_multiplicities(np.array([1, 3]) * si.kg)
+
+    # assert
+    assert (reference[0] != N_IN_DV).any()
+    for expected, actual in zip(reference, scaled):
+        np.testing.assert_allclose(actual, expected)
@@ -0,0 +1,87 @@
+"""checks for the binary attribute snapshot exporter"""
+
+import numpy as np
+
+from PySDM import Builder
+from PySDM.dynamics import Coalescence
+from PySDM.dynamics.collisions.collision_kernels import Golovin
+from PySDM.environments import Box
+from PySDM.exporters import BinaryAttributesExporter
+from PySDM.physics import si
+
+N_SD = 32
+
+
+def test_binary_attributes_exporter_round_trip(backend_class, tmp_path):
+    """snapshots contain only the valid super-droplets and are read back
+    as memory-mapped arrays of the original dtypes"""
+    # arrange
+    particulator = Builder(
+        n_sd=N_SD,
+        backend=backend_class(),
+        environment=Box(dt=1 * si.s, dv=1 * si.mm**3),
+        dynamics=(Coalescence(collision_kernel=Golovin(b=1.5 / si.s)),),
+    ).build(
+        attributes={
+            "multiplicity": np.ones(N_SD),
+            "volume": np.linspace(1, 2, N_SD) * si.um**3 * 1e6,
+        }
+    )
+    sut = BinaryAttributesExporter(
+        path=str(tmp_path), attributes=("multiplicity", "water mass")
+    )
+    expected = []
+
+    # act
+    for _ in range(3):
+        particulator.run(steps=2)
+        sut.export_attributes(particulator)
+        expected.append(
+            {
+                name: particulator.attributes[name].to_ndarray()
+                for name in sut.attributes
+            }
+        )
+
+    # assert
+    assert len(sut.exported_files) == 3
+    for path, values in zip(sut.exported_files, expected):
+        meta, arrays = BinaryAttributesExporter.read(path)
+        assert meta["super_droplet_count"] == len(values["multiplicity"])
+        assert meta["time"] == meta["n_steps"] * particulator.dt
+        assert arrays.keys() == values.keys()
+        for name, array in arrays.items():
+            assert isinstance(array.base, np.memmap)
+            assert array.dtype == values[name].dtype
+            np.testing.assert_array_equal(array, values[name])
+    assert meta["super_droplet_count"] < N_SD
+
+
+def test_binary_attributes_exporter_empty_snapshot(backend_class, tmp_path):
+    """snapshots with no valid super-droplets are read back as empty arrays"""
+    # arrange
+    particulator = Builder(
+        n_sd=N_SD,
+        backend=backend_class(),
+        environment=Box(dt=1 * si.s, dv=1 * si.mm**3),
+    ).build(
+        attributes={
+            "multiplicity": np.ones(N_SD),
+            "volume": np.linspace(1, 2, N_SD) * si.um**3,
+        }
+    )
+    particulator.attributes["multiplicity"].upload(np.zeros(N_SD, dtype=np.int64))
+    particulator.attributes.healthy = False
+    particulator.attributes.sanitize()
+    sut = BinaryAttributesExporter(
+        path=str(tmp_path), attributes=("water mass", "multiplicity")
+    )
+
+    # act
+    meta, arrays = BinaryAttributesExporter.read(sut.export_attributes(particulator))
+
+    # assert
+    assert meta["super_droplet_count"] == 0
+    assert arrays.keys() == {"water mass", "multiplicity"}
+    for array in arrays.values():
+        assert array.shape == (0,)
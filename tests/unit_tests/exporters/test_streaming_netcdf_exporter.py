@@ -0,0 +1,102 @@
+"""checks for the streaming netCDF4 exporter"""
+
+import numpy as np
+import pytest
+from netCDF4 import Dataset
+
+from PySDM import Builder
+from PySDM.backends import CPU
+from PySDM.dynamics import Coalescence
+from PySDM.dynamics.collisions.collision_kernels import Golovin
+from PySDM.environments import Box
+from PySDM.exporters import StreamingNetCDFExporter
+from PySDM.exporters.streaming_netcdf_exporter import DIM_SUFFIX, SD_COUNT
+from PySDM.physics import si
+from PySDM.products import ParticleConcentration, ParticleSizeSpectrumPerVolume
+
+N_SD = 32
+RADIUS_BINS_EDGES = np.logspace(-6, -3, 8) * si.m
+
+
+@pytest.fixture(name="particulator")
+def particulator_fixture():
+    builder = Builder(
+        n_sd=N_SD,
+        backend=CPU(),
+        environment=Box(dt=1 * si.s, dv=1 * si.mm**3),
+        dynamics=(Coalescence(collision_kernel=Golovin(b=1.5e3 / si.s)),),
+    )
+    return builder.build(
+        attributes={
+            "multiplicity": np.ones(N_SD),
+            "volume": np.linspace(1, 2, N_SD) * si.um**3 * 1e6,
+        },
+        products=(
+            ParticleConcentration(),
+            ParticleSizeSpectrumPerVolume(radius_bins_edges=RADIUS_BINS_EDGES),
+        ),
+    )
+
+
+class TestStreamingNetCDFExporter:
+    @staticmethod
+    def test_products_and_ragged_attributes(particulator, tmp_path):
+        # arrange
+        filename = str(tmp_path / "output.nc")
+        attributes = ("multiplicity", "water mass")
+        n_outputs = 4
+        expected = {key: [] for key in particulator.products.keys() | set(attributes)}
+
+        # act
+        with StreamingNetCDFExporter(
+            filename, particulator, attributes=attributes
+        ) as sut:
+            for _ in range(n_outputs):
+                particulator.run(steps=2)
+                sut.write()
+                for name, product in particulator.products.items():
+                    expected[name].append(product.get().copy())
+                for name in attributes:
+                    expected[name].append(particulator.attributes[name].to_ndarray())
+
+        # assert
+        with Dataset(filename) as ncdf:
+            np.testing.assert_array_equal(
+                ncdf.variables["T"][:], np.arange(1, n_outputs + 1) * 2
+            )
+            for name in particulator.products:
+                variable = ncdf.variables[name]
+                assert variable.filters()["zlib"]
+                assert variable.chunking()[0] == 1
+                np.testing.assert_array_equal(variable[:], np.array(expected[name]))
+            assert (
+                ncdf.variables[f"particle size spectrum per volume{DIM_SUFFIX}"].size
+                == len(RADIUS_BINS_EDGES) - 1
+            )
+
+            counts = ncdf.variables[SD_COUNT][:]
+            assert counts[-1] < N_SD
+            starts = np.concatenate(((0,), np.cumsum(counts)))
+            for name in attributes:
+                for i in range(n_outputs):
+                    np.testing.assert_array_equal(
+                        ncdf.variables[name][starts[i] : starts[i + 1]],
+                        expected[name][i],
+                    )
+
+    @staticmethod
+    def test_writer_errors_are_reraised(particulator, tmp_path):
+        # arrange
+        sut = StreamingNetCDFExporter(
+            str(tmp_path / "output.nc"),
+            particulator,
+            products=("particle concentration",),
+        )
+        sut.vars["particle concentration"] = None
+
+        # act
+        sut.write()
+
+        # assert
+        with pytest.raises(RuntimeError):
+            sut.close()
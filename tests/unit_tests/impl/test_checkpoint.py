@@ -0,0 +1,278 @@
+# pylint: disable=missing-module-docstring,missing-class-docstring,missing-function-docstring
+import numpy as np
+import pytest
+
+from PySDM import Builder
+from PySDM.backends import CPU
+from PySDM.dynamics import (
+    AmbientThermodynamics,
+    Coalescence,
+    Condensation,
+    Displacement,
+    EulerianAdvection,
+)
+from PySDM.dynamics.collisions.collision_kernels import Golovin
+from PySDM.environments import Box, Kinematic2D, Parcel
+from PySDM.impl import aligned_binary_file, checkpoint
+from PySDM.initialisation.sampling.spatial_sampling import Pseudorandom
+from PySDM.initialisation.spectra import Lognormal
+from PySDM.particulator import Particulator
+from PySDM.physics import si
+
+N_SD = 64
+
+
+def _box_coalescence_builder(backend):
+    return Builder(
+        n_sd=N_SD,
+        backend=backend,
+        environment=Box(dt=1 * si.s, dv=1 * si.m**3),
+        dynamics=(Coalescence(collision_kernel=Golovin(b=1.5e3 / si.s)),),
+    )
+
+
+def _box_coalescence_attributes():
+    return {
+        "multiplicity": np.full(N_SD, 2**20),
+        "volume": np.linspace(1, 2, N_SD) * si.um**3 * 1e6,
+    }
+
+
+def _parcel_condensation_builder(backend):
+    return Builder(
+        n_sd=N_SD,
+        backend=backend,
+        environment=Parcel(
+            dt=1 * si.s,
+            mass_of_dry_air=1 * si.kg,
+            p0=1000 * si.hPa,
+            initial_water_vapour_mixing_ratio=20 * si.g / si.kg,
+            T0=300 * si.K,
+            w=1 * si.m / si.s,
+        ),
+        dynamics=(AmbientThermodynamics(), Condensation()),
+    )
+
+
+def _parcel_condensation_attributes():
+    return {
+        "multiplicity": np.full(N_SD, 1e8),
+        "dry volume": np.linspace(1, 2, N_SD) * si.nm**3 * 1e6,
+        "kappa times dry volume": np.linspace(1, 2, N_SD) * si.nm**3 * 1e6,
+        "volume": np.linspace(1, 2, N_SD) * si.um**3,
+    }
+
+
+GRID = (8, 8)
+
+
+class PrescribedFlow:
+    """stand-in for PyMPDATA solvers: fixed advectees and a single-eddy Courant field"""
+
+    def __init__(self):
+        self.advectees = {
+            "water_vapour_mixing_ratio": np.full(GRID, 15 * si.g / si.kg),
+            "th": np.full(GRID, 300 * si.K),
+        }
+        x_vec, z_vec = (np.linspace(0, 1, n + 1) for n in GRID)
+        stream_function = 0.2 * np.outer(np.sin(np.pi * x_vec), np.sin(np.pi * z_vec))
+        self.courant_field = (
+            np.diff(stream_function, axis=1),
+            -np.diff(stream_function, axis=0),
+        )
+
+    def __getitem__(self, key):
+        return self.advectees[key]
+
+    def wait(self):
+        pass
+
+    def __call__(self, displacement):
+        displacement.upload_courant_field(self.courant_field)
+
+    def checkpoint_state(self):
+        return {"advectees": self.advectees}
+
+    def restore_checkpoint_state(self, state):
+        pass
+
+
+def _kinematic_2d_builder(backend):
+    return Builder(
+        n_sd=N_SD,
+        backend=backend,
+        environment=Kinematic2D(
+            dt=1 * si.s,
+            grid=GRID,
+            size=(800 * si.m, 800 * si.m),
+            rhod_of=lambda zZ: np.full_like(zZ, 1 * si.kg / si.m**3),
+        ),
+        dynamics=(
+            AmbientThermodynamics(),
+            Condensation(),
+            EulerianAdvection(PrescribedFlow()),
+            Displacement(enable_sedimentation=True),
+            Coalescence(collision_kernel=Golovin(b=1.5e3 / si.s)),
+        ),
+    )
+
+
+def _build_kinematic_2d():
+    builder = _kinematic_2d_builder(CPU())
+    return builder.build(
+        attributes=builder.particulator.environment.init_attributes(
+            spatial_discretisation=Pseudorandom(),
+            dry_radius_spectrum=Lognormal(
+                norm_factor=1e8 / si.mg, m_mode=0.04 * si.um, s_geom=1.4
+            ),
+            kappa=1.28,
+        )
+    )
+
+
+def _state(particulator):
+    state = {
+        "n_steps": particulator.n_steps,
+        "multiplicity": particulator.attributes["multiplicity"].to_ndarray(),
+        "water mass": particulator.attributes["water mass"].to_ndarray(),
+    }
+    if isinstance(particulator.environment, Parcel):
+        state["T"] = particulator.environment["T"].to_ndarray()
+        state["z"] = particulator.environment["z"].to_ndarray()
+    if isinstance(particulator.environment, Kinematic2D):
+        state["cell id"] = particulator.attributes["cell id"].to_ndarray()
+        state["position in cell"] = particulator.attributes[
+            "position in cell"
+        ].to_ndarray()
+        state["RH"] = particulator.environment["RH"].to_ndarray()
+    return state
+
+
+@pytest.mark.parametrize(
+    "make_builder, make_attributes",
+    (
+        (_box_coalescence_builder, _box_coalescence_attributes),
+        (_parcel_condensation_builder, _parcel_condensation_attributes),
+    ),
+)
+class TestCheckpoint:
+    @staticmethod
+    def test_restart_bit_for_bit(
+        backend_class, tmp_path, make_builder, make_attributes
+    ):
+        # arrange
+        n_steps, n_steps_before_checkpoint = 6, 3
+        path = str(tmp_path / "checkpoint.bin")
+
+        reference = make_builder(backend_class()).build(attributes=make_attributes())
+        reference.run(n_steps)
+
+        particulator = make_builder(backend_class()).build(attributes=make_attributes())
+        particulator.run(n_steps_before_checkpoint)
+
+        # act
+        particulator.checkpoint(path)
+        restored = Particulator.restore(path, make_builder(backend_class()))
+        restored.run(n_steps - n_steps_before_checkpoint)
+
+        # assert
+        expected = _state(reference)
+        actual = _state(restored)
+        assert actual.keys() == expected.keys()
+        for key, value in expected.items():
+            np.testing.assert_array_equal(actual[key], value)
+
+    @staticmethod
+    def test_arrays_memory_mapped(
+        backend_class, tmp_path, make_builder, make_attributes
+    ):
+        # arrange
+        path = str(tmp_path / "checkpoint.bin")
+        particulator = make_builder(backend_class()).build(attributes=make_attributes())
+        particulator.run(1)
+
+        # act
+        particulator.checkpoint(path)
+        header, arrays = checkpoint.load(path)
+
+        # assert
+        assert header["n_steps"] == 1
+        buffers = {id(array.base) for array in arrays.values()}
+        assert len(buffers) == 1
+        for spec in header["arrays"].values():
+            assert spec["offset"] % aligned_binary_file.ALIGNMENT == 0
+        np.testing.assert_array_equal(
+            arrays[header["base_attributes"]["multiplicity"]],
+            particulator.attributes["multiplicity"].to_ndarray(raw=True),
+        )
+
+
+def test_restore_rejects_mismatched_n_sd(backend_class, tmp_path):
+    # arrange
+    path = str(tmp_path / "checkpoint.bin")
+    _box_coalescence_builder(backend_class()).build(
+        attributes=_box_coalescence_attributes()
+    ).checkpoint(path)
+    builder = Builder(
+        n_sd=N_SD // 2, backend=backend_class(), environment=Box(dt=1, dv=1)
+    )
+
+    # act & assert
+    with pytest.raises(ValueError):
+        Particulator.restore(path, builder)
+
+
+def test_kinematic_2d_restart_bit_for_bit(tmp_path):
+    # arrange
+    n_steps, n_steps_before_checkpoint = 6, 3
+    path = str(tmp_path / "checkpoint.bin")
+
+    reference = _build_kinematic_2d()
+    reference.run(n_steps)
+
+    particulator = _build_kinematic_2d()
+    particulator.run(n_steps_before_checkpoint)
+
+    # act
+    particulator.checkpoint(path)
+    restored = Particulator.restore(path, _kinematic_2d_builder(CPU()))
+    restored.run(n_steps - n_steps_before_checkpoint)
+
+    # assert
+    expected = _state(reference)
+    actual = _state(restored)
+    assert actual.keys() == expected.keys()
+    for key, value in expected.items():
+        np.testing.assert_array_equal(actual[key], value)
+
+
+def test_save_rejects_unsupported_state(tmp_path):
+    # arrange
+    particulator = _box_coalescence_builder(CPU()).build(
+        attributes=_box_coalescence_attributes()
+    )
+    particulator.dynamics["Collision"].unsupported = {1, 2}
+
+    # act & assert
+    with pytest.raises(TypeError, match="dynamics/Collision/unsupported"):
+        particulator.checkpoint(str(tmp_path / "checkpoint.bin"))
+
+
+class _Observer:  # pylint: disable=too-few-public-methods
+    def __init__(self):
+        self.n_calls = 0
+
+    def notify(self):
+        self.n_calls += 1
+
+
+def test_save_rejects_external_objects_without_checkpoint_state(tmp_path):
+    # arrange
+    particulator = _box_coalescence_builder(CPU()).build(
+        attributes=_box_coalescence_attributes()
+    )
+    particulator.observers.append(_Observer())
+
+    # act & assert
+    with pytest.raises(TypeError, match="observers/0"):
+        particulator.checkpoint(str(tmp_path / "checkpoint.bin"))
@@ -123,3 +123,40 @@ class TestMaths:
 
         # Assert
         np.testing.assert_array_almost_equal(actual, expected)
+
+    @staticmethod
+    def test_moments_of_multiple_attributes_in_one_call(backend_class):
+        # Arrange
+        n_sd = 32
+        v, n = Linear(Lognormal(100000, 2e-6, 1.2)).sample_deterministic(n_sd)
+        particulator = DummyParticulator(backend_class, n_sd)
+        particulator.request_attribute("temperature")
+        particulator.build(
+            {
+                "multiplicity": discretise_multiplicities(n),
+                "volume": v,
+                "heat": np.linspace(280, 300, n_sd) * v,
+            }
+        )
+        specs = {"volume": (1, 2), "temperature": (0, 1), "multiplicity": (1,)}
+        storage = particulator.backend.Storage
+
+        expected = []
+        moment_0 = storage.empty((1,), dtype=float)
+        moments = storage.empty((1, 1), dtype=float)
+        for attr, ranks in specs.items():
+            for rank in ranks:
+                particulator.moments(
+                    moment_0=moment_0, moments=moments, specs={attr: (rank,)}
+                )
+                expected.append(moments[0, slice(0, 1)].to_ndarray())
+        expected_moment_0 = moment_0.to_ndarray()
+
+        moments = storage.empty((len(expected), 1), dtype=float)
+
+        # Act
+        particulator.moments(moment_0=moment_0, moments=moments, specs=specs)
+
+        # Assert
+        np.testing.assert_allclose(moment_0.to_ndarray(), expected_moment_0)
+        np.testing.assert_allclose(moments.to_ndarray(), np.asarray(expected))
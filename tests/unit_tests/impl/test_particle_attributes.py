@@ -1,4 +1,7 @@
 # pylint: disable=missing-module-docstring,missing-class-docstring,missing-function-docstring,no-member
+import copy
+
+import numba
 import numpy as np
 import pytest
 
@@ -171,6 +174,144 @@ class TestParticleAttributes:
         np.testing.assert_array_equal(sut._ParticleAttributes__idx, expected)
         assert not sut._ParticleAttributes__sorted
 
+    @staticmethod
+    @pytest.mark.parametrize("n_sd", (1, 8, 5000))
+    def test_permutation_global_parallel_repeatable(backend_class, n_sd):
+        if backend_class is ThrustRTC:
+            pytest.skip("TODO #328")
+
+        u01 = np.random.random(n_sd)
+
+        # Arrange
+        particulator = DummyParticulator(backend_class, n_sd=n_sd)
+        sut = ParticleAttributesFactory.empty_particles(particulator, n_sd)
+        sut._ParticleAttributes__sorted = True
+        u01 = make_indexed_storage(particulator.backend, u01)
+
+        # Act
+        sut.permutation(u01, local=False, parallel=True)
+        expected = sut._ParticleAttributes__idx.to_ndarray()
+        sut._ParticleAttributes__idx = make_indexed_storage(
+            particulator.backend, range(n_sd)
+        )
+        sut.permutation(u01, local=False, parallel=True)
+
+        # Assert
+        np.testing.assert_array_equal(sut._ParticleAttributes__idx, expected)
+        np.testing.assert_array_equal(np.sort(expected), np.arange(n_sd))
+        assert not sut._ParticleAttributes__sorted
+
+    @staticmethod
+    @pytest.mark.parametrize("n_sd", (8, 5000))
+    def test_permutation_global_parallel_independent_of_thread_count(n_sd):
+        # Arrange
+        u01 = np.random.default_rng(seed=44).uniform(size=n_sd)
+        particulator = DummyParticulator(Numba, n_sd=n_sd)
+        sut = ParticleAttributesFactory.empty_particles(particulator, n_sd)
+        u01 = make_indexed_storage(particulator.backend, u01)
+        n_threads = numba.get_num_threads()
+
+        # Act
+        results = []
+        try:
+            for threads in (1, numba.config.NUMBA_NUM_THREADS):
+                numba.set_num_threads(threads)
+                sut._ParticleAttributes__idx = make_indexed_storage(
+                    particulator.backend, range(n_sd)
+                )
+                sut.permutation(u01, local=False, parallel=True)
+                results.append(sut._ParticleAttributes__idx.to_ndarray())
+        finally:
+            numba.set_num_threads(n_threads)
+        for n_chunks in (1, 3, 7):  # as if run with more threads than available
+            idx = np.arange(n_sd)
+            particulator.backend._shuffle_global_parallel_body(
+                idx, n_sd, u01.data, n_chunks
+            )
+            results.append(idx)
+
+        # Assert
+        for result in results[1:]:
+            np.testing.assert_array_equal(result, results[0])
+
+    @staticmethod
+    def test_reorder(backend_class):
+        if backend_class is ThrustRTC:
+            pytest.skip("Numba-only feature")
+
+        # Arrange
+        n_sd = 64
+        grid = (4, 3)
+        rng = np.random.default_rng(seed=44)
+        particulator = DummyParticulator(backend_class, n_sd, grid=grid)
+        particulator.build(
+            attributes={
+                "multiplicity": np.arange(1, n_sd + 1),
+                "volume": rng.uniform(size=n_sd),
+                "cell id": np.zeros(n_sd, dtype=int),
+                "cell origin": np.asarray(
+                    [rng.integers(0, n, size=n_sd) for n in grid]
+                ),
+                "position in cell": rng.uniform(size=(len(grid), n_sd)),
+            }
+        )
+        sut = particulator.attributes
+        u01 = backend_class.Storage.from_ndarray(rng.uniform(size=n_sd))
+        sut.permutation(u01, local=False)
+        cell_start = sut.cell_start.to_ndarray()
+        expected = {key: sut[key].to_ndarray() for key in tuple(sut.keys())}
+
+        # Act
+        sut.reorder()
+
+        # Assert
+        np.testing.assert_array_equal(sut._ParticleAttributes__idx, np.arange(n_sd))
+        np.testing.assert_array_equal(sut.cell_start, cell_start)
+        assert (np.diff(sut["cell id"].to_ndarray(raw=True)) >= 0).all()
+        for key, value in expected.items():
+            np.testing.assert_array_equal(sut[key].to_ndarray(), value)
+            np.testing.assert_array_equal(sut[key].to_ndarray(raw=True), value)
+
+    @staticmethod
+    def test_reorder_shared_buffers_and_derived_attributes(backend_class):
+        if backend_class is ThrustRTC:
+            pytest.skip("Numba-only feature")
+
+        # Arrange
+        n_sd = 32
+        rng = np.random.default_rng(seed=44)
+        particulator = DummyParticulator(backend_class, n_sd, grid=(n_sd,))
+        particulator.build(
+            attributes={
+                "multiplicity": np.arange(1, n_sd + 1),
+                "volume": rng.uniform(size=n_sd),
+                "cell id": rng.integers(0, n_sd, size=n_sd),
+                "cell origin": np.zeros((1, n_sd), dtype=int),
+                "position in cell": rng.uniform(size=(1, n_sd)),
+            }
+        )
+        sut = particulator.attributes
+        attributes = sut._ParticleAttributes__attributes
+        alias = copy.copy(attributes["multiplicity"])
+        alias.data = particulator.IndexedStorage.indexed(
+            sut._ParticleAttributes__idx, attributes["multiplicity"].data
+        )
+        attributes["multiplicity alias"] = alias
+        u01 = backend_class.Storage.from_ndarray(rng.uniform(size=n_sd))
+        sut.permutation(u01, local=False)
+        expected = {key: sut[key].to_ndarray() for key in ("multiplicity", "volume")}
+        attributes["volume"].data.data[:] = np.nan
+
+        # Act
+        sut.reorder()
+
+        # Assert
+        for key, value in expected.items():
+            np.testing.assert_array_equal(sut[key].to_ndarray(raw=True), value)
+        np.testing.assert_array_equal(
+            sut["multiplicity alias"].to_ndarray(raw=True), expected["multiplicity"]
+        )
+
     @staticmethod
     def test_permutation_local(backend_class):
         if backend_class is ThrustRTC:
@@ -0,0 +1,108 @@
+# pylint: disable=missing-module-docstring,missing-class-docstring,missing-function-docstring
+import json
+
+import numpy as np
+
+from PySDM import Builder
+from PySDM.backends import CPU
+from PySDM.dynamics import Coalescence
+from PySDM.dynamics.collisions.collision_kernels import Golovin
+from PySDM.environments import Box
+from PySDM.impl.profiler import DYNAMIC_CATEGORY
+from PySDM.physics import si
+from PySDM.products import ParticleConcentration
+
+N_SD = 16
+N_STEPS = 3
+
+
+def _particulator(backend):
+    return Builder(
+        n_sd=N_SD,
+        backend=backend,
+        environment=Box(dt=1 * si.s, dv=1 * si.m**3),
+        dynamics=(Coalescence(collision_kernel=Golovin(b=1.5e3 / si.s)),),
+    ).build(
+        attributes={
+            "multiplicity": np.full(N_SD, 2**20),
+            "volume": np.linspace(1, 2, N_SD) * si.um**3 * 1e6,
+        },
+        products=(ParticleConcentration(),),
+    )
+
+
+class TestProfiler:
+    @staticmethod
+    def test_calls_attributed_to_dynamics(backend_class):
+        # arrange
+        particulator = _particulator(backend_class())
+
+        # act
+        with particulator.profile() as sut:
+            particulator.run(steps=N_STEPS)
+            particulator.products["particle concentration"].get()
+
+        # assert
+        stats = sut.stats
+        assert stats[(DYNAMIC_CATEGORY, "Collision")].count == N_STEPS
+        collision = stats[("Collision", "collision_coalescence")]
+        assert collision.count == N_STEPS
+        assert collision.n_bytes > N_STEPS * N_SD
+        assert 0 < collision.time <= stats[(DYNAMIC_CATEGORY, "Collision")].time
+        assert stats[(None, "moments")].count == 1
+        assert sum(stats.count for stats in sut.step_stats(step=0).values()) == sum(
+            1 for event in sut.events if event.step == 0
+        )
+
+    @staticmethod
+    def test_detach_restores_backend_and_timers(backend_class):
+        # arrange
+        particulator = _particulator(backend_class())
+        timers = particulator.timers
+
+        # act
+        with particulator.profile() as sut:
+            particulator.run(steps=1)
+        particulator.run(steps=1)
+
+        # assert
+        assert particulator.timers is timers
+        assert "find_pairs" not in vars(particulator.backend)
+        assert sut.stats[(DYNAMIC_CATEGORY, "Collision")].count == 1
+
+    @staticmethod
+    def test_chrome_trace_export(backend_class, tmp_path):
+        # arrange
+        particulator = _particulator(backend_class())
+        path = tmp_path / "trace.json"
+        with particulator.profile() as sut:
+            particulator.run(steps=N_STEPS)
+
+        # act
+        sut.export_chrome_trace(str(path))
+
+        # assert
+        with open(path, encoding="utf-8") as file:
+            trace = json.load(file)
+        assert len(trace["traceEvents"]) == len(sut.events)
+        for event in trace["traceEvents"]:
+            assert event["ph"] == "X"
+            assert event["dur"] >= 0
+            assert event["args"]["step"] in range(N_STEPS)
+
+    @staticmethod
+    def test_body_kernels_timed_and_created_through_descriptor(tmp_path):
+        # arrange
+        particulator = _particulator(CPU(jit_cache=str(tmp_path)))
+        backend = particulator.backend
+
+        # act
+        with particulator.profile() as sut:
+            particulator.run(steps=N_STEPS)
+
+        # assert
+        body = sut.stats[("Collision", "_collision_coalescence_body")]
+        assert body.count == N_STEPS
+        assert body.time <= sut.stats[("Collision", "collision_coalescence")].time
+        kernel = vars(backend)["_collision_coalescence_body"]
+        assert kernel is backend.jit_cache.kernels["_collision_coalescence_body"]
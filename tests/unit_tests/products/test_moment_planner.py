@@ -0,0 +1,202 @@
+# pylint: disable=missing-module-docstring,missing-class-docstring,missing-function-docstring
+import numpy as np
+import pytest
+
+from PySDM import Builder
+from PySDM.environments import Box
+from PySDM.physics import si
+from PySDM.products.impl.moment_planner import MomentSpec
+from PySDM.products import (
+    EffectiveRadius,
+    MeanRadius,
+    ParticleConcentration,
+    ParticleSizeSpectrumPerVolume,
+    ParticleSpecificConcentration,
+    WaterMixingRatio,
+)
+
+N_SD = 16
+
+
+RADIUS_BINS_EDGES = np.geomspace(0.1 * si.um, 100 * si.um, 5)
+
+
+def _make_particulator(backend_class, plan_moments=True):
+    env = Box(dt=1 * si.s, dv=1 * si.m**3)
+    builder = Builder(
+        n_sd=N_SD,
+        backend=backend_class(double_precision=True),
+        environment=env,
+    )
+    particulator = builder.build(
+        attributes={
+            "multiplicity": np.arange(1, N_SD + 1) * 1000,
+            "volume": builder.formulae.trivia.volume(
+                radius=np.geomspace(0.1 * si.um, 100 * si.um, N_SD)
+            ),
+        },
+        products=(
+            ParticleConcentration(name="n_all"),
+            ParticleConcentration(name="n_big", radius_range=(1 * si.um, np.inf)),
+            ParticleSpecificConcentration(name="n_spec"),
+            WaterMixingRatio(name="q", radius_range=(1 * si.um, np.inf)),
+            MeanRadius(name="r_mean"),
+            EffectiveRadius(name="r_eff"),
+            EffectiveRadius(name="r_eff_big", radius_range=(1 * si.um, np.inf)),
+            ParticleSizeSpectrumPerVolume(
+                name="spectrum", radius_bins_edges=RADIUS_BINS_EDGES
+            ),
+            ParticleSizeSpectrumPerVolume(
+                name="spectrum_copy", radius_bins_edges=RADIUS_BINS_EDGES
+            ),
+        ),
+        plan_moments=plan_moments,
+    )
+    particulator.environment["rhod"] = 1 * si.kg / si.m**3
+    return particulator
+
+
+def _count_passes(particulator, method="moments"):
+    passes = []
+    moments = getattr(particulator.backend, method)
+
+    def counting_moments(**kwargs):
+        passes.append(kwargs)
+        moments(**kwargs)
+
+    setattr(particulator.backend, method, counting_moments)
+    return passes
+
+
+def _get_all(particulator):
+    return {
+        name: product.get().copy() for name, product in particulator.products.items()
+    }
+
+
+class TestMomentPlanner:
+    @staticmethod
+    def test_same_values_as_without_planner(backend_class):
+        # arrange
+        fused = _make_particulator(backend_class)
+        unfused = _make_particulator(backend_class, plan_moments=False)
+
+        # act
+        actual = _get_all(fused)
+        expected = _get_all(unfused)
+
+        # assert
+        assert actual.keys() == expected.keys()
+        for name, value in expected.items():
+            np.testing.assert_array_equal(actual[name], value)
+
+    @staticmethod
+    def test_plan_built_from_declared_specs(backend_class):
+        # act
+        sut = _make_particulator(backend_class).moment_planner
+
+        # assert
+        assert len(sut.plan) == 5
+        assert sum(len(r) for specs in sut.plan.values() for r in specs.values()) == 9
+        assert len(sut.spectrum_plan) == 1
+
+    @staticmethod
+    def test_plan_moments_opt_out(backend_class):
+        particulator = _make_particulator(backend_class, plan_moments=False)
+        assert particulator.moment_planner is None
+
+    @staticmethod
+    def test_fewer_passes_than_without_planner(backend_class):
+        # arrange
+        fused = _make_particulator(backend_class)
+        unfused = _make_particulator(backend_class, plan_moments=False)
+        passes = {"fused": _count_passes(fused), "unfused": _count_passes(unfused)}
+        spectrum_passes = {
+            "fused": _count_passes(fused, "spectrum_moments"),
+            "unfused": _count_passes(unfused, "spectrum_moments"),
+        }
+
+        # act
+        _get_all(fused)
+        n_passes = len(passes["fused"])
+        _get_all(fused)
+        n_passes_repeated = len(passes["fused"]) - n_passes
+        _get_all(unfused)
+
+        # assert
+        assert len(passes["unfused"]) == 10
+        assert n_passes == len(fused.moment_planner.plan)
+        assert n_passes_repeated == 0
+        assert len(spectrum_passes["unfused"]) == 2
+        assert len(spectrum_passes["fused"]) == 1
+
+    @staticmethod
+    def test_undeclared_request_bypasses_plan(backend_class):
+        # arrange
+        particulator = _make_particulator(backend_class)
+        product = particulator.products["n_all"]
+        passes = _count_passes(particulator)
+
+        # act
+        product._download_moment_to_buffer(  # pylint: disable=protected-access
+            MomentSpec(
+                attr="volume",
+                rank=2,
+                filter_attr="signed water mass",
+                filter_range=(0, 1),
+                weighting_attribute="water mass",
+                weighting_rank=0,
+            )
+        )
+
+        # assert
+        assert len(passes) == 1
+        assert passes[0]["min_x"] == 0 and passes[0]["max_x"] == 1
+
+    @staticmethod
+    def test_all_requests_declared(backend_class):
+        # arrange
+        particulator = _make_particulator(backend_class)
+        sut = particulator.moment_planner
+        requested = []
+        for method in ("moments", "spectrum_moments"):
+
+            def recording(*, spec, _method=getattr(sut, method), **kwargs):
+                requested.append(spec)
+                _method(spec=spec, **kwargs)
+
+            setattr(sut, method, recording)
+
+        # act
+        _get_all(particulator)
+
+        # assert
+        declared = [
+            spec
+            for product in particulator.products.values()
+            for specs in ("moment_specs", "spectrum_moment_specs")
+            for spec in getattr(product, specs, ())
+        ]
+        assert len(requested) > 0
+        assert all(spec in declared for spec in requested)
+
+    @staticmethod
+    @pytest.mark.parametrize("update", ("run", "mark_updated"))
+    def test_reevaluated_after_state_change(backend_class, update):
+        # arrange
+        particulator = _make_particulator(backend_class)
+        before = _get_all(particulator)
+        multiplicity = particulator.attributes["multiplicity"]
+        multiplicity.upload(2 * multiplicity.to_ndarray())
+
+        # act
+        if update == "run":
+            particulator.run(steps=1)
+        else:
+            particulator.attributes.mark_updated("multiplicity")
+        after = _get_all(particulator)
+
+        # assert
+        np.testing.assert_allclose(after["n_all"], 2 * before["n_all"])
+        np.testing.assert_allclose(after["n_big"], 2 * before["n_big"])
+        np.testing.assert_allclose(after["r_eff"], before["r_eff"])
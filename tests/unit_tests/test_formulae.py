@@ -5,6 +5,7 @@ import numpy as np
 import pytest
 
 from PySDM import formulae, Formulae
+from PySDM.backends import CPU
 from PySDM.physics import si
 
 DUMMY_CONSTANTS = namedtuple(typename="constants", field_names=("PI", "ZERO"))(
@@ -183,3 +184,172 @@ class TestFormulae:
 
         # assert
         assert sut.seed == seed
+
+    @staticmethod
+    def test_tabulated_formula_within_tolerance():
+        # arrange
+        name = "saturation_vapour_pressure__pvs_water"
+        rtol = 1e-6
+        temperatures = np.linspace(200 * si.K, 320 * si.K, 1001)
+        exact = Formulae(saturation_vapour_pressure="MurphyKoop2005").flatten
+
+        # act
+        sut = Formulae(
+            saturation_vapour_pressure="MurphyKoop2005",
+            tabulate={name: (200 * si.K, 320 * si.K, 10000)},
+            tabulation_rtol=rtol,
+        )
+
+        # assert
+        actual = [getattr(sut.flatten, name)(temp) for temp in temperatures]
+        expected = [getattr(exact, name)(temp) for temp in temperatures]
+        np.testing.assert_allclose(actual, expected, rtol=rtol)
+        assert actual != expected
+
+    @staticmethod
+    def test_tabulation_rtol_enforced_within_intervals():
+        # arrange
+        name = "saturation_vapour_pressure__pvs_water"
+        x_min, x_max, n_points = 200 * si.K, 320 * si.K, 1000
+        nodes = np.linspace(x_min, x_max, n_points)
+        midpoints = (nodes[1:] + nodes[:-1]) / 2
+        exact = Formulae(saturation_vapour_pressure="MurphyKoop2005").flatten
+        expected = np.asarray([getattr(exact, name)(temp) for temp in midpoints])
+        sut = Formulae(
+            saturation_vapour_pressure="MurphyKoop2005",
+            tabulate={name: (x_min, x_max, n_points)},
+            tabulation_rtol=1,
+        )
+        midpoint_error = np.amax(
+            np.abs(
+                np.asarray([getattr(sut.flatten, name)(temp) for temp in midpoints])
+                - expected
+            )
+            / expected
+        )
+
+        # act
+        validation_error = sut.tabulation_report(n_samples=1)[name]["validation_error"]
+
+        # assert
+        np.testing.assert_allclose(validation_error, midpoint_error, rtol=1e-3)
+        Formulae(
+            saturation_vapour_pressure="MurphyKoop2005",
+            tabulate={name: (x_min, x_max, n_points)},
+            tabulation_rtol=1.01 * midpoint_error,
+        )
+        with pytest.raises(ValueError, match="exceeds"):
+            Formulae(
+                saturation_vapour_pressure="MurphyKoop2005",
+                tabulate={name: (x_min, x_max, n_points)},
+                tabulation_rtol=0.99 * midpoint_error,
+            )
+
+    @staticmethod
+    @pytest.mark.parametrize("temp", (150 * si.K, 330 * si.K, np.nan))
+    def test_tabulated_formula_falls_back_outside_of_range(temp):
+        # arrange
+        name = "saturation_vapour_pressure__pvs_water"
+        exact = Formulae(saturation_vapour_pressure="MurphyKoop2005").flatten
+
+        # act
+        sut = Formulae(
+            saturation_vapour_pressure="MurphyKoop2005",
+            tabulate={name: (200 * si.K, 320 * si.K, 10000)},
+        )
+
+        # assert
+        np.testing.assert_equal(
+            getattr(sut.flatten, name)(temp), getattr(exact, name)(temp)
+        )
+
+    @staticmethod
+    @pytest.mark.parametrize(
+        "kwargs, match",
+        (
+            (
+                {"tabulate": {"saturation_vapour_pressure__pvs_water": (200, 320, 10)}},
+                "exceeds",
+            ),
+            (
+                {"tabulate": {"trivia__volume_of_density_mass": (0, 1, 10)}},
+                "not a single-argument",
+            ),
+            (
+                {
+                    "surface_tension": "CompressedFilmRuehl",
+                    "constants": {
+                        "RUEHL_nu_org": 1e2 * si.cm**3 / si.mole,
+                        "RUEHL_A0": 115e-20 * si.m * si.m,
+                        "RUEHL_C0": 6e-7,
+                        "RUEHL_m_sigma": 0.3e17 * si.J / si.m**2,
+                        "RUEHL_sgm_min": 40.0 * si.mN / si.m,
+                    },
+                    "tabulate": {"surface_tension__sigma": (0, 1, 10)},
+                },
+                "not a JIT-compiled",
+            ),
+        ),
+    )
+    def test_tabulation_raises(kwargs, match):
+        with pytest.raises(ValueError, match=match):
+            Formulae(**kwargs)
+
+    @staticmethod
+    def test_tabulation_report():
+        # arrange
+        name = "latent_heat_vapourisation__lv"
+        sut = Formulae(tabulate={name: (250 * si.K, 300 * si.K, 100)})
+
+        # act
+        report = sut.tabulation_report(n_samples=1000)
+
+        # assert
+        assert tuple(report.keys()) == (name,)
+        assert report[name]["range"] == (250 * si.K, 300 * si.K)
+        assert report[name]["n_points"] == 100
+        assert report[name]["validation_error"] < sut.tabulation_rtol
+        assert report[name]["max_sampled_error"] < sut.tabulation_rtol
+        assert report[name]["speedup"] > 0
+
+    @staticmethod
+    def test_tabulation_settings_in_str():
+        # arrange
+        tabulate = {"latent_heat_vapourisation__lv": (250 * si.K, 300 * si.K, 100)}
+
+        # act
+        descriptions = {
+            str(Formulae()),
+            str(Formulae(tabulate=tabulate)),
+            str(Formulae(tabulate=tabulate, tabulation_rtol=1e-4)),
+        }
+
+        # assert
+        assert len(descriptions) == 3
+
+    @staticmethod
+    def test_cached_backend_respects_tabulation():
+        # arrange
+        tabulate = {"latent_heat_vapourisation__lv": (250 * si.K, 300 * si.K, 100)}
+
+        # act
+        plain = CPU(Formulae())
+        tabulated = CPU(Formulae(tabulate=tabulate))
+
+        # assert
+        assert plain is not tabulated
+        assert tabulated.formulae.tabulate == tabulate
+
+    @staticmethod
+    @pytest.mark.parametrize("fastmath", (True, False))
+    def test_tabulated_formula_fastmath(fastmath):
+        # arrange
+        name = "latent_heat_vapourisation__lv"
+
+        # act
+        sut = Formulae(
+            fastmath=fastmath, tabulate={name: (250 * si.K, 300 * si.K, 100)}
+        )
+
+        # assert
+        assert getattr(sut.flatten, name).targetoptions["fastmath"] == fastmath
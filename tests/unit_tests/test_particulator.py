@@ -1,8 +1,16 @@
 # pylint: disable=missing-module-docstring,missing-class-docstring,missing-function-docstring
 from collections import namedtuple
 
+import numpy as np
 import pytest
 
+from PySDM import Builder
+from PySDM.backends import CPU
+from PySDM.dynamics import Coalescence, Seeding
+from PySDM.dynamics.collisions.collision_kernels import Golovin
+from PySDM.environments import Box
+from PySDM.physics import si
+
 from .dummy_particulator import DummyParticulator
 
 
@@ -129,3 +137,148 @@ class TestParticulator:
                 seeded_particle_extensive_attributes=storage,
                 number_of_super_particles_to_inject=0,
             )
+
+    @staticmethod
+    @pytest.mark.parametrize("croupier", ("local", "global"))
+    def test_reordering_does_not_alter_results(croupier):
+        # arrange
+        n_sd = 256
+        rng = np.random.default_rng(seed=44)
+        attributes = {
+            "multiplicity": rng.integers(1e6, 1e8, size=n_sd),
+            "volume": rng.uniform(1, 100, size=n_sd) * si.um**3,
+        }
+
+        def simulation(reordering_interval):
+            builder = Builder(
+                n_sd=n_sd,
+                backend=CPU(),
+                environment=Box(dt=1 * si.s, dv=1 * si.m**3),
+                dynamics=(
+                    Coalescence(
+                        collision_kernel=Golovin(b=1.5e3 / si.s), croupier=croupier
+                    ),
+                ),
+            )
+            particulator = builder.build(
+                attributes={key: value.copy() for key, value in attributes.items()}
+            )
+            particulator.reordering_interval = reordering_interval
+            particulator.run(steps=5)
+            return {
+                key: particulator.attributes[key].to_ndarray()
+                for key in ("multiplicity", "volume")
+            }
+
+        # act
+        expected = simulation(reordering_interval=None)
+        actual = simulation(reordering_interval=2)
+
+        # assert
+        assert (expected["multiplicity"] != attributes["multiplicity"]).any()
+        for key, value in expected.items():
+            np.testing.assert_array_equal(actual[key], value)
+
+    @staticmethod
+    def test_reordering_does_not_revive_removed_super_droplets():
+        # arrange
+        n_sd = 6
+        builder = Builder(
+            n_sd=n_sd, backend=CPU(), environment=Box(dt=1 * si.s, dv=1 * si.m**3)
+        )
+        particulator = builder.build(
+            attributes={
+                "multiplicity": np.arange(1, n_sd + 1),
+                "volume": np.full(n_sd, si.um**3),
+            }
+        )
+        particulator.attributes["multiplicity"][: n_sd // 2] = 0
+        particulator.attributes.healthy = False
+        particulator.attributes.sanitize()
+
+        # act
+        particulator.attributes.reorder()
+        particulator.attributes.reset_idx()
+        particulator.attributes.sanitize()
+
+        # assert
+        assert particulator.attributes.super_droplet_count == n_sd // 2
+        np.testing.assert_array_equal(
+            np.sort(particulator.attributes["multiplicity"].to_ndarray()), (4, 5, 6)
+        )
+
+    @staticmethod
+    def test_reordering_with_seeding():
+        # arrange
+        n_sd_placeholders, n_sd_initial, n_steps = 4, 4, 3
+
+        def simulation(reordering_interval):
+            builder = Builder(
+                n_sd=n_sd_placeholders + n_sd_initial,
+                backend=CPU(),
+                environment=Box(dt=1 * si.s, dv=1 * si.m**3),
+                dynamics=(
+                    Seeding(
+                        super_droplet_injection_rate=lambda time: 1,
+                        seeded_particle_multiplicity=[1],
+                        seeded_particle_extensive_attributes={
+                            "signed water mass": [0.001 * si.ng],
+                        },
+                    ),
+                ),
+            )
+            particulator = builder.build(
+                attributes={
+                    "multiplicity": np.concatenate(
+                        (np.full(n_sd_placeholders, np.nan), np.arange(1, 5))
+                    ),
+                    "volume": np.concatenate(
+                        (np.zeros(n_sd_placeholders), np.full(n_sd_initial, si.um**3))
+                    ),
+                }
+            )
+            particulator.reordering_interval = reordering_interval
+            super_droplet_counts = []
+            for _ in range(n_steps):
+                particulator.run(steps=1)
+                super_droplet_counts.append(
+                    particulator.attributes.super_droplet_count
+                )
+            return super_droplet_counts, np.sort(
+                particulator.attributes["multiplicity"].to_ndarray()
+            )
+
+        # act
+        expected = simulation(reordering_interval=None)
+        actual = simulation(reordering_interval=1)
+
+        # assert
+        assert expected[0] == list(range(n_sd_initial + 1, n_sd_initial + n_steps + 1))
+        assert actual[0] == expected[0]
+        np.testing.assert_array_equal(actual[1], expected[1])
+
+    @staticmethod
+    @pytest.mark.parametrize("value", (0, 1.5, -1))
+    def test_reordering_interval_validated(value):
+        # arrange
+        particulator = Builder(
+            n_sd=1, backend=CPU(), environment=Box(dt=1 * si.s, dv=1 * si.m**3)
+        ).particulator
+
+        # act & assert
+        with pytest.raises(ValueError, match="reordering_interval"):
+            particulator.reordering_interval = value
+
+    @staticmethod
+    def test_reordering_interval_rejected_on_gpu(backend_class):
+        if backend_class.__name__ != "ThrustRTC":
+            pytest.skip("GPU-only check")
+
+        # arrange
+        particulator = Builder(
+            n_sd=1, backend=backend_class(), environment=Box(dt=1 * si.s, dv=1)
+        ).particulator
+
+        # act & assert
+        with pytest.raises(NotImplementedError, match="reordering_interval"):
+            particulator.reordering_interval = 1